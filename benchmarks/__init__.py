@@ -0,0 +1 @@
+"""Outils de benchmark du framework RAG (serveurs stub, scripts de mesure)."""
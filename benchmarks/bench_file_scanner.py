@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark du parcours des répertoires surveillés (étape 1).
+
+Génère une arborescence synthétique profonde (extensions variées, fichiers
+temporaires, répertoires ``.git``) puis compare :
+
+- ``rglob`` : un ``Path.rglob`` par pattern et ``Path.match`` par exclusion
+  (ancienne implémentation de MonitoringStep) ;
+- ``scandir`` : :class:`FileScanner`, une passe, patterns compilés ;
+- ``scandir xN`` : même parcours, sous-arborescences réparties sur N threads.
+
+Les patterns sont ceux de config/01_monitoring.yaml.
+
+Usage:
+    python benchmarks/bench_file_scanner.py --depth 4 --fanout 6 --files 20
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rag_framework.config import load_step_config
+from rag_framework.utils.file_scanner import FileScanner
+
+ROOT = Path(__file__).resolve().parent.parent
+
+EXTENSIONS = [".pdf", ".docx", ".txt", ".png", ".xlsx", ".json", ".py", ".bin"]
+
+
+def build_tree(root: Path, depth: int, fanout: int, files: int, seed: int) -> int:
+    """Crée l'arborescence ; retourne le nombre de fichiers créés."""
+    rng = random.Random(seed)
+    count = 0
+    directories = [root]
+    for level in range(depth + 1):
+        next_level: list[Path] = []
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+            for index in range(files):
+                suffix = rng.choice(EXTENSIONS)
+                name = f"doc_{index}{'_tmp' if rng.random() < 0.05 else ''}{suffix}"
+                (directory / name).touch()
+                count += 1
+            if level < depth:
+                next_level.extend(directory / f"d{i}" for i in range(fanout))
+            if level == 1:
+                # Dépôt git : jamais utile à l'ingestion
+                git_dir = directory / ".git" / "objects"
+                git_dir.mkdir(parents=True)
+                for index in range(files * 5):
+                    (git_dir / f"pack_{index}.pdf").touch()
+                    count += 1
+        directories = next_level
+    return count
+
+
+def legacy_scan(root: Path, patterns: list[str], excludes: list[str]) -> list[Path]:
+    """Ancien parcours : un rglob par pattern."""
+    found = []
+    for pattern in patterns:
+        for path in root.rglob(pattern):
+            if not any(path.match(e) for e in excludes):
+                found.append(path)
+    return found
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--files", type=int, default=20, help="Fichiers par dossier")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = load_step_config("01_monitoring.yaml", ROOT / "config")
+    patterns = config["file_patterns"]
+    excludes = config.get("exclude_patterns", [])
+    exclude_dirs = config.get("exclude_dirs", [])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "inbox"
+        total = build_tree(root, args.depth, args.fanout, args.files, args.seed)
+        print(f"Arborescence: {total} fichiers, {len(patterns)} patterns")
+        print(f"{'méthode':>12} | {'durée (s)':>9} | {'retenus':>8} | {'uniques':>8}")
+        print("-" * 48)
+
+        runs: list[tuple[str, Callable[[], list[Path]]]] = [
+            ("rglob", partial(legacy_scan, root, patterns, excludes))
+        ]
+        for workers in sorted({1, args.workers}):
+            scanner = FileScanner(patterns, excludes, exclude_dirs, workers=workers)
+            label = "scandir" if workers == 1 else f"scandir x{workers}"
+            runs.append((label, partial(scanner.scan, [root])))
+
+        for label, run in runs:
+            start = time.perf_counter()
+            found = run()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:>12} | {elapsed:>9.3f} | {len(found):>8} | "
+                f"{len(set(found)):>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
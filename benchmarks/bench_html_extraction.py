@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark de l'extraction HTML : BeautifulSoup contre une passe lxml.
+
+Génère un corpus de pages volumineuses de type « dump de crawl »
+(navigation, scripts, paragraphes, listes, tableaux, liens, images), puis
+extrait chaque page avec les deux moteurs de HTMLExtractor. Affiche le
+débit, le pic mémoire Python (tracemalloc) et vérifie que les textes
+produits sont identiques.
+
+Usage:
+    python benchmarks/bench_html_extraction.py --pages 5 --page-mb 4
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rag_framework.extractors.html_extractor import HTMLExtractor
+
+WORDS = (
+    "le la les un une des rapport analyse données système réseau sécurité "
+    "procédure contrôle qualité budget annuel projet équipe client service "
+    "document version mise à jour article règlement conformité"
+).split()
+
+
+def sentence(rng: random.Random, words: int = 14) -> str:
+    """Phrase aléatoire."""
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def generate_page(rng: random.Random, target_bytes: int) -> str:
+    """Page HTML synthétique d'environ ``target_bytes`` octets."""
+    parts = [
+        "<!DOCTYPE html><html><head><title>Page de test</title>",
+        '<meta name="description" content="Corpus de benchmark">',
+        "<style>body{font-family:sans-serif}</style>",
+        "<script>window.dataLayer=[];</script></head><body>",
+        "<header><nav>"
+        + "".join(f'<a href="/menu/{i}">Menu {i}</a>' for i in range(20))
+        + "</nav></header>",
+    ]
+    size = sum(len(p) for p in parts)
+    section = 0
+    while size < target_bytes:
+        section += 1
+        block = [f"<section><h2>Section {section}</h2>"]
+        for _ in range(rng.randint(3, 8)):
+            link = f'<a href="/doc/{rng.randint(0, 10**6)}">{rng.choice(WORDS)}</a>'
+            block.append(f"<p>{sentence(rng)} {link} <b>{sentence(rng, 5)}</b></p>")
+        block.append(
+            "<ul>" + "".join(f"<li>{sentence(rng, 6)}</li>" for _ in range(5)) + "</ul>"
+        )
+        block.append(
+            "<table>"
+            + "".join(
+                f"<tr><td>{rng.choice(WORDS)}</td><td>{rng.randint(0, 999)}</td></tr>"
+                for _ in range(4)
+            )
+            + "</table>"
+        )
+        block.append(f'<img src="/img/{section}.png" alt="Figure {section}">')
+        block.append(f"<script>track({section});</script></section>")
+        chunk = "\n".join(block)
+        parts.append(chunk)
+        size += len(chunk)
+    parts.append("<footer>Mentions légales</footer></body></html>")
+    return "\n".join(parts)
+
+
+def run_engine(
+    engine: str, files: list[Path], config: dict[str, object]
+) -> tuple[float, list[str]]:
+    """Extrait les fichiers avec un moteur ; retourne (durée, textes)."""
+    extractor = HTMLExtractor({**config, "engine": engine})
+    start = time.perf_counter()
+    texts = [extractor.extract(path).text for path in files]
+    return time.perf_counter() - start, texts
+
+
+def peak_memory(engine: str, path: Path, config: dict[str, object]) -> float:
+    """Pic d'allocation Python (Mo) pendant l'extraction d'un fichier."""
+    extractor = HTMLExtractor({**config, "engine": engine})
+    tracemalloc.start()
+    extractor.extract(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--page-mb", type=float, default=4.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--preserve-structure", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    config: dict[str, object] = {
+        "preserve_structure": args.preserve_structure,
+        "extract_links": True,
+        "extract_images": True,
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for i in range(args.pages):
+            path = Path(tmp) / f"page_{i}.html"
+            path.write_text(
+                generate_page(rng, int(args.page_mb * 1024 * 1024)), "utf-8"
+            )
+            files.append(path)
+        total_mb = sum(p.stat().st_size for p in files) / 1024 / 1024
+
+        print(f"Corpus: {len(files)} pages, {total_mb:.1f} Mo")
+        print(
+            f"{'moteur':>13} | {'durée (s)':>9} | {'Mo/s':>6} | {'pic mém. (Mo)':>13}"
+        )
+        print("-" * 52)
+        outputs = {}
+        for engine in ("beautifulsoup", "stream"):
+            elapsed, outputs[engine] = run_engine(engine, files, config)
+            peak = peak_memory(engine, files[0], config)
+            print(
+                f"{engine:>13} | {elapsed:>9.2f} | {total_mb / elapsed:>6.1f} | "
+                f"{peak:>13.1f}"
+            )
+
+        identical = outputs["beautifulsoup"] == outputs["stream"]
+        print(f"\nTextes identiques: {'oui' if identical else 'NON'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark du détecteur de PII : débit en Mo/s sur un texte synthétique.
+
+Génère des chunks de texte administratif parsemés de données personnelles
+(emails, téléphones, NIR, IBAN, cartes, adresses IP), valides ou non, puis
+compare :
+
+- ``findall`` : une passe ``findall`` par type de donnée (ancienne méthode
+  d'AuditStep, sans validation) ;
+- ``scanner`` : expression combinée, une passe, validation des clés ;
+- ``scanner xN`` : même analyse répartie sur N processus.
+
+Usage:
+    python benchmarks/bench_pii_scanner.py --chunks 20000 --workers 4
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rag_framework.utils.pii_scanner import PII_DETECTORS, luhn_valid, scan_texts
+
+WORDS = (
+    "le la les un une des dossier contrat client salarié mutuelle facture "
+    "règlement paiement adresse service direction conformité rapport annexe "
+    "article période montant référence agence signature"
+).split()
+
+
+def luhn_number(rng: random.Random) -> str:
+    """Numéro de carte à 16 chiffres de clé de Luhn valide."""
+    while True:
+        digits = "4" + "".join(str(rng.randint(0, 9)) for _ in range(15))
+        if luhn_valid(digits):
+            return " ".join(digits[i : i + 4] for i in range(0, 16, 4))
+
+
+def pii_sample(rng: random.Random) -> str:
+    """Donnée personnelle aléatoire (ou faux positif plausible)."""
+    kind = rng.randrange(7)
+    if kind == 0:
+        return f"{rng.choice(WORDS)}.{rng.randint(1, 99)}@example.fr"
+    if kind == 1:
+        return "06 " + " ".join(f"{rng.randint(0, 99):02d}" for _ in range(4))
+    if kind == 2:
+        body = f"{rng.choice('12')}{rng.randint(0, 99):02d}{rng.randint(1, 12):02d}"
+        body += f"{rng.randint(1, 95):02d}{rng.randint(0, 999):03d}"
+        body += f"{rng.randint(0, 999):03d}"
+        return body + f"{97 - int(body) % 97:02d}"
+    if kind == 3:
+        return "FR76 3000 6000 0112 3456 7890 189"
+    if kind == 4:
+        return luhn_number(rng)
+    if kind == 5:
+        # Suite de chiffres au format carte, clé de Luhn invalide
+        return "-".join(str(rng.randint(1000, 9999)) for _ in range(4))
+    return ".".join(str(rng.randint(0, 255)) for _ in range(4))
+
+
+def generate_chunks(rng: random.Random, count: int, size: int) -> list[str]:
+    """Chunks d'environ ``size`` caractères, ~1 PII pour 300 caractères."""
+    chunks = []
+    for _ in range(count):
+        parts: list[str] = []
+        length = 0
+        while length < size:
+            word = pii_sample(rng) if rng.random() < 0.02 else rng.choice(WORDS)
+            parts.append(word)
+            length += len(word) + 1
+        chunks.append(" ".join(parts))
+    return chunks
+
+
+def findall_counts(texts: list[str]) -> int:
+    """Ancienne méthode : une passe findall par type, sans validation."""
+    patterns = [re.compile(pattern) for _, pattern in PII_DETECTORS]
+    return sum(len(p.findall(text)) for text in texts for p in patterns)
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    chunks = generate_chunks(random.Random(args.seed), args.chunks, args.chunk_size)
+    total_mb = sum(len(c.encode("utf-8")) for c in chunks) / 1024 / 1024
+    print(f"Corpus: {len(chunks)} chunks, {total_mb:.1f} Mo")
+    print(f"{'méthode':>14} | {'durée (s)':>9} | {'Mo/s':>6} | {'PII':>7}")
+    print("-" * 46)
+
+    start = time.perf_counter()
+    found = findall_counts(chunks)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'findall':>14} | {elapsed:>9.2f} | {total_mb / elapsed:>6.1f} | {found:>7}"
+    )
+
+    for workers in sorted({1, args.workers}):
+        start = time.perf_counter()
+        counts = scan_texts(chunks, workers=workers, parallel_min_chars=0)
+        elapsed = time.perf_counter() - start
+        found = sum(sum(c.values()) for c in counts)
+        label = "scanner" if workers == 1 else f"scanner x{workers}"
+        print(
+            f"{label:>14} | {elapsed:>9.2f} | {total_mb / elapsed:>6.1f} | {found:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,841 @@
+#!/usr/bin/env python3
+"""Suite de benchmarks de bout en bout, reproductible et hors ligne.
+
+Sous-commandes :
+
+- ``run`` : génère le corpus synthétique du scénario (voir
+  ``corpus_generator.py``), puis exécute chaque étape séparément
+  (mode ``steps``) et le pipeline complet avec son ordonnancement réel
+  (mode ``pipeline``), sans réseau :
+
+  - embeddings simulés (provider ``fake``) ;
+  - base vectorielle locale (ChromaDB persistant dans l'espace de travail) ;
+  - LLM remplacé par le serveur stub OpenAI-compatible local
+    (``llm_stub_server.py``, latence configurable).
+
+  Chaque répétition tourne dans un espace de travail neuf (copie de
+  config/ adaptée, corpus copié, caches vides). Les répétitions de
+  chauffe (imports, initialisations) sont exclues des statistiques.
+  Les résultats (durées p50/p95, débits, latence par document, pic de
+  mémoire résidente, volumes produits) sont écrits en JSON.
+
+- ``compare`` : compare un résultat à une référence enregistrée et
+  signale les régressions au-delà des tolérances du scénario (code de
+  sortie 1), les volumes produits qui changent et les différences
+  d'environnement ou de corpus.
+
+Les scénarios sont des fichiers YAML (``benchmarks/scenarios/``) : corpus,
+répétitions, latences du LLM stub, surcharges de configuration et
+tolérances de comparaison.
+
+Les références dépendent de la machine : à enregistrer et comparer sur
+le même hôte (l'environnement est inclus dans les résultats).
+
+Usage:
+    python benchmarks/bench_pipeline.py run --scenario smoke --output bench.json
+    python benchmarks/bench_pipeline.py run --save-baseline baseline.json
+    python benchmarks/bench_pipeline.py compare bench.json baseline.json
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Optional, cast
+
+import yaml
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus_generator import CorpusSpec, generate_corpus
+from benchmarks.llm_stub_server import StubLLMServer
+from rag_framework.config import clear_config_cache
+from rag_framework.pipeline import RAGPipeline
+from rag_framework.steps.step_02_preprocessing import PreprocessingStep
+from rag_framework.utils.streaming_stats import QuantileSketch
+
+ROOT = Path(__file__).resolve().parent.parent
+SCENARIOS_DIR = ROOT / "benchmarks" / "scenarios"
+
+RESULTS_SCHEMA = 1
+
+# Provider LLM ajouté à global.yaml, pointant vers le serveur stub
+STUB_PROVIDER = "bench_stub"
+
+DEFAULT_SCENARIO: dict[str, Any] = {
+    "corpus": {},
+    "run": {
+        "modes": ["steps", "pipeline"],
+        "repeat": 3,
+        "warmup": 1,
+        "embedding_dimensions": 384,
+        "tracemalloc": False,
+        "llm": {"latency_ms": 20.0, "per_token_latency_ms": 0.5},
+    },
+    "config_overrides": {},
+    "compare": {
+        "tolerance": 0.10,
+        "memory_tolerance": 0.15,
+        "min_seconds": 0.05,
+        "min_memory_mb": 16.0,
+    },
+}
+
+# (chemin de la métrique, sens d'amélioration, type de tolérance) ; pour
+# une étape, le pic absolu inclut la mémoire des étapes précédentes : seul
+# son accroissement lui est imputable
+TRACKED_METRICS = (
+    ("seconds.p50", "lower", "time"),
+    ("document_latency_seconds.p95", "lower", "time"),
+    ("peak_rss_mb", "lower", "memory"),
+    ("rss_growth_mb", "lower", "memory"),
+)
+
+
+# ---------------------------------------------------------------------------
+# Scénario et espace de travail
+# ---------------------------------------------------------------------------
+
+
+def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def load_scenario(name_or_path: str) -> dict[str, Any]:
+    """Charge un scénario (nom dans benchmarks/scenarios/ ou chemin YAML).
+
+    Args:
+        name_or_path: ``smoke``, ``default``... ou chemin d'un fichier YAML.
+
+    Returns:
+        Scénario complété par les valeurs par défaut.
+    """
+    path = Path(name_or_path)
+    if not path.is_file():
+        path = SCENARIOS_DIR / f"{name_or_path}.yaml"
+    with path.open(encoding="utf-8") as handle:
+        scenario = _deep_merge(DEFAULT_SCENARIO, yaml.safe_load(handle) or {})
+    scenario["name"] = scenario.get("name", path.stem)
+    return scenario
+
+
+def offline_overrides(llm_url: str, run: dict[str, Any]) -> dict[str, Any]:
+    """Surcharges rendant le pipeline autonome (ni réseau, ni modèle).
+
+    Args:
+        llm_url: URL de base du serveur LLM stub.
+        run: Section ``run`` du scénario.
+
+    Returns:
+        Surcharges par fichier de configuration.
+    """
+    llm = {"provider": STUB_PROVIDER, "model": "stub-llm"}
+    return {
+        "global.yaml": {
+            "llm_providers": {
+                STUB_PROVIDER: {
+                    "access_method": "openai_compatible",
+                    "base_url": f"{llm_url}/v1",
+                    "api_key": "bench",
+                }
+            },
+            "logging": {"level": "ERROR"},
+            "telemetry": {"prometheus": {"http_port": None}},
+            "profiling": {"enabled": False},
+        },
+        "01_monitoring.yaml": {"watch_paths": ["./data/input/bench"]},
+        "03_chunking.yaml": {"llm": llm},
+        "04_enrichment.yaml": {
+            "llm": {**llm, "rate_limiting": {"delay_between_requests": 0.0}}
+        },
+        "05_audit.yaml": {"llm": llm},
+        "06_embedding.yaml": {
+            "provider": "fake",
+            "model": "fake",
+            "dimensions": run["embedding_dimensions"],
+        },
+        "08_vector_storage.yaml": {"provider": "chromadb"},
+    }
+
+
+def prepare_workspace(
+    workspace: Path,
+    corpus_dir: Path,
+    manifest: dict[str, Any],
+    overrides: dict[str, Any],
+) -> None:
+    """Crée un espace de travail neuf : config/ adaptée et corpus à traiter.
+
+    Args:
+        workspace: Répertoire à créer (chemins relatifs de la config).
+        corpus_dir: Répertoire du corpus généré.
+        manifest: Manifeste du corpus.
+        overrides: Surcharges par fichier de configuration.
+    """
+    # ChromaDB partage un client par chemin de persistance dans le
+    # processus : un chemin absolu propre à chaque espace de travail
+    overrides = _deep_merge(
+        overrides,
+        {
+            "08_vector_storage.yaml": {
+                "chromadb": {
+                    "persist_directory": str(workspace.resolve() / "chroma_db")
+                }
+            }
+        },
+    )
+    config_dir = workspace / "config"
+    config_dir.mkdir(parents=True)
+    for source in sorted((ROOT / "config").glob("*.yaml")):
+        with source.open(encoding="utf-8") as handle:
+            config = yaml.safe_load(handle) or {}
+        config = _deep_merge(config, overrides.get(source.name, {}))
+        with (config_dir / source.name).open("w", encoding="utf-8") as handle:
+            yaml.safe_dump(config, handle, allow_unicode=True, sort_keys=False)
+
+    input_dir = workspace / "data" / "input" / "bench"
+    input_dir.mkdir(parents=True)
+    for document in manifest["documents"]:
+        shutil.copy2(corpus_dir / document["path"], input_dir / document["path"])
+
+
+# ---------------------------------------------------------------------------
+# Mesures
+# ---------------------------------------------------------------------------
+
+
+def _rss_reader() -> Callable[[], int]:
+    """Lecteur de la mémoire résidente courante (octets)."""
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        return lambda: int(statm.read_text().split()[1]) * page_size
+    try:
+        import psutil
+
+        process = psutil.Process()
+        return lambda: process.memory_info().rss
+    except ImportError:
+        # Repli : pic du processus (non réinitialisable)
+        import resource
+
+        scale = 1 if sys.platform == "darwin" else 1024
+        return lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+_current_rss = _rss_reader()
+
+
+class PeakRSS:
+    """Pic de mémoire résidente pendant un bloc, échantillonné dans un thread.
+
+    Args:
+        interval: Période d'échantillonnage en secondes.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """Initialise l'échantillonneur (démarré par ``with``)."""
+        self.interval = interval
+        self.start_bytes = self.peak_bytes = _current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_bytes = max(self.peak_bytes, _current_rss())
+
+    def __enter__(self) -> "PeakRSS":
+        """Démarre l'échantillonnage."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Arrête l'échantillonnage."""
+        self._stop.set()
+        self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, _current_rss())
+
+
+def measure(
+    func: Callable[[], Any], trace_python: bool = False
+) -> tuple[Any, dict[str, Any]]:
+    """Exécute ``func`` et mesure durée, CPU et mémoire.
+
+    Args:
+        func: Fonction sans argument.
+        trace_python: Mesure aussi le pic du tas Python (tracemalloc, lent).
+
+    Returns:
+        (résultat, mesures).
+    """
+    if trace_python:
+        tracemalloc.start()
+    with PeakRSS() as rss:
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+        cpu_seconds = time.process_time() - cpu_start
+    sample = {
+        "seconds": seconds,
+        "cpu_seconds": cpu_seconds,
+        "peak_rss_mb": rss.peak_bytes / 1024 / 1024,
+        "rss_growth_mb": (rss.peak_bytes - rss.start_bytes) / 1024 / 1024,
+    }
+    if trace_python:
+        sample["python_peak_mb"] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+    return result, sample
+
+
+def _count(data: dict[str, Any], keys: tuple[str, ...]) -> tuple[str, int]:
+    """Première clé de ``keys`` portant une liste, et sa longueur."""
+    for key in keys:
+        if isinstance(data.get(key), list):
+            return key, len(data[key])
+    return "", 0
+
+
+def _outputs(data: dict[str, Any]) -> dict[str, int]:
+    """Volumes produits par une exécution (détection de changements)."""
+    storage = data.get("storage_result") or {}
+    return {
+        "documents": len(data.get("extracted_documents") or []),
+        "chunks": len(data.get("chunks") or []),
+        "vectors": int(storage.get("stored_count", 0) or 0),
+    }
+
+
+def _document_times(pipeline: RAGPipeline) -> Optional[QuantileSketch]:
+    """Durées d'extraction par document relevées par l'étape 2."""
+    try:
+        step = cast(PreprocessingStep, pipeline.get_step("PreprocessingStep"))
+        collector = step.metrics_collector
+    except (ValueError, AttributeError):
+        return None
+    times = collector.metrics.get("processing_times")
+    return times if isinstance(times, QuantileSketch) and times.count else None
+
+
+def _parser_usage(pipeline: RAGPipeline) -> dict[str, int]:
+    try:
+        step = cast(PreprocessingStep, pipeline.get_step("PreprocessingStep"))
+        collector = step.metrics_collector
+    except (ValueError, AttributeError):
+        return {}
+    usage = collector.metrics.get("parser_usage") or {}
+    return {parser: data["count"] for parser, data in sorted(usage.items())}
+
+
+def run_steps(
+    pipeline: RAGPipeline, trace_python: bool
+) -> tuple[dict[str, dict[str, Any]], dict[str, Any]]:
+    """Exécute les étapes activées une à une, dans l'ordre du pipeline.
+
+    Returns:
+        (mesures par étape, données finales).
+    """
+    data: dict[str, Any] = {}
+    samples: dict[str, dict[str, Any]] = {}
+    for step in pipeline.steps:
+        if not step.enabled:
+            continue
+        name = step.__class__.__name__
+        unit, items_in = _count(data, step.consumes)
+        execute: Callable[[], dict[str, Any]] = partial(step.execute, data)
+        data, sample = measure(execute, trace_python)
+        produced, items_out = _count(data, step.produces)
+        sample["items"] = {
+            "unit": unit or produced,
+            "in": items_in,
+            "out": items_out,
+        }
+        samples[name] = sample
+    return samples, data
+
+
+def run_once(
+    mode: str,
+    workspace: Path,
+    scenario: dict[str, Any],
+    llm: StubLLMServer,
+) -> dict[str, Any]:
+    """Une répétition d'un mode dans un espace de travail préparé."""
+    trace_python = bool(scenario["run"]["tracemalloc"])
+    previous_cwd = Path.cwd()
+    os.chdir(workspace)
+    clear_config_cache()
+    try:
+        start = time.perf_counter()
+        pipeline = RAGPipeline(config_dir=Path("config"))
+        setup_seconds = time.perf_counter() - start
+        llm_requests = llm.request_count
+
+        if mode == "steps":
+            steps, data = run_steps(pipeline, trace_python)
+            sample: dict[str, Any] = {"steps": steps}
+        else:
+            data, sample = measure(lambda: pipeline.execute({}), trace_python)
+            sample["critical_path"] = pipeline.last_timings.get("critical_path", [])
+
+        sample["setup_seconds"] = setup_seconds
+        sample["outputs"] = {
+            **_outputs(data),
+            "llm_requests": llm.request_count - llm_requests,
+        }
+        sample["document_times"] = _document_times(pipeline)
+        sample["parser_usage"] = _parser_usage(pipeline)
+        return sample
+    finally:
+        os.chdir(previous_cwd)
+        clear_config_cache()
+
+
+# ---------------------------------------------------------------------------
+# Agrégation
+# ---------------------------------------------------------------------------
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Percentile par interpolation linéaire (``q`` dans [0, 1])."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = q * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    mean = sum(values) / len(values)
+    variance = sum((v - mean) ** 2 for v in values) / len(values)
+    return {
+        "p50": round(percentile(values, 0.5), 4),
+        "p95": round(percentile(values, 0.95), 4),
+        "min": round(min(values), 4),
+        "mean": round(mean, 4),
+        "stdev": round(variance**0.5, 4),
+    }
+
+
+def _summarize_case(samples: list[dict[str, Any]]) -> dict[str, Any]:
+    seconds = [s["seconds"] for s in samples]
+    summary: dict[str, Any] = {
+        "runs": len(samples),
+        "seconds": _distribution(seconds),
+        "cpu_seconds": _distribution([s["cpu_seconds"] for s in samples]),
+        "peak_rss_mb": round(max(s["peak_rss_mb"] for s in samples), 1),
+        "rss_growth_mb": round(max(s["rss_growth_mb"] for s in samples), 1),
+    }
+    if "python_peak_mb" in samples[0]:
+        summary["python_peak_mb"] = round(max(s["python_peak_mb"] for s in samples), 1)
+    return summary
+
+
+def summarize(
+    samples: list[dict[str, Any]], mode: str, manifest: dict[str, Any]
+) -> dict[str, Any]:
+    """Agrège les répétitions d'un mode.
+
+    Args:
+        samples: Mesures des répétitions (hors chauffe).
+        mode: ``steps`` ou ``pipeline``.
+        manifest: Manifeste du corpus (volumes de référence des débits).
+
+    Returns:
+        Résultats du mode.
+    """
+    last = samples[-1]
+    if mode == "steps":
+        result: dict[str, Any] = {}
+        for name, first in last["steps"].items():
+            runs = [s["steps"][name] for s in samples if name in s["steps"]]
+            case = _summarize_case(runs)
+            items = first["items"]
+            case["items"] = items
+            case["items_per_second"] = round(
+                max(items["in"], items["out"]) / max(case["seconds"]["p50"], 1e-9), 2
+            )
+            result[name] = case
+        return result
+
+    result = _summarize_case(samples)
+    p50 = max(result["seconds"]["p50"], 1e-9)
+    outputs = last["outputs"]
+    totals = manifest["totals"]
+    result["setup_seconds"] = _distribution([s["setup_seconds"] for s in samples])
+    result["throughput"] = {
+        "documents_per_second": round(totals["documents"] / p50, 3),
+        "mb_per_second": round(totals["file_bytes"] / 1024 / 1024 / p50, 3),
+        "chunks_per_second": round(outputs["chunks"] / p50, 2),
+    }
+    result["outputs"] = outputs
+    result["critical_path"] = last["critical_path"]
+    result["parser_usage"] = last["parser_usage"]
+
+    sketches = [s["document_times"] for s in samples if s["document_times"]]
+    if sketches:
+        merged = QuantileSketch(sketches[0].relative_accuracy)
+        for sketch in sketches:
+            merged.merge(sketch)
+        result["document_latency_seconds"] = {
+            name: round(merged.quantile(q), 4)
+            for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))
+        }
+    return result
+
+
+def _environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+def run_benchmark(
+    scenario: dict[str, Any],
+    work_dir: Path,
+    corpus_dir: Optional[Path] = None,
+    keep: bool = False,
+) -> dict[str, Any]:
+    """Exécute un scénario complet.
+
+    Args:
+        scenario: Scénario chargé par :func:`load_scenario`.
+        work_dir: Répertoire de travail (corpus et espaces d'exécution).
+        corpus_dir: Corpus existant à réutiliser (généré sinon).
+        keep: Conserve les espaces de travail des répétitions.
+
+    Returns:
+        Résultats sérialisables en JSON.
+    """
+    spec = CorpusSpec.from_config(scenario["corpus"])
+    if corpus_dir is None:
+        corpus_dir = work_dir / "corpus"
+        manifest = generate_corpus(spec, corpus_dir)
+    else:
+        manifest = json.loads((corpus_dir / "manifest.json").read_text("utf-8"))
+
+    run = scenario["run"]
+    results: dict[str, Any] = {
+        "schema": RESULTS_SCHEMA,
+        "scenario": scenario["name"],
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": _environment(),
+        "settings": {
+            "run": run,
+            "compare": scenario["compare"],
+            "config_overrides": scenario["config_overrides"],
+        },
+        "corpus": {
+            "fingerprint": manifest["fingerprint"],
+            "spec": manifest["spec"],
+            "totals": manifest["totals"],
+        },
+        "results": {},
+    }
+
+    with StubLLMServer(
+        latency_ms=run["llm"]["latency_ms"],
+        per_token_latency_ms=run["llm"]["per_token_latency_ms"],
+    ) as llm:
+        overrides = _deep_merge(
+            offline_overrides(llm.base_url, run), scenario["config_overrides"]
+        )
+        for mode in run["modes"]:
+            samples = []
+            for index in range(run["warmup"] + run["repeat"]):
+                workspace = work_dir / "runs" / f"{mode}_{index}"
+                prepare_workspace(workspace, corpus_dir, manifest, overrides)
+                sample = run_once(mode, workspace, scenario, llm)
+                if index >= run["warmup"]:
+                    samples.append(sample)
+                if not keep:
+                    shutil.rmtree(workspace, ignore_errors=True)
+            results["results"][mode] = summarize(samples, mode, manifest)
+        results["llm_stub"] = {
+            "requests": llm.request_count,
+            "prompt_tokens": llm.prompt_tokens,
+            "completion_tokens": llm.completion_tokens,
+        }
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Comparaison
+# ---------------------------------------------------------------------------
+
+
+def _get(data: dict[str, Any], path: str) -> Optional[float]:
+    for key in path.split("."):
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data if isinstance(data, (int, float)) else None
+
+
+def _cases(results: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Cas mesurés : ``pipeline`` et ``steps/<Étape>``."""
+    cases = {}
+    modes = results.get("results", {})
+    if "pipeline" in modes:
+        cases["pipeline"] = modes["pipeline"]
+    for name, case in modes.get("steps", {}).items():
+        cases[f"steps/{name}"] = case
+    return cases
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerances: Optional[dict[str, float]] = None,
+) -> dict[str, Any]:
+    """Compare deux résultats de benchmark.
+
+    Une métrique régresse si elle se dégrade de plus de la tolérance
+    relative (``tolerance`` pour les durées, ``memory_tolerance`` pour la
+    mémoire) et d'au moins le plancher absolu (``min_seconds``,
+    ``min_memory_mb``) qui absorbe le bruit des cas très courts.
+
+    Args:
+        current: Résultat à évaluer.
+        baseline: Résultat de référence.
+        tolerances: Section ``compare`` du scénario (défauts sinon).
+
+    Returns:
+        ``{"rows": [...], "regressions": n, "warnings": [...]}`` ; chaque
+        ligne porte le cas, la métrique, les deux valeurs, la variation
+        relative et un statut (``ok``, ``regression``, ``improvement``,
+        ``changed``, ``missing``).
+    """
+    limits = {**DEFAULT_SCENARIO["compare"], **(tolerances or {})}
+    warnings = []
+    if current.get("corpus", {}).get("fingerprint") != baseline.get("corpus", {}).get(
+        "fingerprint"
+    ):
+        warnings.append("Corpus différent : les résultats ne sont pas comparables")
+    for key in ("python", "machine", "cpu_count"):
+        before = baseline.get("environment", {}).get(key)
+        after = current.get("environment", {}).get(key)
+        if before != after:
+            warnings.append(f"Environnement différent ({key}: {before} → {after})")
+
+    rows: list[dict[str, Any]] = []
+    current_cases = _cases(current)
+    for case, reference in _cases(baseline).items():
+        measured = current_cases.get(case)
+        if measured is None:
+            rows.append({"case": case, "metric": "-", "status": "missing"})
+            continue
+        for metric, direction, kind in TRACKED_METRICS:
+            before, after = _get(reference, metric), _get(measured, metric)
+            if before is None or after is None:
+                continue
+            delta = after - before if direction == "lower" else before - after
+            change = (after - before) / before if before else 0.0
+            tolerance, floor = (
+                (limits["tolerance"], limits["min_seconds"])
+                if kind == "time"
+                else (limits["memory_tolerance"], limits["min_memory_mb"])
+            )
+            status = "ok"
+            if abs(after - before) >= floor and before:
+                if delta / before > tolerance:
+                    status = "regression"
+                elif -delta / before > tolerance:
+                    status = "improvement"
+            rows.append(
+                {
+                    "case": case,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change": round(change, 4),
+                    "status": status,
+                }
+            )
+        # Volumes produits : déterministes pour un même corpus
+        for name, before in (reference.get("outputs") or {}).items():
+            after = (measured.get("outputs") or {}).get(name)
+            if after != before:
+                rows.append(
+                    {
+                        "case": case,
+                        "metric": f"outputs.{name}",
+                        "baseline": before,
+                        "current": after,
+                        "change": None,
+                        "status": "changed",
+                    }
+                )
+
+    return {
+        "rows": rows,
+        "regressions": sum(1 for row in rows if row["status"] == "regression"),
+        "warnings": warnings,
+    }
+
+
+def format_comparison(comparison: dict[str, Any], show_all: bool = False) -> str:
+    """Tableau texte d'une comparaison (lignes ``ok`` masquées par défaut)."""
+    lines = [f"Attention : {warning}" for warning in comparison["warnings"]]
+    lines.append(
+        f"{'cas':<34} {'métrique':<30} {'référence':>10} {'actuel':>10} "
+        f"{'écart':>8}  statut"
+    )
+    lines.append("-" * 104)
+    for row in comparison["rows"]:
+        if row["status"] == "ok" and not show_all:
+            continue
+        change = row.get("change")
+        lines.append(
+            f"{row['case']:<34} {row['metric']:<30} "
+            f"{row.get('baseline', ''):>10} {row.get('current', ''):>10} "
+            f"{'' if change is None else f'{change:+.1%}':>8}  {row['status']}"
+        )
+    compared = sum(1 for row in comparison["rows"] if row["status"] == "ok")
+    lines.append(
+        f"{comparison['regressions']} régression(s), {compared} métrique(s) stable(s)"
+    )
+    return "\n".join(lines)
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    modes = results["results"]
+    if "steps" in modes:
+        print(
+            f"{'étape':<24} | {'p50 (s)':>8} | {'p95 (s)':>8} | "
+            f"{'éléments/s':>10} | {'pic RSS (Mo)':>12}"
+        )
+        print("-" * 74)
+        for name, case in modes["steps"].items():
+            print(
+                f"{name:<24} | {case['seconds']['p50']:>8.3f} | "
+                f"{case['seconds']['p95']:>8.3f} | {case['items_per_second']:>10.1f} | "
+                f"{case['peak_rss_mb']:>12.1f}"
+            )
+    if "pipeline" in modes:
+        case = modes["pipeline"]
+        throughput = case["throughput"]
+        print(
+            f"\nPipeline : p50 {case['seconds']['p50']:.2f}s, "
+            f"p95 {case['seconds']['p95']:.2f}s, "
+            f"{throughput['documents_per_second']:.2f} documents/s, "
+            f"{throughput['mb_per_second']:.2f} Mo/s, "
+            f"pic RSS {case['peak_rss_mb']:.0f} Mo"
+        )
+        latency = case.get("document_latency_seconds")
+        if latency:
+            print(
+                f"Latence par document : p50 {latency['p50']:.3f}s, "
+                f"p95 {latency['p95']:.3f}s, p99 {latency['p99']:.3f}s"
+            )
+        print(f"Volumes : {case['outputs']}")
+
+
+def main() -> None:
+    """Point d'entrée : sous-commandes ``run`` et ``compare``."""
+    parser = argparse.ArgumentParser(description="Suite de benchmarks du pipeline")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Exécute un scénario")
+    run_parser.add_argument("--scenario", default="default")
+    run_parser.add_argument("--output", type=Path, default=None)
+    run_parser.add_argument("--save-baseline", type=Path, default=None)
+    run_parser.add_argument("--compare", type=Path, default=None, metavar="BASELINE")
+    run_parser.add_argument("--corpus", type=Path, default=None)
+    run_parser.add_argument("--work-dir", type=Path, default=None)
+    run_parser.add_argument("--keep", action="store_true")
+    run_parser.add_argument("--documents", type=int, default=None)
+    run_parser.add_argument("--seed", type=int, default=None)
+    run_parser.add_argument("--repeat", type=int, default=None)
+    run_parser.add_argument("--modes", nargs="+", choices=["steps", "pipeline"])
+
+    compare_parser = commands.add_parser("compare", help="Compare à une référence")
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("--tolerance", type=float, default=None)
+    compare_parser.add_argument("--memory-tolerance", type=float, default=None)
+    compare_parser.add_argument("--all", action="store_true", help="Lignes stables")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        current = json.loads(args.current.read_text("utf-8"))
+        baseline = json.loads(args.baseline.read_text("utf-8"))
+        # Tolérances du scénario enregistrées avec la référence
+        tolerances = dict(baseline.get("settings", {}).get("compare", {}))
+        for key in ("tolerance", "memory_tolerance"):
+            if getattr(args, key) is not None:
+                tolerances[key] = getattr(args, key)
+        comparison = compare_results(current, baseline, tolerances)
+        print(format_comparison(comparison, show_all=args.all))
+        sys.exit(1 if comparison["regressions"] else 0)
+
+    scenario = load_scenario(args.scenario)
+    for key in ("documents", "seed"):
+        if getattr(args, key) is not None:
+            scenario["corpus"][key] = getattr(args, key)
+    if args.repeat is not None:
+        scenario["run"]["repeat"] = args.repeat
+    if args.modes:
+        scenario["run"]["modes"] = args.modes
+
+    work_dir = args.work_dir or Path(tempfile.mkdtemp(prefix="rag-bench-"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        results = run_benchmark(scenario, work_dir, args.corpus, keep=args.keep)
+    finally:
+        if not args.keep and args.work_dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    _print_results(results)
+    payload = json.dumps(results, indent=2, ensure_ascii=False)
+    for path in filter(None, (args.output, args.save_baseline)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(payload + "\n", encoding="utf-8")
+        print(f"Résultats écrits dans {path}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text("utf-8"))
+        comparison = compare_results(
+            results, baseline, baseline.get("settings", {}).get("compare")
+        )
+        print()
+        print(format_comparison(comparison))
+        sys.exit(1 if comparison["regressions"] else 0)
+
+
+if __name__ == "__main__":
+    main()
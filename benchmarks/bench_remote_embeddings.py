@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark de débit du client d'embeddings distant.
+
+Compare, contre le serveur stub local, l'ancien mode (une requête
+synchrone par batch, sans concurrence) et le client mutualisé à différents
+niveaux de concurrence.
+
+Usage:
+    python benchmarks/bench_remote_embeddings.py --texts 2000 --latency-ms 30
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.embedding_stub_server import StubEmbeddingServer
+from rag_framework.models.remote_embeddings import (
+    RemoteEmbeddingClient,
+    RemoteEmbeddingSettings,
+)
+
+
+def run_once(
+    server: StubEmbeddingServer,
+    texts: list[str],
+    concurrency: int,
+    batch_size: int,
+) -> tuple[float, dict[str, int]]:
+    """Vectorise ``texts`` et retourne (durée en secondes, statistiques)."""
+    client = RemoteEmbeddingClient(
+        protocol="openai",
+        base_url=f"{server.base_url}/v1",
+        model="stub",
+        settings=RemoteEmbeddingSettings(
+            max_concurrency=concurrency,
+            max_batch_size=batch_size,
+            backoff_base=0.01,
+        ),
+    )
+    start = time.perf_counter()
+    vectors = client.embed(texts)
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    # Vérification de l'ordre de sortie
+    assert vectors[0] == server.vector_for(texts[0])
+    assert vectors[-1] == server.vector_for(texts[-1])
+    return elapsed, client.stats
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--per-text-latency-ms", type=float, default=0.2)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    texts = [f"Chunk de test numéro {i} " * 8 for i in range(args.texts)]
+
+    with StubEmbeddingServer(
+        latency_ms=args.latency_ms,
+        per_text_latency_ms=args.per_text_latency_ms,
+        error_rate=args.error_rate,
+    ) as server:
+        print(
+            f"{'concurrence':>11} | {'durée (s)':>9} | {'textes/s':>9} | "
+            f"{'requêtes':>8} | {'retries':>7}"
+        )
+        print("-" * 58)
+        for concurrency in args.concurrency:
+            elapsed, stats = run_once(server, texts, concurrency, args.batch_size)
+            print(
+                f"{concurrency:>11} | {elapsed:>9.2f} | "
+                f"{len(texts) / elapsed:>9.0f} | {stats['requests']:>8} | "
+                f"{stats['retries']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
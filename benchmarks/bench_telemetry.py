@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark du coût de l'instrumentation (métriques et spans).
+
+Mesure le coût unitaire des opérations utilisées par le pipeline
+(incrément de compteur avec labels, observation d'histogramme, span
+ouvert puis terminé), collecte activée puis désactivée, ainsi que le
+coût d'un export complet (rendu Prometheus et OTLP/JSON).
+
+Usage:
+    python benchmarks/bench_telemetry.py --iterations 200000
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rag_framework.telemetry import (
+    Telemetry,
+    TelemetrySettings,
+    render_prometheus,
+    to_otel_json,
+)
+
+
+def _ns_per_op(operation: Callable[[], None], iterations: int) -> float:
+    """Durée moyenne d'une opération (ns), meilleure de trois séries."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            operation()
+        best = min(best, (time.perf_counter_ns() - start) / iterations)
+    return best
+
+
+def measure(enabled: bool, iterations: int) -> dict[str, Any]:
+    """Coût unitaire des opérations pour un registre actif ou non."""
+    telemetry = Telemetry(TelemetrySettings(enabled=enabled, max_spans=1000))
+    counter = telemetry.counter("bench_total")
+    histogram = telemetry.histogram("bench_seconds")
+
+    def span() -> None:
+        with telemetry.span("bench", file="doc.pdf"):
+            pass
+
+    results = {
+        "baseline": _ns_per_op(lambda: None, iterations),
+        "counter_inc": _ns_per_op(
+            lambda: counter.inc(status="ok", provider="chromadb"), iterations
+        ),
+        "histogram_observe": _ns_per_op(lambda: histogram.observe(0.042), iterations),
+        "span": _ns_per_op(span, iterations // 4),
+    }
+    return {"enabled": enabled, "ns_per_op": results}
+
+
+def measure_export(spans: int) -> dict[str, float]:
+    """Coût d'un export (ms) avec ``spans`` spans en attente."""
+    telemetry = Telemetry(TelemetrySettings(max_spans=spans))
+    for index in range(spans):
+        with telemetry.span("document.extract", index=index):
+            telemetry.counter("rag_documents_total").inc(status="extracted")
+    start = time.perf_counter()
+    render_prometheus(telemetry)
+    prometheus_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    json.dumps(to_otel_json(telemetry.drain_spans(), telemetry))
+    otel_ms = (time.perf_counter() - start) * 1000
+    return {"spans": spans, "prometheus_ms": prometheus_ms, "otel_json_ms": otel_ms}
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--export-spans", type=int, default=1000)
+    parser.add_argument("--json", action="store_true", help="Sortie JSON brute")
+    args = parser.parse_args()
+
+    results = [measure(True, args.iterations), measure(False, args.iterations)]
+    export = measure_export(args.export_spans)
+    if args.json:
+        print(json.dumps({"operations": results, "export": export}, indent=2))
+        return
+
+    enabled, disabled = (r["ns_per_op"] for r in results)
+    print(f"{'opération':<18} | {'activée (ns)':>12} | {'désactivée (ns)':>15}")
+    print("-" * 51)
+    for name in enabled:
+        print(f"{name:<18} | {enabled[name]:>12.0f} | {disabled[name]:>15.0f}")
+    print(
+        f"\nExport de {export['spans']} spans: "
+        f"Prometheus {export['prometheus_ms']:.2f} ms, "
+        f"OTLP/JSON {export['otel_json_ms']:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark de la file de travail partagée : passage à l'échelle.
+
+N processus workers (simulant N nœuds) vident une file SQLite commune.
+Le pipeline est simulé (latence fixe par document et par lot) : le
+benchmark mesure le débit obtenu par rapport au débit idéal N x 1 worker,
+le surcoût de la file (attribution, baux, métriques) et vérifie
+qu'aucun document n'est traité deux fois.
+
+Usage:
+    python benchmarks/bench_work_queue.py --docs 400 --workers 1 2 4 8
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rag_framework.distributed import (
+    DistributedSettings,
+    DistributedWorker,
+    SQLiteWorkQueue,
+)
+from rag_framework.types import StepData
+
+
+class SimulatedPipeline:
+    """Pipeline simulé : enregistre les documents traités dans un journal."""
+
+    def __init__(self, journal: Path, per_doc_ms: float, per_batch_ms: float) -> None:
+        """Initialise le pipeline simulé."""
+        self.journal = journal
+        self.per_doc_ms = per_doc_ms
+        self.per_batch_ms = per_batch_ms
+
+    def execute(self, input_data: Optional[StepData] = None) -> StepData:
+        """Simule le traitement des documents du lot."""
+        files = list((input_data or {})["monitored_files"])
+        time.sleep((self.per_batch_ms + self.per_doc_ms * len(files)) / 1000.0)
+        with open(self.journal, "a", encoding="utf-8") as f:
+            f.writelines(f"{path}\n" for path in files)
+        return {"extracted_documents": [{"file_path": path} for path in files]}
+
+
+def run_worker(database: str, journal: str, index: int, args: dict[str, Any]) -> None:
+    """Processus worker : vide la file puis s'arrête."""
+    settings = DistributedSettings(
+        database=database,
+        batch_size=args["batch_size"],
+        idle_poll_seconds=0.01,
+        worker_id=f"node-{index}",
+    )
+    queue = SQLiteWorkQueue(database)
+    worker = DistributedWorker(
+        queue,
+        lambda: SimulatedPipeline(
+            Path(journal), args["per_doc_ms"], args["per_batch_ms"]
+        ),
+        settings=settings,
+    )
+    worker.run(drain=True)
+    queue.close()
+
+
+def run(workers: int, args: argparse.Namespace, tmp: Path) -> dict[str, Any]:
+    """Vide une file de ``args.docs`` documents avec ``workers`` processus."""
+    database = tmp / f"queue_{workers}.db"
+    queue = SQLiteWorkQueue(database)
+    queue.enqueue([f"/bench/inbox/doc_{i:06d}.pdf" for i in range(args.docs)])
+
+    journals = [tmp / f"journal_{workers}_{i}.txt" for i in range(workers)]
+    options = {
+        "batch_size": args.batch_size,
+        "per_doc_ms": args.per_doc_ms,
+        "per_batch_ms": args.per_batch_ms,
+    }
+    start = time.perf_counter()
+    processes = [
+        multiprocessing.Process(
+            target=run_worker, args=(str(database), str(journals[i]), i, options)
+        )
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+
+    processed: list[str] = []
+    for journal in journals:
+        if journal.exists():
+            processed.extend(journal.read_text(encoding="utf-8").splitlines())
+    stats = queue.get_stats()
+    queue.close()
+    return {
+        "workers": workers,
+        "seconds": round(elapsed, 3),
+        "docs_per_second": round(args.docs / elapsed, 1),
+        "processed": len(processed),
+        "duplicates": len(processed) - len(set(processed)),
+        "done": stats["counts"]["done"],
+        "per_worker": {k: v["done"] for k, v in stats["workers"].items()},
+    }
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--per-doc-ms", type=float, default=20.0)
+    parser.add_argument("--per-batch-ms", type=float, default=50.0)
+    parser.add_argument("--json", action="store_true", help="Sortie JSON brute")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [run(n, args, Path(tmp)) for n in args.workers]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    baseline = results[0]["docs_per_second"] / results[0]["workers"]
+    print(
+        f"{args.docs} documents, lots de {args.batch_size}, "
+        f"{args.per_doc_ms} ms/doc + {args.per_batch_ms} ms/lot"
+    )
+    print(
+        f"{'workers':>7} | {'durée (s)':>9} | {'docs/s':>7} | {'efficacité':>10} | "
+        f"{'doublons':>8} | répartition"
+    )
+    print("-" * 78)
+    for result in results:
+        efficiency = result["docs_per_second"] / (baseline * result["workers"])
+        print(
+            f"{result['workers']:>7} | {result['seconds']:>9.2f} | "
+            f"{result['docs_per_second']:>7.1f} | {efficiency:>9.0%} | "
+            f"{result['duplicates']:>8} | {sorted(result['per_worker'].values())}"
+        )
+
+
+if __name__ == "__main__":
+    main()
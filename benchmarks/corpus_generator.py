@@ -0,0 +1,643 @@
+#!/usr/bin/env python3
+"""Générateur de corpus synthétiques déterministes pour les benchmarks.
+
+Produit des documents de conformité factices dans les formats traités par
+l'étape 2 :
+
+- ``pdf`` : PDF natif (couche texte) ;
+- ``pdf_scanned`` : PDF scanné (pages image, sans couche texte) ;
+- ``docx``, ``pptx``, ``xlsx``, ``csv``, ``html``, ``md``.
+
+La taille du texte de chaque document suit une loi log-normale (médiane et
+dispersion configurables, bornée) et des données personnelles valides
+(emails, téléphones, IBAN, NIR, cartes) sont insérées avec une densité
+donnée pour 1000 mots.
+
+Le corpus ne dépend que de :class:`CorpusSpec` : chaque document a son
+propre générateur aléatoire (graine ``seed:index``) et les métadonnées
+variables des fichiers (dates, identifiants PDF, horodatage des archives
+zip) sont figées. Deux générations avec la même spécification produisent
+des fichiers identiques octet pour octet ; l'empreinte du manifeste
+permet de le vérifier avant de comparer deux résultats de benchmark.
+
+Usage:
+    python benchmarks/corpus_generator.py /tmp/corpus --documents 40 --seed 42
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import math
+import random
+import re
+import sys
+import unicodedata
+import zipfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rag_framework.exceptions import ValidationError
+from rag_framework.utils.pii_scanner import luhn_valid
+
+FORMATS = ("pdf", "pdf_scanned", "docx", "pptx", "xlsx", "csv", "html", "md")
+
+EXTENSIONS = {
+    "pdf": ".pdf",
+    "pdf_scanned": ".pdf",
+    "docx": ".docx",
+    "pptx": ".pptx",
+    "xlsx": ".xlsx",
+    "csv": ".csv",
+    "html": ".html",
+    "md": ".md",
+}
+
+DEFAULT_FORMAT_WEIGHTS = {
+    "pdf": 3.0,
+    "pdf_scanned": 1.0,
+    "docx": 2.0,
+    "pptx": 1.0,
+    "xlsx": 1.0,
+    "csv": 1.0,
+    "html": 2.0,
+    "md": 2.0,
+}
+
+# Date figée des métadonnées (PDF, Office, entrées zip)
+FIXED_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+WORDS = (
+    "le la les un une des du de et pour dans sur avec sans par conformément "
+    "contrat rapport audit procédure contrôle conformité sécurité données "
+    "traitement responsable sous-traitant risque mesure politique accès "
+    "incident registre analyse impact article annexe direction service "
+    "client fournisseur prestation budget exercice période montant facture "
+    "référence dossier validation revue plan action écart recommandation "
+    "exigence norme système information réseau sauvegarde chiffrement"
+).split()
+
+HEADINGS = (
+    "Objet",
+    "Périmètre",
+    "Références réglementaires",
+    "Constats",
+    "Analyse des risques",
+    "Mesures de sécurité",
+    "Plan d'action",
+    "Recommandations",
+    "Responsabilités",
+    "Suivi et révision",
+)
+
+FIRST_NAMES = ("marie", "jean", "sophie", "pierre", "claire", "nicolas", "julie")
+LAST_NAMES = ("martin", "bernard", "dubois", "thomas", "robert", "richard", "petit")
+
+
+@dataclass
+class CorpusSpec:
+    """Spécification d'un corpus synthétique.
+
+    Attributes:
+        documents: Nombre de documents.
+        seed: Graine du corpus.
+        formats: Poids relatifs des formats (clés de ``FORMATS``).
+        size_median_kb: Médiane de la taille du texte d'un document (Ko).
+        size_sigma: Dispersion de la loi log-normale (0 = taille fixe).
+        size_min_kb: Taille minimale du texte (Ko).
+        size_max_kb: Taille maximale du texte (Ko).
+        pii_per_1000_words: Données personnelles insérées pour 1000 mots.
+        scanned_max_pages: Pages maximales d'un PDF scanné (texte tronqué).
+        scanned_dpi: Résolution des pages scannées.
+    """
+
+    documents: int = 40
+    seed: int = 42
+    formats: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_FORMAT_WEIGHTS)
+    )
+    size_median_kb: float = 8.0
+    size_sigma: float = 0.8
+    size_min_kb: float = 0.5
+    size_max_kb: float = 200.0
+    pii_per_1000_words: float = 2.0
+    scanned_max_pages: int = 2
+    scanned_dpi: int = 100
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "CorpusSpec":
+        """Construit la spécification depuis la section ``corpus`` d'un scénario.
+
+        Args:
+            config: Section ``corpus`` (clés inconnues ignorées).
+
+        Returns:
+            Spécification validée.
+
+        Raises:
+            ValidationError: Si un format est inconnu ou une valeur hors bornes.
+        """
+        known = {k: v for k, v in config.items() if k in cls.__dataclass_fields__}
+        spec = cls(**known)
+        unknown = set(spec.formats) - set(FORMATS)
+        if unknown:
+            raise ValidationError(
+                f"Formats inconnus: {sorted(unknown)}",
+                details={"supported": list(FORMATS)},
+            )
+        if spec.documents < 1 or not any(w > 0 for w in spec.formats.values()):
+            raise ValidationError("Le corpus doit contenir au moins un document")
+        if not 0 < spec.size_min_kb <= spec.size_max_kb:
+            raise ValidationError("Bornes de taille invalides (size_min_kb/max_kb)")
+        if spec.pii_per_1000_words < 0 or spec.size_sigma < 0:
+            raise ValidationError("pii_per_1000_words et size_sigma doivent être >= 0")
+        return spec
+
+
+@dataclass
+class CorpusDocument:
+    """Document généré (entrée du manifeste)."""
+
+    path: str
+    format: str
+    text_chars: int
+    file_bytes: int
+    sha256: str
+    pii: dict[str, int]
+
+
+# ---------------------------------------------------------------------------
+# Texte et données personnelles
+# ---------------------------------------------------------------------------
+
+
+def _luhn_number(rng: random.Random) -> str:
+    while True:
+        digits = "4" + "".join(str(rng.randint(0, 9)) for _ in range(15))
+        if luhn_valid(digits):
+            return " ".join(digits[i : i + 4] for i in range(0, 16, 4))
+
+
+def _iban(rng: random.Random) -> str:
+    bban = "".join(str(rng.randint(0, 9)) for _ in range(23))
+    # FR = 15 27 ; clé = 98 - (BBAN + "FR00") mod 97
+    check = 98 - int(bban + "152700") % 97
+    raw = f"FR{check:02d}{bban}"
+    return " ".join(raw[i : i + 4] for i in range(0, len(raw), 4))
+
+
+def _nir(rng: random.Random) -> str:
+    body = f"{rng.choice('12')}{rng.randint(0, 99):02d}{rng.randint(1, 12):02d}"
+    body += (
+        f"{rng.randint(1, 95):02d}{rng.randint(1, 999):03d}{rng.randint(1, 999):03d}"
+    )
+    return body + f"{97 - int(body) % 97:02d}"
+
+
+PII_GENERATORS: dict[str, Callable[[random.Random], str]] = {
+    "email": lambda rng: (
+        f"{rng.choice(FIRST_NAMES)}.{rng.choice(LAST_NAMES)}"
+        f"{rng.randint(1, 99)}@example.fr"
+    ),
+    "phone_fr": lambda rng: (
+        f"0{rng.randint(1, 7)} "
+        + " ".join(f"{rng.randint(0, 99):02d}" for _ in range(4))
+    ),
+    "iban": _iban,
+    "nir": _nir,
+    "credit_card": _luhn_number,
+}
+
+
+class _TextSource:
+    """Flux de mots d'un document, avec insertion de données personnelles."""
+
+    def __init__(self, rng: random.Random, pii_per_1000_words: float) -> None:
+        self.rng = rng
+        self.pii_rate = pii_per_1000_words / 1000
+        self.pii: dict[str, int] = {}
+        self.chars = 0
+
+    def words(self, count: int) -> str:
+        parts = []
+        for _ in range(count):
+            if self.rng.random() < self.pii_rate:
+                kind = self.rng.choice(list(PII_GENERATORS))
+                self.pii[kind] = self.pii.get(kind, 0) + 1
+                parts.append(PII_GENERATORS[kind](self.rng))
+            else:
+                parts.append(self.rng.choice(WORDS))
+        text = " ".join(parts)
+        self.chars += len(text)
+        return text
+
+    def sentence(self) -> str:
+        return self.words(self.rng.randint(8, 20)).capitalize() + "."
+
+    def paragraph(self) -> str:
+        return " ".join(self.sentence() for _ in range(self.rng.randint(2, 6)))
+
+    def sections(self, target_chars: int) -> list[tuple[str, list[str]]]:
+        """Sections (titre, paragraphes) totalisant ~``target_chars``."""
+        sections: list[tuple[str, list[str]]] = []
+        while self.chars < target_chars:
+            number = len(sections) + 1
+            heading = f"{number}. {HEADINGS[(number - 1) % len(HEADINGS)]}"
+            paragraphs = []
+            for _ in range(self.rng.randint(1, 4)):
+                paragraphs.append(self.paragraph())
+                if self.chars >= target_chars:
+                    break
+            sections.append((heading, paragraphs))
+        return sections
+
+    def records(self, target_chars: int) -> list[list[str]]:
+        """Lignes d'un tableau de suivi totalisant ~``target_chars``."""
+        rows: list[list[str]] = []
+        while self.chars < target_chars:
+            index = len(rows) + 1
+            rows.append(
+                [
+                    f"REF-{index:05d}",
+                    f"2024-{self.rng.randint(1, 12):02d}-{self.rng.randint(1, 28):02d}",
+                    f"{self.rng.randint(100, 99999)},{self.rng.randint(0, 99):02d}",
+                    self.words(self.rng.randint(3, 6)),
+                    self.words(self.rng.randint(6, 14)),
+                ]
+            )
+        return rows
+
+
+RECORD_HEADER = ["reference", "date", "montant", "objet", "commentaire"]
+
+
+# ---------------------------------------------------------------------------
+# Écriture par format
+# ---------------------------------------------------------------------------
+
+_DCTERMS_DATE = re.compile(rb"(<dcterms:(?:created|modified)[^>]*>)[^<]*(</dcterms:)")
+
+
+def _normalize_zip(path: Path) -> None:
+    """Réécrit une archive Office avec des horodatages figés.
+
+    openpyxl renseigne la date de modification à l'enregistrement : elle
+    est remplacée dans ``docProps/core.xml``.
+    """
+    with zipfile.ZipFile(path) as source:
+        entries = [(info.filename, source.read(info)) for info in source.infolist()]
+    stamp = FIXED_DATE.strftime("%Y-%m-%dT%H:%M:%SZ").encode()
+    entries = [
+        (name, _DCTERMS_DATE.sub(rb"\g<1>" + stamp + rb"\g<2>", payload))
+        if name == "docProps/core.xml"
+        else (name, payload)
+        for name, payload in entries
+    ]
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as target:
+        for name, payload in entries:
+            info = zipfile.ZipInfo(name, date_time=FIXED_DATE.timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            target.writestr(info, payload)
+
+
+def _pages(sections: list[tuple[str, list[str]]], page_chars: int) -> list[str]:
+    """Regroupe les blocs de texte en pages d'au plus ~``page_chars``."""
+    pages: list[str] = []
+    current: list[str] = []
+    size = 0
+    for heading, paragraphs in sections:
+        for block in (heading, *paragraphs):
+            if current and size + len(block) > page_chars:
+                pages.append("\n\n".join(current))
+                current, size = [], 0
+            current.append(block)
+            size += len(block)
+    if current:
+        pages.append("\n\n".join(current))
+    return pages
+
+
+def _pymupdf() -> Any:  # noqa: ANN401
+    """Module PyMuPDF, vu comme ``Any`` : ses fonctions ne sont pas annotées."""
+    import pymupdf
+
+    return pymupdf
+
+
+def _save_pdf(document: Any, path: Path, title: str) -> None:  # noqa: ANN401
+    stamp = FIXED_DATE.strftime("D:%Y%m%d%H%M%S")
+    document.set_metadata(
+        {
+            "title": title,
+            "producer": "rag-benchmark",
+            "creator": "rag-benchmark",
+            "creationDate": stamp,
+            "modDate": stamp,
+        }
+    )
+    document.save(path, garbage=3, deflate=True, no_new_id=True)
+    document.close()
+
+
+def _write_pdf(path: Path, text: _TextSource, target: int, spec: CorpusSpec) -> None:
+    pymupdf = _pymupdf()
+    document = pymupdf.open()
+    for page_text in _pages(text.sections(target), page_chars=3000):
+        page = document.new_page()
+        box = pymupdf.Rect(50, 50, page.rect.x1 - 50, page.rect.y1 - 50)
+        page.insert_textbox(box, page_text, fontsize=9)
+    _save_pdf(document, path, path.stem)
+
+
+def _strip_accents(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _write_scanned_pdf(
+    path: Path, text: _TextSource, target: int, spec: CorpusSpec
+) -> None:
+    from PIL import Image, ImageDraw, ImageFont
+
+    pymupdf = _pymupdf()
+
+    width, height = int(8.27 * spec.scanned_dpi), int(11.69 * spec.scanned_dpi)
+    font_size = max(10, spec.scanned_dpi // 7)
+    font = ImageFont.load_default(size=font_size)
+    chars_per_line = int(width * 0.8 / (font_size * 0.55))
+    lines_per_page = int(height * 0.85 / (font_size * 1.4))
+    page_chars = chars_per_line * lines_per_page * 3 // 4
+
+    pages = _pages(text.sections(target), page_chars)[: spec.scanned_max_pages]
+    document = pymupdf.open()
+    for page_text in pages:
+        image = Image.new("L", (width, height), 255)
+        draw = ImageDraw.Draw(image)
+        y = int(height * 0.07)
+        # La police embarquée par Pillow n'a pas de glyphes accentués ; une
+        # police système rendrait le corpus dépendant de la machine
+        for block in _strip_accents(page_text).split("\n\n"):
+            words, line = block.split(), ""
+            for word in words:
+                if len(line) + len(word) + 1 > chars_per_line:
+                    draw.text((int(width * 0.1), y), line, fill=20, font=font)
+                    y += int(font_size * 1.4)
+                    line = ""
+                line = f"{line} {word}".strip()
+            draw.text((int(width * 0.1), y), line, fill=20, font=font)
+            y += int(font_size * 2.2)
+        # Défauts de numérisation : grain et légère inclinaison
+        rng = text.rng
+        for _ in range(width * height // 2000):
+            draw.point((rng.randrange(width), rng.randrange(height)), fill=90)
+        image = image.rotate(rng.uniform(-1.0, 1.0), fillcolor=255)
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=75)
+        page = document.new_page()
+        page.insert_image(page.rect, stream=buffer.getvalue())
+    _save_pdf(document, path, path.stem)
+
+
+def _write_docx(path: Path, text: _TextSource, target: int, spec: CorpusSpec) -> None:
+    import docx
+
+    document = docx.Document()
+    document.add_heading(f"Rapport {path.stem}", 0)
+    for number, (heading, paragraphs) in enumerate(text.sections(target), 1):
+        document.add_heading(heading, level=1)
+        for paragraph in paragraphs:
+            document.add_paragraph(paragraph)
+        if number % 4 == 0:
+            rows = text.records(text.chars + 300)
+            table = document.add_table(rows=1, cols=len(RECORD_HEADER))
+            for cell, label in zip(table.rows[0].cells, RECORD_HEADER):
+                cell.text = label
+            for row in rows:
+                for cell, value in zip(table.add_row().cells, row):
+                    cell.text = value
+    properties = document.core_properties
+    properties.author = properties.last_modified_by = "rag-benchmark"
+    properties.created = properties.modified = FIXED_DATE
+    properties.revision = 1
+    document.save(str(path))
+    _normalize_zip(path)
+
+
+def _write_pptx(path: Path, text: _TextSource, target: int, spec: CorpusSpec) -> None:
+    import pptx
+
+    presentation = pptx.Presentation()
+    layout = presentation.slide_layouts[1]  # Titre et contenu
+    for heading, paragraphs in text.sections(target):
+        for paragraph in paragraphs:
+            slide = presentation.slides.add_slide(layout)
+            slide.shapes.title.text = heading
+            body = slide.placeholders[1].text_frame
+            sentences = [s for s in paragraph.split(". ") if s]
+            body.text = sentences[0]
+            for sentence in sentences[1:]:
+                body.add_paragraph().text = sentence
+    properties = presentation.core_properties
+    properties.author = properties.last_modified_by = "rag-benchmark"
+    properties.created = properties.modified = FIXED_DATE
+    properties.revision = 1
+    presentation.save(str(path))
+    _normalize_zip(path)
+
+
+def _write_xlsx(path: Path, text: _TextSource, target: int, spec: CorpusSpec) -> None:
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Suivi"
+    sheet.append(RECORD_HEADER)
+    for row in text.records(target):
+        sheet.append(row)
+    workbook.properties.creator = "rag-benchmark"
+    workbook.properties.created = FIXED_DATE
+    workbook.properties.modified = FIXED_DATE
+    workbook.save(path)
+    _normalize_zip(path)
+
+
+def _write_csv(path: Path, text: _TextSource, target: int, spec: CorpusSpec) -> None:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(RECORD_HEADER)
+        writer.writerows(text.records(target))
+
+
+def _write_html(path: Path, text: _TextSource, target: int, spec: CorpusSpec) -> None:
+    parts = [
+        '<!DOCTYPE html><html lang="fr"><head><meta charset="utf-8">',
+        f"<title>{path.stem}</title></head><body>",
+        "<nav>" + "".join(f'<a href="/s/{i}">Section {i}</a>' for i in range(8)),
+        f"</nav><main><h1>Procédure {path.stem}</h1>",
+    ]
+    for number, (heading, paragraphs) in enumerate(text.sections(target), 1):
+        parts.append(f"<section><h2>{heading}</h2>")
+        parts.extend(f"<p>{paragraph}</p>" for paragraph in paragraphs)
+        if number % 3 == 0:
+            rows = text.records(text.chars + 300)
+            parts.append(
+                "<table><tr>"
+                + "".join(f"<th>{label}</th>" for label in RECORD_HEADER)
+                + "</tr>"
+                + "".join(
+                    "<tr>" + "".join(f"<td>{v}</td>" for v in row) + "</tr>"
+                    for row in rows
+                )
+                + "</table>"
+            )
+        parts.append("</section>")
+    parts.append("</main><footer>Document synthétique</footer></body></html>")
+    path.write_text("\n".join(parts), encoding="utf-8")
+
+
+def _write_markdown(
+    path: Path, text: _TextSource, target: int, spec: CorpusSpec
+) -> None:
+    lines = [f"# Politique {path.stem}", ""]
+    for number, (heading, paragraphs) in enumerate(text.sections(target), 1):
+        lines += [f"## {heading}", ""]
+        for paragraph in paragraphs:
+            lines += [paragraph, ""]
+        if number % 3 == 0:
+            lines += [f"- {text.sentence()}" for _ in range(3)] + [""]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+WRITERS: dict[str, Callable[[Path, _TextSource, int, CorpusSpec], None]] = {
+    "pdf": _write_pdf,
+    "pdf_scanned": _write_scanned_pdf,
+    "docx": _write_docx,
+    "pptx": _write_pptx,
+    "xlsx": _write_xlsx,
+    "csv": _write_csv,
+    "html": _write_html,
+    "md": _write_markdown,
+}
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+
+def _target_chars(rng: random.Random, spec: CorpusSpec) -> int:
+    size_kb = spec.size_median_kb * math.exp(rng.gauss(0.0, spec.size_sigma))
+    return int(1024 * min(max(size_kb, spec.size_min_kb), spec.size_max_kb))
+
+
+def generate_corpus(spec: CorpusSpec, output_dir: Path) -> dict[str, Any]:
+    """Génère le corpus et son manifeste (``manifest.json``).
+
+    Args:
+        spec: Spécification du corpus.
+        output_dir: Répertoire de sortie (créé si absent).
+
+    Returns:
+        Manifeste : spécification, documents, totaux et empreinte.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    formats = [f for f, weight in spec.formats.items() if weight > 0]
+    weights = [spec.formats[f] for f in formats]
+    picker = random.Random(spec.seed)
+
+    documents: list[CorpusDocument] = []
+    for index in range(spec.documents):
+        doc_format = picker.choices(formats, weights)[0]
+        rng = random.Random(f"{spec.seed}:{index}")
+        target = _target_chars(rng, spec)
+        path = output_dir / f"doc_{index:04d}_{doc_format}{EXTENSIONS[doc_format]}"
+        text = _TextSource(rng, spec.pii_per_1000_words)
+        WRITERS[doc_format](path, text, target, spec)
+        payload = path.read_bytes()
+        documents.append(
+            CorpusDocument(
+                path=path.name,
+                format=doc_format,
+                text_chars=text.chars,
+                file_bytes=len(payload),
+                sha256=hashlib.sha256(payload).hexdigest(),
+                pii=dict(sorted(text.pii.items())),
+            )
+        )
+
+    fingerprint = hashlib.sha256()
+    for document in documents:
+        fingerprint.update(f"{document.path}:{document.sha256}\n".encode())
+    by_format: dict[str, int] = {}
+    pii_totals: dict[str, int] = {}
+    for document in documents:
+        by_format[document.format] = by_format.get(document.format, 0) + 1
+        for kind, count in document.pii.items():
+            pii_totals[kind] = pii_totals.get(kind, 0) + count
+
+    manifest = {
+        "spec": asdict(spec),
+        "fingerprint": fingerprint.hexdigest(),
+        "totals": {
+            "documents": len(documents),
+            "file_bytes": sum(d.file_bytes for d in documents),
+            "text_chars": sum(d.text_chars for d in documents),
+            "formats": dict(sorted(by_format.items())),
+            "pii": dict(sorted(pii_totals.items())),
+        },
+        "documents": [asdict(d) for d in documents],
+    }
+    (output_dir / "manifest.json").write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    return manifest
+
+
+def main() -> None:
+    """Point d'entrée : génère un corpus dans le répertoire donné."""
+    parser = argparse.ArgumentParser(description="Générateur de corpus synthétiques")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--documents", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--size-median-kb", type=float, default=8.0)
+    parser.add_argument("--size-sigma", type=float, default=0.8)
+    parser.add_argument("--pii-density", type=float, default=2.0)
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        default=None,
+        help="Formats au format nom=poids (ex. pdf=3 docx=1)",
+    )
+    args = parser.parse_args()
+
+    config: dict[str, Any] = {
+        "documents": args.documents,
+        "seed": args.seed,
+        "size_median_kb": args.size_median_kb,
+        "size_sigma": args.size_sigma,
+        "pii_per_1000_words": args.pii_density,
+    }
+    if args.formats:
+        config["formats"] = {
+            name: float(weight)
+            for name, weight in (item.split("=") for item in args.formats)
+        }
+    manifest = generate_corpus(CorpusSpec.from_config(config), args.output)
+    totals = manifest["totals"]
+    print(
+        f"{totals['documents']} documents, {totals['file_bytes'] / 1024 / 1024:.1f} Mo"
+        f" ({totals['text_chars'] / 1024:.0f} Ko de texte) dans {args.output}"
+    )
+    print(f"Formats: {totals['formats']}")
+    print(f"PII: {totals['pii']}")
+    print(f"Empreinte: {manifest['fingerprint']}")
+
+
+if __name__ == "__main__":
+    main()
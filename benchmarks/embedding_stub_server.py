@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Serveur HTTP stub imitant les providers d'embeddings.
+
+Expose les endpoints utilisés par ``RemoteEmbeddingClient`` :
+
+- ``POST /v1/embeddings`` (OpenAI-compatible : ``{"model", "input": [...]}``)
+- ``POST /api/embed`` (Ollama : ``{"model", "input": [...]}``)
+- ``POST /hf`` (Hugging Face feature-extraction : ``{"inputs": [...]}``)
+
+La latence par requête et par texte, la taille de batch maximale et un taux
+de réponses 429/503 sont configurables pour mesurer le débit du client.
+
+Usage:
+    python benchmarks/embedding_stub_server.py --port 8765 --latency-ms 50
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+
+class StubEmbeddingServer:
+    """Serveur d'embeddings factice exécuté dans un thread."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        dimensions: int = 32,
+        latency_ms: float = 0.0,
+        per_text_latency_ms: float = 0.0,
+        max_batch_size: Optional[int] = None,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialise le serveur.
+
+        Args:
+            host: Adresse d'écoute.
+            port: Port d'écoute (0 = port libre choisi par l'OS).
+            dimensions: Dimension des vecteurs renvoyés.
+            latency_ms: Latence fixe ajoutée à chaque requête.
+            per_text_latency_ms: Latence ajoutée par texte du batch.
+            max_batch_size: Taille de batch au-delà de laquelle on renvoie 413.
+            error_rate: Proportion de requêtes répondant 429 ou 503.
+            seed: Graine du tirage des erreurs (reproductibilité).
+        """
+        self.dimensions = dimensions
+        self.latency_ms = latency_ms
+        self.per_text_latency_ms = per_text_latency_ms
+        self.max_batch_size = max_batch_size
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # Compteurs observables par les tests et le benchmark
+        self.request_count = 0
+        self.error_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL de base du serveur (sans suffixe de protocole)."""
+        host, port = self.httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubEmbeddingServer":
+        """Démarre le serveur dans un thread daemon."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Arrête le serveur."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StubEmbeddingServer":
+        """Démarre le serveur (context manager)."""
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Arrête le serveur (context manager)."""
+        self.stop()
+
+    def vector_for(self, text: str) -> list[float]:
+        """Vecteur déterministe dérivé du hash du texte."""
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [(digest[i % len(digest)] - 128) / 128.0 for i in range(self.dimensions)]
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+                return
+
+            def _send_json(self, status: int, body: Any) -> None:  # noqa: ANN401
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+
+                with server._lock:
+                    server.request_count += 1
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+
+                try:
+                    texts = request.get("input", request.get("inputs", []))
+                    if isinstance(texts, str):
+                        texts = [texts]
+
+                    delay = server.latency_ms + server.per_text_latency_ms * len(texts)
+                    time.sleep(delay / 1000.0)
+
+                    if server._should_fail():
+                        with server._lock:
+                            server.error_count += 1
+                        status = 429 if server.error_count % 2 else 503
+                        self._send_json(status, {"error": "stub failure"})
+                        return
+
+                    if server.max_batch_size and len(texts) > server.max_batch_size:
+                        self._send_json(413, {"error": "batch too large"})
+                        return
+
+                    vectors = [server.vector_for(t) for t in texts]
+                    if self.path.endswith("/embeddings"):
+                        self._send_json(
+                            200,
+                            {
+                                "object": "list",
+                                "data": [
+                                    {"object": "embedding", "index": i, "embedding": v}
+                                    for i, v in enumerate(vectors)
+                                ],
+                                "model": request.get("model"),
+                            },
+                        )
+                    elif self.path.endswith("/api/embed"):
+                        self._send_json(200, {"embeddings": vectors})
+                    else:
+                        self._send_json(200, vectors)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+        return Handler
+
+
+def main() -> None:
+    """Lance le serveur stub au premier plan."""
+    parser = argparse.ArgumentParser(description="Serveur stub d'embeddings")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--per-text-latency-ms", type=float, default=0.5)
+    parser.add_argument("--max-batch-size", type=int, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StubEmbeddingServer(
+        host=args.host,
+        port=args.port,
+        dimensions=args.dimensions,
+        latency_ms=args.latency_ms,
+        per_text_latency_ms=args.per_text_latency_ms,
+        max_batch_size=args.max_batch_size,
+        error_rate=args.error_rate,
+    )
+    print(f"Serveur stub d'embeddings sur {server.base_url} (Ctrl+C pour arrêter)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
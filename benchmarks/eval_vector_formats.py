@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Évaluation rappel/taille des formats compacts de vecteurs.
+
+Compare, sur un jeu de requêtes mis de côté, le rappel@k de chaque format
+(float16, int8, troncature Matryoshka) par rapport à la recherche exacte en
+float32 sur toutes les dimensions, ainsi que la taille par vecteur.
+
+Sources acceptées pour le corpus et les requêtes :
+- fichier ``.npy`` (matrice n x d) ;
+- fichier ``.json`` : liste de vecteurs ou liste de chunks (clé "embedding"),
+  par exemple un export des chunks normalisés ;
+- ``--synthetic N D`` : corpus aléatoire reproductible.
+
+Sans ``--queries``, une fraction ``--holdout`` du corpus est retirée et
+utilisée comme requêtes.
+
+Usage:
+    python benchmarks/eval_vector_formats.py --synthetic 20000 1024 --truncate 256
+    python benchmarks/eval_vector_formats.py --corpus chunks.json --holdout 0.05
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rag_framework.utils.vector_codec import (
+    VectorFormat,
+    l2_normalize,
+    quantize_int8,
+    to_matrix,
+    truncate,
+)
+
+
+def load_vectors(path: Path) -> NDArray[np.float32]:
+    """Charge une matrice de vecteurs depuis un fichier .npy ou .json."""
+    if path.suffix == ".npy":
+        return to_matrix(np.load(path))
+
+    with open(path, encoding="utf-8") as f:
+        content = json.load(f)
+    if isinstance(content, dict):
+        content = content.get("chunks", [])
+    vectors = [
+        item["embedding"] if isinstance(item, dict) else item for item in content
+    ]
+    return to_matrix(vectors)
+
+
+def encode(matrix: NDArray[np.float32], fmt: VectorFormat) -> NDArray[np.float32]:
+    """Applique un format puis reconstruit les vecteurs tels que recherchés."""
+    matrix = l2_normalize(truncate(matrix, fmt.truncate_dim))
+    if fmt.dtype == "int8":
+        return quantize_int8(matrix).dequantize()
+    return matrix.astype(fmt.dtype).astype(np.float32)
+
+
+def top_k(
+    corpus: NDArray[np.float32], queries: NDArray[np.float32], k: int
+) -> NDArray[np.int64]:
+    """Indices des k plus proches voisins (produit scalaire) par requête."""
+    scores = queries @ corpus.T
+    k = min(k, corpus.shape[0])
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.take_along_axis(scores, candidates, axis=1).argsort(axis=1)[:, ::-1]
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def recall_at_k(truth: NDArray[np.int64], found: NDArray[np.int64]) -> float:
+    """Proportion moyenne des vrais k voisins retrouvés."""
+    hits = sum(len(set(t) & set(f)) for t, f in zip(truth.tolist(), found.tolist()))
+    return hits / truth.size
+
+
+def evaluate(
+    corpus: NDArray[np.float32],
+    queries: NDArray[np.float32],
+    formats: list[VectorFormat],
+    k: int,
+) -> list[dict[str, Any]]:
+    """Évalue chaque format par rapport à la recherche exacte float32.
+
+    Args:
+        corpus: Vecteurs du corpus (n, d).
+        queries: Vecteurs des requêtes (q, d).
+        formats: Formats à évaluer.
+        k: Nombre de voisins.
+
+    Returns:
+        Une ligne de résultats par format.
+    """
+    dimensions = corpus.shape[1]
+    truth = top_k(l2_normalize(corpus), l2_normalize(queries), k)
+    reference_size = VectorFormat(dtype="float32").bytes_per_vector(dimensions)
+
+    results = []
+    for fmt in formats:
+        # Les requêtes restent en flottant (seul le corpus est stocké compressé)
+        query_format = VectorFormat(dtype="float32", truncate_dim=fmt.truncate_dim)
+        found = top_k(encode(corpus, fmt), encode(queries, query_format), k)
+        size = fmt.bytes_per_vector(dimensions)
+        results.append(
+            {
+                "dtype": fmt.dtype,
+                "dimensions": min(dimensions, fmt.truncate_dim or dimensions),
+                "bytes_per_vector": size,
+                "compression": reference_size / size,
+                f"recall@{k}": recall_at_k(truth, found),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Point d'entrée de l'outil d'évaluation."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, help="Vecteurs du corpus (.npy/.json)")
+    parser.add_argument("--queries", type=Path, help="Requêtes (.npy/.json)")
+    parser.add_argument(
+        "--synthetic", type=int, nargs=2, metavar=("N", "D"), help="Corpus aléatoire"
+    )
+    parser.add_argument("--holdout", type=float, default=0.02)
+    parser.add_argument("--truncate", type=int, nargs="*", default=[])
+    parser.add_argument("--dtypes", nargs="+", default=["float32", "float16", "int8"])
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Écrit les résultats en JSON")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    if args.synthetic:
+        n, d = args.synthetic
+        corpus = rng.standard_normal((n, d), dtype=np.float32)
+    elif args.corpus:
+        corpus = load_vectors(args.corpus)
+    else:
+        parser.error("--corpus ou --synthetic requis")
+
+    queries: Optional[NDArray[np.float32]] = None
+    if args.queries:
+        queries = load_vectors(args.queries)
+    else:
+        # Requêtes mises de côté : retirées du corpus pour éviter l'auto-match
+        n_queries = max(1, int(corpus.shape[0] * args.holdout))
+        permutation = rng.permutation(corpus.shape[0])
+        queries = corpus[permutation[:n_queries]]
+        corpus = corpus[permutation[n_queries:]]
+
+    formats = [
+        VectorFormat(dtype=dtype, truncate_dim=dims)
+        for dims in [None, *args.truncate]
+        for dtype in args.dtypes
+    ]
+    results = evaluate(corpus, queries, formats, args.k)
+
+    print(
+        f"Corpus: {corpus.shape[0]} x {corpus.shape[1]}, "
+        f"requêtes: {queries.shape[0]}, k={args.k}"
+    )
+    print(f"{'dtype':>8} | {'dims':>5} | {'octets':>7} | {'ratio':>6} | {'rappel':>6}")
+    print("-" * 46)
+    for row in results:
+        print(
+            f"{row['dtype']:>8} | {row['dimensions']:>5} | "
+            f"{row['bytes_per_vector']:>7} | {row['compression']:>5.1f}x | "
+            f"{row[f'recall@{args.k}']:>6.3f}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Serveur HTTP stub imitant un LLM OpenAI-compatible.
+
+Expose ``POST /v1/chat/completions``, utilisé par les clients créés par
+``get_llm_client`` (enrichissement, audit, chunking guidé). La réponse est
+déterministe et adaptée au prompt reçu (niveau de sensibilité, type de
+document, frameworks, tags, résumé), pour que les étapes suivent le même
+chemin de code qu'avec un vrai modèle. La latence fixe et par token généré
+est configurable, de même qu'un taux de réponses 429.
+
+Usage:
+    python benchmarks/llm_stub_server.py --port 8766 --latency-ms 50
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+# Réponses par famille de prompt (premier mot-clé trouvé dans le prompt)
+CANNED_ANSWERS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("sensibilité", ("public", "interne", "confidentiel", "secret")),
+    (
+        "type de document",
+        ("contrat", "rapport_audit", "politique_interne", "procedure"),
+    ),
+    ("frameworks", ("RGPD", "ISO27001", "RGPD, NIS2", "SOC2")),
+    ("tags", ("conformité, sécurité, audit", "données personnelles, risque")),
+)
+
+
+class StubLLMServer:
+    """Serveur LLM factice exécuté dans un thread."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        per_token_latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialise le serveur.
+
+        Args:
+            host: Adresse d'écoute.
+            port: Port d'écoute (0 = port libre choisi par l'OS).
+            latency_ms: Latence fixe ajoutée à chaque requête.
+            per_token_latency_ms: Latence ajoutée par token généré.
+            error_rate: Proportion de requêtes répondant 429.
+            seed: Graine du tirage des erreurs (reproductibilité).
+        """
+        self.latency_ms = latency_ms
+        self.per_token_latency_ms = per_token_latency_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # Compteurs observables par les tests et le benchmark
+        self.request_count = 0
+        self.error_count = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL de base du serveur (sans suffixe de protocole)."""
+        host, port = self.httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubLLMServer":
+        """Démarre le serveur dans un thread daemon."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Arrête le serveur."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        """Démarre le serveur (context manager)."""
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Arrête le serveur (context manager)."""
+        self.stop()
+
+    def answer_for(self, prompt: str, max_tokens: int) -> str:
+        """Réponse déterministe au prompt (mot-clé reconnu ou résumé)."""
+        digest = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest(), 16)
+        lowered = prompt.lower()
+        for keyword, answers in CANNED_ANSWERS:
+            if keyword in lowered:
+                return answers[digest % len(answers)]
+        # Résumé extractif : début du texte soumis, borné par max_tokens
+        words = prompt.split()[-200:]
+        return " ".join(words[: max(1, min(max_tokens, 60))])
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+                return
+
+            def _send_json(self, status: int, body: Any) -> None:  # noqa: ANN401
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                with server._lock:
+                    server.request_count += 1
+
+                if not self.path.endswith("/chat/completions"):
+                    self._send_json(404, {"error": f"endpoint inconnu: {self.path}"})
+                    return
+                if server._should_fail():
+                    with server._lock:
+                        server.error_count += 1
+                    self._send_json(429, {"error": {"message": "429 rate limit"}})
+                    return
+
+                prompt = "\n".join(
+                    str(message.get("content", ""))
+                    for message in request.get("messages", [])
+                )
+                answer = server.answer_for(
+                    prompt, int(request.get("max_tokens") or 256)
+                )
+                # Estimation grossière : ~4 caractères par token
+                prompt_tokens = max(1, len(prompt) // 4)
+                completion_tokens = max(1, len(answer) // 4)
+                with server._lock:
+                    server.prompt_tokens += prompt_tokens
+                    server.completion_tokens += completion_tokens
+
+                delay = (
+                    server.latency_ms + server.per_token_latency_ms * completion_tokens
+                )
+                time.sleep(delay / 1000.0)
+                self._send_json(
+                    200,
+                    {
+                        "id": f"chatcmpl-stub-{server.request_count}",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": request.get("model"),
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": answer},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": {
+                            "prompt_tokens": prompt_tokens,
+                            "completion_tokens": completion_tokens,
+                            "total_tokens": prompt_tokens + completion_tokens,
+                        },
+                    },
+                )
+
+        return Handler
+
+
+def main() -> None:
+    """Lance le serveur stub au premier plan."""
+    parser = argparse.ArgumentParser(description="Serveur stub LLM")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--per-token-latency-ms", type=float, default=2.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StubLLMServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        per_token_latency_ms=args.per_token_latency_ms,
+        error_rate=args.error_rate,
+    )
+    print(f"Serveur stub LLM sur {server.base_url} (Ctrl+C pour arrêter)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
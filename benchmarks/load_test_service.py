@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Test de charge du service d'ingestion (``rag-pipeline --serve``).
+
+N clients concurrents soumettent des documents (``POST /documents``),
+respectent les refus (503 + ``Retry-After``) puis interrogent le statut de
+leur travail jusqu'à sa fin. Mesures :
+
+- débit soutenu (documents terminés par seconde, de la première soumission
+  à la dernière fin de travail) ;
+- latence des travaux vue du client (soumission acceptée → fin), p50/p99 ;
+- nombre de refus pour file pleine ;
+- statistiques du service (``GET /stats``).
+
+Sans ``--url``, le service est démarré dans le processus, avec un pipeline
+simulé (``--pipeline simulated``, latence fixe par fichier : mesure du
+surcoût du service et de la file) ou le vrai pipeline (``--pipeline real``,
+configuration de ``--config-dir``).
+
+Usage:
+    python benchmarks/load_test_service.py --docs 500 --clients 16
+    python benchmarks/load_test_service.py --pipeline real --docs 50
+    python benchmarks/load_test_service.py --url http://127.0.0.1:8080
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Optional
+
+# Ajouter le répertoire racine au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rag_framework.service import IngestionService, ServiceSettings
+from rag_framework.types import StepData
+
+ROOT = Path(__file__).resolve().parent.parent
+
+WORDS = (
+    "audit conformité contrôle risque procédure rapport politique sécurité "
+    "données traitement registre incident mesure responsable exigence"
+).split()
+
+
+class SimulatedPipeline:
+    """Pipeline simulé : latence fixe par fichier, un document par fichier."""
+
+    def __init__(self, per_file_ms: float) -> None:
+        """Initialise le pipeline simulé."""
+        self.per_file_ms = per_file_ms
+        self.last_timings: dict[str, Any] = {}
+
+    def execute(self, input_data: Optional[StepData] = None) -> StepData:
+        """Simule le traitement des fichiers fournis."""
+        files = list((input_data or {})["monitored_files"])
+        start = time.perf_counter()
+        time.sleep(self.per_file_ms * len(files) / 1000.0)
+        elapsed = time.perf_counter() - start
+        self.last_timings = {"wall_clock_seconds": elapsed, "steps": {}}
+        return {"extracted_documents": [{"file_path": f} for f in files]}
+
+
+def _call(
+    url: str, data: Optional[bytes] = None, method: str = "GET", token: str = ""
+) -> tuple[int, dict[str, str], Any]:
+    request = urllib.request.Request(url, data=data, method=method)
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status, dict(response.headers), json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), json.loads(e.read() or b"{}")
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def run_load(
+    base_url: str,
+    docs: int,
+    clients: int,
+    doc_kb: int,
+    token: str = "",
+    poll_interval: float = 0.01,
+    max_retry_wait: float = 1.0,
+) -> dict[str, Any]:
+    """Soumet ``docs`` documents avec ``clients`` clients concurrents.
+
+    Args:
+        base_url: URL du service.
+        docs: Nombre de documents.
+        clients: Nombre de clients concurrents.
+        doc_kb: Taille approximative de chaque document.
+        token: Jeton d'accès (si le service en exige un).
+        poll_interval: Intervalle d'interrogation du statut.
+        max_retry_wait: Attente maximale après un refus (plafonne
+            ``Retry-After``).
+
+    Returns:
+        Mesures du test de charge.
+    """
+    rng = random.Random(0)
+    bodies = [
+        " ".join(rng.choice(WORDS) for _ in range(doc_kb * 100)).encode("utf-8")
+        for _ in range(min(docs, 32))
+    ]
+    lock = threading.Lock()
+    next_doc = [0]
+    latencies: list[float] = []
+    outcome = {"succeeded": 0, "failed": 0, "rejected": 0}
+    finished_at: list[float] = []
+
+    def client() -> None:
+        while True:
+            with lock:
+                index = next_doc[0]
+                next_doc[0] += 1
+            if index >= docs:
+                return
+            body = bodies[index % len(bodies)]
+            while True:
+                status, headers, job = _call(
+                    f"{base_url}/documents?filename=load_{index}.txt",
+                    body,
+                    "POST",
+                    token,
+                )
+                if status != 503:
+                    break
+                with lock:
+                    outcome["rejected"] += 1
+                time.sleep(min(float(headers.get("Retry-After", 1)), max_retry_wait))
+            if status != 202:
+                raise RuntimeError(f"Soumission refusée ({status}): {job}")
+            accepted = time.perf_counter()
+            while job["status"] not in {"succeeded", "failed"}:
+                time.sleep(poll_interval)
+                _, _, job = _call(f"{base_url}/jobs/{job['id']}", token=token)
+            done = time.perf_counter()
+            with lock:
+                outcome[job["status"]] += 1
+                latencies.append(done - accepted)
+                finished_at.append(done)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = (max(finished_at) if finished_at else time.perf_counter()) - start
+
+    completed = outcome["succeeded"] + outcome["failed"]
+    return {
+        "docs": docs,
+        "clients": clients,
+        "elapsed_seconds": round(elapsed, 3),
+        "docs_per_second": round(completed / elapsed, 2) if elapsed else 0.0,
+        "latency_p50_s": round(_percentile(latencies, 0.50), 4),
+        "latency_p99_s": round(_percentile(latencies, 0.99), 4),
+        **outcome,
+        "service": _call(f"{base_url}/stats", token=token)[2],
+    }
+
+
+def main() -> None:
+    """Point d'entrée du test de charge."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=None, help="Service déjà démarré")
+    parser.add_argument("--token", default="", help="Jeton d'accès du service")
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--doc-kb", type=int, default=4)
+    parser.add_argument(
+        "--pipeline", choices=["simulated", "real"], default="simulated"
+    )
+    parser.add_argument(
+        "--per-file-ms", type=float, default=5.0, help="Latence du pipeline simulé"
+    )
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue-size", type=int, default=32)
+    parser.add_argument("--config-dir", type=Path, default=ROOT / "config")
+    parser.add_argument("--json", action="store_true", help="Sortie JSON brute")
+    args = parser.parse_args()
+
+    if args.url:
+        report = run_load(args.url, args.docs, args.clients, args.doc_kb, args.token)
+    else:
+        if args.pipeline == "real":
+            from rag_framework.pipeline import RAGPipeline
+
+            def factory() -> Any:  # noqa: ANN401
+                return RAGPipeline(config_dir=args.config_dir)
+
+        else:
+
+            def factory() -> Any:  # noqa: ANN401
+                return SimulatedPipeline(args.per_file_ms)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = ServiceSettings(
+                port=0,
+                workers=args.workers,
+                queue_size=args.queue_size,
+                retry_after_seconds=1,
+                upload_dir=str(Path(tmp) / "uploads"),
+                allowed_roots=[tmp],
+                token_env=None,
+            )
+            with IngestionService(factory, settings) as service:
+                report = run_load(
+                    service.base_url,
+                    args.docs,
+                    args.clients,
+                    args.doc_kb,
+                    max_retry_wait=0.05,
+                )
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+    print(
+        f"{report['docs']} documents, {report['clients']} clients: "
+        f"{report['docs_per_second']} docs/s soutenus "
+        f"({report['elapsed_seconds']}s)"
+    )
+    print(
+        f"Latence des travaux: p50 {report['latency_p50_s'] * 1000:.1f} ms, "
+        f"p99 {report['latency_p99_s'] * 1000:.1f} ms"
+    )
+    print(
+        f"Succès: {report['succeeded']}, échecs: {report['failed']}, "
+        f"refus (file pleine): {report['rejected']}"
+    )
+    service_stats = report["service"]
+    print(
+        f"Service: file {service_stats['queued']}/{service_stats['queue_size']}, "
+        f"attente p99 {service_stats['queue_wait_p99_s']}s, "
+        f"latence p99 {service_stats['latency_p99_s']}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,33 @@
-"""Framework RAG modulaire pour l'audit et la conformité réglementaire."""
+"""Framework RAG modulaire pour l'audit et la conformité réglementaire.
+
+Le pipeline et la configuration sont importés au premier accès
+(``rag_framework.RAGPipeline``) : ``import rag_framework`` ne charge ni
+les étapes ni leurs dépendances (ChromaDB, watchdog, numpy, pydantic).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 __author__ = "RAG Team"
 
-from rag_framework.config import load_config, load_step_config
 from rag_framework.exceptions import (
     ConfigurationError,
     RAGFrameworkError,
     StepExecutionError,
     ValidationError,
 )
-from rag_framework.pipeline import RAGPipeline
+
+if TYPE_CHECKING:
+    from rag_framework.config import load_config, load_step_config
+    from rag_framework.pipeline import RAGPipeline
+
+# Attributs chargés au premier accès : nom → module
+_LAZY_ATTRIBUTES = {
+    "RAGPipeline": "rag_framework.pipeline",
+    "load_config": "rag_framework.config",
+    "load_step_config": "rag_framework.config",
+}
 
 __all__ = [
     "ConfigurationError",
@@ -23,3 +40,13 @@ __all__ = [
     "load_config",
     "load_step_config",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Importe un attribut public au premier accès (PEP 562)."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""CLI de consultation du journal d'audit segmenté.
+
+Interroge le journal configuré dans config/05_audit.yaml
+(``audit_logging.rotation``) sans relire l'ensemble des segments.
+
+Usage:
+    # Quand un fichier a-t-il été ingéré, avec quelles PII ?
+    python -m rag_framework.cli.audit_cli query --file data/input/contrat.pdf
+
+    # Opérations d'une période (dates ISO 8601)
+    python -m rag_framework.cli.audit_cli query --since 2025-03-01 --until 2025-03-31
+
+    # Volumes du journal, rotation forcée, import de l'ancien fichier JSONL
+    python -m rag_framework.cli.audit_cli stats
+    python -m rag_framework.cli.audit_cli rotate
+    python -m rag_framework.cli.audit_cli import logs/audit_trail.jsonl
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from rag_framework.config import load_step_config
+from rag_framework.utils.audit_trail import AuditTrail
+
+
+def _read_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Enregistrements d'un fichier JSONL (lignes vides ignorées)."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _summary(record: dict[str, Any], file_path: str) -> dict[str, Any]:
+    """Vue condensée d'un enregistrement pour un fichier donné."""
+    pii = record.get("pii_detection", {})
+    return {
+        "timestamp": record.get("timestamp"),
+        "operation": record.get("operation"),
+        "documents_processed": record.get("documents_processed"),
+        "pii_found": pii.get("pii_by_file", {}).get(file_path, {}),
+    }
+
+
+def main() -> int:
+    """Point d'entrée du CLI d'audit.
+
+    Returns:
+        Code de sortie (0 = succès, 1 = erreur).
+    """
+    parser = argparse.ArgumentParser(description="Consultation du journal d'audit")
+    parser.add_argument(
+        "--config-dir",
+        type=Path,
+        default=Path("config"),
+        help="Répertoire contenant les fichiers de configuration (défaut: config/)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    query = commands.add_parser("query", help="Recherche par période ou fichier")
+    query.add_argument("--since", help="Début de période (ISO 8601, inclus)")
+    query.add_argument("--until", help="Fin de période (ISO 8601, incluse)")
+    query.add_argument("--file", help="Chemin tel qu'enregistré dans l'audit")
+    query.add_argument("--limit", type=int, help="Nombre maximal de résultats")
+    query.add_argument(
+        "--full",
+        action="store_true",
+        help="Enregistrements complets (défaut: résumé si --file)",
+    )
+
+    commands.add_parser("stats", help="Volumes du journal")
+    commands.add_parser("rotate", help="Scelle le segment actif")
+    import_parser = commands.add_parser("import", help="Importe un fichier JSONL")
+    import_parser.add_argument("path", type=Path, help="Ancien journal JSONL")
+
+    args = parser.parse_args()
+
+    audit_config = load_step_config("05_audit.yaml", args.config_dir).get(
+        "audit_logging", {}
+    )
+    trail = AuditTrail.from_config(audit_config)
+    if trail is None:
+        print(
+            "Journal segmenté désactivé (audit_logging.rotation.enabled)",
+            file=sys.stderr,
+        )
+        return 1
+
+    if args.command == "query":
+        records = trail.query(
+            since=args.since, until=args.until, file_path=args.file, limit=args.limit
+        )
+        for record in records:
+            if args.file and not args.full:
+                record = _summary(record, args.file)
+            print(json.dumps(record, ensure_ascii=False))
+        print(f"{len(records)} enregistrement(s)", file=sys.stderr)
+    elif args.command == "stats":
+        print(json.dumps(trail.get_stats(), ensure_ascii=False, indent=2))
+    elif args.command == "rotate":
+        sealed = trail.rotate()
+        print(f"Segment scellé: {sealed}" if sealed else "Segment actif vide")
+    elif args.command == "import":
+        count = trail.extend(_read_jsonl(args.path))
+        trail.rotate()
+        print(f"{count} enregistrement(s) importé(s) depuis {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,8 +5,9 @@ import signal
 import sys
 import time
 from pathlib import Path
+from types import FrameType
+from typing import Optional
 
-from rag_framework import RAGPipeline
 from rag_framework.utils.logger import setup_logger
 from rag_framework.utils.secrets import load_env_file
 
@@ -50,11 +51,74 @@ def main() -> None:
         help="Mode surveillance continue - surveille et traite les fichiers en continu",
     )
 
+    parser.add_argument(
+        "--watch-mode",
+        choices=["events", "poll"],
+        default="events",
+        help="Mode watch: 'events' = événements watchdog et file de traitement "
+        "(défaut), 'poll' = pipeline complet à intervalle fixe",
+    )
+
     parser.add_argument(
         "--watch-interval",
         type=int,
         default=10,
-        help="Intervalle entre chaque scan en mode watch (secondes, défaut: 10)",
+        help="Intervalle entre chaque scan en mode watch poll (secondes, défaut: 10)",
+    )
+
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Service d'ingestion : pipeline initialisé une fois, travaux "
+        "soumis par API HTTP (section service de global.yaml)",
+    )
+
+    parser.add_argument(
+        "--host",
+        default=None,
+        help="Adresse d'écoute du service (défaut: service.host)",
+    )
+
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="Port d'écoute du service (défaut: service.port)",
+    )
+
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Worker de la file partagée entre nœuds (section distributed "
+        "de global.yaml)",
+    )
+
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="Avec --worker : s'arrêter lorsque la file est vide",
+    )
+
+    parser.add_argument(
+        "--queue-stats",
+        action="store_true",
+        help="Affiche les métriques agrégées de la file partagée",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile chaque exécution (cProfile, tracemalloc, RSS et piles "
+        "par étape et par extracteur ; section profiling de global.yaml)",
+    )
+
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        const="",
+        metavar="RUN_ID",
+        help="Reprend une exécution en échec depuis son dernier checkpoint "
+        "(défaut: la dernière exécution interrompue)",
     )
 
     args = parser.parse_args()
@@ -67,26 +131,150 @@ def main() -> None:
         load_env_file(args.env_file)
         logger.info(f"Variables d'environnement chargées depuis {args.env_file}")
 
+    # Affichage du statut : lu dans global.yaml, sans initialiser le
+    # pipeline (ni dépendances, ni étapes, ni connexions)
+    if args.status:
+        from rag_framework.pipeline import read_pipeline_status
+
+        try:
+            status = read_pipeline_status(args.config_dir)
+        except Exception as e:
+            print(f"\n❌ Erreur: {e}")
+            sys.exit(1)
+        print("\n📊 STATUT DU PIPELINE RAG")
+        print("=" * 60)
+        print(f"Total d'étapes: {status['total_steps']}")
+        print(f"Étapes activées: {status['enabled_steps']}")
+        print("\nÉtapes:")
+        for step in status["steps"]:
+            status_icon = "✓" if step["enabled"] else "✗"
+            print(f"  {status_icon} {step['name']}")
+        print("=" * 60)
+        sys.exit(0)
+
+    # Métriques de la file partagée, sans initialiser le pipeline
+    if args.queue_stats:
+        import json
+
+        from rag_framework.config import load_config
+        from rag_framework.distributed import DistributedSettings, create_backend
+
+        queue_settings = DistributedSettings.from_config(
+            load_config(args.config_dir).distributed
+        )
+        backend = create_backend(queue_settings)
+        print(json.dumps(backend.get_stats(), indent=2, ensure_ascii=False))
+        backend.close()
+        sys.exit(0)
+
     try:
-        # Initialisation du pipeline
-        pipeline = RAGPipeline(config_dir=args.config_dir)
-
-        # Affichage du statut
-        if args.status:
-            status = pipeline.get_status()
-            print("\n📊 STATUT DU PIPELINE RAG")
-            print("=" * 60)
-            print(f"Total d'étapes: {status['total_steps']}")
-            print(f"Étapes activées: {status['enabled_steps']}")
-            print("\nÉtapes:")
-            for step in status["steps"]:
-                status_icon = "✓" if step["enabled"] else "✗"
-                print(f"  {status_icon} {step['name']}")
-            print("=" * 60)
+        from rag_framework.pipeline import RAGPipeline
+
+        # Initialisation du pipeline (profilage : option ou global.yaml)
+        profile = True if args.profile else None
+        pipeline = RAGPipeline(config_dir=args.config_dir, profile=profile)
+
+        # Worker de la file partagée entre nœuds
+        if args.worker:
+            from rag_framework.config import load_step_config
+            from rag_framework.distributed import (
+                DistributedSettings,
+                DistributedWorker,
+                create_backend,
+            )
+
+            distributed = DistributedSettings.from_config(
+                pipeline.global_config.distributed
+            )
+            backend = create_backend(distributed)
+            worker = DistributedWorker(
+                backend,
+                lambda: pipeline,
+                load_step_config("01_monitoring.yaml", args.config_dir),
+                distributed,
+            )
+
+            def stop_worker(sig: int, frame: Optional[FrameType]) -> None:
+                logger.info("\n🛑 Arrêt du worker après le lot en cours")
+                worker.request_stop()
+
+            signal.signal(signal.SIGINT, stop_worker)
+            signal.signal(signal.SIGTERM, stop_worker)
+
+            worker.run(drain=args.drain)
+            backend.close()
             sys.exit(0)
 
-        # Mode surveillance continue
-        if args.watch:
+        # Service d'ingestion : API HTTP → file bornée → workers
+        if args.serve:
+            from rag_framework.service import IngestionService, ServiceSettings
+
+            service_settings = ServiceSettings.from_config(
+                pipeline.global_config.service
+            )
+            if args.host is not None:
+                service_settings.host = args.host
+            if args.port is not None:
+                service_settings.port = args.port
+            warm = [pipeline]
+
+            def service_pipeline_factory() -> RAGPipeline:
+                # Le premier worker réutilise le pipeline déjà initialisé
+                if warm:
+                    return warm.pop()
+                return RAGPipeline(config_dir=args.config_dir, profile=profile)
+
+            service = IngestionService(service_pipeline_factory, service_settings)
+
+            def stop_service(sig: int, frame: Optional[FrameType]) -> None:
+                logger.info("\n🛑 Arrêt du service (signal reçu)")
+                service.request_stop()
+
+            signal.signal(signal.SIGINT, stop_service)
+            signal.signal(signal.SIGTERM, stop_service)
+
+            service.start()
+            logger.info("Appuyez sur Ctrl+C pour arrêter\n")
+            service.wait()
+            service.stop()
+            logger.info("\n✅ Service arrêté proprement")
+            sys.exit(0)
+
+        # Mode daemon : événements watchdog → file de fichiers stables →
+        # workers (un pipeline chacun)
+        if args.watch and args.watch_mode == "events":
+            from rag_framework.config import load_step_config
+            from rag_framework.watch_daemon import WatchDaemon
+
+            pipelines = [pipeline]
+
+            def pipeline_factory() -> RAGPipeline:
+                # Le premier worker réutilise le pipeline déjà initialisé
+                if pipelines:
+                    return pipelines.pop()
+                return RAGPipeline(config_dir=args.config_dir, profile=profile)
+
+            daemon = WatchDaemon(
+                load_step_config("01_monitoring.yaml", args.config_dir),
+                pipeline_factory,
+            )
+
+            def stop_daemon(sig: int, frame: Optional[FrameType]) -> None:
+                logger.info("\n🛑 Arrêt de la surveillance (signal reçu)")
+                daemon.request_stop()
+
+            signal.signal(signal.SIGINT, stop_daemon)
+            signal.signal(signal.SIGTERM, stop_daemon)
+
+            daemon.start()
+            logger.info("Appuyez sur Ctrl+C pour arrêter\n")
+            daemon.wait()
+            daemon.stop()
+            logger.info("\n✅ Surveillance arrêtée proprement")
+            sys.exit(0)
+
+        # Mode surveillance par scans périodiques
+        elif args.watch:
             # Gestionnaire de signal pour arrêt propre (Ctrl+C)
             stop_watch = False
 
@@ -158,7 +346,10 @@ def main() -> None:
 
         # Mode exécution unique (par défaut)
         else:
-            result = pipeline.execute()
+            if args.resume is not None:
+                result = pipeline.execute(run_id=args.resume or None, resume=True)
+            else:
+                result = pipeline.execute()
 
             # Compter les chunks en fonction de l'étape la plus avancée activée
             if "normalized_chunks" in result:
@@ -178,6 +369,8 @@ def main() -> None:
             if result.get("storage_result"):
                 storage = result["storage_result"]
                 print(f"Chunks stockés: {storage.get('stored_count', 0)}")
+            if pipeline.last_profile is not None:
+                print(f"Profil: {pipeline.last_profile}")
 
     except Exception as e:
         logger.error(f"Erreur d'exécution: {e}", exc_info=True)
@@ -1,6 +1,7 @@
 """Gestion de la configuration du framework RAG."""
 
 import os
+import threading
 from pathlib import Path
 from typing import Any, Union
 
@@ -13,6 +14,11 @@ from rag_framework.exceptions import ConfigurationError
 # Type pour les valeurs de configuration (peut être récursif)
 ConfigValue = Union[str, int, float, bool, dict[str, Any], list[Any], None]
 
+# Configurations globales validées, partagées entre le pipeline et les
+# étapes : (chemin, mtime, taille, environnement) → GlobalConfig
+_GLOBAL_CONFIG_CACHE: dict[tuple[str, int, int, int], "GlobalConfig"] = {}
+_GLOBAL_CONFIG_LOCK = threading.Lock()
+
 
 class RegulatoryFramework(BaseModel):
     """Configuration d'un framework réglementaire."""
@@ -34,6 +40,8 @@ class PerformanceConfig(BaseModel):
     batch_size: int = 10
     max_workers: int = 4
     timeout_seconds: int = 300
+    # Exécution concurrente des étapes indépendantes du pipeline (opt-in)
+    parallel_steps: bool = False
 
 
 class GlobalConfig(BaseModel):
@@ -49,6 +57,16 @@ class GlobalConfig(BaseModel):
     logging: dict[str, Any] = Field(default_factory=dict)
     security: dict[str, Any] = Field(default_factory=dict)
     performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
+    # Checkpoints durables des exécutions (reprise après échec)
+    checkpointing: dict[str, Any] = Field(default_factory=dict)
+    # Service d'ingestion HTTP (rag-pipeline --serve)
+    service: dict[str, Any] = Field(default_factory=dict)
+    # File de travail partagée entre nœuds (rag-pipeline --worker)
+    distributed: dict[str, Any] = Field(default_factory=dict)
+    # Métriques et spans (Prometheus, OpenTelemetry)
+    telemetry: dict[str, Any] = Field(default_factory=dict)
+    # Profilage des exécutions (rag-pipeline --profile)
+    profiling: dict[str, Any] = Field(default_factory=dict)
     # Nouveau: frameworks réglementaires (RGPD, SOC2, ISO27001, etc.)
     regulatory_frameworks: dict[str, RegulatoryFramework] = Field(default_factory=dict)
 
@@ -201,18 +219,52 @@ def load_config(config_dir: Path = Path("config")) -> GlobalConfig:
     ------
     ConfigurationError
         Si la configuration est invalide.
+
+    Notes:
+    -----
+    Le fichier n'est lu et validé qu'une fois : les appels suivants
+    (étapes, validateur) reçoivent la même instance tant que le fichier
+    et les variables d'environnement sont inchangés.
     """
     global_config_path = config_dir / "global.yaml"
+    try:
+        stat = global_config_path.stat()
+        key = (
+            str(global_config_path.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            hash(frozenset(os.environ.items())),
+        )
+    except OSError:
+        key = None  # Fichier absent : erreur levée par load_yaml_config
+
+    if key is not None:
+        with _GLOBAL_CONFIG_LOCK:
+            cached = _GLOBAL_CONFIG_CACHE.get(key)
+        if cached is not None:
+            return cached
+
     config_data = load_yaml_config(global_config_path)
 
     try:
-        return GlobalConfig(**config_data)
+        global_config = GlobalConfig(**config_data)
     except PydanticValidationError as e:
         raise ConfigurationError(
             "Configuration globale invalide",
             details={"errors": e.errors()},
         ) from e
 
+    if key is not None:
+        with _GLOBAL_CONFIG_LOCK:
+            _GLOBAL_CONFIG_CACHE[key] = global_config
+    return global_config
+
+
+def clear_config_cache() -> None:
+    """Vide le cache des configurations globales (rechargement forcé)."""
+    with _GLOBAL_CONFIG_LOCK:
+        _GLOBAL_CONFIG_CACHE.clear()
+
 
 def load_step_config(
     config_path: Union[Path, str],
@@ -5,6 +5,32 @@ Convertit la configuration vers le format fallback.
 
 from typing import Any
 
+# Paramètres du pool OCR transmis tels quels à OCRExtractor
+OCR_POOL_KEYS = ("workers", "page_window", "omp_thread_limit", "start_method")
+
+
+def _ocr_extractor_config(ocr_entry: dict[str, Any]) -> dict[str, Any]:
+    """Configuration OCRExtractor d'un moteur de ``ocr_fallback``/``ocr_chain``.
+
+    Parameters
+    ----------
+    ocr_entry : dict[str, Any]
+        Entrée de la chaîne OCR (engine, language, workers...).
+
+    Returns:
+    -------
+    dict[str, Any]
+        Configuration de l'extracteur (langue, prétraitement, pool OCR).
+    """
+    config: dict[str, Any] = {
+        "lang": ocr_entry.get("language", "eng"),
+        "psm": 3,
+        "preprocess": True,
+        "min_confidence": 0.5,
+    }
+    config.update({key: ocr_entry[key] for key in OCR_POOL_KEYS if key in ocr_entry})
+    return config
+
 
 def convert_parser_to_fallback_config(parser_config: dict[str, Any]) -> dict[str, Any]:
     """Convertit 02_preprocessing.yaml vers le format attendu par FallbackManager.
@@ -51,6 +77,7 @@ def convert_parser_to_fallback_config(parser_config: dict[str, Any]) -> dict[str
         "marker": "marker",
         "docling": "docling",
         "pymupdf": "pymupdf",
+        "hybrid": "hybrid",
         "unstructured": "docling",  # Unstructured → docling
         "pypdf": "pypdf2",
         "pdfplumber": "pdfplumber",
@@ -109,12 +136,7 @@ def convert_parser_to_fallback_config(parser_config: dict[str, Any]) -> dict[str
                 extractor_entry = {
                     "name": extractor_name,
                     "enabled": True,
-                    "config": {
-                        "lang": ocr_entry.get("language", "eng"),
-                        "psm": 3,
-                        "preprocess": True,
-                        "min_confidence": 0.5,
-                    },
+                    "config": _ocr_extractor_config(ocr_entry),
                 }
 
                 # Transférer timeout_seconds si présent dans ocr_entry
@@ -133,12 +155,7 @@ def convert_parser_to_fallback_config(parser_config: dict[str, Any]) -> dict[str
             extractor_entry = {
                 "name": extractor_name,
                 "enabled": True,
-                "config": {
-                    "lang": ocr_entry.get("language", "eng"),
-                    "psm": 3,
-                    "preprocess": True,
-                    "min_confidence": 0.5,
-                },
+                "config": _ocr_extractor_config(ocr_entry),
             }
 
             # Transférer timeout_seconds si présent dans ocr_entry
@@ -155,6 +172,8 @@ def convert_parser_to_fallback_config(parser_config: dict[str, Any]) -> dict[str
             "use_vlm": use_vlm,
             "profile": "custom",  # Toujours custom car config manuelle
             "extractors": extractors,
+            # Ordre adaptatif (statistiques de succès et latence par source)
+            "adaptive": preprocessing.get("adaptive_fallback", {}),
         }
     }
 
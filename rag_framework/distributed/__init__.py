@@ -0,0 +1,25 @@
+"""Répartition du travail d'ingestion entre plusieurs nœuds.
+
+Les workers de tous les nœuds partagent une file de documents avec baux
+(:class:`WorkQueueBackend`) : chaque document n'est traité que par un
+worker à la fois, les documents d'un nœud perdu sont repris à
+l'expiration de son bail et les métriques sont agrégées dans la file.
+"""
+
+from rag_framework.distributed.base import (
+    DistributedSettings,
+    WorkItem,
+    WorkQueueBackend,
+    create_backend,
+)
+from rag_framework.distributed.sqlite_queue import SQLiteWorkQueue
+from rag_framework.distributed.worker import DistributedWorker
+
+__all__ = [
+    "DistributedSettings",
+    "DistributedWorker",
+    "SQLiteWorkQueue",
+    "WorkItem",
+    "WorkQueueBackend",
+    "create_backend",
+]
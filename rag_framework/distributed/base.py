@@ -0,0 +1,277 @@
+"""Interface des files de travail partagées entre nœuds d'ingestion.
+
+Une file distribue des documents (un élément = un fichier) à des workers
+répartis sur plusieurs processus ou machines :
+
+- ``enqueue`` est idempotent : un fichier déjà en file, en cours ou traité
+  sans modification depuis n'est pas ajouté une seconde fois (plusieurs
+  nœuds peuvent parcourir les mêmes répertoires) ;
+- ``claim`` attribue des éléments à un worker avec un bail (*lease*) ;
+  un élément n'est attribué qu'à un worker à la fois ;
+- ``heartbeat`` prolonge les baux d'un worker actif ; un bail expiré
+  (worker arrêté brutalement, machine perdue) remet l'élément en file ;
+- ``complete`` / ``fail`` ne sont acceptés que du détenteur du bail : un
+  worker dont le bail a expiré et été repris ne peut pas écraser le
+  résultat du nouveau détenteur ;
+- un élément en échec est retenté avec un délai croissant, puis écarté
+  (statut ``dead``) après ``max_attempts`` tentatives.
+
+Les files concrètes implémentent :class:`WorkQueueBackend` (SQLite local :
+:class:`~rag_framework.distributed.sqlite_queue.SQLiteWorkQueue` ; un
+broker externe s'intègre par la clé ``distributed.backend`` au format
+``"module:Classe"``).
+"""
+
+import importlib
+import os
+import socket
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from rag_framework.exceptions import ConfigurationError
+
+# Statuts d'un élément
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+DEAD = "dead"
+
+
+@dataclass
+class WorkItem:
+    """Élément de travail attribué à un worker.
+
+    Attributes:
+        id: Identifiant de l'élément dans la file.
+        key: Chemin absolu du document.
+        attempts: Nombre de tentatives, celle-ci comprise.
+        lease_expires: Échéance du bail (timestamp Unix).
+    """
+
+    id: int
+    key: str
+    attempts: int
+    lease_expires: float
+
+
+@dataclass
+class DistributedSettings:
+    """Paramètres de la file de travail distribuée.
+
+    Attributes:
+        backend: ``"sqlite"`` ou classe externe ``"module:Classe"``.
+        database: Base SQLite partagée (backend ``sqlite``).
+        lease_seconds: Durée d'un bail ; prolongée par les heartbeats.
+        heartbeat_seconds: Intervalle des heartbeats (< ``lease_seconds``).
+        batch_size: Documents réclamés puis traités ensemble par un worker.
+        max_attempts: Tentatives avant d'écarter un document.
+        retry_backoff_seconds: Délai avant la 2e tentative (doublé ensuite).
+        idle_poll_seconds: Attente lorsque la file est vide.
+        scan_interval_seconds: Intervalle des parcours des répertoires
+            surveillés par chaque worker (0 = pas de parcours, la file est
+            alimentée par ailleurs).
+        worker_id: Identifiant du worker (défaut: ``<hôte>-<pid>``).
+        options: Options transmises au constructeur d'un backend externe.
+    """
+
+    backend: str = "sqlite"
+    database: str = "./data/queue/work_queue.db"
+    lease_seconds: float = 300.0
+    heartbeat_seconds: float = 60.0
+    batch_size: int = 10
+    max_attempts: int = 3
+    retry_backoff_seconds: float = 30.0
+    idle_poll_seconds: float = 5.0
+    scan_interval_seconds: float = 60.0
+    worker_id: Optional[str] = None
+    options: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "DistributedSettings":
+        """Construit les paramètres depuis la section ``distributed``.
+
+        Args:
+            config: Section ``distributed`` de global.yaml.
+
+        Returns:
+            Paramètres (valeurs par défaut pour les clés absentes).
+        """
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in config.items() if k in known})
+
+
+def default_worker_id() -> str:
+    """Identifiant de worker unique sur le cluster : ``<hôte>-<pid>``."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def document_signature(path: Union[str, Path]) -> Optional[str]:
+    """Signature d'un fichier (taille et date de modification).
+
+    Args:
+        path: Chemin du fichier.
+
+    Returns:
+        Signature, ou None si le fichier n'existe plus.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class WorkQueueBackend(ABC):
+    """File de documents partagée entre workers.
+
+    Toutes les opérations doivent être atomiques vis-à-vis des autres
+    workers (processus et machines).
+    """
+
+    @abstractmethod
+    def enqueue(self, keys: Sequence[str]) -> int:
+        """Ajoute des documents à la file.
+
+        Un document déjà présent n'est remis en file que si son contenu a
+        changé (signature différente) depuis son dernier traitement.
+
+        Args:
+            keys: Chemins absolus des documents.
+
+        Returns:
+            Nombre de documents ajoutés ou remis en file.
+        """
+
+    @abstractmethod
+    def claim(self, worker_id: str, max_items: int) -> list[WorkItem]:
+        """Attribue jusqu'à ``max_items`` documents à un worker.
+
+        Les baux expirés sont repris au passage.
+
+        Args:
+            worker_id: Identifiant du worker.
+            max_items: Nombre maximal de documents.
+
+        Returns:
+            Documents attribués (liste vide si la file est vide).
+        """
+
+    @abstractmethod
+    def heartbeat(self, worker_id: str, item_ids: Sequence[int]) -> list[int]:
+        """Prolonge les baux d'un worker.
+
+        Args:
+            worker_id: Identifiant du worker.
+            item_ids: Documents en cours de traitement.
+
+        Returns:
+            Documents dont le worker détient toujours le bail.
+        """
+
+    @abstractmethod
+    def complete(
+        self, worker_id: str, item_ids: Sequence[int], busy_seconds: float = 0.0
+    ) -> list[int]:
+        """Marque des documents comme traités.
+
+        Args:
+            worker_id: Identifiant du worker.
+            item_ids: Documents traités.
+            busy_seconds: Durée de traitement (métriques du worker).
+
+        Returns:
+            Documents acceptés (ceux dont le worker détenait le bail).
+        """
+
+    @abstractmethod
+    def fail(
+        self,
+        worker_id: str,
+        item_ids: Sequence[int],
+        error: str,
+        busy_seconds: float = 0.0,
+    ) -> list[int]:
+        """Signale l'échec du traitement de documents.
+
+        Args:
+            worker_id: Identifiant du worker.
+            item_ids: Documents en échec.
+            error: Message d'erreur.
+            busy_seconds: Durée de traitement (métriques du worker).
+
+        Returns:
+            Documents acceptés (ceux dont le worker détenait le bail).
+        """
+
+    @abstractmethod
+    def release(self, worker_id: str) -> int:
+        """Rend les documents d'un worker qui s'arrête proprement.
+
+        La tentative n'est pas comptée.
+
+        Args:
+            worker_id: Identifiant du worker.
+
+        Returns:
+            Nombre de documents remis en file.
+        """
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, Any]:
+        """Métriques agrégées de la file et de tous les workers.
+
+        Returns:
+            Dictionnaire avec au moins ``counts`` (documents par statut) et
+            ``workers`` (métriques par worker).
+        """
+
+    def close(self) -> None:
+        """Libère les ressources du backend."""
+        return
+
+
+def create_backend(settings: DistributedSettings) -> WorkQueueBackend:
+    """Instancie le backend configuré.
+
+    Args:
+        settings: Paramètres de la file distribuée.
+
+    Returns:
+        Backend prêt à l'emploi.
+
+    Raises:
+        ConfigurationError: Backend inconnu ou introuvable.
+    """
+    if settings.backend == "sqlite":
+        from rag_framework.distributed.sqlite_queue import SQLiteWorkQueue
+
+        return SQLiteWorkQueue(
+            settings.database,
+            lease_seconds=settings.lease_seconds,
+            max_attempts=settings.max_attempts,
+            retry_backoff_seconds=settings.retry_backoff_seconds,
+        )
+
+    module_name, _, class_name = settings.backend.partition(":")
+    if not class_name:
+        raise ConfigurationError(
+            f"Backend de file inconnu: {settings.backend}",
+            details={"expected": "'sqlite' ou 'module:Classe'"},
+        )
+    try:
+        backend_class = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        raise ConfigurationError(
+            f"Backend de file introuvable: {settings.backend}",
+            details={"error": str(e)},
+        ) from e
+    backend = backend_class(settings, **(settings.options or {}))
+    if not isinstance(backend, WorkQueueBackend):
+        raise ConfigurationError(
+            f"{settings.backend} n'implémente pas WorkQueueBackend",
+            details={"backend": settings.backend},
+        )
+    return backend
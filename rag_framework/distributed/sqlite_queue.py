@@ -0,0 +1,415 @@
+"""File de travail distribuée sur une base SQLite partagée.
+
+Les transactions d'attribution (``BEGIN IMMEDIATE``) sont sérialisées par
+le verrou d'écriture de SQLite : deux workers ne peuvent pas réclamer le
+même document. La base est en mode WAL (lectures concurrentes des
+écritures).
+
+SQLite convient à plusieurs processus d'une même machine, ou à plusieurs
+machines sur un système de fichiers dont les verrous POSIX sont fiables.
+Les partages NFS/SMB ne le garantissent pas toujours : au-delà d'une
+machine, vérifier le support des verrous du partage ou utiliser un broker
+externe (``distributed.backend: "module:Classe"``).
+
+Schéma :
+
+- ``items`` : un document par ligne (chemin unique, signature, statut,
+  détenteur et échéance du bail, tentatives, dates, dernière erreur) ;
+- ``workers`` : métriques cumulées par worker (documents traités, en
+  échec, temps de traitement, dernier signe de vie).
+"""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Union
+
+from rag_framework.distributed.base import (
+    DEAD,
+    DONE,
+    PENDING,
+    RUNNING,
+    WorkItem,
+    WorkQueueBackend,
+    document_signature,
+)
+from rag_framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    signature TEXT,
+    status TEXT NOT NULL,
+    stale INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    lease_expires REAL,
+    available_at REAL NOT NULL,
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS items_claim ON items (status, available_at);
+CREATE INDEX IF NOT EXISTS items_owner ON items (owner, status);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    claimed INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    lost_leases INTEGER NOT NULL DEFAULT 0,
+    busy_seconds REAL NOT NULL DEFAULT 0
+);
+"""
+
+# Nombre maximal de paramètres par requête (SQLITE_MAX_VARIABLE_NUMBER)
+_MAX_PARAMS = 900
+
+
+def _chunks(values: Sequence[Any], size: int = _MAX_PARAMS) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+class SQLiteWorkQueue(WorkQueueBackend):
+    """File de documents dans une base SQLite.
+
+    Args:
+        database: Chemin de la base (créée au besoin).
+        lease_seconds: Durée d'un bail.
+        max_attempts: Tentatives avant d'écarter un document.
+        retry_backoff_seconds: Délai avant la 2e tentative (doublé ensuite).
+        busy_timeout_seconds: Attente maximale du verrou d'écriture.
+
+    Example:
+        >>> queue = SQLiteWorkQueue("data/queue/work_queue.db")
+        >>> queue.enqueue(["/srv/inbox/rapport.pdf"])
+        1
+        >>> items = queue.claim("node-a-1234", max_items=10)
+    """
+
+    def __init__(
+        self,
+        database: Union[str, Path],
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 30.0,
+        busy_timeout_seconds: float = 30.0,
+    ) -> None:
+        """Ouvre (ou crée) la base."""
+        self.database = Path(database)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        # Une connexion par thread (les connexions SQLite ne se partagent pas)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        conn = self._connection()
+        # Mode WAL persistant (enregistré dans la base)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.database),
+                timeout=self.busy_timeout_seconds,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Transaction d'écriture (verrou pris dès le début)."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _touch_worker(
+        self, conn: sqlite3.Connection, worker_id: str, now: float, **increments: float
+    ) -> None:
+        conn.execute(
+            "INSERT INTO workers (worker_id, first_seen, last_seen) VALUES (?, ?, ?) "
+            "ON CONFLICT (worker_id) DO UPDATE SET last_seen = excluded.last_seen",
+            (worker_id, now, now),
+        )
+        if increments:
+            assignments = ", ".join(f"{column} = {column} + ?" for column in increments)
+            conn.execute(
+                f"UPDATE workers SET {assignments} WHERE worker_id = ?",
+                (*increments.values(), worker_id),
+            )
+
+    # ------------------------------------------------------------------
+    # WorkQueueBackend
+    # ------------------------------------------------------------------
+
+    def enqueue(self, keys: Sequence[str]) -> int:
+        """Ajoute des documents (voir :meth:`WorkQueueBackend.enqueue`)."""
+        # Signatures calculées hors transaction (appels système)
+        signatures = {key: document_signature(key) for key in dict.fromkeys(keys)}
+        now = time.time()
+        added = 0
+        with self._transaction() as conn:
+            for batch in _chunks(list(signatures)):
+                placeholders = ",".join("?" * len(batch))
+                existing = {
+                    row[0]: row[1:]
+                    for row in conn.execute(
+                        f"SELECT key, signature, status FROM items "
+                        f"WHERE key IN ({placeholders})",
+                        batch,
+                    )
+                }
+                for key in batch:
+                    signature = signatures[key]
+                    if key not in existing:
+                        conn.execute(
+                            "INSERT INTO items (key, signature, status, "
+                            "available_at, enqueued_at) VALUES (?, ?, ?, ?, ?)",
+                            (key, signature, PENDING, now, now),
+                        )
+                        added += 1
+                        continue
+                    old_signature, status = existing[key]
+                    if signature == old_signature or status == PENDING:
+                        continue
+                    if status == RUNNING:
+                        # Modifié pendant son traitement : retraité ensuite
+                        conn.execute(
+                            "UPDATE items SET signature = ?, stale = 1 WHERE key = ?",
+                            (signature, key),
+                        )
+                        continue
+                    conn.execute(
+                        "UPDATE items SET signature = ?, status = ?, stale = 0, "
+                        "attempts = 0, error = NULL, available_at = ?, "
+                        "enqueued_at = ? WHERE key = ?",
+                        (signature, PENDING, now, now, key),
+                    )
+                    added += 1
+        return added
+
+    def _reclaim_expired(self, conn: sqlite3.Connection, now: float) -> None:
+        expired = conn.execute(
+            "SELECT id, owner, attempts FROM items "
+            "WHERE status = ? AND lease_expires < ?",
+            (RUNNING, now),
+        ).fetchall()
+        for item_id, owner, attempts in expired:
+            status = DEAD if attempts >= self.max_attempts else PENDING
+            conn.execute(
+                "UPDATE items SET status = ?, owner = NULL, lease_expires = NULL, "
+                "available_at = ?, error = ? WHERE id = ?",
+                (status, now, f"Bail expiré ({owner})", item_id),
+            )
+            self._touch_worker(conn, owner, now, lost_leases=1)
+            logger.warning(f"Bail expiré, document repris: #{item_id} ({owner})")
+
+    def claim(self, worker_id: str, max_items: int) -> list[WorkItem]:
+        """Attribue des documents (voir :meth:`WorkQueueBackend.claim`)."""
+        now = time.time()
+        expires = now + self.lease_seconds
+        with self._transaction() as conn:
+            self._reclaim_expired(conn, now)
+            rows = conn.execute(
+                "SELECT id, key, attempts FROM items "
+                "WHERE status = ? AND available_at <= ? ORDER BY id LIMIT ?",
+                (PENDING, now, max_items),
+            ).fetchall()
+            for batch in _chunks([row[0] for row in rows]):
+                conn.execute(
+                    f"UPDATE items SET status = ?, owner = ?, lease_expires = ?, "
+                    f"attempts = attempts + 1, started_at = ?, stale = 0 "
+                    f"WHERE id IN ({','.join('?' * len(batch))})",
+                    (RUNNING, worker_id, expires, now, *batch),
+                )
+            self._touch_worker(conn, worker_id, now, claimed=len(rows))
+        return [
+            WorkItem(id=row[0], key=row[1], attempts=row[2] + 1, lease_expires=expires)
+            for row in rows
+        ]
+
+    def heartbeat(self, worker_id: str, item_ids: Sequence[int]) -> list[int]:
+        """Prolonge des baux (voir :meth:`WorkQueueBackend.heartbeat`)."""
+        now = time.time()
+        owned: list[int] = []
+        with self._transaction() as conn:
+            for batch in _chunks(list(item_ids)):
+                placeholders = ",".join("?" * len(batch))
+                params = (worker_id, RUNNING, *batch)
+                conn.execute(
+                    f"UPDATE items SET lease_expires = ? WHERE owner = ? "
+                    f"AND status = ? AND id IN ({placeholders})",
+                    (now + self.lease_seconds, *params),
+                )
+                owned.extend(
+                    row[0]
+                    for row in conn.execute(
+                        f"SELECT id FROM items WHERE owner = ? AND status = ? "
+                        f"AND id IN ({placeholders})",
+                        params,
+                    )
+                )
+            self._touch_worker(conn, worker_id, now)
+        return owned
+
+    def _owned(
+        self, conn: sqlite3.Connection, worker_id: str, item_ids: Sequence[int]
+    ) -> list[tuple[int, int, int]]:
+        """(id, tentatives, stale) des documents dont le worker a le bail."""
+        rows: list[tuple[int, int, int]] = []
+        for batch in _chunks(list(item_ids)):
+            rows.extend(
+                conn.execute(
+                    f"SELECT id, attempts, stale FROM items WHERE owner = ? "
+                    f"AND status = ? AND id IN ({','.join('?' * len(batch))})",
+                    (worker_id, RUNNING, *batch),
+                )
+            )
+        return rows
+
+    def complete(
+        self, worker_id: str, item_ids: Sequence[int], busy_seconds: float = 0.0
+    ) -> list[int]:
+        """Marque des documents traités (voir :meth:`WorkQueueBackend.complete`)."""
+        now = time.time()
+        with self._transaction() as conn:
+            owned = self._owned(conn, worker_id, item_ids)
+            for item_id, _, stale in owned:
+                # Modifié pendant le traitement : remis en file
+                conn.execute(
+                    "UPDATE items SET status = ?, owner = NULL, lease_expires = NULL, "
+                    "finished_at = ?, available_at = ?, error = NULL, "
+                    "attempts = CASE WHEN ? THEN 0 ELSE attempts END WHERE id = ?",
+                    (PENDING if stale else DONE, now, now, stale, item_id),
+                )
+            self._touch_worker(
+                conn, worker_id, now, done=len(owned), busy_seconds=busy_seconds
+            )
+        return [row[0] for row in owned]
+
+    def fail(
+        self,
+        worker_id: str,
+        item_ids: Sequence[int],
+        error: str,
+        busy_seconds: float = 0.0,
+    ) -> list[int]:
+        """Signale des échecs (voir :meth:`WorkQueueBackend.fail`)."""
+        now = time.time()
+        with self._transaction() as conn:
+            owned = self._owned(conn, worker_id, item_ids)
+            for item_id, attempts, _ in owned:
+                status = DEAD if attempts >= self.max_attempts else PENDING
+                delay = self.retry_backoff_seconds * 2 ** max(0, attempts - 1)
+                conn.execute(
+                    "UPDATE items SET status = ?, owner = NULL, lease_expires = NULL, "
+                    "finished_at = ?, available_at = ?, error = ? WHERE id = ?",
+                    (status, now, now + delay, error[:2000], item_id),
+                )
+            self._touch_worker(
+                conn, worker_id, now, failed=len(owned), busy_seconds=busy_seconds
+            )
+        return [row[0] for row in owned]
+
+    def release(self, worker_id: str) -> int:
+        """Rend les documents d'un worker (voir :meth:`WorkQueueBackend.release`)."""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE items SET status = ?, owner = NULL, lease_expires = NULL, "
+                "available_at = ?, attempts = MAX(0, attempts - 1) "
+                "WHERE owner = ? AND status = ?",
+                (PENDING, now, worker_id, RUNNING),
+            )
+            self._touch_worker(conn, worker_id, now)
+        return cursor.rowcount
+
+    def get_stats(self) -> dict[str, Any]:
+        """Métriques agrégées (voir :meth:`WorkQueueBackend.get_stats`)."""
+        conn = self._connection()
+        now = time.time()
+        counts = dict.fromkeys((PENDING, RUNNING, DONE, DEAD), 0)
+        counts.update(
+            dict(conn.execute("SELECT status, COUNT(*) FROM items GROUP BY status"))
+        )
+        retried = conn.execute(
+            "SELECT COUNT(*) FROM items WHERE attempts > 1"
+        ).fetchone()[0]
+        first_start, last_finish = conn.execute(
+            "SELECT MIN(started_at), MAX(finished_at) FROM items WHERE status = ?",
+            (DONE,),
+        ).fetchone()
+        workers = {}
+        for row in conn.execute(
+            "SELECT worker_id, first_seen, last_seen, claimed, done, failed, "
+            "lost_leases, busy_seconds FROM workers ORDER BY worker_id"
+        ):
+            worker_id, first_seen, last_seen, claimed, done, failed, lost, busy = row
+            workers[worker_id] = {
+                "claimed": claimed,
+                "done": done,
+                "failed": failed,
+                "lost_leases": lost,
+                "busy_seconds": round(busy, 3),
+                "docs_per_busy_second": round(done / busy, 3) if busy else None,
+                "last_seen_seconds_ago": round(now - last_seen, 1),
+                "uptime_seconds": round(last_seen - first_seen, 1),
+            }
+        elapsed = (last_finish - first_start) if first_start and last_finish else 0.0
+        return {
+            "counts": counts,
+            "retried": retried,
+            "workers": workers,
+            "docs_per_second": round(counts[DONE] / elapsed, 3) if elapsed else None,
+        }
+
+    def dead_letters(self, limit: int = 100) -> list[dict[str, Any]]:
+        """Documents écartés après ``max_attempts`` tentatives.
+
+        Args:
+            limit: Nombre maximal de documents.
+
+        Returns:
+            Chemin, tentatives et dernière erreur de chaque document.
+        """
+        rows = self._connection().execute(
+            "SELECT key, attempts, error, finished_at FROM items WHERE status = ? "
+            "ORDER BY finished_at DESC LIMIT ?",
+            (DEAD, limit),
+        )
+        return [
+            {"key": key, "attempts": attempts, "error": error, "finished_at": finished}
+            for key, attempts, error, finished in rows
+        ]
+
+    def close(self) -> None:
+        """Ferme les connexions ouvertes par ce processus."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -0,0 +1,239 @@
+"""Worker d'ingestion alimenté par une file de travail partagée.
+
+Chaque nœud exécute un ou plusieurs workers (``rag-pipeline --worker``)
+pointant vers la même file. Un worker :
+
+1. parcourt périodiquement les répertoires surveillés et met en file les
+   documents trouvés (``scan_interval_seconds`` ; l'ajout est idempotent,
+   tous les nœuds peuvent parcourir les mêmes répertoires) ;
+2. réclame un lot de documents (``batch_size``) et les traite avec son
+   pipeline (une exécution pour le lot) ;
+3. prolonge ses baux pendant le traitement (heartbeat) ;
+4. signale chaque document traité ou en échec : un document absent des
+   ``extracted_documents`` du pipeline est compté en échec et retenté.
+
+Le découpage se fait au document : N workers traitent des documents
+disjoints, sans verrou sur les fichiers eux-mêmes.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, Optional
+
+from rag_framework.distributed.base import (
+    DistributedSettings,
+    WorkItem,
+    WorkQueueBackend,
+    default_worker_id,
+)
+from rag_framework.utils.logger import get_logger
+from rag_framework.watch_daemon import BatchProcessor
+
+logger = get_logger(__name__)
+
+
+class _Heartbeat:
+    """Prolonge les baux d'un lot tant que son traitement dure."""
+
+    def __init__(
+        self,
+        backend: WorkQueueBackend,
+        worker_id: str,
+        item_ids: Sequence[int],
+        interval: float,
+    ) -> None:
+        self.backend = backend
+        self.worker_id = worker_id
+        self.item_ids = list(item_ids)
+        self.interval = interval
+        self.lost: set[int] = set()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="rag-worker-heartbeat", daemon=True
+        )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                owned = set(self.backend.heartbeat(self.worker_id, self.item_ids))
+            except Exception as e:
+                logger.warning(f"Heartbeat en échec: {e}")
+                continue
+            lost = set(self.item_ids) - owned - self.lost
+            if lost:
+                # Résultat refusé à la fin du traitement (le document a
+                # été repris par un autre worker)
+                logger.warning(f"Bail perdu pour {len(lost)} document(s)")
+                self.lost |= lost
+
+    def __enter__(self) -> "_Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+class DistributedWorker:
+    """Worker réclamant des documents dans une file partagée.
+
+    Args:
+        backend: File de travail partagée.
+        pipeline_factory: Crée le pipeline du worker (appelée une fois, au
+            premier lot).
+        monitoring_config: Configuration de l'étape 1, pour le parcours des
+            répertoires surveillés (None = la file est alimentée par
+            ailleurs).
+        settings: Paramètres de la file distribuée.
+    """
+
+    def __init__(
+        self,
+        backend: WorkQueueBackend,
+        pipeline_factory: Callable[[], BatchProcessor],
+        monitoring_config: Optional[dict[str, Any]] = None,
+        settings: Optional[DistributedSettings] = None,
+    ) -> None:
+        """Prépare le worker (rien n'est démarré)."""
+        self.backend = backend
+        self.pipeline_factory = pipeline_factory
+        self.monitoring_config = monitoring_config
+        self.settings = settings or DistributedSettings()
+        self.worker_id = self.settings.worker_id or default_worker_id()
+        self._pipeline: Optional[BatchProcessor] = None
+        self._stop = threading.Event()
+        self._last_scan = 0.0
+        self.stats = {"batches": 0, "done": 0, "failed": 0, "rejected": 0}
+
+    def request_stop(self) -> None:
+        """Demande l'arrêt après le lot en cours (ex. gestionnaire de signal)."""
+        self._stop.set()
+
+    def scan_and_enqueue(self) -> int:
+        """Met en file les documents des répertoires surveillés.
+
+        Returns:
+            Nombre de documents ajoutés ou remis en file.
+        """
+        if self.monitoring_config is None:
+            return 0
+        from rag_framework.steps.step_01_monitoring import MonitoringStep
+
+        scan = MonitoringStep(self.monitoring_config).execute({})
+        keys = [os.path.abspath(path) for path in scan["monitored_files"]]
+        added = self.backend.enqueue(keys)
+        self._last_scan = time.monotonic()
+        if added:
+            logger.info(f"📥 {added} document(s) mis en file ({len(keys)} trouvés)")
+        return added
+
+    def process(self, items: list[WorkItem]) -> tuple[int, int]:
+        """Traite un lot de documents réclamés.
+
+        Args:
+            items: Documents attribués au worker.
+
+        Returns:
+            (documents traités, documents en échec) acceptés par la file.
+        """
+        if self._pipeline is None:
+            self._pipeline = self.pipeline_factory()
+        ids = [item.id for item in items]
+        start = time.perf_counter()
+        error: Optional[str] = None
+        extracted: set[str] = set()
+        with _Heartbeat(
+            self.backend, self.worker_id, ids, self.settings.heartbeat_seconds
+        ):
+            try:
+                result = self._pipeline.execute(
+                    {"monitored_files": [item.key for item in items]}
+                )
+                extracted = {
+                    os.path.abspath(document["file_path"])
+                    for document in result.get("extracted_documents", [])
+                    if "file_path" in document
+                }
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                logger.error(f"Erreur de traitement du lot: {e}", exc_info=True)
+        busy = time.perf_counter() - start
+
+        succeeded = [
+            item.id for item in items if error is None and item.key in extracted
+        ]
+        failed = [item.id for item in items if item.id not in set(succeeded)]
+        # Temps de traitement réparti entre documents traités et en échec
+        share = busy / len(items)
+        accepted_done = (
+            self.backend.complete(self.worker_id, succeeded, share * len(succeeded))
+            if succeeded
+            else []
+        )
+        accepted_failed = (
+            self.backend.fail(
+                self.worker_id,
+                failed,
+                error or "Document non extrait",
+                share * len(failed),
+            )
+            if failed
+            else []
+        )
+        rejected = len(items) - len(accepted_done) - len(accepted_failed)
+        self.stats["batches"] += 1
+        self.stats["done"] += len(accepted_done)
+        self.stats["failed"] += len(accepted_failed)
+        self.stats["rejected"] += rejected
+        logger.info(
+            f"✅ Lot traité en {busy:.1f}s: {len(accepted_done)} document(s), "
+            f"{len(accepted_failed)} échec(s)"
+            + (f", {rejected} résultat(s) refusé(s) (bail perdu)" if rejected else "")
+        )
+        return len(accepted_done), len(accepted_failed)
+
+    def _queue_empty(self) -> bool:
+        counts: dict[str, int] = self.backend.get_stats()["counts"]
+        return counts.get("pending", 0) == 0 and counts.get("running", 0) == 0
+
+    def run(self, drain: bool = False) -> dict[str, int]:
+        """Boucle du worker.
+
+        Args:
+            drain: S'arrêter lorsque la file est vide (aucun document en
+                attente ni en cours chez un autre worker) au lieu
+                d'attendre de nouveaux documents.
+
+        Returns:
+            Compteurs du worker.
+        """
+        logger.info(
+            f"👷 Worker {self.worker_id} démarré "
+            f"(lots de {self.settings.batch_size}, bail {self.settings.lease_seconds}s)"
+        )
+        try:
+            while not self._stop.is_set():
+                interval = self.settings.scan_interval_seconds
+                if (
+                    self.monitoring_config is not None
+                    and interval > 0
+                    and time.monotonic() - self._last_scan >= interval
+                ):
+                    self.scan_and_enqueue()
+
+                items = self.backend.claim(self.worker_id, self.settings.batch_size)
+                if items:
+                    self.process(items)
+                    continue
+                if drain and self._queue_empty():
+                    break
+                self._stop.wait(self.settings.idle_poll_seconds)
+        finally:
+            released = self.backend.release(self.worker_id)
+            if released:
+                logger.info(f"{released} document(s) rendu(s) à la file")
+        logger.info(f"Worker {self.worker_id} arrêté: {self.stats}")
+        return dict(self.stats)
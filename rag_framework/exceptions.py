@@ -73,3 +73,9 @@ class VectorStoreError(RAGFrameworkError):
     """Exception levée lors d'erreurs avec le vector store."""
 
     pass
+
+
+class ServiceOverloadedError(RAGFrameworkError):
+    """Exception levée lorsque la file de travaux du service est pleine."""
+
+    pass
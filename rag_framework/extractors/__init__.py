@@ -1,20 +1,51 @@
-"""Module d'extraction de texte avec support de fallback."""
+"""Module d'extraction de texte avec support de fallback.
+
+Les extracteurs sont importés au premier accès.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
-from rag_framework.extractors.docling_extractor import DoclingExtractor
-from rag_framework.extractors.image_extractor import ImageExtractor
-from rag_framework.extractors.marker_extractor import MarkerExtractor
-from rag_framework.extractors.pypdf2_extractor import PyPDF2Extractor
-from rag_framework.extractors.text_extractor import TextExtractor
-from rag_framework.extractors.vlm_extractor import VLMExtractor
+
+if TYPE_CHECKING:
+    from rag_framework.extractors.docling_extractor import DoclingExtractor
+    from rag_framework.extractors.hybrid_extractor import HybridExtractor
+    from rag_framework.extractors.image_extractor import ImageExtractor
+    from rag_framework.extractors.marker_extractor import MarkerExtractor
+    from rag_framework.extractors.pypdf2_extractor import PyPDF2Extractor
+    from rag_framework.extractors.text_extractor import TextExtractor
+    from rag_framework.extractors.vlm_extractor import VLMExtractor
+
+# Classe d'extracteur exportée → module
+_LAZY_EXTRACTORS = {
+    "DoclingExtractor": "rag_framework.extractors.docling_extractor",
+    "HybridExtractor": "rag_framework.extractors.hybrid_extractor",
+    "ImageExtractor": "rag_framework.extractors.image_extractor",
+    "MarkerExtractor": "rag_framework.extractors.marker_extractor",
+    "PyPDF2Extractor": "rag_framework.extractors.pypdf2_extractor",
+    "TextExtractor": "rag_framework.extractors.text_extractor",
+    "VLMExtractor": "rag_framework.extractors.vlm_extractor",
+}
 
 __all__ = [
     "BaseExtractor",
     "DoclingExtractor",
     "ExtractionResult",
+    "HybridExtractor",
     "ImageExtractor",
     "MarkerExtractor",
     "PyPDF2Extractor",
     "TextExtractor",
     "VLMExtractor",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Importe une classe d'extracteur au premier accès (PEP 562)."""
+    module_name = _LAZY_EXTRACTORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,321 @@
+"""Ordre adaptatif de la chaîne de fallback, appris des extractions passées.
+
+Une chaîne statique paie à chaque fichier le coût des extracteurs qui
+échouent : si un système source ne produit que des PDF scannés, chaque
+document traverse pymupdf → pdfplumber → pypdf2 avant d'atteindre l'OCR.
+
+Ce module conserve, par profil de source (extension, logiciel producteur,
+tranche de taille), le taux de succès et la durée moyenne de chaque
+extracteur, et réordonne la chaîne pour minimiser le temps attendu avant
+un résultat valide. Pour des tentatives successives indépendantes, ce
+temps est minimal lorsque les extracteurs sont triés par coût moyen
+divisé par probabilité de succès (``coût / p`` croissant).
+
+- Tant qu'un profil compte moins de ``min_samples`` tentatives, l'ordre
+  configuré est conservé (apprentissage).
+- Un extracteur sans aucun succès après ``skip_after`` tentatives est
+  relégué en fin de chaîne (il reste tenté si tous les autres échouent).
+- Avec une probabilité ``exploration``, l'ordre configuré est utilisé
+  pour continuer à mesurer les extracteurs relégués ou jamais atteints.
+
+Les statistiques sont persistées dans un fichier JSON, réécrit au plus
+tous les ``save_every`` enregistrements ou toutes les
+``save_interval_seconds`` secondes, en fin de lot et à l'arrêt du
+processus : le fichier n'est pas réécrit à chaque tentative d'extraction.
+"""
+
+import atexit
+import json
+import os
+import random
+import re
+import threading
+import time
+import weakref
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from rag_framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Tranches de taille : (borne supérieure en octets, libellé)
+SIZE_BUCKETS: list[tuple[float, str]] = [
+    (100 * 1024, "<100KB"),
+    (1024 * 1024, "100KB-1MB"),
+    (10 * 1024 * 1024, "1-10MB"),
+    (100 * 1024 * 1024, "10-100MB"),
+    (float("inf"), ">100MB"),
+]
+
+# Formats Office dont le producteur est lu dans docProps/app.xml
+OFFICE_EXTENSIONS = {".docx", ".docm", ".xlsx", ".xlsm", ".pptx", ".pptm"}
+
+
+@dataclass
+class AdaptiveSettings:
+    """Paramètres de l'ordre adaptatif.
+
+    Attributes:
+        enabled: Activer la réorganisation de la chaîne.
+        stats_path: Fichier JSON des statistiques ("" = non persistées).
+        min_samples: Tentatives enregistrées d'un profil avant de réordonner.
+        exploration: Probabilité d'utiliser l'ordre configuré.
+        skip_after: Tentatives sans succès avant de reléguer un extracteur.
+        save_every: Enregistrements avant réécriture du fichier.
+        save_interval_seconds: Délai maximum entre deux réécritures tant
+            que des enregistrements sont en attente.
+    """
+
+    enabled: bool = False
+    stats_path: str = ".cache/extractor_stats.json"
+    min_samples: int = 5
+    exploration: float = 0.05
+    skip_after: int = 10
+    save_every: int = 50
+    save_interval_seconds: float = 30.0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "AdaptiveSettings":
+        """Construit les paramètres depuis la configuration du fallback.
+
+        Args:
+            config: Section ``adaptive`` de la configuration.
+
+        Returns:
+            Paramètres (valeurs par défaut pour les clés absentes).
+        """
+        known = set(cls.__dataclass_fields__)
+        values = {k: v for k, v in config.items() if k in known}
+        if values.get("stats_path") is None and "stats_path" in values:
+            values["stats_path"] = ""
+        return cls(**values)
+
+
+def _flush_at_exit(ref: "weakref.ReferenceType[AdaptiveOrdering]") -> None:
+    """Persiste les enregistrements en attente d'une instance encore vivante."""
+    ordering = ref()
+    if ordering is not None:
+        ordering.flush()
+
+
+def size_bucket(size: int) -> str:
+    """Libellé de la tranche de taille d'un fichier."""
+    for upper, label in SIZE_BUCKETS:
+        if size < upper:
+            return label
+    return SIZE_BUCKETS[-1][1]
+
+
+def normalize_producer(producer: str) -> str:
+    """Normalise le nom d'un logiciel producteur (sans numéro de version).
+
+    Args:
+        producer: Valeur brute (ex. "pdfTeX-1.40.21", "Microsoft® Word 2016").
+
+    Returns:
+        Nom normalisé (ex. "pdftex", "microsoft word").
+    """
+    producer = re.sub(r"[\d._-]+", " ", producer.lower())
+    producer = re.sub(r"[^\w ]+", "", producer)
+    return " ".join(producer.split())[:40]
+
+
+def document_producer(file_path: Path) -> str:
+    """Logiciel ayant produit le document, lu dans ses métadonnées.
+
+    Args:
+        file_path: Chemin du fichier.
+
+    Returns:
+        Producteur normalisé ("" si inconnu ou illisible).
+    """
+    suffix = file_path.suffix.lower()
+    producer = ""
+    try:
+        if suffix == ".pdf":
+            import fitz
+
+            with fitz.open(str(file_path)) as doc:
+                metadata = doc.metadata or {}
+            producer = metadata.get("producer") or metadata.get("creator") or ""
+        elif suffix in OFFICE_EXTENSIONS:
+            with zipfile.ZipFile(file_path) as archive:
+                app = archive.read("docProps/app.xml").decode("utf-8", "ignore")
+            match = re.search(r"<Application>([^<]*)</Application>", app)
+            producer = match.group(1) if match else ""
+    except Exception as e:
+        logger.debug(f"Producteur illisible pour {file_path.name}: {e}")
+    return normalize_producer(producer)
+
+
+class AdaptiveOrdering:
+    """Statistiques par profil de source et ordre de la chaîne d'extracteurs.
+
+    Args:
+        settings: Paramètres de l'ordre adaptatif.
+        rng: Générateur aléatoire (exploration), injectable pour les tests.
+
+    Example:
+        >>> ordering = AdaptiveOrdering(AdaptiveSettings(enabled=True))
+        >>> key = ordering.source_key(Path("scan.pdf"))
+        >>> names = ordering.order(key, ["pymupdf", "pdfplumber", "ocr"])
+        >>> ordering.record(key, "ocr", success=True, seconds=4.2)
+    """
+
+    def __init__(
+        self, settings: AdaptiveSettings, rng: Optional[random.Random] = None
+    ) -> None:
+        """Initialise l'ordre adaptatif et charge les statistiques."""
+        self.settings = settings
+        self.rng = rng or random.Random()
+        self._lock = threading.Lock()
+        # {profil: {extracteur: {"attempts", "successes", "seconds"}}}
+        self.stats: dict[str, dict[str, dict[str, float]]] = {}
+        # Enregistrements non encore persistés et date de la dernière écriture
+        self._pending = 0
+        self._last_save = time.monotonic()
+        self._load()
+        if settings.stats_path:
+            atexit.register(_flush_at_exit, weakref.ref(self))
+
+    def source_key(self, file_path: Path) -> str:
+        """Profil de source d'un fichier : ``extension|producteur|taille``.
+
+        Args:
+            file_path: Chemin du fichier.
+
+        Returns:
+            Clé du profil.
+        """
+        return "|".join(
+            [
+                file_path.suffix.lower(),
+                document_producer(file_path),
+                size_bucket(file_path.stat().st_size),
+            ]
+        )
+
+    def order(self, key: str, names: list[str]) -> list[str]:
+        """Ordonne les extracteurs pour un profil de source.
+
+        Args:
+            key: Profil de source.
+            names: Extracteurs applicables, dans l'ordre configuré.
+
+        Returns:
+            Extracteurs dans l'ordre de tentative.
+        """
+        with self._lock:
+            profile = {name: dict(s) for name, s in self.stats.get(key, {}).items()}
+
+        samples = sum(s["attempts"] for s in profile.values())
+        if samples < self.settings.min_samples:
+            return list(names)
+        if self.rng.random() < self.settings.exploration:
+            logger.debug(f"Exploration: ordre configuré pour {key}")
+            return list(names)
+
+        default_cost = self._default_cost(profile)
+
+        def expected_cost(name: str) -> tuple[bool, float]:
+            s = profile.get(name, {"attempts": 0, "successes": 0, "seconds": 0.0})
+            attempts, successes = s["attempts"], s["successes"]
+            relegated = attempts >= self.settings.skip_after and successes == 0
+            cost = s["seconds"] / attempts if attempts else default_cost
+            # Probabilité de succès lissée (Laplace) : jamais nulle
+            success_rate = (successes + 1) / (attempts + 2)
+            return relegated, cost / success_rate
+
+        # Tri stable : à coût attendu égal, l'ordre configuré est conservé
+        ordered = sorted(names, key=expected_cost)
+        if ordered != names:
+            logger.debug(f"Ordre adaptatif pour {key}: {ordered}")
+        return ordered
+
+    @staticmethod
+    def _default_cost(profile: dict[str, dict[str, float]]) -> float:
+        """Coût supposé d'un extracteur jamais tenté (coût moyen du profil)."""
+        attempts = sum(s["attempts"] for s in profile.values())
+        seconds = sum(s["seconds"] for s in profile.values())
+        return seconds / attempts if attempts else 1.0
+
+    def record(self, key: str, name: str, success: bool, seconds: float) -> None:
+        """Enregistre le résultat d'une tentative d'extraction.
+
+        Args:
+            key: Profil de source.
+            name: Extracteur tenté.
+            success: True si le résultat a été validé.
+            seconds: Durée de la tentative (timeout compris).
+        """
+        with self._lock:
+            stats = self.stats.setdefault(key, {}).setdefault(
+                name, {"attempts": 0, "successes": 0, "seconds": 0.0}
+            )
+            stats["attempts"] += 1
+            stats["successes"] += int(success)
+            stats["seconds"] = round(stats["seconds"] + seconds, 4)
+            self._pending += 1
+            due = (
+                self._pending >= self.settings.save_every
+                or time.monotonic() - self._last_save
+                >= self.settings.save_interval_seconds
+            )
+        if due:
+            self.save()
+
+    def flush(self) -> None:
+        """Persiste les statistiques si des enregistrements sont en attente."""
+        if self._pending:
+            self.save()
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Statistiques par profil et extracteur (taux de succès, latence).
+
+        Returns:
+            ``{profil: {extracteur: {attempts, successes, success_rate,
+            mean_seconds}}}``.
+        """
+        with self._lock:
+            return {
+                key: {
+                    name: {
+                        "attempts": s["attempts"],
+                        "successes": s["successes"],
+                        "success_rate": round(s["successes"] / s["attempts"], 3),
+                        "mean_seconds": round(s["seconds"] / s["attempts"], 3),
+                    }
+                    for name, s in profile.items()
+                    if s["attempts"]
+                }
+                for key, profile in self.stats.items()
+            }
+
+    def _load(self) -> None:
+        """Charge les statistiques persistées (ignorées si illisibles)."""
+        if not self.settings.stats_path:
+            return
+        try:
+            with open(self.settings.stats_path, encoding="utf-8") as f:
+                self.stats = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Statistiques d'extraction illisibles, ignorées: {e}")
+
+    def save(self) -> None:
+        """Persiste les statistiques (écriture atomique)."""
+        if not self.settings.stats_path:
+            return
+        path = Path(self.settings.stats_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._lock:
+            payload = json.dumps(self.stats, indent=1, sort_keys=True)
+            self._pending = 0
+            self._last_save = time.monotonic()
+        tmp.write_text(payload, encoding="utf-8")
+        os.replace(tmp, path)
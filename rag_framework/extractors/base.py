@@ -156,6 +156,25 @@ class BaseExtractor(ABC):
 
         return True
 
+    def attempted_engines(self, result: Optional[ExtractionResult]) -> set[str]:
+        """Extracteurs dont le travail a déjà été tenté par cette extraction.
+
+        Le FallbackManager ne rappelle pas ces extracteurs pour le même
+        fichier (ex. pages scannées déjà OCRisées par l'extracteur hybride).
+
+        Parameters
+        ----------
+        result : Optional[ExtractionResult]
+            Résultat rejeté de l'extraction, ou None si elle a dépassé son
+            timeout.
+
+        Returns:
+        -------
+        set[str]
+            Noms des extracteurs à ne pas tenter ensuite (vide par défaut).
+        """
+        return set()
+
     def __repr__(self) -> str:
         """Représentation string de l'extracteur."""
         return f"{self.__class__.__name__}(name='{self.name}')"
@@ -0,0 +1,175 @@
+"""Détection d'encodage sur échantillon et décodage en une passe.
+
+Plutôt que d'essayer chaque encodage candidat sur le fichier entier (un
+gros fichier latin-1 était entièrement décodé en UTF-8, échouait, puis
+relu), l'encodage est déterminé sur un échantillon borné des premiers
+octets :
+
+1. BOM (UTF-8, UTF-16, UTF-32) ;
+2. validité UTF-8 de l'échantillon (un texte ASCII pur est de l'UTF-8) ;
+3. repli statistique : chaque encodage candidat restant décode
+   l'échantillon, celui qui produit le moins de caractères improbables
+   (caractères de contrôle) l'emporte, à égalité dans l'ordre des
+   candidats.
+
+Le fichier est ensuite décodé une seule fois. Au-delà d'un seuil, il est
+projeté en mémoire (``mmap``) et décodé directement depuis les pages du
+fichier : seul le texte décodé occupe la mémoire du processus.
+"""
+
+import codecs
+import mmap
+import unicodedata
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# BOM reconnus, du plus long au plus court (le BOM UTF-32 LE commence
+# par celui d'UTF-16 LE)
+BOMS: list[tuple[bytes, str]] = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+# Caractères de contrôle plausibles dans un texte
+TEXT_CONTROLS = {"\t", "\n", "\r", "\f", "\v"}
+
+
+@dataclass
+class EncodingGuess:
+    """Encodage détecté sur un échantillon.
+
+    Attributes:
+        encoding: Nom du codec Python.
+        confidence: Confiance dans la détection (0.0 à 1.0).
+        method: "bom", "ascii", "utf-8", "statistical", "configured" ou
+            "none" (aucun candidat ne décode l'échantillon).
+    """
+
+    encoding: str
+    confidence: float
+    method: str
+
+
+def read_sample(file_path: Path, size: int) -> bytes:
+    """Lit les ``size`` premiers octets d'un fichier.
+
+    Args:
+        file_path: Chemin du fichier.
+        size: Taille maximale de l'échantillon.
+
+    Returns:
+        Octets lus.
+    """
+    with open(file_path, "rb") as f:
+        return f.read(size)
+
+
+def _implausible_chars(text: str) -> int:
+    """Nombre de caractères improbables dans un texte (contrôles, non assignés)."""
+    return sum(
+        1
+        for char in text
+        if char not in TEXT_CONTROLS and unicodedata.category(char) in {"Cc", "Cn"}
+    )
+
+
+def _known(encoding: str) -> bool:
+    """Indique si le codec existe."""
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return False
+    return True
+
+
+def detect_encoding(
+    sample: bytes, candidates: Sequence[str], complete: bool = False
+) -> EncodingGuess:
+    """Détermine l'encodage d'un texte à partir d'un échantillon.
+
+    Args:
+        sample: Premiers octets du fichier.
+        candidates: Encodages candidats, par ordre de préférence.
+        complete: True si l'échantillon est le fichier entier (sinon une
+            séquence UTF-8 coupée en fin d'échantillon est tolérée).
+
+    Returns:
+        Encodage retenu. Si aucun candidat ne décode l'échantillon,
+        le premier candidat est retourné avec une confiance nulle.
+    """
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return EncodingGuess(encoding, 1.0, "bom")
+
+    known = [c for c in candidates if _known(c)]
+    others = [c for c in known if codecs.lookup(c).name != "utf-8"]
+    if len(others) < len(known):
+        if sample.isascii():
+            return EncodingGuess("utf-8", 1.0, "ascii")
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(sample, final=complete)
+            return EncodingGuess("utf-8", 0.99, "utf-8")
+        except UnicodeDecodeError:
+            pass
+
+    return statistical_guess(sample, others or known)
+
+
+def statistical_guess(sample: bytes, candidates: Sequence[str]) -> EncodingGuess:
+    """Choisit l'encodage produisant le texte le plus plausible.
+
+    Args:
+        sample: Octets à décoder.
+        candidates: Encodages candidats, par ordre de préférence.
+
+    Returns:
+        Encodage retenu (confiance = part de caractères plausibles).
+    """
+    best: Optional[EncodingGuess] = None
+    best_score = -1
+    for encoding in candidates:
+        try:
+            text = codecs.decode(sample, encoding)
+        except (UnicodeDecodeError, LookupError):
+            continue
+        implausible = _implausible_chars(text)
+        score = len(text) - implausible
+        if best is None or score > best_score:
+            confidence = 1.0 - implausible / len(text) if text else 1.0
+            best, best_score = EncodingGuess(encoding, confidence, "statistical"), score
+    return best or EncodingGuess(candidates[0] if candidates else "utf-8", 0.0, "none")
+
+
+def decode_file(
+    file_path: Path, encoding: str, errors: str = "strict", mmap_threshold: int = 0
+) -> str:
+    """Décode un fichier en une seule passe.
+
+    Args:
+        file_path: Chemin du fichier.
+        encoding: Codec à utiliser.
+        errors: Gestion des erreurs de décodage ("strict", "replace", etc.).
+        mmap_threshold: Taille (octets) à partir de laquelle le fichier est
+            projeté en mémoire plutôt que lu (0 = toujours lu).
+
+    Returns:
+        Texte décodé.
+
+    Raises:
+        UnicodeDecodeError: Si ``errors="strict"`` et le contenu est invalide.
+    """
+    size = file_path.stat().st_size
+    if size == 0:
+        return ""
+    if not mmap_threshold or size < mmap_threshold:
+        return file_path.read_bytes().decode(encoding, errors)
+
+    # Décodage direct depuis les pages du fichier (pas de copie en bytes)
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, encoding, errors)
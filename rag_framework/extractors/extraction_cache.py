@@ -0,0 +1,322 @@
+"""Cache des extractions, adressé par le contenu des fichiers.
+
+Un même fichier déposé plusieurs fois (re-dépôt dans un répertoire
+surveillé, copie entre répertoires, pièce jointe récurrente d'une boîte
+mail à l'autre) traversait à chaque fois toute la chaîne de fallback,
+OCR et VLM compris.
+
+Le cache associe l'empreinte SHA-256 du contenu d'un fichier (combinée à
+une signature de la configuration d'extraction) au résultat validé :
+texte, métadonnées, extracteur et score de confiance. Chaque entrée est
+un fichier JSON compressé (zlib) ; la taille totale est bornée et les
+entrées les moins récemment utilisées sont évincées en premier (LRU,
+date d'accès portée par la date de modification du fichier).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from rag_framework.extractors.base import ExtractionResult
+from rag_framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ENTRY_SUFFIX = ".json.z"
+
+
+@dataclass
+class ExtractionCacheSettings:
+    """Paramètres du cache d'extraction.
+
+    Attributes:
+        enabled: Activer le cache.
+        cache_dir: Répertoire des entrées.
+        max_size_mb: Taille totale maximale des entrées (compressées).
+        compression_level: Niveau zlib (1 = rapide, 9 = compact).
+    """
+
+    enabled: bool = False
+    cache_dir: str = ".cache/extractions"
+    max_size_mb: float = 512.0
+    compression_level: int = 6
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "ExtractionCacheSettings":
+        """Construit les paramètres depuis la configuration du preprocessing.
+
+        Args:
+            config: Section ``extraction_cache`` de la configuration.
+
+        Returns:
+            Paramètres (valeurs par défaut pour les clés absentes).
+        """
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in config.items() if k in known})
+
+
+def file_digest(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Empreinte SHA-256 du contenu d'un fichier, lu par blocs.
+
+    Args:
+        file_path: Chemin du fichier.
+        chunk_size: Taille des blocs lus.
+
+    Returns:
+        Empreinte hexadécimale.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_signature(config: dict[str, Any]) -> str:
+    """Signature d'une configuration d'extraction.
+
+    Une entrée produite avec une autre configuration (autres extracteurs,
+    autres options) n'est pas réutilisée.
+
+    Args:
+        config: Configuration du FallbackManager.
+
+    Returns:
+        Empreinte hexadécimale courte.
+    """
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def rebind_metadata(metadata: dict[str, Any], file_path: Path) -> dict[str, Any]:
+    """Métadonnées d'une entrée partagée, rattachées au fichier courant.
+
+    Une entrée est partagée entre fichiers au contenu identique : les clés
+    propres au fichier (nom, chemin, taille) décrivent celui qui l'a
+    produite et sont remplacées par celles de ``file_path``.
+
+    Args:
+        metadata: Métadonnées de l'entrée en cache.
+        file_path: Fichier en cours d'extraction.
+
+    Returns:
+        Copie des métadonnées (seules les clés déjà présentes sont
+        remplacées).
+    """
+    per_file = {
+        "file_name": file_path.name,
+        "file_path": str(file_path),
+        "file_size": file_path.stat().st_size,
+    }
+    rebound = dict(metadata)
+    for name, value in per_file.items():
+        if name in rebound:
+            rebound[name] = value
+    return rebound
+
+
+class ExtractionCache:
+    """Cache disque des extractions validées, borné en taille (LRU).
+
+    Args:
+        settings: Paramètres du cache.
+        signature: Signature de la configuration d'extraction
+            (``config_signature``), intégrée aux clés.
+
+    Example:
+        >>> cache = ExtractionCache(ExtractionCacheSettings(enabled=True))
+        >>> key = cache.key(Path("facture.pdf"))
+        >>> cached = cache.get(key)
+        >>> if cached is None:
+        ...     result, name = manager.extract_with_fallback(Path("facture.pdf"))
+        ...     cache.put(key, result, name, seconds=2.5)
+    """
+
+    def __init__(self, settings: ExtractionCacheSettings, signature: str = "") -> None:
+        """Initialise le cache et indexe les entrées existantes."""
+        self.settings = settings
+        self.signature = signature
+        self.root = Path(settings.cache_dir)
+        self.max_bytes = int(settings.max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        # {clé: taille en octets}, de la moins à la plus récemment utilisée
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self.stats: dict[str, float] = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "seconds_saved": 0.0,
+        }
+        self._scan()
+
+    def _path(self, key: str) -> Path:
+        """Chemin du fichier associé à une clé."""
+        return self.root / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def _scan(self) -> None:
+        """Reconstruit l'index LRU depuis le disque (ordre des dates d'accès)."""
+        if not self.root.is_dir():
+            return
+        found = []
+        for path in self.root.glob(f"*/*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime, path.name[: -len(ENTRY_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._size += size
+        self._evict()
+
+    def key(self, file_path: Path) -> str:
+        """Clé de cache d'un fichier : contenu + configuration.
+
+        Args:
+            file_path: Chemin du fichier.
+
+        Returns:
+            Clé hexadécimale.
+        """
+        digest = file_digest(file_path)
+        if not self.signature:
+            return digest
+        return hashlib.sha256(f"{digest}-{self.signature}".encode("ascii")).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[ExtractionResult, str]]:
+        """Résultat en cache pour ``key``.
+
+        Args:
+            key: Clé de cache (``key``).
+
+        Returns:
+            Tuple (résultat, nom de l'extracteur), ou None si absent ou
+            illisible.
+        """
+        path = self._path(key)
+        try:
+            entry = json.loads(zlib.decompress(path.read_bytes()))
+            result = ExtractionResult(
+                text=entry["text"],
+                success=True,
+                extractor_name=entry["extractor_name"],
+                metadata=entry.get("metadata", {}),
+                confidence_score=entry.get("confidence_score", 1.0),
+            )
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError, KeyError, zlib.error) as e:
+            logger.warning(f"Entrée de cache illisible, ignorée ({key[:12]}): {e}")
+            self._discard(key)
+            self._count("misses")
+            return None
+
+        # Date d'accès LRU (persistée via la date de modification)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            self.stats["seconds_saved"] += entry.get("seconds", 0.0)
+        return result, entry["extractor_name"]
+
+    def put(
+        self,
+        key: str,
+        result: ExtractionResult,
+        extractor_name: Optional[str],
+        seconds: float = 0.0,
+    ) -> None:
+        """Enregistre un résultat validé (écriture atomique), puis évince.
+
+        Args:
+            key: Clé de cache (``key``).
+            result: Résultat d'extraction validé.
+            extractor_name: Extracteur ayant produit le résultat.
+            seconds: Durée de l'extraction (comptée comme économisée à
+                chaque réutilisation).
+        """
+        entry = {
+            "text": result.text,
+            "extractor_name": extractor_name or result.extractor_name,
+            "metadata": result.metadata,
+            "confidence_score": result.confidence_score,
+            "seconds": round(seconds, 4),
+            "created": time.time(),
+        }
+        payload = zlib.compress(
+            json.dumps(entry, ensure_ascii=False, default=str).encode("utf-8"),
+            self.settings.compression_level,
+        )
+        if len(payload) > self.max_bytes:
+            logger.debug(f"Entrée trop volumineuse pour le cache ({len(payload)} o)")
+            return
+
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Écriture du cache d'extraction impossible: {e}")
+            return
+
+        with self._lock:
+            self._size += len(payload) - self._entries.pop(key, 0)
+            self._entries[key] = len(payload)
+            self.stats["stores"] += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        """Supprime les entrées les moins récemment utilisées au-delà du quota."""
+        while self._size > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            self.stats["evictions"] += 1
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def _discard(self, key: str) -> None:
+        """Retire une entrée invalide de l'index et du disque."""
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _count(self, name: str) -> None:
+        """Incrémente un compteur (thread-safe)."""
+        with self._lock:
+            self.stats[name] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Statistiques du cache (succès, échecs, taille, évictions).
+
+        Returns:
+            Compteurs, taux de succès et occupation du cache.
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self.stats)
+            stats["entries"] = len(self._entries)
+            stats["size_mb"] = round(self._size / 1024 / 1024, 3)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["seconds_saved"] = round(stats["seconds_saved"], 2)
+        return stats
@@ -1,25 +1,18 @@
 """Gestionnaire de fallback pour l'extraction de texte."""
 
+import importlib
 import time
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
-from typing import Any, ClassVar, Optional
+from typing import Any, ClassVar, Optional, Union
 
+from rag_framework.extractors.adaptive_order import (
+    AdaptiveOrdering,
+    AdaptiveSettings,
+)
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
-from rag_framework.extractors.docling_extractor import DoclingExtractor
-from rag_framework.extractors.docx_extractor import DocxExtractor
-from rag_framework.extractors.html_extractor import HTMLExtractor
-from rag_framework.extractors.image_extractor import ImageExtractor
-from rag_framework.extractors.marker_extractor import MarkerExtractor
-from rag_framework.extractors.ocr_extractor import OCRExtractor
-from rag_framework.extractors.pandas_extractor import PandasExtractor
-from rag_framework.extractors.pdfplumber_extractor import PdfPlumberExtractor
-from rag_framework.extractors.pptx_extractor import PptxExtractor
-from rag_framework.extractors.pymupdf_extractor import PyMuPDFExtractor
-from rag_framework.extractors.pypdf2_extractor import PyPDF2Extractor
-from rag_framework.extractors.text_extractor import TextExtractor
-from rag_framework.extractors.vlm_extractor import VLMExtractor
+from rag_framework.profiling import get_active_profiler
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -60,25 +53,41 @@ class FallbackManager:
         Profil de fallback actif.
     """
 
-    # Mapping nom → classe d'extracteur
-    EXTRACTOR_CLASSES: ClassVar[dict[str, type[BaseExtractor]]] = {
+    # Mapping nom → classe d'extracteur ("module:Classe" dans
+    # rag_framework.extractors, importé au premier usage)
+    EXTRACTOR_CLASSES: ClassVar[dict[str, Union[str, type[BaseExtractor]]]] = {
         # Extracteurs rapides et gratuits (2025)
-        "text": TextExtractor,  # Texte simple (.txt, .md, .xml, .svg, etc.)
-        "pandas": PandasExtractor,  # Données tabulaires (.csv, .xlsx, .xls, .ods)
-        "html": HTMLExtractor,  # HTML/XML avec BeautifulSoup
-        "docx": DocxExtractor,  # Word (.docx, .docm) avec python-docx
-        "pptx": PptxExtractor,  # PowerPoint (.pptx, .pptm) avec python-pptx
+        # Texte simple (.txt, .md, .xml, .svg, etc.)
+        "text": "text_extractor:TextExtractor",
+        # Données tabulaires (.csv, .xlsx, .xls, .ods)
+        "pandas": "pandas_extractor:PandasExtractor",
+        # HTML/XML avec BeautifulSoup
+        "html": "html_extractor:HTMLExtractor",
+        # Word (.docx, .docm) avec python-docx
+        "docx": "docx_extractor:DocxExtractor",
+        # PowerPoint (.pptx, .pptm) avec python-pptx
+        "pptx": "pptx_extractor:PptxExtractor",
         # Extracteurs PDF (ordre: rapide → avancé)
-        "pymupdf": PyMuPDFExtractor,  # PDF rapide (fitz)
-        "pdfplumber": PdfPlumberExtractor,  # PDF + tableaux avancés
-        "pypdf2": PyPDF2Extractor,  # PDF simple (fallback)
+        # PDF mixte : texte natif + OCR page par page
+        "hybrid": "hybrid_extractor:HybridExtractor",
+        # PDF rapide (fitz)
+        "pymupdf": "pymupdf_extractor:PyMuPDFExtractor",
+        # PDF + tableaux avancés
+        "pdfplumber": "pdfplumber_extractor:PdfPlumberExtractor",
+        # PDF simple (fallback)
+        "pypdf2": "pypdf2_extractor:PyPDF2Extractor",
         # Extracteurs avancés/lourds
-        "docling": DoclingExtractor,  # Universel (PDF/Office/OCR/layout)
-        "marker": MarkerExtractor,  # PDF ML haute qualité
-        "ocr": OCRExtractor,  # OCR Tesseract (images + PDF scannés)
+        # Universel (PDF/Office/OCR/layout)
+        "docling": "docling_extractor:DoclingExtractor",
+        # PDF ML haute qualité
+        "marker": "marker_extractor:MarkerExtractor",
+        # OCR Tesseract (images + PDF scannés)
+        "ocr": "ocr_extractor:OCRExtractor",
         # Extracteurs VLM (nécessitent API)
-        "image": ImageExtractor,  # Images avec VLM
-        "vlm": VLMExtractor,  # VLM pour documents (dernier recours)
+        # Images avec VLM
+        "image": "image_extractor:ImageExtractor",
+        # VLM pour documents (dernier recours)
+        "vlm": "vlm_extractor:VLMExtractor",
     }
 
     # Profils prédéfinis (meilleures pratiques 2025)
@@ -101,9 +110,13 @@ class FallbackManager:
                 "config": {"output_format": "markdown", "include_stats": False},
             },
             {
-                "name": "html",  # HTML/XML (rapide avec lxml)
+                "name": "html",  # HTML/XML (une passe lxml, sans arbre)
                 "enabled": True,
-                "config": {"parser": "lxml", "preserve_structure": False},
+                "config": {
+                    "parser": "lxml",
+                    "engine": "stream",
+                    "preserve_structure": False,
+                },
             },
             {
                 "name": "pymupdf",  # PDF rapide (10-100x plus rapide que pypdf)
@@ -183,8 +196,8 @@ class FallbackManager:
         # =====================================================================
         # Profil COMPROMISE : Équilibre qualité/performance (RECOMMANDÉ)
         # =====================================================================
-        # Ordre: text → pandas → html → docx → pptx → pdfplumber → pymupdf →
-        #        pypdf2 → docling → ocr
+        # Ordre: text → pandas → html → docx → pptx → hybrid → pdfplumber →
+        #        pymupdf → pypdf2 → docling → ocr
         # Temps moyen: 2-5 secondes par document
         # RAM: < 500 MB
         "compromise": [
@@ -229,6 +242,11 @@ class FallbackManager:
                     "include_slide_numbers": True,
                 },
             },
+            {
+                "name": "hybrid",  # PDF mixtes : OCR des seules pages scannées
+                "enabled": True,
+                "config": {"engine": "ocr", "lang": "fra+eng", "min_confidence": 0.5},
+            },
             {
                 "name": "pdfplumber",  # PDF avec tableaux (meilleur en 2025)
                 "enabled": True,
@@ -267,8 +285,8 @@ class FallbackManager:
         # =====================================================================
         # Profil QUALITY : Qualité maximale (ML + VLM disponibles)
         # =====================================================================
-        # Ordre: text → pandas → html → docx → pptx → pdfplumber → pymupdf →
-        #        marker → docling → ocr → image → vlm
+        # Ordre: text → pandas → html → docx → pptx → hybrid → pdfplumber →
+        #        pymupdf → marker → docling → ocr → image → vlm
         # Temps moyen: 10-30 secondes par document
         # RAM: 500 MB - 2 GB
         "quality": [
@@ -313,6 +331,11 @@ class FallbackManager:
                     "include_slide_numbers": True,
                 },
             },
+            {
+                "name": "hybrid",  # PDF mixtes : OCR des seules pages scannées
+                "enabled": True,
+                "config": {"engine": "ocr", "lang": "fra+eng", "min_confidence": 0.4},
+            },
             {
                 "name": "pdfplumber",  # PDF tableaux haute qualité
                 "enabled": True,
@@ -387,6 +410,14 @@ class FallbackManager:
         # Initialisation des extracteurs depuis la config
         self._initialize_extractors()
 
+        # Ordre adaptatif de la chaîne (statistiques par profil de source)
+        adaptive_settings = AdaptiveSettings.from_config(
+            self.config.get("fallback", {}).get("adaptive", {})
+        )
+        self.adaptive: Optional[AdaptiveOrdering] = (
+            AdaptiveOrdering(adaptive_settings) if adaptive_settings.enabled else None
+        )
+
         logger.info(
             f"FallbackManager initialisé avec profil '{self.profile}' "
             f"et {len(self.extractors)} extracteurs"
@@ -454,7 +485,7 @@ class FallbackManager:
                 continue
 
             # Récupération de la classe d'extracteur
-            extractor_class = self.EXTRACTOR_CLASSES.get(name)
+            extractor_class = self.get_extractor_class(name)
 
             if not extractor_class:
                 logger.warning(f"Extracteur inconnu: '{name}'. Ignoré.")
@@ -512,14 +543,16 @@ class FallbackManager:
 
         # Liste pour tracker les échecs
         failures: list[tuple[str, str]] = []
-
-        # Essayer chaque extracteur dans l'ordre
-        for extractor in self.extractors:
-            # Vérifier si l'extracteur peut traiter ce type de fichier
-            if not extractor.can_extract(file_path):
-                logger.debug(
-                    f"Extracteur '{extractor.name}' ne supporte pas {file_path.suffix}"
-                )
+        # Extracteurs dont le travail a déjà été tenté (ex. OCR de l'hybride)
+        attempted: dict[str, str] = {}
+
+        # Essayer chaque extracteur dans l'ordre (appris si adaptatif)
+        source_key, extractors = self._ordered_extractors(file_path)
+        for extractor in extractors:
+            if extractor.name in attempted:
+                reason = f"Déjà tenté par '{attempted[extractor.name]}'"
+                logger.info(f"Extracteur '{extractor.name}' ignoré: {reason}")
+                failures.append((extractor.name, reason))
                 continue
 
             # Récupération du timeout pour cet extracteur
@@ -536,7 +569,17 @@ class FallbackManager:
 
                 # Extraction avec timeout via ThreadPoolExecutor
                 with ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(extractor.extract, file_path)
+                    profiler = get_active_profiler()
+                    if profiler is not None:
+                        # Mode --profile : mesures propres à l'extracteur
+                        future = executor.submit(
+                            profiler.call,
+                            f"extractor.{extractor.name}",
+                            extractor.extract,
+                            file_path,
+                        )
+                    else:
+                        future = executor.submit(extractor.extract, file_path)
 
                     try:
                         # Attendre le résultat avec timeout
@@ -549,6 +592,9 @@ class FallbackManager:
                             f"✗ Extraction avec '{extractor.name}' timeout: {error_msg}"
                         )
                         failures.append((extractor.name, error_msg))
+                        self._record(source_key, extractor.name, False, timeout_seconds)
+                        for name in extractor.attempted_engines(None):
+                            attempted.setdefault(name, extractor.name)
                         continue
 
                 extraction_time = time.time() - start_time
@@ -557,7 +603,9 @@ class FallbackManager:
                 result.metadata["extraction_time_seconds"] = round(extraction_time, 2)
 
                 # Validation du résultat
-                if extractor.validate_result(result):
+                valid = extractor.validate_result(result)
+                self._record(source_key, extractor.name, valid, extraction_time)
+                if valid:
                     logger.info(
                         f"✓ Extraction réussie avec '{extractor.name}' "
                         f"({len(result.text)} chars, "
@@ -577,12 +625,17 @@ class FallbackManager:
                         f"✗ Extraction avec '{extractor.name}' invalide: {reason}"
                     )
                     failures.append((extractor.name, reason))
+                    for name in extractor.attempted_engines(result):
+                        attempted.setdefault(name, extractor.name)
 
             except Exception as e:
                 # Erreur durant l'extraction, passer au suivant
                 error_msg = f"Exception: {e}"
                 logger.warning(f"✗ Extraction avec '{extractor.name}' échouée: {e}")
                 failures.append((extractor.name, error_msg))
+                self._record(
+                    source_key, extractor.name, False, time.time() - start_time
+                )
 
         # Si on arrive ici, tous les extracteurs ont échoué
         failure_summary = "\n".join(
@@ -597,6 +650,84 @@ class FallbackManager:
         logger.error(error_message)
         raise RuntimeError(error_message)
 
+    def _ordered_extractors(
+        self, file_path: Path
+    ) -> tuple[Optional[str], list[BaseExtractor]]:
+        """Extracteurs applicables au fichier, dans l'ordre de tentative.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin vers le fichier à extraire.
+
+        Returns:
+        -------
+        tuple[Optional[str], list[BaseExtractor]]
+            (Profil de source si l'ordre est adaptatif, extracteurs).
+        """
+        applicable = []
+        for extractor in self.extractors:
+            # Vérifier si l'extracteur peut traiter ce type de fichier
+            if extractor.can_extract(file_path):
+                applicable.append(extractor)
+            else:
+                logger.debug(
+                    f"Extracteur '{extractor.name}' ne supporte pas {file_path.suffix}"
+                )
+
+        if self.adaptive is None or len(applicable) < 2:
+            return None, applicable
+
+        source_key = self.adaptive.source_key(file_path)
+        by_name = {extractor.name: extractor for extractor in applicable}
+        order = self.adaptive.order(source_key, list(by_name))
+        return source_key, [by_name[name] for name in order]
+
+    def _record(
+        self, source_key: Optional[str], name: str, success: bool, seconds: float
+    ) -> None:
+        """Enregistre une tentative dans les statistiques adaptatives."""
+        if self.adaptive is not None and source_key is not None:
+            self.adaptive.record(source_key, name, success, seconds)
+
+    def flush_extractor_stats(self) -> None:
+        """Persiste les statistiques adaptatives en attente d'écriture."""
+        if self.adaptive is not None:
+            self.adaptive.flush()
+
+    def get_extractor_stats(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Retourne les statistiques de l'ordre adaptatif.
+
+        Returns:
+        -------
+        dict[str, dict[str, dict[str, float]]]
+            ``{profil: {extracteur: {attempts, successes, success_rate,
+            mean_seconds}}}`` (vide si l'ordre adaptatif est désactivé).
+        """
+        return self.adaptive.snapshot() if self.adaptive is not None else {}
+
+    @classmethod
+    def get_extractor_class(cls, name: str) -> Optional[type[BaseExtractor]]:
+        """Retourne la classe d'un extracteur, importée au premier appel.
+
+        Parameters
+        ----------
+        name : str
+            Nom de l'extracteur (clé de ``EXTRACTOR_CLASSES``).
+
+        Returns:
+        -------
+        Optional[type[BaseExtractor]]
+            Classe de l'extracteur, ou None si le nom est inconnu.
+        """
+        extractor_class = cls.EXTRACTOR_CLASSES.get(name)
+        if isinstance(extractor_class, str):
+            module_name, class_name = extractor_class.split(":")
+            module = importlib.import_module(f"rag_framework.extractors.{module_name}")
+            extractor_class = getattr(module, class_name)
+            cls.EXTRACTOR_CLASSES[name] = extractor_class
+        return extractor_class
+
     def get_available_extractors(self) -> list[str]:
         """Retourne la liste des extracteurs disponibles.
 
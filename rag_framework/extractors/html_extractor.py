@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any, ClassVar
 
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.html_stream import parse_html_stream
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -41,6 +42,10 @@ class HTMLExtractor(BaseExtractor):
         - remove_tags : list[str] (défaut: ["script", "style", "nav", "footer"])
         - preserve_structure : bool (défaut: False)
         - min_text_length : int (défaut: 10)
+        - engine : str (défaut: "auto") - "beautifulsoup", "stream" (une passe
+          sur les événements lxml, sans arbre) ou "auto" (stream au-delà de
+          stream_threshold_kb)
+        - stream_threshold_kb : float (défaut: 512)
 
     Notes:
     -----
@@ -83,7 +88,7 @@ class HTMLExtractor(BaseExtractor):
         return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
 
     def extract(self, file_path: Path) -> ExtractionResult:
-        """Extrait le texte d'un fichier HTML/XML avec BeautifulSoup.
+        """Extrait le texte d'un fichier HTML/XML.
 
         Parameters
         ----------
@@ -98,15 +103,13 @@ class HTMLExtractor(BaseExtractor):
         Notes:
         -----
         L'extraction:
-        1. Parse le document avec BeautifulSoup
+        1. Parse le document avec BeautifulSoup (ou, pour les gros
+           fichiers, en une seule passe sur les événements lxml)
         2. Supprime les balises indésirables (scripts, styles, etc.)
         3. Extrait le texte principal
         4. Optionnellement extrait métadonnées, liens et images
         """
         try:
-            # Import tardif pour éviter erreur si librairie non installée
-            from bs4 import BeautifulSoup
-
             # Options d'extraction
             parser = self.config.get("parser", "lxml")
             extract_links = self.config.get("extract_links", False)
@@ -117,51 +120,33 @@ class HTMLExtractor(BaseExtractor):
             )
             preserve_structure = self.config.get("preserve_structure", False)
 
-            # Lecture du fichier
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                html_content = f.read()
-
-            # Parsing avec BeautifulSoup
-            soup = BeautifulSoup(html_content, parser)
-
-            # Suppression des balises indésirables
-            for tag_name in remove_tags:
-                for tag in soup.find_all(tag_name):
-                    tag.decompose()
-
             # Métadonnées
             metadata: dict[str, Any] = {
                 "file_size": file_path.stat().st_size,
                 "file_name": file_path.name,
-                "extractor": "beautifulsoup",
-                "parser": parser,
             }
 
-            # Extraction des métadonnées HTML
-            if extract_metadata:
-                metadata.update(self._extract_html_metadata(soup))
-
-            # Extraction du texte principal
-            if preserve_structure:
-                # Préservation de la structure (titres, paragraphes, listes)
-                full_text = self._extract_structured_text(soup)
+            if self._use_stream_engine(file_path):
+                # Une seule passe sur les événements du parseur, sans arbre
+                parsed = parse_html_stream(file_path, remove_tags, preserve_structure)
+                metadata.update({"extractor": "lxml", "engine": "stream"})
+                if extract_metadata:
+                    metadata.update(parsed.metadata)
+                full_text, links, images = parsed.text, parsed.links, parsed.images
             else:
-                # Extraction simple (tout le texte)
-                full_text = soup.get_text(separator="\n", strip=True)
-
-            # Extraction des liens si demandé
-            if extract_links:
-                links = self._extract_links(soup)
-                if links:
-                    full_text += "\n\n### Liens\n\n" + "\n".join(links)
-                    metadata["links_count"] = len(links)
-
-            # Extraction des images si demandé
-            if extract_images:
-                images = self._extract_images(soup)
-                if images:
-                    full_text += "\n\n### Images\n\n" + "\n".join(images)
-                    metadata["images_count"] = len(images)
+                full_text, links, images = self._extract_with_soup(
+                    file_path, metadata, parser, remove_tags, preserve_structure
+                )
+
+            # Ajout des liens si demandé
+            if extract_links and links:
+                full_text += "\n\n### Liens\n\n" + "\n".join(links)
+                metadata["links_count"] = len(links)
+
+            # Ajout des images si demandé
+            if extract_images and images:
+                full_text += "\n\n### Images\n\n" + "\n".join(images)
+                metadata["images_count"] = len(images)
 
             # Vérification de la longueur minimale
             min_length = self.config.get("min_text_length", 10)
@@ -179,8 +164,8 @@ class HTMLExtractor(BaseExtractor):
             confidence = 0.95
 
             logger.debug(
-                f"BeautifulSoup: Extrait {len(full_text)} caractères "
-                f"(parser={parser}, confidence={confidence:.2f})"
+                f"HTML ({metadata['extractor']}): Extrait {len(full_text)} "
+                f"caractères (confidence={confidence:.2f})"
             )
 
             return ExtractionResult(
@@ -219,6 +204,87 @@ class HTMLExtractor(BaseExtractor):
                 confidence_score=0.0,
             )
 
+    def _use_stream_engine(self, file_path: Path) -> bool:
+        """Indique si le moteur en une passe doit être utilisé.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin du fichier.
+
+        Returns:
+        -------
+        bool
+            True si ``engine`` vaut "stream", ou "auto" et que le fichier
+            dépasse ``stream_threshold_kb``.
+        """
+        engine = self.config.get("engine", "auto")
+        if engine == "auto":
+            threshold_kb = float(self.config.get("stream_threshold_kb", 512))
+            return file_path.stat().st_size >= threshold_kb * 1024
+        return bool(engine == "stream")
+
+    def _extract_with_soup(
+        self,
+        file_path: Path,
+        metadata: dict[str, Any],
+        parser: str,
+        remove_tags: list[str],
+        preserve_structure: bool,
+    ) -> tuple[str, list[str], list[str]]:
+        """Extrait le contenu via un arbre BeautifulSoup.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin du fichier.
+        metadata : dict[str, Any]
+            Métadonnées à compléter (titre, balises meta).
+        parser : str
+            Parser BeautifulSoup.
+        remove_tags : list[str]
+            Balises supprimées avec leur contenu.
+        preserve_structure : bool
+            Extraction structurée (titres, paragraphes, listes).
+
+        Returns:
+        -------
+        tuple[str, list[str], list[str]]
+            Texte, liens et images.
+        """
+        # Import tardif pour éviter erreur si librairie non installée
+        from bs4 import BeautifulSoup
+
+        # Lecture du fichier
+        with open(file_path, encoding="utf-8", errors="ignore") as f:
+            html_content = f.read()
+
+        # Parsing avec BeautifulSoup
+        soup = BeautifulSoup(html_content, parser)
+
+        # Suppression des balises indésirables
+        for tag_name in remove_tags:
+            for tag in soup.find_all(tag_name):
+                tag.decompose()
+
+        metadata.update({"extractor": "beautifulsoup", "parser": parser})
+
+        # Extraction des métadonnées HTML
+        if self.config.get("extract_metadata", True):
+            metadata.update(self._extract_html_metadata(soup))
+
+        # Extraction du texte principal
+        if preserve_structure:
+            # Préservation de la structure (titres, paragraphes, listes)
+            full_text = self._extract_structured_text(soup)
+        else:
+            # Extraction simple (tout le texte)
+            full_text = soup.get_text(separator="\n", strip=True)
+
+        links = self._extract_links(soup) if self.config.get("extract_links") else []
+        images = self._extract_images(soup) if self.config.get("extract_images") else []
+        return full_text, links, images
+
     def _extract_html_metadata(self, soup: Any) -> dict[str, Any]:
         """Extrait les métadonnées HTML (title, meta tags).
 
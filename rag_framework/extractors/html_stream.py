@@ -0,0 +1,269 @@
+"""Extraction HTML en une seule passe, sans construction d'arbre.
+
+Le parseur HTML de lxml (libxml2) est alimenté par blocs et notifie une
+cible à chaque événement (ouverture, fermeture, texte) : le texte, les
+marqueurs de structure, les liens, les images et les balises meta sont
+collectés au fil de la lecture. Aucun DOM n'est construit, la mémoire est
+bornée par la taille du texte extrait et non par celle de la page.
+
+Les événements reçus sont ceux que BeautifulSoup reçoit de lxml pour
+construire son arbre : les nœuds texte, et donc le texte produit, sont
+identiques à ceux du mode BeautifulSoup (``get_text`` et extraction
+structurée).
+"""
+
+import codecs
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+# Balises dont le contenu n'est jamais du texte (exclues par get_text)
+NON_TEXT_TAGS = {"script", "style", "template"}
+
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+LIST_TAGS = {"ul", "ol"}
+
+# Balises meta reportées dans les métadonnées (clé → attribut name)
+META_NAMES = {
+    "description": "description",
+    "keywords": "keywords",
+    "author": "author",
+    "language": "language",
+}
+
+
+@dataclass
+class HTMLStreamResult:
+    """Contenu collecté en une passe sur un document HTML.
+
+    Attributes:
+        text: Texte extrait (structuré en Markdown si demandé).
+        links: Liens au format ``- Texte: URL``.
+        images: Images au format ``- Alt: URL``.
+        metadata: Titre et balises meta (description, auteur, etc.).
+    """
+
+    text: str
+    links: list[str] = field(default_factory=list)
+    images: list[str] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _Capture:
+    """Élément structurant en cours de lecture (texte accumulé)."""
+
+    tag: str
+    depth: int
+    slot: int = -1
+    strings: list[str] = field(default_factory=list)
+    items: list[str] = field(default_factory=list)
+
+
+class HTMLStreamCollector:
+    """Cible du parseur lxml : collecte le contenu au fil des événements.
+
+    Args:
+        remove_tags: Balises ignorées avec tout leur contenu.
+        preserve_structure: Produire un texte structuré (titres, paragraphes,
+            listes, citations) plutôt que tous les nœuds texte.
+    """
+
+    def __init__(self, remove_tags: list[str], preserve_structure: bool) -> None:
+        """Initialise le collecteur."""
+        self.remove_tags = {tag.lower() for tag in remove_tags}
+        self.preserve_structure = preserve_structure
+
+        self._stack: list[str] = []  # balises ouvertes
+        self._removed = 0  # balises supprimées ouvertes
+        self._buffer: list[str] = []  # texte depuis le dernier événement
+
+        self.strings: list[str] = []  # nœuds texte (mode simple)
+        self.parts: list[Optional[str]] = []  # blocs (mode structuré)
+        self._captures: list[_Capture] = []
+
+        self.links: list[str] = []
+        self.images: list[str] = []
+        self.metadata: dict[str, Any] = {}
+        self._link: Optional[tuple[str, list[str]]] = None
+        self._title: Optional[list[str]] = None
+        self._og_title: Optional[str] = None
+        self._meta_seen: set[str] = set()
+
+    # Interface cible du parseur lxml
+
+    def start(self, tag: Any, attrib: dict[str, str]) -> None:  # noqa: ANN401
+        """Ouverture d'une balise."""
+        self._flush()
+        tag = str(tag).lower()
+        parent_depth = len(self._stack)
+        self._stack.append(tag)
+        if self._removed or tag in self.remove_tags:
+            if tag in self.remove_tags:
+                self._removed += 1
+            return
+
+        depth = len(self._stack)
+        if tag == "a" and "href" in attrib and self._link is None:
+            self._link = (attrib["href"], [])
+        elif tag == "img" and "src" in attrib:
+            alt, src = attrib.get("alt", ""), attrib["src"]
+            self.images.append(f"- {alt}: {src}" if alt else f"- {src}")
+        elif tag == "meta":
+            self._collect_meta(attrib)
+        elif tag == "title" and "title" not in self._meta_seen:
+            self._meta_seen.add("title")
+            self._title = []
+
+        if not self.preserve_structure:
+            return
+        if tag in HEADING_TAGS or tag in LIST_TAGS or tag in {"p", "blockquote"}:
+            # Emplacement réservé : les blocs restent dans l'ordre d'ouverture
+            self.parts.append(None)
+            self._captures.append(_Capture(tag, depth, len(self.parts) - 1))
+        elif tag == "li" and self._stack[-2:-1] and self._stack[-2] in LIST_TAGS:
+            # Élément direct d'une liste ouverte
+            owner = self._captures[-1] if self._captures else None
+            if owner is not None and owner.depth == parent_depth:
+                self._captures.append(_Capture(tag, depth))
+
+    def end(self, tag: Any) -> None:  # noqa: ANN401
+        """Fermeture d'une balise."""
+        self._flush()
+        if not self._stack:
+            return
+        depth = len(self._stack)
+        tag = self._stack.pop()
+        if tag in self.remove_tags:
+            self._removed -= 1
+            return
+        if self._removed:
+            return
+
+        if tag == "a" and self._link is not None:
+            url, strings = self._link
+            self._link = None
+            if url and not url.startswith("#"):  # Ignorer ancres locales
+                text = "".join(strings)
+                self.links.append(f"- {text}: {url}" if text else f"- {url}")
+        elif tag == "title" and self._title is not None:
+            self.metadata.setdefault("title", "".join(self._title))
+            self._title = None
+
+        if self._captures and self._captures[-1].depth == depth:
+            self._close_capture(self._captures.pop())
+
+    def data(self, data: str) -> None:
+        """Texte entre deux balises (éventuellement en plusieurs appels)."""
+        self._buffer.append(data)
+
+    def close(self) -> None:
+        """Fin du document."""
+        self._flush()
+        while self._captures:
+            self._close_capture(self._captures.pop())
+
+    # Collecte
+
+    def _flush(self) -> None:
+        """Distribue le nœud texte courant aux collectes actives."""
+        if not self._buffer:
+            return
+        text = "".join(self._buffer).strip()
+        self._buffer.clear()
+        if not text or self._removed:
+            return
+        if self._stack and self._stack[-1] in NON_TEXT_TAGS:
+            return
+
+        if self.preserve_structure:
+            for capture in self._captures:
+                capture.strings.append(text)
+        else:
+            self.strings.append(text)
+        if self._link is not None:
+            self._link[1].append(text)
+        if self._title is not None:
+            self._title.append(text)
+
+    def _close_capture(self, capture: _Capture) -> None:
+        """Formate un bloc structurant à sa fermeture."""
+        text = "".join(capture.strings)
+        if capture.tag == "li":
+            owner = self._captures[-1] if self._captures else None
+            if text and owner is not None and owner.tag in LIST_TAGS:
+                owner.items.append(text)
+        elif capture.tag in LIST_TAGS:
+            prefix = "-" if capture.tag == "ul" else "1."
+            if capture.items:
+                self.parts[capture.slot] = "\n".join(
+                    f"  {prefix} {item}" for item in capture.items
+                )
+        elif text:
+            if capture.tag in HEADING_TAGS:
+                text = f"{'#' * int(capture.tag[1])} {text}"
+            elif capture.tag == "blockquote":
+                text = f"> {text}"
+            self.parts[capture.slot] = text
+
+    def _collect_meta(self, attrib: dict[str, str]) -> None:
+        """Retient la première balise meta de chaque nom (comme ``find``)."""
+        name = attrib.get("name")
+        for key, meta_name in META_NAMES.items():
+            if name == meta_name and key not in self._meta_seen:
+                self._meta_seen.add(key)
+                if attrib.get("content"):
+                    self.metadata[key] = attrib["content"]
+        if attrib.get("property") == "og:title" and "og:title" not in self._meta_seen:
+            self._meta_seen.add("og:title")
+            if attrib.get("content"):
+                self._og_title = attrib["content"]
+
+    def result(self) -> HTMLStreamResult:
+        """Contenu collecté (après la fin du document)."""
+        metadata = dict(self.metadata)
+        if self._og_title and "title" not in metadata:
+            metadata["title"] = self._og_title
+        if self.preserve_structure:
+            text = "\n\n".join(part for part in self.parts if part)
+        else:
+            text = "\n".join(self.strings)
+        return HTMLStreamResult(text, self.links, self.images, metadata)
+
+
+def parse_html_stream(
+    file_path: Path,
+    remove_tags: list[str],
+    preserve_structure: bool = False,
+    chunk_size: int = 64 * 1024,
+) -> HTMLStreamResult:
+    """Extrait le contenu d'un fichier HTML en une passe, par blocs.
+
+    Args:
+        file_path: Chemin du fichier HTML/XML.
+        remove_tags: Balises ignorées avec tout leur contenu.
+        preserve_structure: Texte structuré en Markdown.
+        chunk_size: Taille des blocs lus et transmis au parseur (octets).
+
+    Returns:
+        Texte, liens, images et métadonnées du document.
+
+    Raises:
+        ImportError: Si lxml n'est pas installé.
+    """
+    from lxml import etree
+
+    collector = HTMLStreamCollector(remove_tags, preserve_structure)
+    parser = etree.HTMLParser(target=collector)
+    # Décodage incrémental (mêmes règles que la lecture du mode BeautifulSoup)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    with open(file_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            text = decoder.decode(chunk)
+            if text:
+                parser.feed(text)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        parser.feed(tail)
+    parser.close()
+    return collector.result()
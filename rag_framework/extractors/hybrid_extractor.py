@@ -0,0 +1,521 @@
+"""Extracteur PDF hybride : routage page par page texte natif / OCR / VLM."""
+
+import os
+import time
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, ClassVar, Optional
+
+from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.ocr_extractor import (
+    PageWords,
+    filter_ocr_words,
+    map_ocr_windows,
+    preprocess_image,
+    rss_mb,
+)
+from rag_framework.extractors.page_ranges import PageRange, map_page_ranges
+from rag_framework.extractors.vlm_extractor import VLMExtractor
+from rag_framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PageDecision:
+    """Décision de routage d'une page PDF.
+
+    Attributes:
+    ----------
+    page : int
+        Numéro de page (1-indexé).
+    route : str
+        "text" (couche texte native), "ocr", "vlm" ou "empty" (page vide).
+    reason : str
+        Motif de la décision ("text_layer", "no_text_layer",
+        "sparse_text", "image_dominant", "blank").
+    text_chars : int
+        Caractères de la couche texte native.
+    image_coverage : float
+        Part de la surface de la page couverte par des images (0-1).
+    """
+
+    page: int
+    route: str
+    reason: str
+    text_chars: int
+    image_coverage: float
+
+
+def image_coverage(page: Any) -> float:  # noqa: ANN401
+    """Part de la surface d'une page PyMuPDF couverte par des images.
+
+    Les rectangles des images sont bornés à la page puis sommés : les
+    recouvrements éventuels sont comptés deux fois, d'où le plafond à 1.
+    """
+    page_rect = page.rect
+    page_area = float(abs(page_rect))
+    if not page_area:
+        return 0.0
+
+    covered = 0.0
+    for info in page.get_image_info():
+        bbox = page_rect & info["bbox"]
+        if not bbox.is_empty:
+            covered += abs(bbox)
+    return min(1.0, covered / page_area)
+
+
+def plan_page(
+    page: Any,  # noqa: ANN401
+    text: str,
+    engine: str,
+    min_chars: int,
+    dense_text_chars: int,
+    max_image_coverage: float,
+) -> PageDecision:
+    """Décide si une page est lue depuis sa couche texte ou re-extraite.
+
+    Args:
+        page: Page PyMuPDF.
+        text: Texte de la couche native de la page.
+        engine: Moteur des pages déficientes ("ocr" ou "vlm").
+        min_chars: En dessous, la couche texte est jugée absente/lacunaire.
+        dense_text_chars: Au-dessus, la couche texte suffit même si la page
+            est couverte d'images (scan déjà OCRisé).
+        max_image_coverage: Couverture image à partir de laquelle une page
+            peu dense est considérée comme un scan.
+
+    Returns:
+        Décision de routage de la page.
+    """
+    chars = len(text.strip())
+    coverage = image_coverage(page)
+    number = page.number + 1
+
+    if chars >= dense_text_chars:
+        route, reason = "text", "text_layer"
+    elif chars >= min_chars:
+        if coverage >= max_image_coverage:
+            route, reason = engine, "image_dominant"
+        else:
+            route, reason = "text", "text_layer"
+    elif chars == 0 and not coverage and not page.get_drawings():
+        route, reason = "empty", "blank"
+    else:
+        route, reason = engine, "no_text_layer" if chars == 0 else "sparse_text"
+
+    return PageDecision(number, route, reason, chars, round(coverage, 3))
+
+
+def plan_page_range(
+    page_range: PageRange,
+    file_path: str,
+    engine: str,
+    min_chars: int,
+    dense_text_chars: int,
+    max_image_coverage: float,
+) -> list[tuple[PageDecision, str]]:
+    """Lit la couche texte et route chaque page d'une plage.
+
+    Fonction de niveau module pour être exécutée dans un pool de processus
+    (voir :func:`map_page_ranges`) : les gros PDF natifs sont lus par
+    plages de pages en parallèle, comme avec PyMuPDFExtractor.
+
+    Args:
+        page_range: Plage ``(début, fin)`` de pages, 0-indexées.
+        file_path: Chemin du PDF.
+        engine: Moteur des pages déficientes ("ocr" ou "vlm").
+        min_chars: Seuil de couche texte lacunaire (voir :func:`plan_page`).
+        dense_text_chars: Seuil de couche texte suffisante.
+        max_image_coverage: Couverture image marquant un scan.
+
+    Returns:
+        ``(décision, texte natif)`` de chaque page, dans l'ordre.
+    """
+    import fitz  # PyMuPDF
+
+    results: list[tuple[PageDecision, str]] = []
+    with fitz.open(file_path) as doc:
+        for page_num in range(*page_range):
+            page = doc.load_page(page_num)
+            text = page.get_text("text")
+            decision = plan_page(
+                page, text, engine, min_chars, dense_text_chars, max_image_coverage
+            )
+            results.append((decision, text.strip() if decision.route == "text" else ""))
+    return results
+
+
+def ocr_pdf_pages(
+    pages: tuple[int, ...],
+    file_path: str,
+    dpi: int,
+    lang: str,
+    custom_config: str,
+    preprocess: bool,
+    min_confidence: float,
+) -> tuple[list[PageWords], float]:
+    """Rastérise avec PyMuPDF et OCRise une liste de pages d'un PDF.
+
+    Fonction de niveau module pour être exécutée dans un pool de processus
+    (voir :func:`map_ocr_windows`). Seules les pages demandées sont
+    rastérisées, sans dépendre de poppler.
+
+    Args:
+        pages: Numéros de pages (1-indexés) à OCRiser.
+        file_path: Chemin du PDF.
+        dpi: Résolution de rastérisation.
+        lang: Langues Tesseract.
+        custom_config: Options Tesseract (``--oem``/``--psm``).
+        preprocess: Applique le prétraitement d'image.
+        min_confidence: Confiance minimale des mots (0-1).
+
+    Returns:
+        Tuple (mots par page dans l'ordre, pic RSS en Mo échantillonné dans
+        le processus exécutant les pages, hors binaire tesseract).
+    """
+    import fitz  # PyMuPDF
+    import pytesseract
+    from PIL import Image
+
+    results: list[PageWords] = []
+    peak_rss = 0.0
+    with fitz.open(file_path) as doc:
+        for number in pages:
+            pixmap = doc.load_page(number - 1).get_pixmap(
+                dpi=dpi, colorspace=fitz.csGRAY
+            )
+            image = Image.frombytes("L", (pixmap.width, pixmap.height), pixmap.samples)
+            ocr_image = preprocess_image(image) if preprocess else image
+            data = pytesseract.image_to_data(
+                ocr_image,
+                lang=lang,
+                config=custom_config,
+                output_type=pytesseract.Output.DICT,
+            )
+            words, confidences = filter_ocr_words(data, min_confidence)
+            results.append((number, words, confidences))
+            peak_rss = max(peak_rss, rss_mb())
+            image.close()
+
+    return results, peak_rss
+
+
+class HybridExtractor(BaseExtractor):
+    """Extracteur PDF routant chaque page vers la méthode adaptée.
+
+    Chaque page est inspectée à faible coût avec PyMuPDF (longueur de la
+    couche texte, couverture des images). Les pages disposant d'une couche
+    texte exploitable sont lues directement ; seules les pages déficientes
+    (scans, pages majoritairement image) sont envoyées à l'OCR Tesseract
+    ou au VLM. Les textes sont fusionnés dans l'ordre de lecture et la
+    décision de chaque page est enregistrée dans les métadonnées.
+
+    Contrairement à la chaîne de fallback, qui ré-extrait tout le document
+    dès qu'un extracteur renvoie trop peu de texte, un PDF mixte ne paie
+    l'OCR que pour ses pages scannées.
+
+    Parameters
+    ----------
+    config : dict[str, Any]
+        Configuration de l'extracteur.
+        Clés supportées:
+        - engine : str (défaut: "ocr") - Moteur des pages déficientes
+          ("ocr" ou "vlm")
+        - min_chars_per_page : int (défaut: 50) - Couche texte lacunaire
+          en dessous de ce nombre de caractères
+        - dense_text_chars : int (défaut: 200) - Couche texte suffisante
+          au-delà, quelle que soit la couverture image
+        - max_image_coverage : float (défaut: 0.5) - Couverture image
+          marquant une page peu dense comme scannée
+        - lang, psm, oem, preprocess, min_confidence, dpi : options OCR
+          (voir OCRExtractor)
+        - workers, page_window, omp_thread_limit, start_method : pool OCR
+          (voir OCRExtractor) ; ``workers`` sert aussi à la lecture de la
+          couche texte par plages de pages
+        - parallel_min_pages : int (défaut: 200) - Taille à partir de
+          laquelle la couche texte est lue par plages parallèles
+        - range_pages : int (défaut: 0 = automatique) - Pages par plage
+        - vlm : dict - Configuration VLMExtractor (engine "vlm")
+        - min_text_length : int (défaut: 10)
+    """
+
+    SUPPORTED_EXTENSIONS: ClassVar[set[str]] = {".pdf"}
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialise l'extracteur hybride.
+
+        Parameters
+        ----------
+        config : dict[str, Any]
+            Configuration de l'extracteur.
+        """
+        super().__init__(config)
+        self.engine = self.config.get("engine", "ocr")
+        if self.engine not in {"ocr", "vlm"}:
+            logger.warning(
+                f"Moteur hybride inconnu: '{self.engine}'. Utilisation 'ocr'"
+            )
+            self.engine = "ocr"
+        self._vlm_extractor: Optional[VLMExtractor] = None
+
+    def can_extract(self, file_path: Path) -> bool:
+        """Vérifie si le fichier est un PDF.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin vers le fichier.
+
+        Returns:
+        -------
+        bool
+            True si le fichier est un PDF.
+        """
+        return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
+
+    def attempted_engines(self, result: Optional[ExtractionResult]) -> set[str]:
+        """Moteur des pages déficientes, s'il a été sollicité.
+
+        Après un timeout ou des pages déjà passées au moteur ("ocr" ou
+        "vlm"), l'extracteur du même nom refairait ce travail sur tout le
+        document : le FallbackManager le saute.
+
+        Parameters
+        ----------
+        result : Optional[ExtractionResult]
+            Résultat rejeté, ou None après un timeout.
+
+        Returns:
+        -------
+        set[str]
+            ``{engine}`` si le moteur a été sollicité, sinon vide.
+        """
+        if result is None or result.metadata.get("engine_pages"):
+            return {self.engine}
+        return set()
+
+    def extract(self, file_path: Path) -> ExtractionResult:
+        """Extrait le texte d'un PDF en routant chaque page.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin vers le fichier PDF.
+
+        Returns:
+        -------
+        ExtractionResult
+            Résultat de l'extraction. ``metadata["page_decisions"]`` liste
+            la décision de chaque page, ``metadata["routes"]`` leur
+            décompte par route.
+        """
+        try:
+            import fitz  # PyMuPDF
+
+            with fitz.open(str(file_path)) as doc:
+                num_pages = len(doc)
+
+            # Couche texte et routage par plages de pages (processus
+            # parallèles à partir de parallel_min_pages pages)
+            plan_range = partial(
+                plan_page_range,
+                file_path=str(file_path),
+                engine=self.engine,
+                min_chars=int(self.config.get("min_chars_per_page", 50)),
+                dense_text_chars=int(self.config.get("dense_text_chars", 200)),
+                max_image_coverage=float(self.config.get("max_image_coverage", 0.5)),
+            )
+            texts: dict[int, str] = {}
+            decisions: list[PageDecision] = []
+            for planned in map_page_ranges(plan_range, num_pages, self.config):
+                for decision, text in planned:
+                    decisions.append(decision)
+                    if decision.route == "text":
+                        texts[decision.page] = text
+
+            deficient = [d.page for d in decisions if d.route == self.engine]
+            confidences: list[float] = [0.95] * len(texts)
+            start = time.perf_counter()
+            errors: list[str] = []
+            if deficient:
+                try:
+                    if self.engine == "vlm":
+                        texts.update(self._extract_pages_vlm(file_path, deficient))
+                    else:
+                        ocr_texts, ocr_confidences = self._extract_pages_ocr(
+                            file_path, deficient
+                        )
+                        texts.update(ocr_texts)
+                        confidences.extend(ocr_confidences)
+                except (ImportError, RuntimeError, OSError) as e:
+                    # OSError : binaire tesseract absent (TesseractNotFoundError)
+                    errors.append(f"Moteur '{self.engine}' indisponible: {e}")
+                    logger.warning(
+                        f"Hybride {file_path.name}: {errors[-1]} "
+                        f"({len(deficient)} page(s) non extraite(s))"
+                    )
+            engine_seconds = time.perf_counter() - start
+
+            # Fusion dans l'ordre de lecture
+            full_text = "\n\n".join(
+                f"=== Page {page} ===\n{texts[page]}"
+                for page in sorted(texts)
+                if texts[page]
+            )
+
+            routes: dict[str, int] = {}
+            for decision in decisions:
+                routes[decision.route] = routes.get(decision.route, 0) + 1
+
+            metadata: dict[str, Any] = {
+                "file_size": file_path.stat().st_size,
+                "file_name": file_path.name,
+                "extractor": "hybrid",
+                "num_pages": num_pages,
+                "engine": self.engine,
+                "routes": routes,
+                "page_decisions": [asdict(d) for d in decisions],
+                "engine_pages": deficient,
+                "engine_seconds": round(engine_seconds, 2),
+            }
+            if errors:
+                metadata["engine_error"] = errors[0]
+
+            logger.info(
+                f"Hybride {file_path.name}: {num_pages} pages, "
+                f"{routes.get('text', 0)} texte natif, "
+                f"{len(deficient)} via {self.engine} ({engine_seconds:.1f}s)"
+            )
+
+            confidence = sum(confidences) / len(confidences) if confidences else 0.0
+            if deficient and len(texts) < num_pages - routes.get("empty", 0):
+                # Pages déficientes non résolues : confiance proportionnelle
+                confidence *= len(texts) / max(1, num_pages)
+
+            # Vérification de la longueur minimale
+            min_length = self.config.get("min_text_length", 10)
+            if len(full_text.strip()) < min_length:
+                return ExtractionResult(
+                    text=full_text,
+                    success=False,
+                    extractor_name=self.name,
+                    metadata=metadata,
+                    error=errors[0]
+                    if errors
+                    else f"Texte extrait trop court ({len(full_text)} < {min_length})",
+                    confidence_score=confidence,
+                )
+
+            return ExtractionResult(
+                text=full_text,
+                success=True,
+                extractor_name=self.name,
+                metadata=metadata,
+                confidence_score=round(confidence, 2),
+            )
+
+        except ImportError:
+            error_msg = (
+                "PyMuPDF n'est pas installé. Installez avec: pip install pymupdf"
+            )
+            logger.error(error_msg)
+            return ExtractionResult(
+                text="",
+                success=False,
+                extractor_name=self.name,
+                metadata={},
+                error=error_msg,
+                confidence_score=0.0,
+            )
+
+        except Exception as e:
+            error_msg = f"Erreur extraction hybride: {e}"
+            logger.warning(error_msg)
+            return ExtractionResult(
+                text="",
+                success=False,
+                extractor_name=self.name,
+                metadata={},
+                error=error_msg,
+                confidence_score=0.0,
+            )
+
+    def _extract_pages_ocr(
+        self, file_path: Path, pages: list[int]
+    ) -> tuple[dict[int, str], list[float]]:
+        """OCRise les pages déficientes, par fenêtres, dans un pool.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin vers le PDF.
+        pages : list[int]
+            Pages (1-indexées) à OCRiser, dans l'ordre.
+
+        Returns:
+        -------
+        tuple[dict[int, str], list[float]]
+            Texte par page et confiance moyenne (0-1) de chaque page OCRisée.
+        """
+        import pytesseract  # noqa: F401 - échec rapide si absent
+
+        psm = self.config.get("psm", 3)
+        oem = self.config.get("oem", 3)
+        page_window = max(1, int(self.config.get("page_window", 4)))
+        windows = [
+            tuple(pages[i : i + page_window]) for i in range(0, len(pages), page_window)
+        ]
+        workers = int(self.config.get("workers") or os.cpu_count() or 1)
+        workers = max(1, min(workers, len(windows)))
+
+        ocr_window = partial(
+            ocr_pdf_pages,
+            file_path=str(file_path),
+            dpi=self.config.get("dpi", 300),
+            lang=self.config.get("lang", "fra+eng"),
+            custom_config=f"--oem {oem} --psm {psm}",
+            preprocess=self.config.get("preprocess", True),
+            min_confidence=self.config.get("min_confidence", 0.4),
+        )
+
+        texts: dict[int, str] = {}
+        confidences: list[float] = []
+        for results, _peak_rss in map_ocr_windows(
+            ocr_window, windows, workers, self.config
+        ):
+            for page, words, page_confidences in results:
+                texts[page] = " ".join(words)
+                confidences.append(
+                    sum(page_confidences) / len(page_confidences) / 100
+                    if page_confidences
+                    else 0.0
+                )
+        return texts, confidences
+
+    def _extract_pages_vlm(self, file_path: Path, pages: list[int]) -> dict[int, str]:
+        """Extrait les pages déficientes avec le VLM.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin vers le PDF.
+        pages : list[int]
+            Pages (1-indexées) à envoyer au VLM.
+
+        Returns:
+        -------
+        dict[int, str]
+            Texte par page (pages en échec absentes).
+        """
+        if self._vlm_extractor is None:
+            self._vlm_extractor = VLMExtractor(self.config.get("vlm", {}))
+        vlm = self._vlm_extractor
+        if not vlm.runner:
+            raise RuntimeError("client VLM non configuré (clé 'vlm')")
+
+        # Rendu en mémoire, envoi concurrent et cache par empreinte de page
+        results = vlm.runner.extract(vlm.iter_page_images(file_path, pages))
+        return {page: text for page, text in zip(pages, results) if text}
@@ -1,15 +1,22 @@
 """Extracteur pour fichiers images (nécessite VLM)."""
 
-import base64
 from pathlib import Path
 from typing import Any, ClassVar, Optional
 
 from rag_framework.config import get_llm_client, load_config
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.vlm_pages import VLMPageRunner, VLMPageSettings
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_IMAGE_PROMPT = (
+    "Extract all text visible in this image. "
+    "Preserve the structure and formatting. "
+    "Include all visible text, labels, and captions. "
+    "If there is no text, respond with 'NO_TEXT_FOUND'."
+)
+
 
 class ImageExtractor(BaseExtractor):
     """Extracteur pour fichiers images utilisant VLM.
@@ -37,6 +44,8 @@ class ImageExtractor(BaseExtractor):
         - temperature : float (défaut: 0.0)
         - max_tokens : int (défaut: 2000)
         - prompt : str (prompt personnalisé)
+        - max_pixels, image_format, jpeg_quality, cache_dir,
+          cache_max_size_mb, requests_per_minute : voir VLMExtractor
     """
 
     # Extensions d'images supportées
@@ -78,6 +87,16 @@ class ImageExtractor(BaseExtractor):
                 logger.warning(f"Erreur initialisation VLM client: {e}")
                 self.vlm_client = None
 
+        # Encodage, cache et limite de débit partagés avec VLMExtractor
+        self.runner: Optional[VLMPageRunner] = None
+        if self.vlm_client:
+            self.runner = VLMPageRunner(
+                self.vlm_client,
+                VLMPageSettings.from_config(config),
+                prompt=config.get("prompt", DEFAULT_IMAGE_PROMPT),
+                max_tokens=config.get("max_tokens", 2000),
+            )
+
     def can_extract(self, file_path: Path) -> bool:
         """Vérifie si VLM peut traiter cette image.
 
@@ -138,54 +157,25 @@ class ImageExtractor(BaseExtractor):
         try:
             logger.info(f"Extraction VLM de l'image: {file_path.name}")
 
-            # Lecture et encodage de l'image en base64
-            with open(file_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode("utf-8")
+            # Encodage en mémoire (réduit au budget de pixels), cache par
+            # empreinte de l'image
+            from PIL import Image
+
+            assert self.runner is not None
+            hits_before = self.runner.stats["cache_hits"]
+            with Image.open(file_path) as image:
+                image.load()
+                texts = self.runner.extract([image])
 
             # Déterminer le type MIME
             mime_type = self._get_mime_type(file_path)
 
-            # Prompt pour extraction de texte
-            prompt = self.config.get(
-                "prompt",
-                "Extract all text visible in this image. "
-                "Preserve the structure and formatting. "
-                "Include all visible text, labels, and captions. "
-                "If there is no text, respond with 'NO_TEXT_FOUND'.",
-            )
-
-            # Appel au VLM
-            assert self.vlm_client is not None
-
-            response = self.vlm_client.chat.completions.create(
-                model=self.vlm_client._model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:{mime_type};base64,{image_data}"
-                                },
-                            },
-                        ],
-                    }
-                ],
-                temperature=self.vlm_client._temperature,
-                max_tokens=self.config.get("max_tokens", 2000),
-            )
-
-            # Extraction du texte de la réponse
-            if response.choices and response.choices[0].message.content:
-                extracted_text: str = str(response.choices[0].message.content).strip()
+            if texts[0] is None:
+                raise RuntimeError("appel VLM en échec")
+            extracted_text = texts[0]
 
-                # Vérifier si aucun texte trouvé
-                if extracted_text.upper() == "NO_TEXT_FOUND":
-                    extracted_text = ""
-
-            else:
+            # Vérifier si aucun texte trouvé
+            if extracted_text.upper() == "NO_TEXT_FOUND":
                 extracted_text = ""
 
             # Métadonnées
@@ -194,6 +184,7 @@ class ImageExtractor(BaseExtractor):
                 "file_size": file_path.stat().st_size,
                 "format": file_path.suffix[1:],
                 "mime_type": mime_type,
+                "vlm_cache_hit": self.runner.stats["cache_hits"] > hits_before,
                 "vlm_provider": self.config.get("provider"),
                 "vlm_model": self.config.get("model"),
             }
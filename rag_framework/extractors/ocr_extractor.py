@@ -1,13 +1,179 @@
 """Extracteur basé sur PyTesseract (OCR pour images et PDF scannés)."""
 
+import os
+import time
+from collections.abc import Callable, Sequence
+from functools import partial
 from pathlib import Path
 from typing import Any, ClassVar
 
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.page_ranges import map_in_processes
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Résultat OCR d'une page : (numéro de page, mots retenus, confiances)
+PageWords = tuple[int, list[str], list[int]]
+
+
+def rss_mb() -> float:
+    """Mémoire résidente actuelle du processus courant, en Mo.
+
+    Les fenêtres OCR échantillonnent cette valeur pendant leur exécution :
+    ``ru_maxrss`` donnerait le pic de toute la vie du processus, qui
+    inclut le travail antérieur lorsque l'OCR s'exécute dans le
+    processus du pipeline.
+    """
+    import psutil
+
+    return float(psutil.Process().memory_info().rss) / (1024 * 1024)
+
+
+def filter_ocr_words(
+    data: dict[str, list[Any]], min_confidence: float
+) -> tuple[list[str], list[int]]:
+    """Filtre les mots Tesseract par confiance.
+
+    Args:
+        data: Sortie ``pytesseract.image_to_data`` (format DICT).
+        min_confidence: Confiance minimale (0-1).
+
+    Returns:
+        Tuple (mots retenus, confiances 0-100).
+    """
+    words: list[str] = []
+    confidences: list[int] = []
+    for i, conf in enumerate(data["conf"]):
+        # Confiance -1 signifie pas de texte détecté
+        if conf != -1:
+            text = data["text"][i].strip()
+            if text and int(conf) >= (min_confidence * 100):
+                words.append(text)
+                confidences.append(int(conf))
+    return words, confidences
+
+
+def preprocess_image(image: Any) -> Any:  # noqa: ANN401
+    """Prétraite une image pour améliorer la qualité OCR.
+
+    Applique une conversion en niveaux de gris, une augmentation du
+    contraste puis de la netteté.
+
+    Args:
+        image: Image PIL à prétraiter.
+
+    Returns:
+        Image PIL prétraitée.
+    """
+    from PIL import ImageEnhance
+
+    # Conversion en niveaux de gris
+    if image.mode != "L":
+        image = image.convert("L")
+
+    # Augmentation du contraste
+    enhancer = ImageEnhance.Contrast(image)
+    image = enhancer.enhance(1.5)
+
+    # Augmentation de la netteté
+    enhancer = ImageEnhance.Sharpness(image)
+    image = enhancer.enhance(1.3)
+
+    return image
+
+
+def _init_ocr_worker(omp_thread_limit: int) -> None:
+    """Initialise un worker OCR : limite les threads OpenMP de Tesseract."""
+    os.environ["OMP_THREAD_LIMIT"] = str(omp_thread_limit)
+
+
+def ocr_page_window(
+    window: tuple[int, int],
+    file_path: str,
+    dpi: int,
+    lang: str,
+    custom_config: str,
+    preprocess: bool,
+    min_confidence: float,
+) -> tuple[list[PageWords], float]:
+    """Rastérise et OCRise une fenêtre de pages d'un PDF.
+
+    Seules les pages ``window`` sont converties en images : la mémoire
+    reste bornée quelle que soit la taille du document. Fonction de niveau
+    module pour être exécutée dans un pool de processus.
+
+    Args:
+        window: Première et dernière page (1-indexées, incluses).
+        file_path: Chemin du PDF.
+        dpi: Résolution de rastérisation.
+        lang: Langues Tesseract.
+        custom_config: Options Tesseract (``--oem``/``--psm``).
+        preprocess: Applique le prétraitement d'image.
+        min_confidence: Confiance minimale des mots (0-1).
+
+    Returns:
+        Tuple (mots par page dans l'ordre, pic RSS en Mo échantillonné dans
+        le processus exécutant la fenêtre, hors binaire tesseract).
+    """
+    import pytesseract
+    from pdf2image import convert_from_path
+
+    first_page, last_page = window
+    images = convert_from_path(
+        file_path, dpi=dpi, first_page=first_page, last_page=last_page
+    )
+    # Toutes les pages de la fenêtre sont en mémoire : pic attendu
+    peak_rss = rss_mb()
+
+    pages: list[PageWords] = []
+    for offset, image in enumerate(images):
+        # Prétraitement si activé
+        ocr_image = preprocess_image(image) if preprocess else image
+
+        # Extraction OCR avec données détaillées
+        data = pytesseract.image_to_data(
+            ocr_image,
+            lang=lang,
+            config=custom_config,
+            output_type=pytesseract.Output.DICT,
+        )
+        words, confidences = filter_ocr_words(data, min_confidence)
+        pages.append((first_page + offset, words, confidences))
+        peak_rss = max(peak_rss, rss_mb())
+        image.close()
+
+    return pages, peak_rss
+
+
+def map_ocr_windows(
+    func: Callable[[Any], tuple[list[PageWords], float]],
+    windows: Sequence[Any],
+    workers: int,
+    config: dict[str, Any],
+) -> list[tuple[list[PageWords], float]]:
+    """Exécute l'OCR de fenêtres de pages, en processus si ``workers > 1``.
+
+    Args:
+        func: Fonction picklable OCRisant une fenêtre (niveau module).
+        windows: Fenêtres de pages, dans l'ordre de lecture.
+        workers: Nombre de processus (1 = dans le processus courant).
+        config: Configuration OCR (``start_method``, ``omp_thread_limit``).
+
+    Returns:
+        Résultats de ``func`` dans l'ordre des fenêtres.
+    """
+    return list(
+        map_in_processes(
+            func,
+            windows,
+            workers,
+            config.get("start_method", "spawn"),
+            initializer=_init_ocr_worker,
+            initargs=(int(config.get("omp_thread_limit", 1)),),
+        )
+    )
+
 
 class OCRExtractor(BaseExtractor):
     """Extracteur utilisant PyTesseract (Tesseract OCR) pour extraire du texte.
@@ -43,6 +209,11 @@ class OCRExtractor(BaseExtractor):
         - dpi : int (défaut: 300) - DPI pour PDF conversion
         - min_confidence : float (défaut: 0.4) - Confiance minimale
         - min_text_length : int (défaut: 10)
+        - workers : int (défaut: nombre de cœurs) - Processus OCR pour les PDF
+        - page_window : int (défaut: 4) - Pages rastérisées à la fois par
+          worker (borne la mémoire : workers x page_window images)
+        - omp_thread_limit : int (défaut: 1) - Threads OpenMP par Tesseract
+        - start_method : str (défaut: "spawn") - Démarrage des workers
 
     Notes:
     -----
@@ -152,6 +323,8 @@ class OCRExtractor(BaseExtractor):
                 error_msg += "Installez avec: pip install pytesseract"
             elif "PIL" in str(e):
                 error_msg += "Installez avec: pip install Pillow"
+            elif "pdf2image" in str(e):
+                error_msg += "Installez avec: pip install pdf2image (+ poppler)"
             logger.error(error_msg)
             return ExtractionResult(
                 text="",
@@ -218,16 +391,7 @@ class OCRExtractor(BaseExtractor):
         )
 
         # Filtrage par confiance et reconstruction du texte
-        filtered_text = []
-        confidences = []
-
-        for i, conf in enumerate(data["conf"]):
-            # Confiance -1 signifie pas de texte détecté
-            if conf != -1:
-                text = data["text"][i].strip()
-                if text and int(conf) >= (min_confidence * 100):
-                    filtered_text.append(text)
-                    confidences.append(int(conf))
+        filtered_text, confidences = filter_ocr_words(data, min_confidence)
 
         full_text = " ".join(filtered_text)
 
@@ -287,6 +451,11 @@ class OCRExtractor(BaseExtractor):
     ) -> ExtractionResult:
         """Extrait le texte d'un PDF scanné (conversion en images + OCR).
 
+        Les pages sont rastérisées par fenêtres de ``page_window`` pages et
+        OCRisées dans un pool de ``workers`` processus (un Tesseract par
+        cœur, ``OMP_THREAD_LIMIT`` contrôlé). L'ordre des pages est
+        préservé et la mémoire reste bornée.
+
         Parameters
         ----------
         file_path : Path
@@ -305,45 +474,45 @@ class OCRExtractor(BaseExtractor):
         ExtractionResult
             Résultat de l'extraction.
         """
-        import pytesseract
-        from pdf2image import convert_from_path
+        from pdf2image import pdfinfo_from_path
 
         # DPI pour conversion
         dpi = self.config.get("dpi", 300)
+        page_window = max(1, int(self.config.get("page_window", 4)))
+        workers = int(self.config.get("workers") or os.cpu_count() or 1)
+
+        # Découpage en fenêtres de pages rastérisées à la demande
+        num_pages = int(pdfinfo_from_path(str(file_path))["Pages"])
+        windows = [
+            (first, min(first + page_window - 1, num_pages))
+            for first in range(1, num_pages + 1, page_window)
+        ]
+        workers = max(1, min(workers, len(windows)))
+        ocr_window = partial(
+            ocr_page_window,
+            file_path=str(file_path),
+            dpi=dpi,
+            lang=lang,
+            custom_config=custom_config,
+            preprocess=preprocess,
+            min_confidence=min_confidence,
+        )
 
-        # Conversion PDF en images
-        images = convert_from_path(str(file_path), dpi=dpi)
+        start = time.perf_counter()
+        window_results = map_ocr_windows(ocr_window, windows, workers, self.config)
+        ocr_seconds = time.perf_counter() - start
 
-        # OCR sur chaque page
+        # Reconstruction du texte dans l'ordre des pages
         text_pages = []
-        all_confidences = []
-
-        for page_num, image in enumerate(images):
-            # Prétraitement si activé
-            if preprocess:
-                image = self._preprocess_image(image)
-
-            # Extraction OCR avec données détaillées
-            data = pytesseract.image_to_data(
-                image,
-                lang=lang,
-                config=custom_config,
-                output_type=pytesseract.Output.DICT,
-            )
-
-            # Filtrage par confiance
-            page_text = []
-            for i, conf in enumerate(data["conf"]):
-                if conf != -1:
-                    text = data["text"][i].strip()
-                    if text and int(conf) >= (min_confidence * 100):
-                        page_text.append(text)
-                        all_confidences.append(int(conf))
-
-            if page_text:
-                text_pages.append(
-                    f"=== Page {page_num + 1} ===\n" + " ".join(page_text)
-                )
+        all_confidences: list[int] = []
+        # Pic des fenêtres, mesuré par le processus qui les a traitées
+        peak_rss = 0.0
+        for pages, window_peak_rss in window_results:
+            peak_rss = max(peak_rss, window_peak_rss)
+            for page_num, words, confidences in pages:
+                all_confidences.extend(confidences)
+                if words:
+                    text_pages.append(f"=== Page {page_num} ===\n" + " ".join(words))
 
         # Concaténation
         full_text = "\n\n".join(text_pages)
@@ -354,19 +523,31 @@ class OCRExtractor(BaseExtractor):
             if all_confidences
             else 0.0
         )
+        pages_per_second = num_pages / ocr_seconds if ocr_seconds > 0 else 0.0
 
         # Métadonnées
         metadata: dict[str, Any] = {
             "file_size": file_path.stat().st_size,
             "file_name": file_path.name,
             "extractor": "pytesseract",
-            "num_pages": len(images),
+            "num_pages": num_pages,
             "words_detected": len(all_confidences),
             "avg_confidence": round(avg_confidence, 2),
             "lang": lang,
             "dpi": dpi,
+            "ocr_workers": workers,
+            "page_window": page_window,
+            "ocr_seconds": round(ocr_seconds, 2),
+            "pages_per_second": round(pages_per_second, 2),
+            "peak_rss_mb": round(peak_rss, 1),
         }
 
+        logger.info(
+            f"OCR {file_path.name}: {num_pages} pages en {ocr_seconds:.1f}s "
+            f"({pages_per_second:.2f} pages/s, {workers} worker(s), "
+            f"pic RSS {peak_rss:.0f} Mo)"
+        )
+
         # Vérification de la longueur minimale
         min_length = self.config.get("min_text_length", 10)
         if len(full_text.strip()) < min_length:
@@ -381,7 +562,7 @@ class OCRExtractor(BaseExtractor):
 
         logger.debug(
             f"OCR: Extrait {len(full_text)} caractères "
-            f"depuis {len(images)} pages PDF "
+            f"depuis {num_pages} pages PDF "
             f"(confidence={avg_confidence:.2f})"
         )
 
@@ -408,23 +589,6 @@ class OCRExtractor(BaseExtractor):
 
         Notes:
         -----
-        Applique:
-        - Conversion en niveaux de gris
-        - Augmentation du contraste
-        - Réduction du bruit (optionnel)
+        Voir :func:`preprocess_image` (niveaux de gris, contraste, netteté).
         """
-        from PIL import ImageEnhance
-
-        # Conversion en niveaux de gris
-        if image.mode != "L":
-            image = image.convert("L")
-
-        # Augmentation du contraste
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(1.5)
-
-        # Augmentation de la netteté
-        enhancer = ImageEnhance.Sharpness(image)
-        image = enhancer.enhance(1.3)
-
-        return image
+        return preprocess_image(image)
@@ -0,0 +1,151 @@
+"""Extraction parallèle de PDF natifs par plages de pages.
+
+Un PDF de plusieurs milliers de pages extrait dans un seul thread devient
+la tâche la plus longue d'un batch. Ce module découpe le document en
+plages de pages contiguës, les fait extraire par des processus workers
+(chacun ouvrant le fichier indépendamment) et réassemble les pages dans
+l'ordre, en conservant la position de chaque page dans le texte final.
+
+Les fonctions d'extraction d'une plage doivent être de niveau module
+(picklables) ; leurs résultats sont restitués dans l'ordre des pages.
+"""
+
+import math
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+
+# Plage de pages : (première page, page suivant la dernière), 0-indexées
+PageRange = tuple[int, int]
+
+# Texte d'une page : (numéro de page 1-indexé, texte)
+PageText = tuple[int, str]
+
+
+def plan_page_ranges(
+    num_pages: int, workers: int, range_pages: int = 0, min_range_pages: int = 25
+) -> list[PageRange]:
+    """Découpe un document en plages de pages contiguës.
+
+    Args:
+        num_pages: Nombre de pages du document.
+        workers: Nombre de processus disponibles.
+        range_pages: Taille imposée des plages (0 = automatique : environ
+            deux plages par worker pour lisser les pages lentes).
+        min_range_pages: Taille minimale d'une plage automatique (amortit
+            l'ouverture du fichier dans chaque worker).
+
+    Returns:
+        Plages ``(début, fin)`` couvrant toutes les pages, dans l'ordre.
+    """
+    if num_pages <= 0:
+        return []
+    if range_pages <= 0:
+        range_pages = max(min_range_pages, math.ceil(num_pages / (2 * workers)))
+    return [
+        (start, min(start + range_pages, num_pages))
+        for start in range(0, num_pages, range_pages)
+    ]
+
+
+def map_in_processes(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    workers: int,
+    start_method: str = "spawn",
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[Any]:
+    """Applique ``func`` à chaque élément, en processus si ``workers > 1``.
+
+    Les résultats sont produits dans l'ordre des éléments, au fur et à
+    mesure de leur disponibilité.
+
+    Args:
+        func: Fonction picklable (niveau module).
+        items: Éléments à traiter.
+        workers: Nombre de processus (1 = dans le processus courant).
+        start_method: Méthode de démarrage des workers ("spawn" évite
+            d'hériter des verrous des threads du pipeline).
+        initializer: Fonction exécutée au démarrage de chaque worker.
+        initargs: Arguments de ``initializer``.
+
+    Yields:
+        Résultat de ``func`` pour chaque élément, dans l'ordre.
+    """
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    context = multiprocessing.get_context(start_method)
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(items)),
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        # map() restitue les résultats dans l'ordre de soumission
+        yield from executor.map(func, items)
+
+
+def map_page_ranges(
+    func: Callable[[PageRange], Any], num_pages: int, config: dict[str, Any]
+) -> Iterator[Any]:
+    """Extrait un PDF par plages de pages, résultats dans l'ordre.
+
+    En dessous de ``parallel_min_pages`` pages, le document est extrait en
+    une seule plage dans le processus courant (pas de coût de démarrage).
+
+    Args:
+        func: Extraction d'une plage (niveau module, arguments liés).
+        num_pages: Nombre de pages du document.
+        config: Configuration de l'extracteur (``workers``,
+            ``parallel_min_pages``, ``range_pages``, ``start_method``).
+
+    Yields:
+        Résultat de ``func`` pour chaque plage, dans l'ordre des pages.
+    """
+    workers = int(config.get("workers") or os.cpu_count() or 1)
+    if num_pages < int(config.get("parallel_min_pages", 200)):
+        workers = 1
+
+    ranges = (
+        plan_page_ranges(num_pages, workers, int(config.get("range_pages", 0)))
+        if workers > 1
+        else [(0, num_pages)]
+    )
+    yield from map_in_processes(
+        func, ranges, workers, config.get("start_method", "spawn")
+    )
+
+
+def join_pages(
+    pages: Iterable[PageText], separator: str = "\n\n"
+) -> tuple[str, list[list[int]]]:
+    """Assemble les pages et calcule leurs positions dans le texte.
+
+    Les pages vides sont ignorées (comme l'assemblage séquentiel).
+
+    Args:
+        pages: ``(numéro de page, texte)`` dans l'ordre.
+        separator: Séparateur entre deux pages.
+
+    Returns:
+        Tuple (texte complet, ``[[page, début, fin], ...]`` : positions en
+        caractères de chaque page non vide dans le texte complet).
+    """
+    parts: list[str] = []
+    offsets: list[list[int]] = []
+    position = 0
+    for page_num, text in pages:
+        if not text:
+            continue
+        if parts:
+            position += len(separator)
+        offsets.append([page_num, position, position + len(text)])
+        parts.append(text)
+        position += len(text)
+    return separator.join(parts), offsets
@@ -1,13 +1,87 @@
 """Extracteur basé sur pandas (extraction de données structurées CSV/Excel)."""
 
+import csv
+import io
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Optional
 
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Extensions lisibles en flux (CSV par blocs, xlsx en lecture seule)
+STREAMING_EXTENSIONS = {".csv", ".tsv", ".xlsx", ".xlsm"}
+
+
+def _markdown_cell(value: Any) -> str:  # noqa: ANN401
+    """Cellule de tableau markdown (barres verticales et sauts de ligne neutralisés)."""
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+class _LineCollector:
+    """Pseudo-fichier recevant une ligne CSV par appel à ``write``."""
+
+    def __init__(self, lines: list[str]) -> None:
+        """Initialise le collecteur."""
+        self.write = lines.append
+
+
+class TableStats:
+    """Statistiques descriptives d'un tableau, calculées bloc par bloc.
+
+    Les blocs de lignes sont agrégés sans jamais conserver le tableau
+    complet : nombre de lignes, valeurs manquantes par colonne et colonnes
+    numériques (numériques dans tous les blocs).
+    """
+
+    def __init__(self) -> None:
+        """Initialise des statistiques vides."""
+        self.rows = 0
+        self.columns: list[Any] = []
+        self.missing: dict[Any, int] = {}
+        self.numeric: dict[Any, bool] = {}
+
+    def update(self, df: Any) -> None:  # noqa: ANN401
+        """Ajoute un bloc de lignes (DataFrame) aux statistiques."""
+        from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+        if not self.columns:
+            self.columns = list(df.columns)
+        self.rows += len(df)
+        for column, count in df.isnull().sum().items():
+            self.missing[column] = self.missing.get(column, 0) + int(count)
+        for column in df.columns:
+            dtype = df[column].dtype
+            self.numeric[column] = self.numeric.get(column, True) and bool(
+                is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+            )
+
+    def render(self) -> str:
+        """Statistiques formatées en liste markdown."""
+        stats_lines = []
+
+        # Nombre de lignes et colonnes
+        stats_lines.append(f"- **Lignes**: {self.rows}")
+        stats_lines.append(f"- **Colonnes**: {len(self.columns)}")
+
+        # Valeurs manquantes
+        missing = {col: count for col, count in self.missing.items() if count}
+        if missing and self.rows:
+            stats_lines.append("- **Valeurs manquantes**:")
+            for col, count in missing.items():
+                stats_lines.append(
+                    f"  - {col}: {count} ({round(count / self.rows * 100, 2)}%)"
+                )
+
+        # Types de colonnes
+        numeric_cols = sum(self.numeric.values())
+        if numeric_cols > 0:
+            stats_lines.append(f"- **Colonnes numériques**: {numeric_cols}")
+
+        return "\n".join(stats_lines)
+
 
 class PandasExtractor(BaseExtractor):
     """Extracteur utilisant pandas pour l'extraction de données tabulaires.
@@ -39,6 +113,14 @@ class PandasExtractor(BaseExtractor):
         - max_rows_display : int (défaut: None) - Limite de lignes à afficher
         - detect_encoding : bool (défaut: True)
         - min_text_length : int (défaut: 10)
+        - streaming : bool | "auto" (défaut: "auto") - Lecture en flux des
+          CSV/TSV/xlsx ; "auto" l'active au-delà de streaming_threshold_mb
+        - streaming_threshold_mb : float (défaut: 20)
+        - read_chunk_rows : int (défaut: 50000) - Lignes lues par bloc
+        - window_rows : int (défaut: 50) - Lignes par fenêtre émise (chaque
+          fenêtre répète l'en-tête du tableau)
+        - window_max_chars : int (défaut: 1500) - Taille max d'une fenêtre
+        - read_only, data_only : bool (défaut: True) - Options openpyxl
 
     Notes:
     -----
@@ -111,6 +193,12 @@ class PandasExtractor(BaseExtractor):
             # Lecture selon le format
             file_extension = file_path.suffix.lower()
 
+            # Gros fichiers : lecture en flux et émission par fenêtres
+            if self._use_streaming(file_path):
+                return self._extract_streaming(
+                    file_path, output_format, include_stats, max_rows_display
+                )
+
             if file_extension == ".csv":
                 # CSV avec détection automatique du délimiteur et encodage
                 df = pd.read_csv(
@@ -396,6 +484,364 @@ class PandasExtractor(BaseExtractor):
             confidence_score=confidence,
         )
 
+    def _use_streaming(self, file_path: Path) -> bool:
+        """Indique si le fichier doit être lu en flux.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin du fichier.
+
+        Returns:
+        -------
+        bool
+            True pour un CSV/TSV/xlsx au-delà du seuil configuré (ou si
+            ``streaming`` vaut True).
+        """
+        if file_path.suffix.lower() not in STREAMING_EXTENSIONS:
+            return False
+        streaming = self.config.get("streaming", "auto")
+        if streaming == "auto":
+            threshold_mb = float(self.config.get("streaming_threshold_mb", 20))
+            return file_path.stat().st_size >= threshold_mb * 1024 * 1024
+        return bool(streaming)
+
+    def _iter_frames(self, file_path: Path) -> Iterator[tuple[Optional[str], Any]]:
+        """Lit un fichier tabulaire par blocs de ``read_chunk_rows`` lignes.
+
+        Seul le bloc courant est en mémoire : ``read_csv(chunksize=...)``
+        pour les CSV/TSV, ``openpyxl`` en lecture seule pour les classeurs
+        Excel (la première ligne de chaque feuille sert d'en-tête).
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin du fichier (.csv, .tsv, .xlsx, .xlsm).
+
+        Yields:
+        ------
+        tuple[str | None, pandas.DataFrame]
+            (nom de la feuille ou None pour un CSV, bloc de lignes).
+        """
+        import pandas as pd
+
+        chunk_rows = max(1, int(self.config.get("read_chunk_rows", 50_000)))
+        file_extension = file_path.suffix.lower()
+
+        if file_extension in {".csv", ".tsv"}:
+            with pd.read_csv(
+                str(file_path),
+                sep="\t" if file_extension == ".tsv" else ",",
+                encoding_errors="replace",
+                on_bad_lines="skip",
+                chunksize=chunk_rows,
+            ) as reader:
+                for chunk in reader:
+                    yield None, chunk
+            return
+
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(
+            str(file_path),
+            read_only=self.config.get("read_only", True),
+            data_only=self.config.get("data_only", True),
+        )
+        try:
+            for sheet in workbook.worksheets:
+                rows = sheet.iter_rows(values_only=True)
+                header = next(rows, None)
+                if header is None:
+                    continue
+                # Même nommage que pandas pour les en-têtes vides
+                columns = [
+                    f"Unnamed: {i}" if value is None else str(value)
+                    for i, value in enumerate(header)
+                ]
+                width = len(columns)
+                buffer: list[tuple[Any, ...]] = []
+                for row in rows:
+                    # Lignes ramenées à la largeur de l'en-tête
+                    buffer.append(tuple(row[:width]) + (None,) * (width - len(row)))
+                    if len(buffer) >= chunk_rows:
+                        yield sheet.title, pd.DataFrame(buffer, columns=columns)
+                        buffer = []
+                if buffer:
+                    yield sheet.title, pd.DataFrame(buffer, columns=columns)
+        finally:
+            workbook.close()
+
+    def _render_rows(
+        self,
+        frame: Any,  # noqa: ANN401
+        output_format: str,
+    ) -> list[str]:
+        """Formate chaque ligne d'un bloc (une chaîne par ligne).
+
+        Les lignes sont formatées une seule fois par bloc puis regroupées
+        en fenêtres. Le markdown est produit directement (sans dépendance
+        à tabulate), comme les tableaux des extracteurs PDF.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+            Bloc de lignes.
+        output_format : str
+            "markdown", "csv" ou "json".
+
+        Returns:
+        -------
+        list[str]
+            Texte de chaque ligne, dans l'ordre.
+        """
+        if output_format == "json":
+            records = frame.to_json(orient="records", lines=True, force_ascii=False)
+            return [line for line in str(records).split("\n") if line]
+
+        rows = frame.astype(object).where(frame.notna(), "")
+        if output_format == "markdown":
+            return [
+                "| " + " | ".join(_markdown_cell(v) for v in row) + " |"
+                for row in rows.itertuples(index=False, name=None)
+            ]
+
+        lines: list[str] = []
+        writer = csv.writer(_LineCollector(lines), lineterminator="")
+        writer.writerows(rows.itertuples(index=False, name=None))
+        return lines
+
+    def _table_header(self, columns: list[Any], output_format: str) -> str:
+        """En-tête répété en tête de chaque fenêtre.
+
+        Parameters
+        ----------
+        columns : list
+            Noms des colonnes.
+        output_format : str
+            Format de sortie.
+
+        Returns:
+        -------
+        str
+            En-tête (vide pour le JSON, dont chaque ligne est nommée).
+        """
+        if output_format == "json":
+            return ""
+        if output_format == "markdown":
+            return "\n".join(
+                [
+                    "| " + " | ".join(_markdown_cell(c) for c in columns) + " |",
+                    "| " + " | ".join("---" for _ in columns) + " |",
+                ]
+            )
+        lines: list[str] = []
+        csv.writer(_LineCollector(lines), lineterminator="").writerow(columns)
+        return lines[0]
+
+    def _group_rows(self, rows: list[str], final: bool) -> Iterator[list[str]]:
+        """Regroupe des lignes formatées en fenêtres.
+
+        Une fenêtre est close à ``window_rows`` lignes ou avant de dépasser
+        ``window_max_chars`` caractères (au moins une ligne par fenêtre).
+        Les lignes d'une fenêtre incomplète restent dans ``rows`` pour le
+        bloc suivant, sauf si ``final``.
+
+        Parameters
+        ----------
+        rows : list[str]
+            Lignes formatées en attente (modifiée : lignes émises retirées).
+        final : bool
+            Dernier bloc de la feuille : la fenêtre incomplète est émise.
+
+        Yields:
+        ------
+        list[str]
+            Lignes d'une fenêtre.
+        """
+        window_rows = max(1, int(self.config.get("window_rows", 50)))
+        max_chars = int(self.config.get("window_max_chars", 1500))
+        start = 0
+        while start < len(rows):
+            end = start
+            size = 0
+            while end < len(rows) and end - start < window_rows:
+                size += len(rows[end]) + 1
+                if max_chars > 0 and size > max_chars and end > start:
+                    break
+                end += 1
+            if end == len(rows) and end - start < window_rows and not final:
+                # Fenêtre incomplète : complétée par le bloc suivant
+                break
+            yield rows[start:end]
+            start = end
+        del rows[:start]
+
+    def _iter_sheet_windows(
+        self,
+        file_path: Path,
+        output_format: str,
+        stats: dict[Optional[str], TableStats],
+        max_rows_display: int | None,
+    ) -> Iterator[str]:
+        """Lit le fichier en flux et produit les fenêtres de lignes.
+
+        Chaque fenêtre est autonome : un titre (feuille, numéros de lignes)
+        puis le tableau avec son en-tête. Les fenêtres sont continues d'un
+        bloc de lecture à l'autre. Les statistiques sont mises à jour pour
+        toutes les lignes, y compris au-delà de ``max_rows_display``.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin du fichier.
+        output_format : str
+            Format de sortie.
+        stats : dict[str | None, TableStats]
+            Statistiques par feuille, complétées au fil de la lecture.
+        max_rows_display : int | None
+            Nombre maximum de lignes émises par feuille.
+
+        Yields:
+        ------
+        str
+            Texte d'une fenêtre.
+        """
+        sheet_name: Optional[str] = None
+        started = False
+        header = ""
+        pending: list[str] = []  # lignes formatées pas encore émises
+        next_row = 1  # numéro de la première ligne en attente
+
+        def windows(final: bool) -> Iterator[str]:
+            nonlocal next_row
+            label = sheet_name if sheet_name is not None else file_path.name
+            for lines in self._group_rows(pending, final):
+                last_row = next_row + len(lines) - 1
+                if output_format == "json":
+                    table_text = "[" + ",\n".join(lines) + "]"
+                else:
+                    table_text = header + "\n" + "\n".join(lines)
+                yield f"### {label} — lignes {next_row}-{last_row}\n\n{table_text}"
+                next_row = last_row + 1
+
+        for chunk_sheet, chunk in self._iter_frames(file_path):
+            if not started or chunk_sheet != sheet_name:
+                yield from windows(final=True)
+                started = True
+                sheet_name = chunk_sheet
+                header = self._table_header(list(chunk.columns), output_format)
+                next_row = 1
+            sheet_stats = stats.setdefault(sheet_name, TableStats())
+            first_row = sheet_stats.rows + 1
+            sheet_stats.update(chunk)
+
+            if max_rows_display:
+                chunk = chunk.iloc[: max(0, max_rows_display - first_row + 1)]
+            pending.extend(self._render_rows(chunk, output_format))
+            yield from windows(final=False)
+
+        yield from windows(final=True)
+
+    def _extract_streaming(
+        self,
+        file_path: Path,
+        output_format: str,
+        include_stats: bool,
+        max_rows_display: int | None,
+    ) -> ExtractionResult:
+        """Extrait un gros fichier tabulaire par fenêtres de lignes.
+
+        Le fichier n'est jamais chargé en entier : il est lu par blocs et
+        chaque fenêtre de ``window_rows`` lignes est émise avec l'en-tête du
+        tableau, séparée des suivantes par une double ligne vide (premier
+        séparateur du chunking récursif). Chaque chunk reste ainsi
+        interprétable seul.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin du fichier.
+        output_format : str
+            Format de sortie.
+        include_stats : bool
+            Inclure les statistiques (calculées incrémentalement).
+        max_rows_display : int | None
+            Nombre maximum de lignes émises par feuille.
+
+        Returns:
+        -------
+        ExtractionResult
+            Résultat de l'extraction.
+        """
+        stats: dict[Optional[str], TableStats] = {}
+        # Fenêtres écrites au fil de l'eau : seul le texte final est conservé
+        # (pas de liste des fenêtres doublée par leur concaténation)
+        buffer = io.StringIO()
+        window_count = 0
+
+        def write(window: str) -> None:
+            nonlocal window_count
+            if window_count:
+                buffer.write("\n\n\n")
+            buffer.write(window)
+            window_count += 1
+
+        for window in self._iter_sheet_windows(
+            file_path, output_format, stats, max_rows_display
+        ):
+            write(window)
+
+        if include_stats:
+            for sheet_name, sheet_stats in stats.items():
+                if sheet_stats.rows:
+                    title = "Statistiques" + (f" — {sheet_name}" if sheet_name else "")
+                    write(f"### {title}\n\n{sheet_stats.render()}")
+
+        full_text = buffer.getvalue()
+        buffer.close()
+
+        metadata: dict[str, Any] = {
+            "file_size": file_path.stat().st_size,
+            "file_name": file_path.name,
+            "extractor": "pandas",
+            "streaming": True,
+            "windows": window_count,
+            "total_rows": sum(s.rows for s in stats.values()),
+        }
+        if None in stats:
+            metadata["rows"] = stats[None].rows
+            metadata["columns"] = len(stats[None].columns)
+            metadata["column_names"] = stats[None].columns
+        else:
+            metadata["sheets"] = len(stats)
+            metadata["total_columns"] = sum(len(s.columns) for s in stats.values())
+
+        min_length = self.config.get("min_text_length", 10)
+        if len(full_text.strip()) < min_length:
+            return ExtractionResult(
+                text=full_text,
+                success=False,
+                extractor_name=self.name,
+                metadata=metadata,
+                error=f"Texte extrait trop court ({len(full_text)} < {min_length})",
+                confidence_score=0.1,
+            )
+
+        confidence = 0.95
+
+        logger.debug(
+            f"pandas: Extrait {metadata['total_rows']} lignes en flux "
+            f"({window_count} fenêtres) (confidence={confidence:.2f})"
+        )
+
+        return ExtractionResult(
+            text=full_text,
+            success=True,
+            extractor_name=self.name,
+            metadata=metadata,
+            confidence_score=confidence,
+        )
+
     def _generate_stats(self, df: Any) -> str:
         """Génère des statistiques descriptives sur un DataFrame.
 
@@ -409,23 +855,6 @@ class PandasExtractor(BaseExtractor):
         str
             Statistiques formatées.
         """
-        stats_lines = []
-
-        # Nombre de lignes et colonnes
-        stats_lines.append(f"- **Lignes**: {len(df)}")
-        stats_lines.append(f"- **Colonnes**: {len(df.columns)}")
-
-        # Valeurs manquantes
-        missing = df.isnull().sum()
-        if missing.sum() > 0:
-            missing_pct = (missing / len(df) * 100).round(2)
-            stats_lines.append("- **Valeurs manquantes**:")
-            for col, count in missing[missing > 0].items():
-                stats_lines.append(f"  - {col}: {count} ({missing_pct[col]}%)")
-
-        # Types de colonnes
-        numeric_cols = df.select_dtypes(include=["number"]).columns
-        if len(numeric_cols) > 0:
-            stats_lines.append(f"- **Colonnes numériques**: {len(numeric_cols)}")
-
-        return "\n".join(stats_lines)
+        stats = TableStats()
+        stats.update(df)
+        return stats.render()
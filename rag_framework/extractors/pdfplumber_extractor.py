@@ -1,13 +1,49 @@
 """Extracteur basé sur pdfplumber (extraction avancée avec tableaux)."""
 
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Optional
 
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.page_ranges import (
+    PageRange,
+    PageText,
+    join_pages,
+    map_page_ranges,
+)
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Résultat d'une page : (numéro de page, texte + tableaux, nombre de tableaux)
+PageResult = tuple[int, str, int]
+
+
+def extract_pdfplumber_range(
+    page_range: PageRange, file_path: str, config: dict[str, Any]
+) -> list[PageResult]:
+    """Extrait le texte et les tableaux d'une plage de pages avec pdfplumber.
+
+    Fonction de niveau module pour être exécutée dans un pool de processus
+    (chaque worker ouvre le fichier indépendamment).
+
+    Args:
+        page_range: Plage ``(début, fin)`` de pages, 0-indexées.
+        file_path: Chemin du PDF.
+        config: Configuration de l'extracteur.
+
+    Returns:
+        Résultat de chaque page de la plage, dans l'ordre.
+    """
+    import pdfplumber
+
+    extractor = PdfPlumberExtractor(config)
+    with pdfplumber.open(
+        file_path, pages=list(range(page_range[0] + 1, page_range[1] + 1))
+    ) as pdf:
+        return [extractor._extract_page(page) for page in pdf.pages]
+
 
 class PdfPlumberExtractor(BaseExtractor):
     """Extracteur utilisant pdfplumber pour l'extraction avancée de PDF.
@@ -39,6 +75,11 @@ class PdfPlumberExtractor(BaseExtractor):
         - preserve_layout : bool (défaut: True)
         - min_text_length : int (défaut: 10)
         - extract_metadata : bool (défaut: True)
+        - workers : int (défaut: nombre de cœurs) - Processus d'extraction
+        - parallel_min_pages : int (défaut: 200) - Taille à partir de
+          laquelle le document est découpé en plages parallèles
+        - range_pages : int (défaut: 0 = automatique) - Pages par plage
+        - start_method : str (défaut: "spawn") - Démarrage des workers
 
     Notes:
     -----
@@ -94,66 +135,47 @@ class PdfPlumberExtractor(BaseExtractor):
             # Import tardif pour éviter erreur si librairie non installée
             import pdfplumber
 
-            # Options d'extraction
-            extract_tables = self.config.get("extract_tables", True)
-            table_format = self.config.get("table_format", "markdown")
-            preserve_layout = self.config.get("preserve_layout", True)
-
-            # Ouverture du PDF
+            # Ouverture du PDF (métadonnées et nombre de pages)
             with pdfplumber.open(str(file_path)) as pdf:
-                text_parts = []
-                total_tables = 0
-
-                # Extraction page par page
-                for page_num, page in enumerate(pdf.pages):
-                    # Extraction du texte
-                    if preserve_layout:
-                        # layout=True preserve spaces et indentation
-                        page_text = page.extract_text(layout=True)
-                    else:
-                        # Extraction basique plus rapide
-                        page_text = page.extract_text()
-
-                    if page_text:
-                        text_parts.append(f"=== Page {page_num + 1} ===\n{page_text}")
-
-                    # Extraction des tableaux si activé
-                    if extract_tables:
-                        tables = page.extract_tables()
-                        if tables:
-                            for table_idx, table in enumerate(tables):
-                                total_tables += 1
-                                formatted_table = self._format_table(
-                                    table, table_format, page_num + 1, table_idx + 1
-                                )
-                                if formatted_table:
-                                    text_parts.append(formatted_table)
-
-                # Concaténation de toutes les parties
-                full_text = "\n\n".join(text_parts)
-
-                # Métadonnées
-                metadata: dict[str, Any] = {
-                    "num_pages": len(pdf.pages),
-                    "file_size": file_path.stat().st_size,
-                    "file_name": file_path.name,
-                    "extractor": "pdfplumber",
-                    "tables_detected": total_tables,
-                }
-
-                # Métadonnées PDF si disponibles
-                if self.config.get("extract_metadata", True) and pdf.metadata:
-                    pdf_meta = pdf.metadata
-                    if pdf_meta.get("Title"):
-                        metadata["title"] = pdf_meta["Title"]
-                    if pdf_meta.get("Author"):
-                        metadata["author"] = pdf_meta["Author"]
-                    if pdf_meta.get("Subject"):
-                        metadata["subject"] = pdf_meta["Subject"]
-                    if pdf_meta.get("Creator"):
-                        metadata["creator"] = pdf_meta["Creator"]
-                    if pdf_meta.get("Producer"):
-                        metadata["producer"] = pdf_meta["Producer"]
+                num_pages = len(pdf.pages)
+                pdf_meta = pdf.metadata
+
+            # Extraction par plages de pages (en parallèle si gros document)
+            # et assemblage avec la position de chaque page
+            total_tables = 0
+
+            def pages() -> Iterator[PageText]:
+                nonlocal total_tables
+                for page_num, page_text, tables in self._iter_page_results(
+                    file_path, num_pages
+                ):
+                    total_tables += tables
+                    yield page_num, page_text
+
+            full_text, page_offsets = join_pages(pages())
+
+            # Métadonnées
+            metadata: dict[str, Any] = {
+                "num_pages": num_pages,
+                "file_size": file_path.stat().st_size,
+                "file_name": file_path.name,
+                "extractor": "pdfplumber",
+                "tables_detected": total_tables,
+                "page_offsets": page_offsets,
+            }
+
+            # Métadonnées PDF si disponibles
+            if self.config.get("extract_metadata", True) and pdf_meta:
+                if pdf_meta.get("Title"):
+                    metadata["title"] = pdf_meta["Title"]
+                if pdf_meta.get("Author"):
+                    metadata["author"] = pdf_meta["Author"]
+                if pdf_meta.get("Subject"):
+                    metadata["subject"] = pdf_meta["Subject"]
+                if pdf_meta.get("Creator"):
+                    metadata["creator"] = pdf_meta["Creator"]
+                if pdf_meta.get("Producer"):
+                    metadata["producer"] = pdf_meta["Producer"]
 
             # Vérification de la longueur minimale
             min_length = self.config.get("min_text_length", 10)
@@ -228,6 +250,80 @@ class PdfPlumberExtractor(BaseExtractor):
                 confidence_score=0.0,
             )
 
+    def _iter_page_results(
+        self, file_path: Path, num_pages: Optional[int] = None
+    ) -> Iterator[PageResult]:
+        """Itère sur les résultats par page, extraits par plages de pages.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin vers le fichier PDF.
+        num_pages : Optional[int]
+            Nombre de pages s'il est déjà connu.
+
+        Yields:
+        ------
+        tuple[int, str, int]
+            Numéro de page, texte (tableaux inclus), nombre de tableaux.
+        """
+        if num_pages is None:
+            import pdfplumber
+
+            with pdfplumber.open(str(file_path)) as pdf:
+                num_pages = len(pdf.pages)
+
+        extract_range = partial(
+            extract_pdfplumber_range, file_path=str(file_path), config=self.config
+        )
+        for results in map_page_ranges(extract_range, num_pages, self.config):
+            yield from results
+
+    def _extract_page(self, page: Any) -> PageResult:  # noqa: ANN401
+        """Extrait le texte et les tableaux d'une page pdfplumber.
+
+        Parameters
+        ----------
+        page : pdfplumber.page.Page
+            Page à extraire.
+
+        Returns:
+        -------
+        tuple[int, str, int]
+            Numéro de page, texte (en-tête de page et tableaux formatés
+            inclus, "" si vide), nombre de tableaux détectés.
+        """
+        page_num = page.page_number
+        text_parts = []
+
+        # Extraction du texte
+        if self.config.get("preserve_layout", True):
+            # layout=True preserve spaces et indentation
+            page_text = page.extract_text(layout=True)
+        else:
+            # Extraction basique plus rapide
+            page_text = page.extract_text()
+
+        if page_text:
+            text_parts.append(f"=== Page {page_num} ===\n{page_text}")
+
+        # Extraction des tableaux si activé
+        tables_count = 0
+        if self.config.get("extract_tables", True):
+            tables = page.extract_tables()
+            for table_idx, table in enumerate(tables or []):
+                tables_count += 1
+                formatted_table = self._format_table(
+                    table,
+                    self.config.get("table_format", "markdown"),
+                    page_num,
+                    table_idx + 1,
+                )
+                if formatted_table:
+                    text_parts.append(formatted_table)
+
+        return page_num, "\n\n".join(text_parts), tables_count
+
     def _format_table(
         self, table: list[list[Any]], format_type: str, page_num: int, table_num: int
     ) -> str:
@@ -1,14 +1,61 @@
 """Extracteur basé sur PyMuPDF/fitz (extraction rapide et performante)."""
 
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Optional
 
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.page_ranges import (
+    PageRange,
+    PageText,
+    join_pages,
+    map_page_ranges,
+)
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def extract_pymupdf_range(
+    page_range: PageRange, file_path: str, preserve_layout: bool
+) -> list[PageText]:
+    """Extrait le texte d'une plage de pages avec PyMuPDF.
+
+    Fonction de niveau module pour être exécutée dans un pool de processus
+    (chaque worker ouvre le fichier indépendamment).
+
+    Args:
+        page_range: Plage ``(début, fin)`` de pages, 0-indexées.
+        file_path: Chemin du PDF.
+        preserve_layout: Mode "text" (mise en page) ou "blocks" (rapide).
+
+    Returns:
+        ``(numéro de page, texte)`` de chaque page ("" si page sans texte).
+    """
+    import fitz  # PyMuPDF
+
+    pages: list[PageText] = []
+    with fitz.open(file_path) as doc:
+        for page_num in range(*page_range):
+            page = doc.load_page(page_num)
+
+            # Extraction avec ou sans préservation de la mise en page
+            if preserve_layout:
+                # "text" mode preserve layout mieux que "html" ou "dict"
+                page_text = page.get_text("text")
+            else:
+                # Mode "blocks" pour extraction plus rapide sans layout
+                blocks = page.get_text("blocks")
+                # Extraction du texte de chaque bloc
+                page_text = "\n".join(
+                    block[4] for block in blocks if isinstance(block[4], str)
+                )
+
+            pages.append((page_num + 1, page_text if page_text.strip() else ""))
+    return pages
+
+
 class PyMuPDFExtractor(BaseExtractor):
     """Extracteur utilisant PyMuPDF (fitz) pour l'extraction rapide de PDF.
 
@@ -40,6 +87,11 @@ class PyMuPDFExtractor(BaseExtractor):
         - preserve_layout : bool (défaut: True)
         - min_text_length : int (défaut: 10)
         - extract_metadata : bool (défaut: True)
+        - workers : int (défaut: nombre de cœurs) - Processus d'extraction
+        - parallel_min_pages : int (défaut: 200) - Taille à partir de
+          laquelle le document est découpé en plages parallèles
+        - range_pages : int (défaut: 0 = automatique) - Pages par plage
+        - start_method : str (défaut: "spawn") - Démarrage des workers
     """
 
     SUPPORTED_EXTENSIONS: ClassVar[set[str]] = {".pdf"}
@@ -67,6 +119,41 @@ class PyMuPDFExtractor(BaseExtractor):
         """
         return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
 
+    def _iter_pages(
+        self, file_path: Path, num_pages: Optional[int] = None
+    ) -> Iterator[PageText]:
+        """Itère sur le texte des pages, dans l'ordre de lecture.
+
+        Les gros documents sont extraits par plages de pages dans des
+        processus workers ; les pages sont produites dès que leur plage est
+        disponible, ce qui permet de les traiter en flux.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin vers le fichier PDF.
+        num_pages : Optional[int]
+            Nombre de pages s'il est déjà connu.
+
+        Yields:
+        ------
+        tuple[int, str]
+            Numéro de page (1-indexé) et texte ("" si page sans texte).
+        """
+        if num_pages is None:
+            import fitz  # PyMuPDF
+
+            with fitz.open(str(file_path)) as doc:
+                num_pages = len(doc)
+
+        extract_range = partial(
+            extract_pymupdf_range,
+            file_path=str(file_path),
+            preserve_layout=self.config.get("preserve_layout", True),
+        )
+        for pages in map_page_ranges(extract_range, num_pages, self.config):
+            yield from pages
+
     def extract(self, file_path: Path) -> ExtractionResult:
         """Extrait le texte d'un PDF avec PyMuPDF.
 
@@ -90,41 +177,21 @@ class PyMuPDFExtractor(BaseExtractor):
             # Import tardif pour éviter erreur si librairie non installée
             import fitz  # PyMuPDF
 
-            # Ouverture du document PDF
+            # Ouverture du document PDF (métadonnées et nombre de pages)
             doc = fitz.open(str(file_path))
+            num_pages = len(doc)
 
-            # Options d'extraction
-            preserve_layout = self.config.get("preserve_layout", True)
-
-            # Extraction du texte de toutes les pages
-            text_pages = []
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-
-                # Extraction avec ou sans préservation de la mise en page
-                if preserve_layout:
-                    # "text" mode preserve layout mieux que "html" ou "dict"
-                    page_text = page.get_text("text")
-                else:
-                    # Mode "blocks" pour extraction plus rapide sans layout
-                    page_text = page.get_text("blocks")
-                    # Extraction du texte de chaque bloc
-                    page_text = "\n".join(
-                        block[4] for block in page_text if isinstance(block[4], str)
-                    )
-
-                if page_text and page_text.strip():
-                    text_pages.append(page_text)
-
-            # Concaténation de toutes les pages
-            full_text = "\n\n".join(text_pages)
+            # Extraction par plages de pages (en parallèle si gros document)
+            # et assemblage avec la position de chaque page
+            full_text, page_offsets = join_pages(self._iter_pages(file_path, num_pages))
 
             # Métadonnées du PDF
             metadata: dict[str, Any] = {
-                "num_pages": len(doc),
+                "num_pages": num_pages,
                 "file_size": file_path.stat().st_size,
                 "file_name": file_path.name,
                 "extractor": "pymupdf",
+                "page_offsets": page_offsets,
             }
 
             # Extraction des métadonnées PDF si demandé
@@ -164,7 +231,7 @@ class PyMuPDFExtractor(BaseExtractor):
 
             # Calcul du score de confiance basé sur la densité de texte
             # PyMuPDF est généralement très fiable pour les PDF textuels
-            char_per_page = len(full_text) / len(doc) if len(doc) > 0 else 0  # type: ignore
+            char_per_page = len(full_text) / num_pages if num_pages > 0 else 0
 
             # Score élevé si bonne densité de texte (> 200 chars/page = 0.9)
             if char_per_page > 200:
@@ -4,6 +4,13 @@ from pathlib import Path
 from typing import ClassVar
 
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.encoding import (
+    EncodingGuess,
+    decode_file,
+    detect_encoding,
+    read_sample,
+    statistical_guess,
+)
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -30,8 +37,11 @@ class TextExtractor(BaseExtractor):
     config : dict[str, Any]
         Configuration de l'extracteur.
         Clés supportées:
-        - encoding : str (défaut: "utf-8")
-        - fallback_encodings : list[str] (défaut: ["utf-8", "latin-1", "cp1252"])
+        - encoding : str (défaut: None) - Encodage imposé (sinon détecté)
+        - fallback_encodings : list[str] (défaut: ["utf-8", "latin-1", "cp1252",
+          "iso-8859-1"]) - Candidats de la détection, par ordre de préférence
+        - sample_bytes : int (défaut: 65536) - Taille de l'échantillon analysé
+        - mmap_threshold_mb : float (défaut: 32) - Lecture via mmap au-delà
         - strip_html : bool (défaut: True pour .html)
         - min_text_length : int (défaut: 10)
     """
@@ -91,31 +101,11 @@ class TextExtractor(BaseExtractor):
         >>> if result.success:
         ...     print(f"Extrait {len(result.text)} caractères")
         """
-        # Encodages à essayer dans l'ordre
-        encodings = self.config.get(
-            "fallback_encodings", ["utf-8", "latin-1", "cp1252", "iso-8859-1"]
-        )
-
-        # Tentative de lecture avec différents encodages
-        text = None
-        encoding_used = None
-
-        for encoding in encodings:
-            try:
-                with open(file_path, encoding=encoding) as f:
-                    text = f.read()
-                encoding_used = encoding
-                logger.debug(f"Fichier {file_path.name} lu avec encodage {encoding}")
-                break
-
-            except (UnicodeDecodeError, LookupError):
-                continue
-
-        if text is None:
-            error_msg = (
-                f"Impossible de lire {file_path.name} "
-                f"avec les encodages : {', '.join(encodings)}"
-            )
+        try:
+            guess = self.detect_encoding(file_path)
+            text, encoding_used = self._decode(file_path, guess)
+        except (OSError, LookupError, ValueError) as e:
+            error_msg = f"Impossible de lire {file_path.name} : {e}"
             logger.error(error_msg)
             return ExtractionResult(
                 text="",
@@ -136,12 +126,16 @@ class TextExtractor(BaseExtractor):
             "file_size": file_path.stat().st_size,
             "format": file_path.suffix[1:],
             "encoding": encoding_used,
+            "encoding_detection": guess.method,
             "text_length": len(text),
         }
 
         # Score de confiance élevé (lecture directe)
         # Réduit si le texte est très court
-        if len(text) > 100:
+        if encoding_used != guess.encoding:
+            # Octets invalides au-delà de l'échantillon : texte décodé par repli
+            confidence = 0.7
+        elif len(text) > 100:
             confidence = 1.0
         elif len(text) > 10:
             confidence = 0.8
@@ -161,6 +155,82 @@ class TextExtractor(BaseExtractor):
             confidence_score=confidence,
         )
 
+    def _candidates(self) -> list[str]:
+        """Encodages candidats, par ordre de préférence."""
+        return list(
+            self.config.get(
+                "fallback_encodings", ["utf-8", "latin-1", "cp1252", "iso-8859-1"]
+            )
+        )
+
+    def detect_encoding(self, file_path: Path) -> EncodingGuess:
+        """Détecte l'encodage d'un fichier sur un échantillon de ses octets.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin vers le fichier texte.
+
+        Returns:
+        -------
+        EncodingGuess
+            Encodage retenu (``encoding`` de la configuration s'il est fixé).
+        """
+        if self.config.get("encoding"):
+            return EncodingGuess(self.config["encoding"], 1.0, "configured")
+        sample_bytes = int(self.config.get("sample_bytes", 64 * 1024))
+        sample = read_sample(file_path, sample_bytes)
+        return detect_encoding(
+            sample, self._candidates(), complete=len(sample) < sample_bytes
+        )
+
+    def _decode(self, file_path: Path, guess: EncodingGuess) -> tuple[str, str]:
+        """Décode le fichier en une passe avec l'encodage détecté.
+
+        Si un octet invalide apparaît au-delà de l'échantillon, l'encodage
+        est redéterminé sur les octets voisins parmi les autres candidats et
+        le fichier décodé une seconde fois, en remplaçant les séquences
+        encore invalides.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin vers le fichier texte.
+        guess : EncodingGuess
+            Encodage détecté.
+
+        Returns:
+        -------
+        tuple[str, str]
+            (texte, encodage utilisé).
+
+        Raises:
+        ------
+        UnicodeDecodeError
+            Si aucun encodage candidat ne décode le fichier.
+        """
+        mmap_threshold = int(
+            float(self.config.get("mmap_threshold_mb", 32)) * 1024 * 1024
+        )
+        try:
+            text = decode_file(file_path, guess.encoding, "strict", mmap_threshold)
+            return text, guess.encoding
+        except UnicodeDecodeError as e:
+            with open(file_path, "rb") as f:
+                f.seek(max(0, e.start - 4096))
+                window = f.read(8192)
+            others = [c for c in self._candidates() if c != guess.encoding]
+            fallback = statistical_guess(window, others or [guess.encoding])
+            if fallback.method == "none":
+                # Aucun encodage candidat ne convient
+                raise
+            logger.warning(
+                f"{file_path.name}: octet invalide en {guess.encoding} "
+                f"(position {e.start}), relecture en {fallback.encoding}"
+            )
+            text = decode_file(file_path, fallback.encoding, "replace", mmap_threshold)
+            return text, fallback.encoding
+
     def _strip_html_tags(self, html_text: str) -> str:
         """Supprime les balises HTML basiques.
 
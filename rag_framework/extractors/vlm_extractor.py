@@ -1,14 +1,21 @@
 """Extracteur basé sur VLM (Vision Language Model) - dernier recours."""
 
+from collections.abc import Iterator, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from rag_framework.config import get_llm_client, load_config
 from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.vlm_pages import VLMPageRunner, VLMPageSettings
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_PAGE_PROMPT = """Extract all text from this document page.
+Preserve the structure and formatting as much as possible.
+Include all visible text, tables, and captions.
+Return only the extracted text without any commentary."""
+
 
 class VLMExtractor(BaseExtractor):
     """Extracteur utilisant un Vision Language Model pour extraction visuelle.
@@ -45,6 +52,17 @@ class VLMExtractor(BaseExtractor):
         - max_pages : int (défaut: None)
         - prompt : str (prompt personnalisé)
         - image_dpi : int (défaut: 200)
+        - max_concurrency : int (défaut: 4) - Requêtes VLM en vol
+        - requests_per_minute : float (défaut: 0 = illimité)
+        - max_pixels : int (défaut: 1 500 000) - Budget de pixels par page
+        - image_format : str (défaut: "jpeg") - "jpeg" ou "png"
+        - jpeg_quality : int (défaut: 85)
+        - cache_dir : str (défaut: ".cache/vlm_pages", vide = désactivé) -
+          Cache des réponses par empreinte exacte des pixels de page
+        - cache_max_size_mb : float (défaut: 256) - Taille du cache ; les
+          réponses les moins récemment utilisées sont évincées au-delà
+        - near_duplicate_reuse : bool (défaut: False) - Cache indexé sur
+          l'empreinte perceptuelle (réutilisation entre pages proches)
     """
 
     def __init__(self, config: dict[str, Any]) -> None:
@@ -77,6 +95,16 @@ class VLMExtractor(BaseExtractor):
                 logger.warning(f"Erreur initialisation VLM client: {e}")
                 self.vlm_client = None
 
+        # Envoi concurrent, limité en débit et mis en cache des pages
+        self.runner: Optional[VLMPageRunner] = None
+        if self.vlm_client:
+            self.runner = VLMPageRunner(
+                self.vlm_client,
+                VLMPageSettings.from_config(config),
+                prompt=config.get("prompt", DEFAULT_PAGE_PROMPT),
+                max_tokens=config.get("max_tokens_per_page", 2000),
+            )
+
     def can_extract(self, file_path: Path) -> bool:
         """Vérifie si VLM peut traiter ce fichier.
 
@@ -122,10 +150,12 @@ class VLMExtractor(BaseExtractor):
             )
 
         try:
-            # Conversion du document en images
-            images = self._convert_to_images(file_path)
+            # Rendu paresseux des pages : extraction concurrente et en cache
+            assert self.runner is not None
+            stats_before = dict(self.runner.stats)
+            pages = self.runner.extract(self.iter_page_images(file_path))
 
-            if not images:
+            if not pages:
                 return ExtractionResult(
                     text="",
                     success=False,
@@ -135,32 +165,20 @@ class VLMExtractor(BaseExtractor):
                     confidence_score=0.0,
                 )
 
-            # Limitation du nombre de pages si configuré
-            max_pages = self.config.get("max_pages", None)
-            if max_pages:
-                images = images[:max_pages]
-
-            logger.info(f"VLM: Traitement de {len(images)} pages...")
-
-            # Extraction du texte page par page
-            extracted_pages = []
-            for page_num, image_path in enumerate(images, 1):
-                logger.debug(f"VLM: Extraction page {page_num}/{len(images)}")
-
-                page_text = self._extract_from_image(image_path, page_num)
-                if page_text:
-                    extracted_pages.append(page_text)
-
             # Concaténation de toutes les pages
-            full_text = "\n\n---\n\n".join(extracted_pages)
+            full_text = "\n\n---\n\n".join(text for text in pages if text)
 
             # Métadonnées
             metadata = {
                 "file_size": file_path.stat().st_size,
                 "file_name": file_path.name,
-                "num_pages_processed": len(images),
+                "num_pages_processed": len(pages),
                 "vlm_provider": self.config.get("provider"),
                 "vlm_model": self.config.get("model"),
+                "vlm_stats": {
+                    key: value - stats_before[key]
+                    for key, value in self.runner.stats.items()
+                },
             }
 
             # Score de confiance moyen pour VLM (dépend de la qualité du modèle)
@@ -168,7 +186,7 @@ class VLMExtractor(BaseExtractor):
 
             logger.info(
                 f"VLM: Extrait {len(full_text)} caractères "
-                f"depuis {len(images)} pages "
+                f"depuis {len(pages)} pages "
                 f"(confidence={confidence:.2f})"
             )
 
@@ -192,122 +210,49 @@ class VLMExtractor(BaseExtractor):
                 confidence_score=0.0,
             )
 
-    def _convert_to_images(self, file_path: Path) -> list[Path]:
-        """Convertit un document en liste d'images.
+    def iter_page_images(
+        self, file_path: Path, pages: Optional[Sequence[int]] = None
+    ) -> Iterator[Any]:
+        """Rend les pages d'un document en images PIL, à la demande.
+
+        Les pages PDF sont rastérisées en mémoire avec PyMuPDF à
+        ``image_dpi`` (aucun fichier temporaire) ; une image est renvoyée
+        telle quelle.
 
         Parameters
         ----------
         file_path : Path
             Chemin vers le document (PDF ou image).
-
-        Returns:
-        -------
-        list[Path]
-            Liste des chemins vers les images générées.
-        """
-        try:
-            # Si c'est déjà une image, retour direct
-            if file_path.suffix.lower() in {".png", ".jpg", ".jpeg", ".webp"}:
-                return [file_path]
-
-            # Conversion PDF → images
-            from pdf2image import convert_from_path
-
-            dpi = self.config.get("image_dpi", 200)
-
-            logger.debug(f"Conversion PDF en images (DPI={dpi})...")
-            images = convert_from_path(
-                str(file_path),
-                dpi=dpi,
-                fmt="png",
-            )
-
-            # Sauvegarde temporaire des images
-            import tempfile
-
-            temp_dir = Path(tempfile.mkdtemp())
-            image_paths = []
-
-            for i, image in enumerate(images):
-                image_path = temp_dir / f"page_{i + 1}.png"
-                image.save(str(image_path), "PNG")
-                image_paths.append(image_path)
-
-            logger.debug(f"Généré {len(image_paths)} images temporaires")
-            return image_paths
-
-        except ImportError:
-            logger.error(
-                "pdf2image non installé. Installez avec: pip install pdf2image"
-            )
-            return []
-        except Exception as e:
-            logger.error(f"Erreur conversion PDF → images: {e}")
-            return []
-
-    def _extract_from_image(self, image_path: Path, page_num: int) -> str:
-        """Extrait le texte d'une image avec VLM.
-
-        Parameters
-        ----------
-        image_path : Path
-            Chemin vers l'image.
-        page_num : int
-            Numéro de la page.
-
-        Returns:
-        -------
-        str
-            Texte extrait de l'image.
+        pages : Optional[Sequence[int]]
+            Pages PDF à rendre (1-indexées) ; défaut : les ``max_pages``
+            premières.
+
+        Yields:
+        ------
+        PIL.Image
+            Image de chaque page demandée, dans l'ordre.
         """
-        try:
-            import base64
-
-            # Lecture et encodage de l'image en base64
-            with open(image_path, "rb") as img_file:
-                image_data = base64.b64encode(img_file.read()).decode("utf-8")
-
-            # Récupération du prompt personnalisé ou utilisation du défaut
-            prompt = self.config.get(
-                "prompt",
-                """Extract all text from this document page.
-Preserve the structure and formatting as much as possible.
-Include all visible text, tables, and captions.
-Return only the extracted text without any commentary.""",
-            )
-
-            # Appel au VLM
-            # Note: L'API varie selon le provider (OpenAI, Anthropic, etc.)
-            # On utilise le format OpenAI compatible
-            assert self.vlm_client is not None
-
-            response = self.vlm_client.chat.completions.create(
-                model=self.vlm_client._model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{image_data}"
-                                },
-                            },
-                        ],
-                    }
-                ],
-                temperature=self.vlm_client._temperature,
-                max_tokens=self.config.get("max_tokens_per_page", 2000),
-            )
-
-            # Extraction du texte de la réponse
-            if response.choices and response.choices[0].message.content:
-                content: str = str(response.choices[0].message.content).strip()
-                return content
-
-            return ""
-
-        except Exception as e:
-            logger.error(f"Erreur extraction VLM page {page_num}: {e}")
-            return ""
+        from PIL import Image
+
+        max_pages = self.config.get("max_pages", None)
+
+        # Si c'est déjà une image, retour direct
+        if file_path.suffix.lower() in {".png", ".jpg", ".jpeg", ".webp"}:
+            with Image.open(file_path) as image:
+                image.load()
+                yield image
+            return
+
+        import fitz  # PyMuPDF
+
+        dpi = self.config.get("image_dpi", 200)
+        logger.debug(f"Rendu PDF en images (DPI={dpi})...")
+        with fitz.open(str(file_path)) as doc:
+            if pages is None:
+                num_pages = min(len(doc), max_pages) if max_pages else len(doc)
+                pages = range(1, num_pages + 1)
+            for page_num in pages:
+                pixmap = doc.load_page(page_num - 1).get_pixmap(dpi=dpi)
+                yield Image.frombytes(
+                    "RGB", (pixmap.width, pixmap.height), pixmap.samples
+                )
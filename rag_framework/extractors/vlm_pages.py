@@ -0,0 +1,425 @@
+"""Extraction VLM de pages : encodage en mémoire, concurrence et cache.
+
+Ce module factorise l'envoi d'images de pages à un Vision Language Model
+(format de chat OpenAI-compatible) pour VLMExtractor, ImageExtractor et
+HybridExtractor :
+
+- encodage en mémoire (aucun fichier temporaire), avec réduction de la
+  résolution jusqu'à un budget de pixels et compression JPEG ;
+- N requêtes en vol simultanément (ThreadPoolExecutor), espacées par un
+  limiteur de débit (requêtes par minute) ;
+- cache disque des réponses indexé par l'empreinte exacte des pixels du
+  rendu de la page : ré-ingérer un document dont une page n'a pas changé
+  ne coûte aucun appel, même si le fichier PDF a été régénéré (autres
+  pages modifiées, métadonnées, ordre des objets). La réutilisation entre
+  pages quasi identiques (empreinte perceptuelle dHash) est une option
+  explicite : deux pages ne différant que par quelques mots y partagent
+  la même réponse ;
+- ordre des résultats identique à l'ordre des pages.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from rag_framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class VLMPageSettings:
+    """Paramètres d'envoi des pages au VLM.
+
+    Attributes:
+        max_concurrency: Nombre maximum de requêtes VLM en vol.
+        requests_per_minute: Débit maximum (0 = illimité).
+        max_pixels: Budget de pixels par image envoyée (largeur x hauteur).
+        image_format: Format d'encodage ("jpeg" ou "png").
+        jpeg_quality: Qualité JPEG (1-95).
+        cache_dir: Répertoire du cache des réponses ("" = désactivé).
+        cache_max_size_mb: Taille maximale du cache ; les réponses les moins
+            récemment utilisées sont évincées au-delà.
+        near_duplicate_reuse: Indexe le cache sur l'empreinte perceptuelle
+            plutôt que sur les pixels exacts. Une page re-rendue avec un
+            léger écart (anticrénelage, DPI) réutilise la réponse, mais une
+            page dont seuls quelques mots changent aussi.
+        hash_size: Côté de l'empreinte perceptuelle (bits = hash_size²),
+            utilisée seulement avec ``near_duplicate_reuse``.
+    """
+
+    max_concurrency: int = 4
+    requests_per_minute: float = 0.0
+    max_pixels: int = 1_500_000
+    image_format: str = "jpeg"
+    jpeg_quality: int = 85
+    cache_dir: str = ".cache/vlm_pages"
+    cache_max_size_mb: float = 256.0
+    near_duplicate_reuse: bool = False
+    hash_size: int = 32
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "VLMPageSettings":
+        """Construit les paramètres depuis la configuration d'un extracteur.
+
+        Args:
+            config: Configuration de l'extracteur VLM.
+
+        Returns:
+            Paramètres (valeurs par défaut pour les clés absentes).
+        """
+        known = set(cls.__dataclass_fields__)
+        values = {k: v for k, v in config.items() if k in known}
+        if values.get("cache_dir") is None and "cache_dir" in values:
+            values["cache_dir"] = ""
+        return cls(**values)
+
+
+class RateLimiter:
+    """Limiteur de débit espaçant régulièrement les appels (thread-safe).
+
+    Args:
+        requests_per_minute: Débit maximum ; 0 ou moins désactive la limite.
+    """
+
+    def __init__(self, requests_per_minute: float) -> None:
+        """Initialise le limiteur."""
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Bloque jusqu'au prochain créneau disponible."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def pixel_hash(image: Any) -> str:  # noqa: ANN401
+    """Empreinte exacte (SHA-256) des pixels d'une image.
+
+    Le mode et les dimensions font partie de l'empreinte : deux rendus de
+    tailles différentes aux octets identiques restent distincts.
+
+    Args:
+        image: Image PIL.
+
+    Returns:
+        Empreinte hexadécimale.
+    """
+    digest = hashlib.sha256(f"{image.mode}:{image.width}x{image.height}:".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def perceptual_hash(image: Any, hash_size: int = 32) -> str:  # noqa: ANN401
+    """Empreinte perceptuelle (dHash) d'une image.
+
+    L'image est réduite en niveaux de gris à ``(hash_size + 1) x hash_size``
+    puis chaque pixel est comparé à son voisin de droite. L'empreinte ne
+    dépend que du rendu de la page, pas des octets du fichier. Les
+    comparaisons se font à l'identique : tolérer quelques bits d'écart
+    confondrait des pages de texte de même gabarit.
+
+    Args:
+        image: Image PIL.
+        hash_size: Côté de l'empreinte.
+
+    Returns:
+        Empreinte hexadécimale (``hash_size²`` bits).
+    """
+    from PIL import Image
+
+    small = image.convert("L").resize(
+        (hash_size + 1, hash_size), Image.Resampling.LANCZOS
+    )
+    pixels = small.tobytes()
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+def encode_image(
+    image: Any,  # noqa: ANN401
+    max_pixels: int,
+    image_format: str = "jpeg",
+    jpeg_quality: int = 85,
+) -> tuple[str, str, tuple[int, int]]:
+    """Encode une image en base64, réduite au budget de pixels.
+
+    Args:
+        image: Image PIL (non modifiée).
+        max_pixels: Nombre maximum de pixels (0 = pas de réduction).
+        image_format: "jpeg" ou "png".
+        jpeg_quality: Qualité JPEG.
+
+    Returns:
+        Tuple (données base64, type MIME, taille envoyée).
+    """
+    from PIL import Image
+
+    width, height = image.size
+    if max_pixels and width * height > max_pixels:
+        scale = (max_pixels / (width * height)) ** 0.5
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        image = image.resize(size, Image.Resampling.LANCZOS)
+
+    buffer = io.BytesIO()
+    if image_format == "png":
+        image.save(buffer, format="PNG", optimize=True)
+        mime_type = "image/png"
+    else:
+        if image.mode not in {"RGB", "L"}:
+            image = image.convert("RGB")
+        image.save(buffer, format="JPEG", quality=jpeg_quality, optimize=True)
+        mime_type = "image/jpeg"
+
+    return base64.b64encode(buffer.getvalue()).decode("ascii"), mime_type, image.size
+
+
+class VLMPageCache:
+    """Cache disque des textes extraits, un fichier JSON par clé, borné (LRU).
+
+    Comme ExtractionCache, la date de modification d'une entrée sert de date
+    d'accès : l'ordre LRU survit aux redémarrages.
+
+    Args:
+        root: Répertoire du cache.
+        max_size_mb: Taille maximale ; les entrées les moins récemment
+            utilisées sont évincées au-delà.
+    """
+
+    def __init__(self, root: Path, max_size_mb: float = 256.0) -> None:
+        """Initialise le cache et indexe les entrées existantes."""
+        self.root = Path(root)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        # {clé: taille en octets}, de la moins à la plus récemment utilisée
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._scan()
+
+    def _path(self, key: str) -> Path:
+        """Chemin du fichier associé à une clé."""
+        return self.root / key[:2] / f"{key}.json"
+
+    def _scan(self) -> None:
+        """Reconstruit l'index LRU depuis le disque (ordre des dates d'accès)."""
+        if not self.root.is_dir():
+            return
+        found = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._size += size
+        self._evict()
+
+    def get(self, key: str) -> Optional[str]:
+        """Texte en cache pour ``key`` (None si absent ou illisible)."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = str(json.load(f)["text"])
+        except (OSError, ValueError, KeyError):
+            return None
+        # Date d'accès LRU (persistée via la date de modification)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Enregistre le texte de ``key`` (écriture atomique), puis évince."""
+        payload = json.dumps({"text": text}, ensure_ascii=False).encode("utf-8")
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        with self._lock:
+            self._size += len(payload) - self._entries.pop(key, 0)
+            self._entries[key] = len(payload)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Supprime les entrées les moins récemment utilisées au-delà du quota."""
+        while self._size > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+
+class VLMPageRunner:
+    """Envoie des images de pages à un VLM, en parallèle et avec cache.
+
+    Args:
+        client: Client VLM OpenAI-compatible (``get_llm_client``).
+        settings: Paramètres de concurrence, d'encodage et de cache.
+        prompt: Instruction envoyée avec chaque image.
+        max_tokens: Tokens maximum de la réponse par page.
+
+    Example:
+        >>> runner = VLMPageRunner(client, VLMPageSettings(), prompt)
+        >>> texts = runner.extract(page_images)
+    """
+
+    def __init__(
+        self,
+        client: Any,  # noqa: ANN401
+        settings: VLMPageSettings,
+        prompt: str,
+        max_tokens: int = 2000,
+    ) -> None:
+        """Initialise le runner."""
+        self.client = client
+        self.settings = settings
+        self.prompt = prompt
+        self.max_tokens = max_tokens
+        self.limiter = RateLimiter(settings.requests_per_minute)
+        self.cache = (
+            VLMPageCache(Path(settings.cache_dir), settings.cache_max_size_mb)
+            if settings.cache_dir
+            else None
+        )
+
+        # La clé de cache dépend aussi de tout ce qui influence la réponse
+        signature = json.dumps(
+            [
+                getattr(client, "_model", ""),
+                prompt,
+                max_tokens,
+                settings.max_pixels,
+                settings.image_format,
+                settings.jpeg_quality,
+            ]
+        )
+        self._signature = hashlib.sha256(signature.encode("utf-8")).hexdigest()
+
+        # Statistiques cumulées (exposées dans les métadonnées)
+        self.stats: dict[str, int] = {
+            "pages": 0,
+            "cache_hits": 0,
+            "requests": 0,
+            "bytes_sent": 0,
+        }
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str, value: int = 1) -> None:
+        """Incrémente un compteur de statistiques (thread-safe)."""
+        with self._stats_lock:
+            self.stats[key] += value
+
+    def extract(self, images: Iterable[Any]) -> list[Optional[str]]:
+        """Extrait le texte de chaque image, dans l'ordre.
+
+        Les images sont consommées une à une : chacune est hachée et
+        encodée puis libérée. Au plus ``2 x max_concurrency`` charges
+        utiles compressées attendent leur envoi : le rendu des pages
+        suivantes est suspendu tant que le VLM n'a pas rattrapé.
+
+        Args:
+            images: Images PIL des pages (itérable éventuellement paresseux).
+
+        Returns:
+            Texte extrait par page (None si l'appel a échoué).
+        """
+        results: list[Any] = []
+        max_workers = max(1, self.settings.max_concurrency)
+        pending = threading.BoundedSemaphore(2 * max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for page_num, image in enumerate(images, 1):
+                self._count("pages")
+                # Empreinte de la page + signature des paramètres de l'appel
+                if self.settings.near_duplicate_reuse:
+                    page_hash = perceptual_hash(image, self.settings.hash_size)
+                else:
+                    page_hash = pixel_hash(image)
+                key = hashlib.sha256(
+                    f"{page_hash}-{self._signature}".encode("ascii")
+                ).hexdigest()
+                cached = self.cache.get(key) if self.cache else None
+                if cached is not None:
+                    self._count("cache_hits")
+                    results.append(cached)
+                    continue
+
+                data, mime_type, _size = encode_image(
+                    image,
+                    self.settings.max_pixels,
+                    self.settings.image_format,
+                    self.settings.jpeg_quality,
+                )
+                pending.acquire()
+                future = executor.submit(self._call, data, mime_type, page_num, key)
+                future.add_done_callback(lambda _: pending.release())
+                results.append(future)
+
+        return [r.result() if isinstance(r, Future) else r for r in results]
+
+    def _call(
+        self, data: str, mime_type: str, page_num: int, key: str
+    ) -> Optional[str]:
+        """Appelle le VLM pour une page et met le résultat en cache."""
+        self.limiter.acquire()
+        self._count("requests")
+        self._count("bytes_sent", len(data))
+        try:
+            response = self.client.chat.completions.create(
+                model=self.client._model,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": self.prompt},
+                            {
+                                "type": "image_url",
+                                "image_url": {"url": f"data:{mime_type};base64,{data}"},
+                            },
+                        ],
+                    }
+                ],
+                temperature=self.client._temperature,
+                max_tokens=self.max_tokens,
+            )
+        except Exception as e:
+            # Échec non mis en cache : la page sera retentée à la prochaine
+            # ingestion
+            logger.error(f"Erreur extraction VLM page {page_num}: {e}")
+            return None
+
+        text = ""
+        if response.choices and response.choices[0].message.content:
+            text = str(response.choices[0].message.content).strip()
+        if self.cache:
+            self.cache.put(key, text)
+        return text
@@ -7,6 +7,18 @@ Auteur: RAG Framework Team
 Version: 1.0.0
 """
 
+from rag_framework.models.fake_embeddings import FakeEmbedder, FakeEmbeddingSettings
 from rag_framework.models.loader import ModelLoader, load_model
+from rag_framework.models.remote_embeddings import (
+    RemoteEmbeddingClient,
+    RemoteEmbeddingSettings,
+)
 
-__all__ = ["ModelLoader", "load_model"]
+__all__ = [
+    "FakeEmbedder",
+    "FakeEmbeddingSettings",
+    "ModelLoader",
+    "RemoteEmbeddingClient",
+    "RemoteEmbeddingSettings",
+    "load_model",
+]
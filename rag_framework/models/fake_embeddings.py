@@ -0,0 +1,206 @@
+"""Générateur d'embeddings factices, déterministes et vectorisés.
+
+Utilisé pour les tests de charge et d'endurance des étapes 07 et 08 sans
+modèle ni réseau. Chaque vecteur ne dépend que du contenu du texte et de la
+configuration :
+
+- la graine d'un texte est dérivée d'un hash BLAKE2b de son contenu (stable
+  d'un processus à l'autre, contrairement à ``hash()``) ;
+- le bruit gaussien est produit pour tout le batch d'un coup par un
+  générateur à compteur (SplitMix64 + Box-Muller) en opérations NumPy ;
+- une structure en clusters optionnelle (centroïdes tirés par un
+  ``np.random.Generator`` local) rend les tests de rappel ANN significatifs :
+  les voisins exacts d'un vecteur sont ceux de son cluster.
+
+Aucun état global NumPy n'est modifié et la sortie est une matrice float32.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from rag_framework.exceptions import ValidationError
+
+# Constantes de SplitMix64
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _splitmix64(state: NDArray[np.uint64]) -> NDArray[np.uint64]:
+    """Fonction de mélange SplitMix64 appliquée élément par élément."""
+    z = state + _GOLDEN_GAMMA
+    z = (z ^ (z >> np.uint64(30))) * _MIX_1
+    z = (z ^ (z >> np.uint64(27))) * _MIX_2
+    mixed: NDArray[np.uint64] = z ^ (z >> np.uint64(31))
+    return mixed
+
+
+def _uniform(state: NDArray[np.uint64]) -> NDArray[np.float64]:
+    """Convertit des entiers 64 bits mélangés en flottants dans ]0, 1]."""
+    bits = (_splitmix64(state) >> np.uint64(11)) + 1
+    uniform: NDArray[np.float64] = bits * (1.0 / 2**53)
+    return uniform
+
+
+@dataclass
+class FakeEmbeddingSettings:
+    """Paramètres du générateur d'embeddings factices.
+
+    Attributes:
+        dimensions: Dimension des vecteurs.
+        n_clusters: Nombre de clusters (0 = bruit isotrope sans structure).
+        cluster_spread: Écart-type du bruit autour du centroïde (relatif à
+            des centroïdes de variance unitaire par composante).
+        seed: Graine globale (centroïdes et flux de bruit).
+        normalize: Normalise les vecteurs en norme L2.
+    """
+
+    dimensions: int = 1024
+    n_clusters: int = 0
+    cluster_spread: float = 0.5
+    seed: int = 0
+    normalize: bool = False
+
+    @classmethod
+    def from_config(
+        cls, config: dict[str, Any], dimensions: Optional[int] = None
+    ) -> "FakeEmbeddingSettings":
+        """Construit les paramètres depuis la section ``fake`` du YAML.
+
+        Args:
+            config: Section ``fake`` de 06_embedding.yaml.
+            dimensions: Dimension de l'étape (clé ``dimensions``), prioritaire
+                si renseignée.
+
+        Returns:
+            Paramètres validés.
+
+        Raises:
+            ValidationError: Si une valeur est hors bornes.
+        """
+        settings = cls(
+            dimensions=int(dimensions or config.get("dimensions", cls.dimensions)),
+            n_clusters=int(config.get("n_clusters", cls.n_clusters)),
+            cluster_spread=float(config.get("cluster_spread", cls.cluster_spread)),
+            seed=int(config.get("seed", cls.seed)),
+            normalize=bool(config.get("normalize", cls.normalize)),
+        )
+        if settings.dimensions <= 0 or settings.n_clusters < 0:
+            raise ValidationError(
+                "Paramètres d'embeddings factices invalides",
+                details={
+                    "dimensions": settings.dimensions,
+                    "n_clusters": settings.n_clusters,
+                },
+            )
+        if settings.cluster_spread < 0:
+            raise ValidationError(
+                "cluster_spread doit être positif",
+                details={"cluster_spread": settings.cluster_spread},
+            )
+        return settings
+
+
+class FakeEmbedder:
+    """Embedder factice déterministe : même texte, même vecteur, partout."""
+
+    def __init__(self, settings: Optional[FakeEmbeddingSettings] = None) -> None:
+        """Initialise l'embedder et tire les centroïdes éventuels.
+
+        Args:
+            settings: Paramètres (défauts si None).
+        """
+        self.settings = settings or FakeEmbeddingSettings()
+        self.centroids: Optional[NDArray[np.float32]] = None
+
+        if self.settings.n_clusters > 0:
+            rng = np.random.default_rng(self.settings.seed)
+            self.centroids = rng.standard_normal(
+                (self.settings.n_clusters, self.settings.dimensions),
+                dtype=np.float32,
+            )
+
+    def text_seeds(self, texts: list[str]) -> NDArray[np.uint64]:
+        """Graines 64 bits dérivées du contenu des textes (BLAKE2b).
+
+        Args:
+            texts: Textes à vectoriser.
+
+        Returns:
+            Tableau (n,) de graines.
+        """
+        salt = self.settings.seed.to_bytes(8, "little", signed=True)
+        digests = b"".join(
+            hashlib.blake2b(text.encode("utf-8"), digest_size=8, salt=salt).digest()
+            for text in texts
+        )
+        return np.frombuffer(digests, dtype="<u8").astype(np.uint64)
+
+    def cluster_of(self, texts: list[str]) -> NDArray[np.int64]:
+        """Cluster assigné à chaque texte (vérité terrain des tests ANN).
+
+        Args:
+            texts: Textes à vectoriser.
+
+        Returns:
+            Indices de cluster (n,), ou -1 sans structure en clusters.
+        """
+        if self.settings.n_clusters == 0:
+            return np.full(len(texts), -1, dtype=np.int64)
+        seeds = self.text_seeds(texts)
+        clusters: NDArray[np.int64] = (
+            seeds % np.uint64(self.settings.n_clusters)
+        ).astype(np.int64)
+        return clusters
+
+    def embed_matrix(self, texts: list[str]) -> NDArray[np.float32]:
+        """Génère les embeddings d'un batch sous forme de matrice float32.
+
+        Args:
+            texts: Textes à vectoriser.
+
+        Returns:
+            Matrice (len(texts), dimensions).
+        """
+        dims = self.settings.dimensions
+        if not texts:
+            return np.empty((0, dims), dtype=np.float32)
+
+        seeds = self.text_seeds(texts)
+
+        # Compteurs (graine du texte, composante) : deux flux indépendants
+        # pour la transformée de Box-Muller
+        counters = np.arange(dims, dtype=np.uint64) * np.uint64(2)
+        state = seeds[:, np.newaxis] * _GOLDEN_GAMMA + counters
+        u1 = _uniform(state)
+        u2 = _uniform(state + np.uint64(1))
+        noise = np.sqrt(-2.0 * np.log(u1)) * np.cos(2.0 * np.pi * u2)
+        matrix = noise.astype(np.float32)
+
+        if self.centroids is not None:
+            clusters = seeds % np.uint64(self.settings.n_clusters)
+            matrix *= np.float32(self.settings.cluster_spread)
+            matrix += self.centroids[clusters.astype(np.intp)]
+
+        if self.settings.normalize:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+
+        return matrix
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Génère les embeddings d'un batch (interface des autres clients).
+
+        Args:
+            texts: Textes à vectoriser.
+
+        Returns:
+            Liste d'embeddings (un par texte, ordre préservé).
+        """
+        embeddings: list[list[float]] = self.embed_matrix(texts).tolist()
+        return embeddings
@@ -16,6 +16,10 @@ from typing import Any, Callable, Literal
 
 import yaml
 
+from rag_framework.models.remote_embeddings import (
+    RemoteEmbeddingClient,
+    RemoteEmbeddingSettings,
+)
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -281,33 +285,28 @@ class ModelLoader:
     def _load_ollama_embeddings(
         self, model_name: str, provider_config: dict[str, Any]
     ) -> Callable[[list[str]], list[list[float]]]:
-        """Charge un modèle Ollama local."""
+        """Charge un modèle Ollama local.
+
+        Utilise l'endpoint batché ``/api/embed`` (plusieurs textes par requête)
+        via le client HTTP mutualisé.
+        """
         if not importlib.util.find_spec("requests"):
             raise ImportError(
                 "requests non installé. Installez avec : rye add requests"
             )
 
-        import requests
-
         base_url = provider_config.get("base_url", "http://127.0.0.1:11434")
-        # Ollama utilise /api/embeddings sans /v1
-        if base_url.endswith("/v1"):
-            base_url = base_url[:-3]
-        embed_url = f"{base_url}/api/embeddings"
-        logger.info(f"Chargement du modèle Ollama : {model_name} ({base_url})")
-
-        def embed_fn(texts: list[str]) -> list[list[float]]:
-            """Encode les textes via Ollama API."""
-            embeddings = []
-            for text in texts:
-                response = requests.post(
-                    embed_url, json={"model": model_name, "prompt": text}, timeout=30
-                )
-                response.raise_for_status()
-                embeddings.append(response.json()["embedding"])
-            return embeddings
+        client = RemoteEmbeddingClient(
+            protocol="ollama",
+            base_url=base_url,
+            model=model_name,
+            settings=RemoteEmbeddingSettings.from_config(
+                provider_config.get("remote_client", {})
+            ),
+        )
+        logger.info(f"Chargement du modèle Ollama : {model_name} ({client.endpoint})")
 
-        return embed_fn
+        return client.embed
 
     def _load_huggingface_embeddings(
         self, model_name: str, provider_config: dict[str, Any]
@@ -318,8 +317,6 @@ class ModelLoader:
                 "requests non installé. Installez avec : rye add requests"
             )
 
-        import requests
-
         api_key = provider_config.get("api_key", os.getenv("HUGGINGFACE_API_KEY"))
         if not api_key or api_key == "${HUGGINGFACE_API_KEY}":
             raise ValueError(
@@ -331,18 +328,19 @@ class ModelLoader:
             f"https://api-inference.huggingface.co/pipeline/"
             f"feature-extraction/{model_name}"
         )
-        headers = {"Authorization": f"Bearer {api_key}"}
+        # Session keep-alive réutilisée entre les appels (un seul client)
+        client = RemoteEmbeddingClient(
+            protocol="huggingface",
+            base_url=api_url,
+            model=model_name,
+            api_key=api_key,
+            settings=RemoteEmbeddingSettings.from_config(
+                provider_config.get("remote_client", {})
+            ),
+        )
         logger.info(f"Chargement du modèle Hugging Face Inference : {model_name}")
 
-        def embed_fn(texts: list[str]) -> list[list[float]]:
-            """Encode les textes avec l'API Hugging Face."""
-            response = requests.post(
-                api_url, headers=headers, json={"inputs": texts}, timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
-
-        return embed_fn
+        return client.embed
 
 
 def load_model(
@@ -0,0 +1,387 @@
+"""Client HTTP mutualisé pour les providers d'embeddings distants.
+
+Ce module fournit une couche cliente commune aux providers d'embeddings
+accessibles par HTTP (API OpenAI-compatibles, Ollama, Hugging Face Inference) :
+
+- connexions HTTP persistantes (keep-alive) via une ``requests.Session``
+  dotée d'un pool de connexions dimensionné sur la concurrence ;
+- batching côté serveur quand le protocole le permet, en respectant les
+  limites du provider (nombre de textes et nombre de tokens par requête) ;
+- N requêtes en vol simultanément (ThreadPoolExecutor) ;
+- retry avec backoff exponentiel sur 429 et 5xx (en-tête ``Retry-After``
+  respecté s'il est présent) ;
+- ordre de sortie identique à l'ordre d'entrée.
+
+Auteur: RAG Framework Team
+Version: 1.0.0
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from rag_framework.exceptions import EmbeddingError
+from rag_framework.telemetry import get_telemetry
+from rag_framework.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    import requests
+
+logger = get_logger(__name__)
+
+# Compteurs Prometheus alimentés par les statistiques du client
+_METRICS = {
+    key: get_telemetry().counter(f"rag_embedding_{key}_total", description)
+    for key, description in (
+        ("requests", "Requêtes HTTP d'embeddings envoyées"),
+        ("retries", "Requêtes d'embeddings retentées (429/5xx)"),
+        ("texts", "Textes envoyés au service d'embeddings"),
+    )
+}
+
+# Protocoles HTTP supportés
+SUPPORTED_PROTOCOLS = ("openai", "ollama", "huggingface")
+
+# Codes HTTP pour lesquels une nouvelle tentative a du sens
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class RemoteEmbeddingSettings:
+    """Paramètres de la couche cliente d'embeddings distants.
+
+    Attributes:
+        max_concurrency: Nombre maximum de requêtes HTTP en vol.
+        max_batch_size: Nombre maximum de textes par requête.
+        max_batch_tokens: Nombre maximum de tokens (estimés) par requête.
+        chars_per_token: Ratio caractères/token pour l'estimation des tokens.
+        max_retries: Nombre de nouvelles tentatives sur 429/5xx.
+        backoff_base: Délai de base (secondes) du backoff exponentiel.
+        backoff_max: Délai maximum (secondes) entre deux tentatives.
+        timeout_seconds: Timeout HTTP par requête.
+    """
+
+    max_concurrency: int = 4
+    max_batch_size: int = 64
+    max_batch_tokens: int = 8192
+    chars_per_token: float = 4.0
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    timeout_seconds: float = 60.0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "RemoteEmbeddingSettings":
+        """Construit les paramètres depuis une section de configuration YAML.
+
+        Args:
+            config: Section ``remote_client`` de 06_embedding.yaml.
+
+        Returns:
+            Paramètres (valeurs par défaut pour les clés absentes).
+        """
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in config.items() if k in known})
+
+
+class RemoteEmbeddingClient:
+    """Client d'embeddings HTTP concurrent, batché et tolérant aux erreurs.
+
+    Example:
+        >>> client = RemoteEmbeddingClient(
+        ...     protocol="openai",
+        ...     base_url="http://127.0.0.1:1234/v1",
+        ...     model="text-embedding-3-small",
+        ...     api_key="sk-...",
+        ... )
+        >>> vectors = client.embed(["Bonjour", "Hello"])
+    """
+
+    def __init__(
+        self,
+        protocol: str,
+        base_url: str,
+        model: str,
+        api_key: Optional[str] = None,
+        settings: Optional[RemoteEmbeddingSettings] = None,
+        session: Optional["requests.Session"] = None,
+    ) -> None:
+        """Initialise le client.
+
+        Args:
+            protocol: Protocole HTTP ("openai", "ollama" ou "huggingface").
+            base_url: URL de base du provider.
+            model: Nom du modèle d'embedding.
+            api_key: Clé API (optionnelle pour les providers locaux).
+            settings: Paramètres de concurrence/batching/retry.
+            session: Session HTTP à réutiliser (créée si None).
+
+        Raises:
+            ValueError: Si le protocole n'est pas supporté.
+        """
+        if protocol not in SUPPORTED_PROTOCOLS:
+            raise ValueError(
+                f"Protocole d'embeddings non supporté : '{protocol}'. "
+                f"Disponibles : {', '.join(SUPPORTED_PROTOCOLS)}"
+            )
+
+        self.protocol = protocol
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.api_key = api_key
+        self.settings = settings or RemoteEmbeddingSettings()
+        self.session = session or self._create_session()
+
+        # Statistiques cumulées (exposées pour le benchmark et les logs)
+        self.stats: dict[str, int] = {"requests": 0, "retries": 0, "texts": 0}
+        self._stats_lock = threading.Lock()
+
+    def _create_session(self) -> "requests.Session":
+        """Crée une session HTTP keep-alive avec un pool dimensionné.
+
+        Returns:
+            Session ``requests`` configurée.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # Un slot de pool par requête en vol : évite l'ouverture de nouvelles
+        # connexions TCP/TLS quand toutes les requêtes sont concurrentes
+        pool_size = max(1, self.settings.max_concurrency)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        if self.api_key:
+            session.headers["Authorization"] = f"Bearer {self.api_key}"
+
+        return session
+
+    @property
+    def endpoint(self) -> str:
+        """URL de l'endpoint d'embeddings selon le protocole."""
+        if self.protocol == "openai":
+            return f"{self.base_url}/embeddings"
+        if self.protocol == "ollama":
+            # Ollama expose l'API native sans le préfixe /v1
+            base_url = self.base_url
+            if base_url.endswith("/v1"):
+                base_url = base_url[:-3]
+            return f"{base_url}/api/embed"
+        return self.base_url
+
+    def close(self) -> None:
+        """Ferme les connexions du pool."""
+        self.session.close()
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Génère les embeddings d'une liste de textes.
+
+        Les textes sont découpés en batches conformes aux limites du provider,
+        envoyés en parallèle, puis réassemblés dans l'ordre d'entrée.
+
+        Args:
+            texts: Textes à vectoriser.
+
+        Returns:
+            Embeddings (un par texte, même ordre que l'entrée).
+
+        Raises:
+            EmbeddingError: Si un batch échoue après toutes les tentatives.
+        """
+        if not texts:
+            return []
+
+        batches = self.plan_batches(texts)
+        results: list[Optional[list[list[float]]]] = [None] * len(batches)
+        max_workers = max(1, min(self.settings.max_concurrency, len(batches)))
+
+        if max_workers == 1:
+            for idx, (start, end) in enumerate(batches):
+                results[idx] = self._post_with_retry(texts[start:end])
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._post_with_retry, texts[start:end])
+                    for start, end in batches
+                ]
+                # Parcours dans l'ordre de soumission : l'ordre est préservé
+                for idx, future in enumerate(futures):
+                    results[idx] = future.result()
+
+        embeddings: list[list[float]] = []
+        for batch_result in results:
+            assert batch_result is not None
+            embeddings.extend(batch_result)
+
+        self._count("texts", len(texts))
+        return embeddings
+
+    def _count(self, key: str, value: int = 1) -> None:
+        """Incrémente un compteur de statistiques (thread-safe)."""
+        with self._stats_lock:
+            self.stats[key] += value
+        _METRICS[key].inc(value)
+
+    def plan_batches(self, texts: list[str]) -> list[tuple[int, int]]:
+        """Découpe les textes en plages [start, end) respectant les limites.
+
+        Un texte seul dépassant ``max_batch_tokens`` forme son propre batch
+        (la troncature reste à la charge de l'appelant).
+
+        Args:
+            texts: Textes à découper.
+
+        Returns:
+            Liste de plages d'indices (start, end).
+        """
+        max_size = max(1, self.settings.max_batch_size)
+        max_tokens = max(1, self.settings.max_batch_tokens)
+
+        batches: list[tuple[int, int]] = []
+        start = 0
+        current_tokens = 0
+
+        for idx, text in enumerate(texts):
+            tokens = self.estimate_tokens(text)
+            size = idx - start
+            if size > 0 and (size >= max_size or current_tokens + tokens > max_tokens):
+                batches.append((start, idx))
+                start = idx
+                current_tokens = 0
+            current_tokens += tokens
+
+        batches.append((start, len(texts)))
+        return batches
+
+    def estimate_tokens(self, text: str) -> int:
+        """Estime le nombre de tokens d'un texte (heuristique caractères).
+
+        Args:
+            text: Texte à évaluer.
+
+        Returns:
+            Nombre de tokens estimé (au moins 1).
+        """
+        return max(1, int(len(text) / self.settings.chars_per_token) + 1)
+
+    def _build_payload(self, texts: list[str]) -> dict[str, Any]:
+        """Construit le corps JSON de la requête selon le protocole."""
+        if self.protocol == "openai":
+            return {"model": self.model, "input": texts}
+        if self.protocol == "ollama":
+            return {"model": self.model, "input": texts}
+        return {"inputs": texts}
+
+    def _parse_response(
+        self,
+        payload: Any,  # noqa: ANN401
+        expected: int,
+    ) -> list[list[float]]:
+        """Extrait les embeddings d'une réponse selon le protocole.
+
+        Args:
+            payload: Réponse JSON décodée.
+            expected: Nombre d'embeddings attendus.
+
+        Returns:
+            Embeddings dans l'ordre des textes envoyés.
+
+        Raises:
+            EmbeddingError: Si la réponse est mal formée.
+        """
+        if self.protocol == "openai":
+            items = payload.get("data", [])
+            # L'API renvoie un champ "index" : tri explicite par sécurité
+            items = sorted(items, key=lambda item: item.get("index", 0))
+            embeddings = [item["embedding"] for item in items]
+        elif self.protocol == "ollama":
+            embeddings = payload.get("embeddings", [])
+        else:
+            embeddings = payload
+
+        if not isinstance(embeddings, list) or len(embeddings) != expected:
+            raise EmbeddingError(
+                "Réponse d'embeddings invalide",
+                details={
+                    "protocol": self.protocol,
+                    "expected": expected,
+                    "received": len(embeddings) if isinstance(embeddings, list) else 0,
+                },
+            )
+        return embeddings
+
+    def _post_with_retry(self, texts: list[str]) -> list[list[float]]:
+        """Envoie un batch avec retry/backoff sur erreurs transitoires.
+
+        Args:
+            texts: Textes du batch.
+
+        Returns:
+            Embeddings du batch.
+
+        Raises:
+            EmbeddingError: Si le batch échoue définitivement.
+        """
+        import requests
+
+        payload = self._build_payload(texts)
+        last_error: Optional[str] = None
+
+        for attempt in range(self.settings.max_retries + 1):
+            retry_after: Optional[float] = None
+            try:
+                self._count("requests")
+                response = self.session.post(
+                    self.endpoint, json=payload, timeout=self.settings.timeout_seconds
+                )
+
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    last_error = f"HTTP {response.status_code}"
+                    retry_after = self._parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+                else:
+                    response.raise_for_status()
+                    return self._parse_response(response.json(), len(texts))
+
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = str(e)
+            except requests.HTTPError as e:
+                # Erreurs 4xx non transitoires : pas de retry
+                raise EmbeddingError(
+                    f"Erreur HTTP du provider d'embeddings: {e}",
+                    details={"endpoint": self.endpoint, "batch_size": len(texts)},
+                ) from e
+
+            if attempt < self.settings.max_retries:
+                delay = retry_after
+                if delay is None:
+                    delay = self.settings.backoff_base * (2**attempt)
+                delay = min(delay, self.settings.backoff_max)
+                self._count("retries")
+                logger.warning(
+                    f"Embeddings: {last_error} (tentative "
+                    f"{attempt + 1}/{self.settings.max_retries + 1}). "
+                    f"Retry dans {delay:.2f}s..."
+                )
+                time.sleep(delay)
+
+        raise EmbeddingError(
+            f"Échec du batch d'embeddings après "
+            f"{self.settings.max_retries + 1} tentatives: {last_error}",
+            details={"endpoint": self.endpoint, "batch_size": len(texts)},
+        )
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Convertit l'en-tête Retry-After (en secondes) si présent."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
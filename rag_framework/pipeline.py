@@ -1,32 +1,95 @@
 """Orchestrateur principal du pipeline RAG."""
 
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from typing import Any, Optional
 
 from rag_framework.config import load_config, load_step_config
 from rag_framework.exceptions import RAGFrameworkError
-from rag_framework.steps import (
-    AuditStep,
-    ChunkingStep,
-    EmbeddingStep,
-    EnrichmentStep,
-    MonitoringStep,
-    NormalizationStep,
-    PreprocessingStep,
-    VectorStorageStep,
-)
+from rag_framework.profiling import Profiler, ProfilingSettings
+from rag_framework.steps import load_step_class
 from rag_framework.steps.base_step import BaseStep
+from rag_framework.telemetry import (
+    configure_telemetry,
+    export_telemetry,
+    get_telemetry,
+)
 from rag_framework.types import StepData
+from rag_framework.utils.checkpoint import CheckpointStore
 from rag_framework.utils.logger import get_logger, setup_logger
+from rag_framework.utils.step_graph import build_dependencies, critical_path
 from rag_framework.validation import validate_dependencies
 
 logger = get_logger(__name__)
 
+telemetry = get_telemetry()
+_RUNS = telemetry.counter("rag_pipeline_runs_total", "Exécutions du pipeline")
+_STEP_ERRORS = telemetry.counter("rag_step_errors_total", "Étapes en échec")
+
+# Étapes exécutées par sous-batches lorsque les checkpoints sont activés :
+# (clé de données en entrée, clé de données en sortie). Ce sont les étapes
+# coûteuses (LLM, modèle d'embeddings, base vectorielle) qui traitent les
+# chunks indépendamment les uns des autres.
+SUB_BATCHED_STEPS: dict[str, tuple[str, str]] = {
+    "EnrichmentStep": ("chunks", "enriched_chunks"),
+    "EmbeddingStep": ("enriched_chunks", "embedded_chunks"),
+    "VectorStorageStep": ("normalized_chunks", "storage_result"),
+}
+
+# Les 8 étapes du pipeline dans l'ordre d'exécution :
+# (classe d'étape, fichier de config YAML, clé d'activation globale).
+# L'ordre est CRITIQUE : chaque étape dépend des sorties des précédentes.
+# Les classes sont importées à l'initialisation, seulement si activées.
+STEP_DEFINITIONS: list[tuple[str, str, str]] = [
+    ("MonitoringStep", "01_monitoring.yaml", "monitoring_enabled"),
+    ("PreprocessingStep", "02_preprocessing.yaml", "preprocessing_enabled"),
+    ("ChunkingStep", "03_chunking.yaml", "chunking_enabled"),
+    ("EnrichmentStep", "04_enrichment.yaml", "enrichment_enabled"),
+    ("AuditStep", "05_audit.yaml", "audit_enabled"),
+    ("EmbeddingStep", "06_embedding.yaml", "embedding_enabled"),
+    ("NormalizationStep", "07_normalization.yaml", "normalization_enabled"),
+    ("VectorStorageStep", "08_vector_storage.yaml", "vector_storage_enabled"),
+]
+
+
+def read_pipeline_status(config_dir: Path = Path("config")) -> dict[str, Any]:
+    """Statut du pipeline lu dans global.yaml, sans initialiser les étapes.
+
+    Ni les dépendances ni les étapes ne sont chargées : le statut est
+    disponible instantanément (``--status``).
+
+    Parameters
+    ----------
+    config_dir : Path, optional
+        Répertoire contenant les fichiers de configuration.
+
+    Returns:
+    -------
+    dict[str, Any]
+        Même structure que ``RAGPipeline.get_status``.
+    """
+    steps_config = load_config(config_dir).steps
+    steps = [
+        {"name": name, "enabled": bool(steps_config.get(key, True))}
+        for name, _, key in STEP_DEFINITIONS
+    ]
+    return {
+        "total_steps": len(steps),
+        "enabled_steps": sum(1 for step in steps if step["enabled"]),
+        "steps": steps,
+    }
+
 
 class RAGPipeline:
     """Orchestrateur principal du pipeline RAG."""
 
-    def __init__(self, config_dir: Path = Path("config")) -> None:
+    def __init__(
+        self, config_dir: Path = Path("config"), profile: Optional[bool] = None
+    ) -> None:
         """Initialize the RAG pipeline.
 
         Parameters
@@ -34,6 +97,9 @@ class RAGPipeline:
         config_dir : Path, optional
             Répertoire contenant les fichiers de configuration.
             (default: Path("config"))
+        profile : Optional[bool], optional
+            Profile chaque exécution (``--profile``) ; par défaut,
+            global.yaml > profiling.enabled.
         """
         # Stockage du répertoire de configuration pour accès ultérieur
         self.config_dir = config_dir
@@ -59,10 +125,30 @@ class RAGPipeline:
             log_format=log_config.get("format"),  # Format des messages
         )
 
+        # Métriques et spans (exports Prometheus / OpenTelemetry)
+        configure_telemetry(self.global_config.telemetry)
+
         # Initialisation séquentielle des 8 étapes du pipeline
         # Chaque étape charge sa propre configuration YAML
         self.steps: list[BaseStep] = self._initialize_steps()
 
+        # Checkpoints durables par étape (reprise après échec)
+        checkpoint_config = self.global_config.checkpointing
+        self.checkpoint_store = CheckpointStore.from_config(checkpoint_config)
+        self.sub_batch_size: int = checkpoint_config.get("sub_batch_size", 100)
+        self.run_id: Optional[str] = None
+        # Décomposition du temps de la dernière exécution (voir execute)
+        self.last_timings: dict[str, Any] = {}
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.collect_garbage()
+
+        # Profilage des exécutions (dossier de la dernière dans last_profile)
+        self.profiling = ProfilingSettings.from_config(self.global_config.profiling)
+        if profile is not None:
+            self.profiling.enabled = profile
+        self.last_profile: Optional[Path] = None
+        self._profiler: Optional[Profiler] = None
+
         # Log de confirmation avec comptage des étapes actives
         logger.info(
             f"Pipeline initialisé avec {len(self.steps)} étapes "
@@ -80,20 +166,6 @@ class RAGPipeline:
         # Liste pour accumuler les instances d'étapes
         steps: list[BaseStep] = []
 
-        # Définition des 8 étapes du pipeline dans l'ordre d'exécution
-        # Format: (Classe Python, Fichier de config YAML, Clé d'activation globale)
-        # L'ordre est CRITIQUE : chaque étape dépend des sorties des précédentes
-        step_classes = [
-            (MonitoringStep, "01_monitoring.yaml", "monitoring_enabled"),
-            (PreprocessingStep, "02_preprocessing.yaml", "preprocessing_enabled"),
-            (ChunkingStep, "03_chunking.yaml", "chunking_enabled"),
-            (EnrichmentStep, "04_enrichment.yaml", "enrichment_enabled"),
-            (AuditStep, "05_audit.yaml", "audit_enabled"),
-            (EmbeddingStep, "06_embedding.yaml", "embedding_enabled"),
-            (NormalizationStep, "07_normalization.yaml", "normalization_enabled"),
-            (VectorStorageStep, "08_vector_storage.yaml", "vector_storage_enabled"),
-        ]
-
         # Récupération des flags d'activation globaux depuis global.yaml
         global_steps_config = self.global_config.steps
 
@@ -101,7 +173,7 @@ class RAGPipeline:
         monitoring_config: dict[str, Any] = {}
 
         # Boucle d'initialisation avec gestion d'erreur
-        for step_class, config_file, global_enabled_key in step_classes:
+        for step_name, config_file, global_enabled_key in STEP_DEFINITIONS:
             try:
                 # Vérification de l'activation de l'étape dans global.yaml
                 # C'est le SEUL endroit où l'activation est contrôlée.
@@ -111,20 +183,23 @@ class RAGPipeline:
 
                 if not global_enabled:
                     logger.info(
-                        f"Étape {step_class.__name__} désactivée globalement "
+                        f"Étape {step_name} désactivée globalement "
                         f"({global_enabled_key}=false dans global.yaml)"
                     )
                     continue  # Passer à l'étape suivante sans initialiser
 
+                # Import de la classe de l'étape (uniquement si activée)
+                step_class = load_step_class(step_name)
+
                 # Chargement de la configuration spécifique à cette étape
                 step_config = load_step_config(config_file, self.config_dir)
 
                 # Cas spécial: MonitoringStep - sauvegarder la config pour preprocessing
-                if step_class.__name__ == "MonitoringStep":
+                if step_name == "MonitoringStep":
                     monitoring_config = step_config
 
                 # Cas spécial: PreprocessingStep - transférer file_management et output du monitoring
-                if step_class.__name__ == "PreprocessingStep" and monitoring_config:
+                if step_name == "PreprocessingStep" and monitoring_config:
                     # Transfert de la configuration file_management depuis monitoring
                     if "file_management" in monitoring_config:
                         step_config["file_management"] = monitoring_config[
@@ -149,23 +224,49 @@ class RAGPipeline:
                 steps.append(step)
 
                 # Log de confirmation (niveau DEBUG pour éviter verbosité)
-                logger.debug(f"Étape initialisée: {step_class.__name__}")
+                logger.debug(f"Étape initialisée: {step_name}")
 
             except Exception as e:
                 # En cas d'erreur, logger et propager l'exception
                 # Le pipeline ne peut pas démarrer avec une étape défaillante
-                logger.error(f"Erreur initialisation {step_class.__name__}: {e}")
+                logger.error(f"Erreur initialisation {step_name}: {e}")
                 raise  # Re-raise pour arrêter le pipeline
 
         return steps
 
-    def execute(self, input_data: Optional[StepData] = None) -> StepData:
-        """Exécute séquentiellement toutes les étapes du pipeline.
+    def execute(
+        self,
+        input_data: Optional[StepData] = None,
+        run_id: Optional[str] = None,
+        resume: bool = False,
+    ) -> StepData:
+        """Exécute toutes les étapes du pipeline.
+
+        Les étapes sont ordonnancées selon les clés de données qu'elles
+        consomment et produisent. Avec ``performance.parallel_steps: true``
+        (opt-in), les branches indépendantes (ex. audit et embeddings)
+        s'exécutent en parallèle, dans la limite de
+        ``performance.max_workers`` ; sinon les étapes s'exécutent une à
+        une, dans l'ordre de leurs dépendances. La décomposition du temps par
+        étape et le chemin critique sont disponibles dans ``last_timings``.
+
+        Lorsque les checkpoints sont activés (global.yaml > checkpointing),
+        les données sont enregistrées après chaque étape et après chaque
+        sous-batch des étapes coûteuses. Une exécution en échec peut être
+        reprise avec ``resume=True`` : les étapes terminées ne sont pas
+        rejouées (les fichiers déjà déplacés par le FileManager ne sont
+        donc pas recherchés à nouveau).
 
         Parameters
         ----------
         input_data : Optional[StepData], optional
             Données d'entrée optionnelles (default: None).
+        run_id : Optional[str], optional
+            Identifiant de l'exécution. Généré si absent ; avec ``resume``,
+            la dernière exécution interrompue est reprise s'il est absent.
+        resume : bool, optional
+            Reprend l'exécution ``run_id`` depuis son dernier checkpoint
+            (default: False).
 
         Returns:
         -------
@@ -175,44 +276,167 @@ class RAGPipeline:
         Raises:
         ------
         RAGFrameworkError
-            En cas d'erreur durant l'exécution.
+            En cas d'erreur durant l'exécution, ou si la reprise est demandée
+            sans checkpoint disponible.
         """
         # Initialisation du dictionnaire de données si non fourni
         # Ce dictionnaire est passé et enrichi à chaque étape
         data = input_data or {}
+        completed_steps: list[str] = []
+        store = self.checkpoint_store
+
+        if resume:
+            if store is None:
+                raise RAGFrameworkError(
+                    "Reprise impossible: checkpoints désactivés "
+                    "(global.yaml > checkpointing.enabled)"
+                )
+            run_id = run_id or store.latest_resumable_run()
+            if run_id is None:
+                raise RAGFrameworkError("Aucune exécution à reprendre")
+            data, completed_steps = store.resume_run(run_id)
+        elif store is not None:
+            run_id = run_id or store.new_run_id()
+            store.start_run(run_id)
+        self.run_id = run_id
 
         # En-tête visuel pour les logs (facilite le suivi dans les fichiers de log)
         logger.info("=" * 60)
         logger.info("DÉMARRAGE DU PIPELINE RAG")
+        if run_id is not None:
+            action = "reprise" if resume else "exécution"
+            logger.info(f"Identifiant d'{action}: {run_id}")
         logger.info("=" * 60)
 
-        # Exécution séquentielle de chaque étape
-        # enumerate(..., 1) pour numérotation à partir de 1 (plus lisible)
-        for idx, step in enumerate(self.steps, 1):
+        # Ordonnancement en graphe : une étape démarre dès que les étapes
+        # dont elle dépend (clés de données consommées) sont terminées ; les
+        # branches indépendantes (ex. audit ∥ embeddings) tournent en parallèle
+        names = [step.__class__.__name__ for step in self.steps]
+        dependencies = build_dependencies(self.steps, names)
+        positions = {name: idx for idx, name in enumerate(names, 1)}
+        max_parallel = (
+            self.global_config.performance.max_workers
+            if self.global_config.performance.parallel_steps
+            else 1
+        )
+        if self.profiling.enabled:
+            # Mesures par étape non mélangées entre branches parallèles
+            max_parallel = 1
+
+        done: set[str] = set()
+        pending: list[BaseStep] = []
+        for step in self.steps:
+            step_name = step.__class__.__name__
+            idx = positions[step_name]
             # Vérification du flag enabled : skip si désactivée
             if not step.enabled:
-                logger.info(f"[{idx}/8] {step.__class__.__name__}: DÉSACTIVÉE")
-                continue  # Passe à l'étape suivante sans exécution
-
-            try:
-                # Log de début d'étape avec indicateur de progression [X/8]
-                logger.info(f"[{idx}/8] {step.__class__.__name__}: DÉBUT")
+                logger.info(f"[{idx}/8] {step_name}: DÉSACTIVÉE")
+                done.add(step_name)
+            elif step_name in completed_steps:
+                logger.info(f"[{idx}/8] {step_name}: DÉJÀ TERMINÉE (checkpoint)")
+                done.add(step_name)
+            else:
+                pending.append(step)
+
+        timings: dict[str, dict[str, float]] = {}
+        failure: Optional[tuple[str, Exception]] = None
+        pipeline_start = time.perf_counter()
+        # Span racine : les spans des étapes (exécutées dans le pool) lui
+        # sont rattachés explicitement
+        run_span = telemetry.start_span(
+            "pipeline.run",
+            run_id=run_id or "",
+            resume=resume,
+            files=len(data.get("monitored_files", [])),
+        )
 
-                # Exécution de l'étape avec les données courantes
-                # La méthode execute() DOIT retourner un dict enrichi
-                # Les données en sortie deviennent l'entrée de l'étape suivante
-                data = step.execute(data)
-                logger.info(f"[{idx}/8] {step.__class__.__name__}: TERMINÉE ✓")
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, max_parallel), thread_name_prefix="rag-step"
+        )
+        with self._profile_run(run_id), executor:
+            running: dict[Future[StepData], tuple[BaseStep, StepData]] = {}
+
+            while pending or running:
+                # Lancement des étapes prêtes (aucune après un échec)
+                for step in list(pending):
+                    if failure is not None or len(running) >= max_parallel:
+                        break
+                    step_name = step.__class__.__name__
+                    if not all(dep in done for dep in dependencies[step_name]):
+                        continue
+                    pending.remove(step)
+                    # Log de début d'étape avec indicateur de progression [X/8]
+                    logger.info(f"[{positions[step_name]}/8] {step_name}: DÉBUT")
+                    timings[step_name] = {"start": time.perf_counter() - pipeline_start}
+                    # Chaque étape reçoit sa propre copie (superficielle) des
+                    # données ; ses sorties sont fusionnées à la fin
+                    snapshot = dict(data)
+                    future = executor.submit(
+                        self._run_step, step, dict(snapshot), run_id, run_span
+                    )
+                    running[future] = (step, snapshot)
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step, snapshot = running.pop(future)
+                    step_name = step.__class__.__name__
+                    idx = positions[step_name]
+                    timing = timings[step_name]
+                    timing["end"] = time.perf_counter() - pipeline_start
+                    timing["duration"] = timing["end"] - timing["start"]
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"[{idx}/8] {step_name}: ERREUR",
+                            exc_info=e,
+                        )
+                        _STEP_ERRORS.inc(step=step_name)
+                        if failure is None:
+                            failure = (step_name, e)
+                        continue
+
+                    # Fusion des clés ajoutées ou remplacées par l'étape
+                    for key, value in result.items():
+                        if key not in snapshot or snapshot[key] is not value:
+                            data[key] = value
+                    done.add(step_name)
+                    if store is not None and run_id is not None:
+                        store.save_stage(run_id, step_name, data)
+                    logger.info(
+                        f"[{idx}/8] {step_name}: TERMINÉE ✓ ({timing['duration']:.2f}s)"
+                    )
 
-            except Exception as e:
+        self.last_timings = self._summarize_timings(
+            dependencies, timings, time.perf_counter() - pipeline_start
+        )
+        _RUNS.inc(status="failed" if failure else "succeeded")
+        run_span.end(failure[1] if failure else None)
+        export_telemetry()
+
+        if failure is not None:
+            step_name, error = failure
+            details = {"step": step_name, "error": str(error)}
+            if store is not None and run_id is not None:
+                store.fail_run(run_id, step_name, str(error))
+                details["run_id"] = run_id
                 logger.error(
-                    f"[{idx}/8] {step.__class__.__name__}: ERREUR",
-                    exc_info=True,
+                    f"Exécution {run_id} reprenable depuis {step_name} "
+                    f"(--resume {run_id})"
                 )
-                raise RAGFrameworkError(
-                    f"Erreur à l'étape {step.__class__.__name__}",
-                    details={"step": step.__class__.__name__, "error": str(e)},
-                ) from e
+                self._collect_checkpoints()
+            raise RAGFrameworkError(
+                f"Erreur à l'étape {step_name}",
+                details=details,
+            ) from error
+
+        if store is not None and run_id is not None:
+            store.complete_run(run_id)
+            self._collect_checkpoints()
 
         logger.info("=" * 60)
         logger.info("PIPELINE TERMINÉ AVEC SUCCÈS")
@@ -220,6 +444,219 @@ class RAGPipeline:
 
         return data
 
+    def _run_step(
+        self,
+        step: BaseStep,
+        data: StepData,
+        run_id: Optional[str],
+        parent_span: Any = None,  # noqa: ANN401
+    ) -> StepData:
+        """Exécute une étape (dans un thread du pool du pipeline).
+
+        Args:
+            step: Étape à exécuter.
+            data: Copie des données courantes.
+            run_id: Identifiant de l'exécution (None sans checkpoints).
+            parent_span: Span de l'exécution (les threads du pool n'héritent
+                pas du span courant).
+
+        Returns:
+            Données en sortie de l'étape.
+        """
+        step_name = step.__class__.__name__
+        with telemetry.span(f"step.{step_name}", parent=parent_span or None):
+            # La méthode execute() DOIT retourner un dict enrichi
+            if run_id is not None and step_name in SUB_BATCHED_STEPS:
+                run = partial(self._execute_in_sub_batches, step, data, run_id)
+            else:
+                run = partial(step.execute, data)
+            if self._profiler is not None:
+                return self._profiler.call(f"step.{step_name}", run)
+            return run()
+
+    def _collect_checkpoints(self) -> None:
+        """Purge les checkpoints expirés ou orphelins après une exécution.
+
+        Un processus long (--serve, --watch) récupère ainsi l'espace des
+        exécutions en échec jamais reprises. Une erreur de purge ne fait
+        pas échouer l'exécution.
+        """
+        assert self.checkpoint_store is not None
+        try:
+            self.checkpoint_store.collect_garbage()
+        except (OSError, RAGFrameworkError) as e:
+            logger.warning(f"Purge des checkpoints impossible: {e}")
+
+    @contextmanager
+    def _profile_run(self, run_id: Optional[str]) -> Iterator[None]:
+        """Profile l'exécution si le profilage est activé.
+
+        Args:
+            run_id: Identifiant de l'exécution (nom du dossier de profil).
+        """
+        if not self.profiling.enabled:
+            yield
+            return
+        profiler = Profiler(self.profiling, label=run_id or "run").start()
+        self._profiler = profiler
+        try:
+            yield
+        finally:
+            self._profiler = None
+            self.last_profile = profiler.stop()
+
+    def _summarize_timings(
+        self,
+        dependencies: dict[str, list[str]],
+        timings: dict[str, dict[str, float]],
+        wall_clock: float,
+    ) -> dict[str, Any]:
+        """Construit et journalise la décomposition du temps par étape.
+
+        Args:
+            dependencies: Dépendances directes entre étapes.
+            timings: Début, fin et durée (secondes) des étapes exécutées.
+            wall_clock: Durée totale de l'exécution.
+
+        Returns:
+            Décomposition ``{"wall_clock_seconds", "steps", "critical_path",
+            "critical_path_seconds"}``.
+        """
+        durations = {
+            name: timing["duration"]
+            for name, timing in timings.items()
+            if "duration" in timing
+        }
+        path, path_seconds = critical_path(dependencies, durations)
+        summary: dict[str, Any] = {
+            "wall_clock_seconds": round(wall_clock, 4),
+            "steps": {
+                name: {
+                    **{key: round(value, 4) for key, value in timing.items()},
+                    "dependencies": dependencies.get(name, []),
+                }
+                for name, timing in timings.items()
+            },
+            "critical_path": path,
+            "critical_path_seconds": round(path_seconds, 4),
+        }
+
+        if durations:
+            logger.info("Temps par étape (début → fin, durée) :")
+            for name, timing in sorted(timings.items(), key=lambda t: t[1]["start"]):
+                marker = "*" if name in path else " "
+                logger.info(
+                    f" {marker} {name:<20} {timing['start']:8.2f}s → "
+                    f"{timing.get('end', timing['start']):8.2f}s "
+                    f"({timing.get('duration', 0.0):.2f}s)"
+                )
+            logger.info(
+                f"Chemin critique (*): {' → '.join(path)} "
+                f"({path_seconds:.2f}s sur {wall_clock:.2f}s au total, "
+                f"{sum(durations.values()):.2f}s cumulés)"
+            )
+        return summary
+
+    def _plan_sub_batches(self, items: list[Any]) -> list[tuple[int, int]]:
+        """Découpe une liste de chunks en sous-batches.
+
+        Un sous-batch n'est jamais coupé au milieu d'un document : les
+        traitements au niveau document (ex. résumé de l'enrichissement)
+        voient tous les chunks du document.
+
+        Args:
+            items: Chunks à découper.
+
+        Returns:
+            Liste d'intervalles [début, fin).
+        """
+        bounds: list[tuple[int, int]] = []
+        start = 0
+        for i in range(1, len(items) + 1):
+            if i == len(items):
+                bounds.append((start, i))
+            elif i - start >= self.sub_batch_size:
+                previous = items[i - 1]
+                current = items[i]
+                same_document = (
+                    isinstance(previous, dict)
+                    and isinstance(current, dict)
+                    and previous.get("source_file") is not None
+                    and previous.get("source_file") == current.get("source_file")
+                )
+                if not same_document:
+                    bounds.append((start, i))
+                    start = i
+        return bounds
+
+    def _execute_in_sub_batches(
+        self, step: BaseStep, data: StepData, run_id: str
+    ) -> StepData:
+        """Exécute une étape par sous-batches avec un checkpoint par sous-batch.
+
+        Lors d'une reprise, les sous-batches déjà traités (entrée identique)
+        ne sont pas rejoués.
+
+        Args:
+            step: Étape à exécuter.
+            data: Données courantes.
+            run_id: Identifiant de l'exécution.
+
+        Returns:
+            Données avec la sortie fusionnée de tous les sous-batches.
+        """
+        assert self.checkpoint_store is not None
+        step_name = step.__class__.__name__
+        input_key, output_key = SUB_BATCHED_STEPS[step_name]
+        items = data.get(input_key, [])
+        if not items:
+            return step.execute(data)
+
+        outputs: list[Any] = []
+        reused = 0
+        for index, (start, end) in enumerate(self._plan_sub_batches(items)):
+            batch = items[start:end]
+            input_digest = self.checkpoint_store.digest(batch)
+            found, output = self.checkpoint_store.load_sub_batch(
+                run_id, step_name, index, input_digest
+            )
+            if found:
+                reused += 1
+            else:
+                batch_data = dict(data)
+                batch_data[input_key] = batch
+                output = step.execute(batch_data)[output_key]
+                self.checkpoint_store.save_sub_batch(
+                    run_id, step_name, index, input_digest, output
+                )
+            outputs.append(output)
+
+        if reused:
+            logger.info(
+                f"{step_name}: {reused}/{len(outputs)} sous-batch(es) repris "
+                "depuis le checkpoint"
+            )
+
+        data[output_key] = self._merge_outputs(outputs)
+        return data
+
+    @staticmethod
+    def _merge_outputs(outputs: list[Any]) -> Any:  # noqa: ANN401
+        """Fusionne les sorties des sous-batches d'une étape.
+
+        Les listes sont concaténées ; pour les dictionnaires (ex.
+        ``storage_result``), le dernier est conservé et les compteurs
+        (clés ``*_count``) sont additionnés.
+        """
+        if all(isinstance(output, list) for output in outputs):
+            return [item for output in outputs for item in output]
+
+        merged = dict(outputs[-1])
+        for key, value in merged.items():
+            if key.endswith("_count") and isinstance(value, int):
+                merged[key] = sum(output.get(key, 0) for output in outputs)
+        return merged
+
     def execute_step(self, step_name: str, input_data: StepData) -> StepData:
         """Exécute une étape spécifique du pipeline.
 
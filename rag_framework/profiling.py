@@ -0,0 +1,603 @@
+"""Profilage des exécutions du pipeline (``rag-pipeline --profile``).
+
+Une exécution profilée mesure chaque *portée* (``step.<Étape>``,
+``extractor.<nom>``) et écrit un dossier par exécution::
+
+    logs/profiles/20260118-142501_<run_id>/
+        summary.txt                 tableau récapitulatif par portée
+        summary.json                mêmes données, structurées
+        cprofile/<portée>.prof      profil cProfile (pstats, snakeviz...)
+        cprofile/<portée>.txt       fonctions les plus coûteuses
+        allocations/<portée>.txt    principaux allocateurs (tracemalloc)
+        stacks.collapsed            piles échantillonnées (flamegraph.pl,
+                                    speedscope, inferno)
+
+Par portée : nombre d'appels, temps mural et CPU (du thread exécutant la
+portée), écart de RSS et croissance du pic de RSS du processus, pic de
+mémoire Python tracée et mémoire retenue par ligne de code.
+
+Chaque portée est exécutée dans un frame nommé ``rag_step[<Étape>]`` ou
+``rag_extractor[<nom>]`` : ces marqueurs apparaissent dans les piles
+échantillonnées, dans les profils cProfile et dans celles d'un profileur
+externe (``py-spy record``, ``py-spy dump``), ce qui permet d'attribuer un
+coût à une étape ou un extracteur sans instrumentation supplémentaire.
+
+Les profils cProfile sont exclusifs : une portée imbriquée (extracteur
+appelé par une étape) suspend le profil de la portée englobante. Le temps
+mural et les mesures de mémoire sont inclusifs. Le temps CPU ne l'est pas :
+il ne couvre que le thread exécutant la portée. Les extracteurs tournent
+dans le thread du FallbackManager (timeout), leur CPU est donc compté dans
+``extractor.<nom>`` mais absent de ``step.PreprocessingStep`` ; de même
+pour les pools de threads ou de processus lancés par une portée. Un seul
+pipeline profilé à la fois par processus.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import sys
+import sysconfig
+import threading
+import time
+import tracemalloc
+import types
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+import psutil
+
+from rag_framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Depuis Python 3.12, cProfile repose sur sys.monitoring : un seul profil
+# actif pour tout le processus (et non plus par thread)
+_PROCESS_WIDE_CPROFILE = sys.version_info >= (3, 12)
+
+_active_profiler: Optional["Profiler"] = None
+
+# Fonctions natives d'attente (verrous, sleep, I/O) : temps propre élevé
+# sans être un coût de calcul
+_WAITING = re.compile(r"\b(acquire|sleep|wait|select|poll|join)\b")
+
+
+@dataclass
+class ProfilingSettings:
+    """Paramètres du profilage.
+
+    Attributes:
+        enabled: Profile chaque exécution du pipeline.
+        output_dir: Répertoire des dossiers d'exécution.
+        cprofile: Profil cProfile par portée.
+        tracemalloc: Pic de mémoire tracée et allocateurs par portée.
+        tracemalloc_frames: Profondeur des traces d'allocation.
+        sample_interval_ms: Période d'échantillonnage des piles
+            (0 = désactivé).
+        top: Nombre de lignes des rapports.
+    """
+
+    enabled: bool = False
+    output_dir: str = "./logs/profiles"
+    cprofile: bool = True
+    tracemalloc: bool = True
+    tracemalloc_frames: int = 1
+    sample_interval_ms: float = 5.0
+    top: int = 25
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "ProfilingSettings":
+        """Construit les paramètres depuis la section ``profiling``.
+
+        Args:
+            config: Section ``profiling`` de global.yaml.
+
+        Returns:
+            Paramètres (valeurs par défaut pour les clés absentes).
+        """
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in config.items() if k in known})
+
+
+@dataclass
+class ScopeStats:
+    """Mesures cumulées d'une portée (étape ou extracteur).
+
+    Attributes:
+        name: Nom de la portée (ex. ``step.PreprocessingStep``).
+        calls: Nombre d'exécutions.
+        wall_seconds: Temps mural cumulé.
+        cpu_seconds: Temps CPU cumulé du thread exécutant la portée (le
+            travail délégué à d'autres threads ou processus est exclu).
+        rss_delta_bytes: Écart de RSS cumulé (fin - début).
+        max_rss_growth_bytes: Croissance cumulée du pic de RSS du processus.
+        traced_peak_bytes: Plus grand pic de mémoire Python tracée au-dessus
+            du niveau d'entrée.
+        allocations: Mémoire retenue en fin de portée, par ligne de code :
+            ``[octets, blocs]``.
+    """
+
+    name: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rss_delta_bytes: int = 0
+    max_rss_growth_bytes: int = 0
+    traced_peak_bytes: int = 0
+    allocations: dict[str, list[int]] = field(default_factory=dict)
+    profile: Optional[cProfile.Profile] = field(default=None, repr=False)
+
+
+@dataclass
+class _ActiveScope:
+    """Portée en cours d'exécution."""
+
+    stats: ScopeStats
+    thread: int
+    wall_start: float
+    cpu_start: float
+    rss_start: int
+    max_rss_start: Optional[int]
+    profiling: bool = False
+    paused: Optional["_ActiveScope"] = None
+    traced_start: int = 0
+    peak_seen: int = 0
+    snapshot: Optional[tracemalloc.Snapshot] = None
+
+
+def _trampoline(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:  # noqa: ANN401
+    return func(*args, **kwargs)
+
+
+_MARKERS: dict[str, Callable[..., Any]] = {}
+
+
+def marker(label: str) -> Callable[..., Any]:
+    """Fonction ``f(func, *args, **kwargs)`` exécutée dans un frame nommé.
+
+    Le nom du frame (``label``) apparaît dans toute pile d'appels : piles
+    échantillonnées, cProfile, py-spy.
+
+    Args:
+        label: Nom du frame (ex. ``rag_step[ChunkingStep]``).
+
+    Returns:
+        Fonction appelant ``func`` avec les arguments donnés.
+    """
+    function = _MARKERS.get(label)
+    if function is None:
+        name = re.sub(r"[^\w.\[\]-]", "_", label)
+        code = _trampoline.__code__.replace(co_name=name)
+        if sys.version_info >= (3, 11):
+            code = code.replace(co_qualname=name)
+        function = types.FunctionType(code, _trampoline.__globals__, name)
+        _MARKERS[label] = function
+    return function
+
+
+def get_active_profiler() -> Optional["Profiler"]:
+    """Profileur de l'exécution en cours (None hors ``--profile``)."""
+    return _active_profiler
+
+
+def _max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        # Windows : pas de pic de RSS
+        return None
+    value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Octets sous macOS, kilo-octets sous Linux
+    return int(value) if sys.platform == "darwin" else int(value) * 1024
+
+
+_OWN_FILES = frozenset((__file__, tracemalloc.__file__))
+
+_STDLIB = sysconfig.get_paths()["stdlib"] + os.sep
+
+
+def _short_path(filename: str) -> str:
+    site = "site-packages" + os.sep
+    if site in filename:
+        return filename.split(site, 1)[1]
+    if filename.startswith(_STDLIB):
+        return filename[len(_STDLIB) :]
+    try:
+        relative = os.path.relpath(filename)
+    except ValueError:
+        return filename
+    return filename if relative.startswith("..") else relative
+
+
+def _frame_label(code: types.CodeType) -> str:
+    label = f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+    # « ; » sépare les frames dans le format collapsed
+    return label.replace(";", ":")
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^\w.-]", "_", name)
+
+
+def _mb(value: float) -> float:
+    return round(value / (1024 * 1024), 2)
+
+
+class Profiler:
+    """Profileur d'une exécution du pipeline.
+
+    Args:
+        settings: Paramètres du profilage.
+        label: Nom de l'exécution (identifiant de run), repris dans le nom
+            du dossier de sortie.
+    """
+
+    def __init__(self, settings: ProfilingSettings, label: str = "run") -> None:
+        """Prépare le profileur (rien n'est mesuré avant :meth:`start`)."""
+        self.settings = settings
+        self.label = label
+        self.scopes: dict[str, ScopeStats] = {}
+        self.stacks: dict[str, int] = {}
+        self._stack: list[_ActiveScope] = []
+        self._lock = threading.RLock()
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._owns_tracemalloc = False
+        self._cprofile_unavailable = False
+        self._started_at = datetime.now(timezone.utc)
+        self._wall_start = 0.0
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+
+    def start(self) -> "Profiler":
+        """Démarre tracemalloc et l'échantillonnage, active le profileur."""
+        global _active_profiler
+        self._started_at = datetime.now(timezone.utc)
+        self._wall_start = time.perf_counter()
+        if self.settings.tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start(self.settings.tracemalloc_frames)
+            self._owns_tracemalloc = True
+        if self.settings.sample_interval_ms > 0:
+            self._stop.clear()
+            self._sampler = threading.Thread(
+                target=self._sample, name="rag-profiler-sampler", daemon=True
+            )
+            self._sampler.start()
+        _active_profiler = self
+        return self
+
+    def stop(self) -> Path:
+        """Arrête les mesures et écrit le dossier de l'exécution.
+
+        Returns:
+            Dossier contenant les rapports.
+        """
+        global _active_profiler
+        if _active_profiler is self:
+            _active_profiler = None
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        wall_seconds = time.perf_counter() - self._wall_start
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+        output_dir = self.write_report(wall_seconds)
+        logger.info(f"🔬 Profil de l'exécution écrit dans {output_dir}")
+        return output_dir
+
+    # ------------------------------------------------------------------
+    # Portées
+    # ------------------------------------------------------------------
+
+    def call(self, scope: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:  # noqa: ANN401
+        """Exécute ``func`` dans une portée, sous un frame marqueur.
+
+        Args:
+            scope: Nom de la portée (``step.<Étape>``, ``extractor.<nom>``).
+            func: Fonction à exécuter.
+            *args: Arguments positionnels de ``func``.
+            **kwargs: Arguments nommés de ``func``.
+
+        Returns:
+            Valeur retournée par ``func``.
+        """
+        kind, _, name = scope.partition(".")
+        label = f"rag_{kind}[{name}]" if name else f"rag_{kind}"
+        with self.scope(scope):
+            return marker(label)(func, *args, **kwargs)  # type: ignore[no-any-return]
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[ScopeStats]:
+        """Mesure le bloc comme une exécution de la portée ``name``."""
+        active = self._enter(name)
+        try:
+            yield active.stats
+        finally:
+            self._exit(active)
+
+    def _enter(self, name: str) -> _ActiveScope:
+        ident = threading.get_ident()
+        with self._lock:
+            stats = self.scopes.get(name)
+            if stats is None:
+                stats = self.scopes[name] = ScopeStats(name)
+            active = _ActiveScope(
+                stats=stats,
+                thread=ident,
+                wall_start=0.0,
+                cpu_start=0.0,
+                rss_start=self._process.memory_info().rss,
+                max_rss_start=_max_rss_bytes(),
+            )
+            if tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                for other in self._stack:
+                    other.peak_seen = max(other.peak_seen, peak)
+                tracemalloc.reset_peak()
+                active.traced_start = current
+                active.snapshot = self._snapshot()
+            if self.settings.cprofile:
+                self._start_cprofile(active)
+            self._stack.append(active)
+            active.wall_start = time.perf_counter()
+            active.cpu_start = time.thread_time()
+        return active
+
+    def _exit(self, active: _ActiveScope) -> None:
+        wall = time.perf_counter() - active.wall_start
+        cpu = time.thread_time() - active.cpu_start
+        with self._lock:
+            if active.profiling:
+                active.stats.profile.disable()  # type: ignore[union-attr]
+                active.profiling = False
+            self._stack.remove(active)
+            paused = active.paused
+            if paused is not None and paused in self._stack:
+                paused.stats.profile.enable()  # type: ignore[union-attr]
+                paused.profiling = True
+
+            stats = active.stats
+            stats.calls += 1
+            stats.wall_seconds += wall
+            stats.cpu_seconds += cpu
+            stats.rss_delta_bytes += self._process.memory_info().rss - active.rss_start
+            max_rss = _max_rss_bytes()
+            if max_rss is not None and active.max_rss_start is not None:
+                stats.max_rss_growth_bytes += max_rss - active.max_rss_start
+
+            if active.snapshot is not None and tracemalloc.is_tracing():
+                _, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, active.peak_seen)
+                for other in self._stack:
+                    other.peak_seen = max(other.peak_seen, peak)
+                stats.traced_peak_bytes = max(
+                    stats.traced_peak_bytes, peak - active.traced_start
+                )
+                self._accumulate_allocations(stats, active.snapshot)
+
+    def _start_cprofile(self, active: _ActiveScope) -> None:
+        """Active le profil de la portée, en suspendant celui qu'il gênerait."""
+        if self._cprofile_unavailable:
+            return
+        ident = active.thread
+        if any(
+            other.stats is active.stats and other.profiling for other in self._stack
+        ):
+            # Portée réentrante : déjà profilée
+            return
+        for other in reversed(self._stack):
+            if other.profiling and (_PROCESS_WIDE_CPROFILE or other.thread == ident):
+                other.stats.profile.disable()  # type: ignore[union-attr]
+                other.profiling = False
+                active.paused = other
+                break
+        if active.stats.profile is None:
+            active.stats.profile = cProfile.Profile()
+        try:
+            active.stats.profile.enable()
+        except ValueError as e:
+            # Autre outil de profilage actif (ex. sys.monitoring)
+            logger.warning(f"cProfile indisponible: {e}")
+            self._cprofile_unavailable = True
+            return
+        active.profiling = True
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot()
+
+    def _accumulate_allocations(
+        self, stats: ScopeStats, before: tracemalloc.Snapshot
+    ) -> None:
+        for diff in self._snapshot().compare_to(before, "lineno"):
+            frame = diff.traceback[0]
+            # Allocations du profileur lui-même : ignorées
+            if diff.size_diff <= 0 or frame.filename in _OWN_FILES:
+                continue
+            location = f"{_short_path(frame.filename)}:{frame.lineno}"
+            totals = stats.allocations.setdefault(location, [0, 0])
+            totals[0] += diff.size_diff
+            totals[1] += diff.count_diff
+
+    # ------------------------------------------------------------------
+    # Échantillonnage des piles
+    # ------------------------------------------------------------------
+
+    def _sample(self) -> None:
+        interval = self.settings.sample_interval_ms / 1000
+        own = threading.get_ident()
+        labels: dict[types.CodeType, str] = {}
+        while not self._stop.wait(interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                parts: list[str] = []
+                current: Optional[types.FrameType] = frame
+                while current is not None:
+                    code = current.f_code
+                    label = labels.get(code)
+                    if label is None:
+                        label = labels[code] = _frame_label(code)
+                    parts.append(label)
+                    current = current.f_back
+                parts.append(names.get(ident, str(ident)))
+                key = ";".join(reversed(parts))
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Rapports
+    # ------------------------------------------------------------------
+
+    def summary(self, wall_seconds: Optional[float] = None) -> dict[str, Any]:
+        """Mesures par portée, triées par temps mural décroissant."""
+        scopes = []
+        for stats in sorted(
+            self.scopes.values(), key=lambda s: s.wall_seconds, reverse=True
+        ):
+            top_allocation = max(
+                stats.allocations.items(), key=lambda item: item[1][0], default=None
+            )
+            scopes.append(
+                {
+                    "name": stats.name,
+                    "calls": stats.calls,
+                    "wall_seconds": round(stats.wall_seconds, 4),
+                    "cpu_seconds": round(stats.cpu_seconds, 4),
+                    "rss_delta_mb": _mb(stats.rss_delta_bytes),
+                    "max_rss_growth_mb": _mb(stats.max_rss_growth_bytes),
+                    "traced_peak_mb": _mb(stats.traced_peak_bytes),
+                    "top_function": self._top_function(stats),
+                    "top_allocation": (
+                        f"{top_allocation[0]} ({_mb(top_allocation[1][0])} MB)"
+                        if top_allocation
+                        else None
+                    ),
+                }
+            )
+        return {
+            "label": self.label,
+            "started_at": self._started_at.isoformat(),
+            "wall_seconds": (
+                round(wall_seconds, 4) if wall_seconds is not None else None
+            ),
+            "python": sys.version.split()[0],
+            "settings": asdict(self.settings),
+            "samples": sum(self.stacks.values()),
+            "scopes": scopes,
+        }
+
+    @staticmethod
+    def _top_function(stats: ScopeStats) -> Optional[str]:
+        """Fonction au temps propre (tottime) le plus élevé, hors attentes."""
+        if stats.profile is None:
+            return None
+        entries = [
+            (key, values)
+            for key, values in pstats.Stats(stats.profile).stats.items()  # type: ignore[attr-defined]
+            if not (key[0] == "~" and _WAITING.search(key[2]))
+        ]
+        if not entries:
+            return None
+        (filename, line, name), _ = max(entries, key=lambda item: item[1][2])
+        if filename == "~":
+            # Fonction native (ex. <built-in method ...>)
+            return str(name)
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    def format_table(self, summary: dict[str, Any]) -> str:
+        """Tableau récapitulatif (texte)."""
+        header = (
+            f"{'portée':<36} {'appels':>6} {'mural (s)':>10} {'CPU (s)':>9} "
+            f"{'ΔRSS (MB)':>10} {'pic RSS+':>9} {'pic py (MB)':>11}  fonction la "
+            f"plus coûteuse"
+        )
+        lines = [header, "-" * len(header)]
+        for scope in summary["scopes"]:
+            lines.append(
+                f"{scope['name']:<36} {scope['calls']:>6} "
+                f"{scope['wall_seconds']:>10.3f} {scope['cpu_seconds']:>9.3f} "
+                f"{scope['rss_delta_mb']:>10.2f} {scope['max_rss_growth_mb']:>9.2f} "
+                f"{scope['traced_peak_mb']:>11.2f}  {scope['top_function'] or '-'}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, wall_seconds: Optional[float] = None) -> Path:
+        """Écrit le dossier de l'exécution.
+
+        Args:
+            wall_seconds: Durée totale de l'exécution.
+
+        Returns:
+            Dossier créé.
+        """
+        base = Path(self.settings.output_dir)
+        stem = f"{self._started_at:%Y%m%d-%H%M%S}_{_safe_name(self.label)}"
+        output_dir = base / stem
+        suffix = 1
+        while output_dir.exists():
+            suffix += 1
+            output_dir = base / f"{stem}_{suffix}"
+        output_dir.mkdir(parents=True)
+
+        with self._lock:
+            summary = self.summary(wall_seconds)
+            (output_dir / "summary.json").write_text(
+                json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8"
+            )
+            table = self.format_table(summary)
+            (output_dir / "summary.txt").write_text(table, encoding="utf-8")
+
+            for stats in self.scopes.values():
+                name = _safe_name(stats.name)
+                if stats.profile is not None:
+                    cprofile_dir = output_dir / "cprofile"
+                    cprofile_dir.mkdir(exist_ok=True)
+                    stats.profile.dump_stats(str(cprofile_dir / f"{name}.prof"))
+                    buffer = io.StringIO()
+                    pstats.Stats(stats.profile, stream=buffer).sort_stats(
+                        "cumulative"
+                    ).print_stats(self.settings.top)
+                    (cprofile_dir / f"{name}.txt").write_text(
+                        buffer.getvalue(), encoding="utf-8"
+                    )
+                if stats.allocations:
+                    allocations_dir = output_dir / "allocations"
+                    allocations_dir.mkdir(exist_ok=True)
+                    top = sorted(
+                        stats.allocations.items(),
+                        key=lambda item: item[1][0],
+                        reverse=True,
+                    )[: self.settings.top]
+                    lines = [f"{'retenu (KB)':>12} {'blocs':>8}  ligne"]
+                    lines += [
+                        f"{size / 1024:>12.1f} {count:>8}  {location}"
+                        for location, (size, count) in top
+                    ]
+                    (allocations_dir / f"{name}.txt").write_text(
+                        "\n".join(lines) + "\n", encoding="utf-8"
+                    )
+
+            if self.stacks:
+                (output_dir / "stacks.collapsed").write_text(
+                    "".join(
+                        f"{stack} {count}\n"
+                        for stack, count in sorted(self.stacks.items())
+                    ),
+                    encoding="utf-8",
+                )
+
+        logger.info(f"Profil par portée:\n{table}")
+        return output_dir
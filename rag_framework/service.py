@@ -0,0 +1,651 @@
+"""Service d'ingestion : pipeline chaud et API HTTP de soumission.
+
+Chaque appel de la CLI paie l'initialisation complète du pipeline
+(configuration, vérification des dépendances, chargement des modèles,
+connexion au vector store) avant de traiter le moindre document. Le
+service initialise le pipeline une fois puis traite les travaux soumis
+par HTTP :
+
+- ``POST /jobs`` : ``{"paths": [...]}``, fichiers déjà présents sous l'un
+  des répertoires autorisés (``allowed_roots``) ;
+- ``POST /documents?filename=rapport.pdf`` : contenu brut d'un document,
+  enregistré dans ``upload_dir`` ;
+- ``GET /jobs/<id>`` : statut, résumé du résultat et temps par étape
+  (``RAGPipeline.last_timings``) ;
+- ``GET /jobs``, ``GET /stats``, ``GET /health`` ;
+- ``GET /metrics`` : métriques du pipeline au format Prometheus ;
+- ``POST /query`` : recherche, déléguée à ``query_handler`` (501 tant
+  qu'aucun n'est fourni).
+
+Les travaux passent par une file bornée : lorsqu'elle est pleine, la
+soumission est refusée immédiatement (HTTP 503 avec ``Retry-After``)
+plutôt que d'accumuler des travaux dont la latence ne ferait que croître.
+Chaque worker possède son propre pipeline (``RAGPipeline`` n'est pas
+partagé entre threads).
+
+Le serveur HTTP est celui de la bibliothèque standard
+(``ThreadingHTTPServer``) : il écoute par défaut sur 127.0.0.1 et ne
+doit pas être exposé directement ; un jeton (``Authorization: Bearer``)
+est exigé si la variable d'environnement ``token_env`` est définie.
+
+Exemple:
+    >>> service = IngestionService(lambda: RAGPipeline(), ServiceSettings())
+    >>> service.start()
+    >>> service.wait()
+"""
+
+import hmac
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from rag_framework.exceptions import ServiceOverloadedError, ValidationError
+from rag_framework.telemetry import render_prometheus
+from rag_framework.telemetry.exporters import PROMETHEUS_CONTENT_TYPE
+from rag_framework.types import StepData
+from rag_framework.utils.logger import get_logger
+from rag_framework.watch_daemon import BatchProcessor
+
+logger = get_logger(__name__)
+
+QueryHandler = Callable[[dict[str, Any]], dict[str, Any]]
+
+# Latences conservées pour les percentiles de /stats
+_LATENCY_WINDOW = 10000
+_COPY_CHUNK = 1024 * 1024
+
+
+@dataclass
+class ServiceSettings:
+    """Paramètres du service d'ingestion.
+
+    Attributes:
+        host: Adresse d'écoute.
+        port: Port d'écoute (0 = port libre choisi par l'OS).
+        workers: Nombre de workers (un pipeline chacun).
+        queue_size: Nombre maximal de travaux en attente.
+        retry_after_seconds: Valeur de l'en-tête ``Retry-After`` des refus.
+        max_upload_mb: Taille maximale d'un document soumis.
+        upload_dir: Répertoire des documents soumis par ``POST /documents``.
+        allowed_roots: Répertoires sous lesquels ``POST /jobs`` accepte des
+            chemins.
+        max_finished_jobs: Travaux terminés conservés pour consultation.
+        token_env: Variable d'environnement contenant le jeton d'accès.
+    """
+
+    host: str = "127.0.0.1"
+    port: int = 8080
+    workers: int = 1
+    queue_size: int = 100
+    retry_after_seconds: int = 5
+    max_upload_mb: float = 100.0
+    upload_dir: str = "./data/service_uploads"
+    allowed_roots: list[str] = field(default_factory=lambda: ["./data/input"])
+    max_finished_jobs: int = 1000
+    token_env: Optional[str] = "RAG_SERVICE_TOKEN"
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "ServiceSettings":
+        """Construit les paramètres depuis la section ``service``.
+
+        Args:
+            config: Section ``service`` de global.yaml.
+
+        Returns:
+            Paramètres (valeurs par défaut pour les clés absentes).
+        """
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in config.items() if k in known})
+
+
+@dataclass
+class Job:
+    """Travail d'ingestion soumis au service."""
+
+    id: str
+    files: list[str]
+    submitted_at: float
+    status: str = "queued"  # queued, running, succeeded, failed
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: dict[str, int] = field(default_factory=dict)
+    timings: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    upload_dir: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Représentation JSON du travail (``GET /jobs/<id>``)."""
+        data: dict[str, Any] = {
+            "id": self.id,
+            "status": self.status,
+            "files": self.files,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+        }
+        if self.started_at is not None:
+            data["queue_wait_seconds"] = round(self.started_at - self.submitted_at, 4)
+        if self.finished_at is not None:
+            data["latency_seconds"] = round(self.finished_at - self.submitted_at, 4)
+        if self.timings:
+            data["timings"] = self.timings
+        return data
+
+
+class _ServiceHTTPServer(ThreadingHTTPServer):
+    """Serveur HTTP du service."""
+
+    # File d'attente TCP par défaut (5) : au-delà, les connexions des
+    # clients qui interrogent leur statut attendent la retransmission SYN (1 s)
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def _percentile(values: list[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))
+    return round(ordered[index], 4)
+
+
+def _summarize(result: StepData) -> dict[str, int]:
+    """Nombre d'éléments de chaque liste du résultat du pipeline."""
+    return {key: len(value) for key, value in result.items() if isinstance(value, list)}
+
+
+class IngestionService:
+    """Pipeline chaud alimenté par une file bornée et une API HTTP.
+
+    Args:
+        pipeline_factory: Crée le pipeline d'un worker (appelée une fois
+            par worker, au démarrage, avant l'ouverture du port).
+        settings: Paramètres du service.
+        query_handler: Fonction de recherche pour ``POST /query`` (reçoit
+            et retourne un dictionnaire JSON).
+    """
+
+    def __init__(
+        self,
+        pipeline_factory: Callable[[], BatchProcessor],
+        settings: Optional[ServiceSettings] = None,
+        query_handler: Optional[QueryHandler] = None,
+    ) -> None:
+        """Prépare le service (rien n'est démarré)."""
+        self.pipeline_factory = pipeline_factory
+        self.settings = settings or ServiceSettings()
+        self.query_handler = query_handler
+        self.upload_dir = Path(self.settings.upload_dir)
+        self.allowed_roots = [Path(r).resolve() for r in self.settings.allowed_roots]
+        self.token = (
+            os.environ.get(self.settings.token_env) if self.settings.token_env else None
+        )
+
+        self._queue: queue.Queue[Optional[Job]] = queue.Queue(
+            maxsize=max(1, self.settings.queue_size)
+        )
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._finished: deque[str] = deque()
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._queue_waits: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "running": 0,
+            "files_processed": 0,
+        }
+        self._started_at: Optional[float] = None
+        self._stop = threading.Event()
+        self._workers: list[threading.Thread] = []
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self._http_thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+
+    @property
+    def base_url(self) -> str:
+        """URL de base du service (après :meth:`start`)."""
+        if self.httpd is None:
+            return f"http://{self.settings.host}:{self.settings.port}"
+        host, port = self.httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}"
+
+    def start(self) -> "IngestionService":
+        """Initialise les pipelines, démarre les workers puis le serveur HTTP."""
+        # Pipelines créés avant l'ouverture du port : le premier travail
+        # ne paie pas l'initialisation
+        start = time.perf_counter()
+        pipelines = [
+            self.pipeline_factory() for _ in range(max(1, self.settings.workers))
+        ]
+        logger.info(
+            f"Pipeline(s) initialisé(s) en {time.perf_counter() - start:.1f}s "
+            f"({len(pipelines)} worker(s))"
+        )
+        for index, pipeline in enumerate(pipelines):
+            thread = threading.Thread(
+                target=self._work,
+                args=(pipeline,),
+                name=f"rag-service-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._workers.append(thread)
+
+        self.httpd = _ServiceHTTPServer(
+            (self.settings.host, self.settings.port), self._make_handler()
+        )
+        self._http_thread = threading.Thread(
+            target=self.httpd.serve_forever, name="rag-service-http", daemon=True
+        )
+        self._http_thread.start()
+        self._started_at = time.monotonic()
+        logger.info(
+            f"🌐 Service d'ingestion à l'écoute sur {self.base_url} "
+            f"(file: {self.settings.queue_size} travaux)"
+        )
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Ferme l'API puis laisse les workers terminer les travaux en file.
+
+        Args:
+            timeout: Attente maximale par worker.
+        """
+        self._stop.set()
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+        # Sentinelles en fin de file : les travaux acceptés sont traités
+        for _ in self._workers:
+            self._queue.put(None)
+        for thread in self._workers:
+            thread.join(timeout)
+        logger.info(f"Service d'ingestion arrêté: {self.get_stats()}")
+
+    def request_stop(self) -> None:
+        """Demande l'arrêt (ex. depuis un gestionnaire de signal)."""
+        self._stop.set()
+
+    def wait(self) -> None:
+        """Bloque jusqu'à :meth:`request_stop` ou :meth:`stop`."""
+        # Attente par tranches : les signaux restent traités
+        while not self._stop.wait(1.0):
+            pass
+
+    def __enter__(self) -> "IngestionService":
+        """Démarre le service (context manager)."""
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Arrête le service (context manager)."""
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Travaux
+    # ------------------------------------------------------------------
+
+    def resolve_paths(self, paths: list[str]) -> list[str]:
+        """Valide les chemins soumis à ``POST /jobs``.
+
+        Args:
+            paths: Chemins de fichiers.
+
+        Returns:
+            Chemins absolus.
+
+        Raises:
+            ValidationError: Liste vide, fichier inexistant ou hors des
+                répertoires autorisés.
+        """
+        if not paths or not all(isinstance(p, str) for p in paths):
+            raise ValidationError(
+                "Liste de chemins vide ou invalide", details={"paths": paths}
+            )
+        resolved = []
+        for raw in paths:
+            path = Path(raw).resolve()
+            if not any(path.is_relative_to(root) for root in self.allowed_roots):
+                raise ValidationError(
+                    "Chemin hors des répertoires autorisés",
+                    details={"path": raw, "allowed_roots": self.settings.allowed_roots},
+                )
+            if not path.is_file():
+                raise ValidationError("Fichier introuvable", details={"path": raw})
+            resolved.append(str(path))
+        return resolved
+
+    def submit(self, files: list[str], upload_dir: Optional[str] = None) -> Job:
+        """Met un travail en file.
+
+        Args:
+            files: Fichiers à ingérer.
+            upload_dir: Répertoire des documents téléversés du travail
+                (supprimé s'il est refusé).
+
+        Returns:
+            Travail créé (statut ``queued``).
+
+        Raises:
+            ServiceOverloadedError: File pleine.
+        """
+        job = Job(
+            id=uuid.uuid4().hex[:16],
+            files=files,
+            submitted_at=time.time(),
+            upload_dir=upload_dir,
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job.id]
+                self._stats["rejected"] += 1
+            raise ServiceOverloadedError(
+                "File de travaux pleine",
+                details={"queue_size": self.settings.queue_size},
+            ) from None
+        with self._lock:
+            self._stats["submitted"] += 1
+        return job
+
+    def submit_document(self, filename: str, stream: Any, length: int) -> Job:  # noqa: ANN401
+        """Enregistre un document téléversé puis met son travail en file.
+
+        Args:
+            filename: Nom du document (seul le dernier composant est gardé).
+            stream: Flux binaire du contenu.
+            length: Taille annoncée du contenu.
+
+        Returns:
+            Travail créé.
+
+        Raises:
+            ValidationError: Nom invalide, document trop volumineux ou tronqué.
+            ServiceOverloadedError: File pleine (le document n'est pas lu).
+        """
+        name = Path(filename).name
+        if not name or name in {".", ".."}:
+            raise ValidationError(
+                "Nom de document invalide", details={"filename": filename}
+            )
+        if length > self.settings.max_upload_mb * 1024 * 1024:
+            raise ValidationError(
+                "Document trop volumineux",
+                details={"size": length, "max_upload_mb": self.settings.max_upload_mb},
+            )
+        # Refus avant lecture : un client refusé ne paie pas le transfert
+        if self._queue.full():
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise ServiceOverloadedError(
+                "File de travaux pleine",
+                details={"queue_size": self.settings.queue_size},
+            )
+
+        job_dir = self.upload_dir / uuid.uuid4().hex[:16]
+        job_dir.mkdir(parents=True, exist_ok=True)
+        target = job_dir / name
+        remaining = length
+        with open(target, "wb") as f:
+            while remaining > 0:
+                chunk = stream.read(min(_COPY_CHUNK, remaining))
+                if not chunk:
+                    break
+                f.write(chunk)
+                remaining -= len(chunk)
+        if remaining > 0:
+            # Client déconnecté avant la fin du corps annoncé
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise ValidationError(
+                "Document tronqué",
+                details={"expected": length, "received": length - remaining},
+            )
+        try:
+            return self.submit([str(target.resolve())], upload_dir=str(job_dir))
+        except ServiceOverloadedError:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Travail par identifiant (None si inconnu ou expiré)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, limit: int = 100) -> list[dict[str, Any]]:
+        """Derniers travaux soumis, du plus récent au plus ancien."""
+        with self._lock:
+            jobs = list(self._jobs.values())[-limit:]
+        return [job.to_dict() for job in reversed(jobs)]
+
+    def _work(self, pipeline: BatchProcessor) -> None:
+        """Boucle d'un worker : travaux de la file → pipeline."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            job.started_at = time.time()
+            job.status = "running"
+            with self._lock:
+                self._stats["running"] += 1
+            status = "failed"
+            try:
+                result = pipeline.execute({"monitored_files": job.files})
+                job.result = _summarize(result)
+                job.timings = getattr(pipeline, "last_timings", None) or {}
+                status = "succeeded"
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"
+                logger.error(f"Échec du travail {job.id}: {e}", exc_info=True)
+            finally:
+                if job.upload_dir is not None:
+                    # Document téléversé traité : sa copie n'est plus utile
+                    shutil.rmtree(job.upload_dir, ignore_errors=True)
+                job.finished_at = time.time()
+                job.status = status
+                self._finish(job)
+
+    def _finish(self, job: Job) -> None:
+        with self._lock:
+            self._stats["running"] -= 1
+            self._stats[job.status] += 1
+            if job.status == "succeeded":
+                self._stats["files_processed"] += len(job.files)
+            assert job.started_at is not None and job.finished_at is not None
+            self._latencies.append(job.finished_at - job.submitted_at)
+            self._queue_waits.append(job.started_at - job.submitted_at)
+            self._finished.append(job.id)
+            while len(self._finished) > self.settings.max_finished_jobs:
+                self._jobs.pop(self._finished.popleft(), None)
+        logger.info(
+            f"Travail {job.id} {job.status} en "
+            f"{job.finished_at - job.submitted_at:.2f}s ({len(job.files)} fichier(s))"
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Compteurs, profondeur de file et percentiles de latence."""
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            latencies = list(self._latencies)
+            waits = list(self._queue_waits)
+        uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        stats.update(
+            {
+                "queued": self._queue.qsize(),
+                "queue_size": self.settings.queue_size,
+                "workers": len(self._workers),
+                "uptime_seconds": round(uptime, 3),
+                "files_per_second": round(stats["files_processed"] / uptime, 3)
+                if uptime > 0
+                else 0.0,
+                "latency_p50_s": _percentile(latencies, 0.50),
+                "latency_p99_s": _percentile(latencies, 0.99),
+                "queue_wait_p50_s": _percentile(waits, 0.50),
+                "queue_wait_p99_s": _percentile(waits, 0.99),
+            }
+        )
+        return stats
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+                logger.debug(f"{self.address_string()} {format % args}")
+
+            def _send_json(
+                self,
+                status: int,
+                body: Any,  # noqa: ANN401
+                headers: Optional[dict[str, str]] = None,
+            ) -> None:
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _authorized(self) -> bool:
+                if not service.token:
+                    return True
+                header = self.headers.get("Authorization", "")
+                if hmac.compare_digest(header, f"Bearer {service.token}"):
+                    return True
+                self._send_json(401, {"error": "Jeton d'accès invalide"})
+                return False
+
+            def _content_length(self) -> int:
+                value = self.headers.get("Content-Length") or "0"
+                if not value.isdigit():
+                    raise ValidationError(
+                        "En-tête Content-Length invalide",
+                        details={"content_length": value},
+                    )
+                return int(value)
+
+            def _read_json(self) -> dict[str, Any]:
+                length = self._content_length()
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError as e:
+                    raise ValidationError(f"JSON invalide: {e}") from None
+                if not isinstance(body, dict):
+                    raise ValidationError("Objet JSON attendu")
+                return body
+
+            def _accepted(self, job: Job) -> None:
+                self._send_json(
+                    202, job.to_dict(), headers={"Location": f"/jobs/{job.id}"}
+                )
+
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                if url.path == "/health":
+                    self._send_json(200, {"status": "ok"})
+                    return
+                if not self._authorized():
+                    return
+                if url.path == "/stats":
+                    self._send_json(200, service.get_stats())
+                elif url.path == "/metrics":
+                    payload = render_prometheus().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                elif url.path == "/jobs":
+                    value = parse_qs(url.query).get("limit", ["100"])[0]
+                    limit = int(value) if value.isdigit() else 100
+                    self._send_json(200, {"jobs": service.list_jobs(limit)})
+                elif url.path.startswith("/jobs/"):
+                    job = service.get_job(url.path[len("/jobs/") :])
+                    if job is None:
+                        self._send_json(404, {"error": "Travail inconnu"})
+                    else:
+                        self._send_json(200, job.to_dict())
+                else:
+                    self._send_json(404, {"error": "Ressource inconnue"})
+
+            def do_POST(self) -> None:
+                url = urlsplit(self.path)
+                if not self._authorized():
+                    return
+                try:
+                    if url.path == "/jobs":
+                        paths = self._read_json().get("paths")
+                        files = service.resolve_paths(paths)  # type: ignore[arg-type]
+                        self._accepted(service.submit(files))
+                    elif url.path == "/documents":
+                        if self.headers.get("Content-Length") is None:
+                            self._send_json(411, {"error": "Content-Length requis"})
+                            return
+                        filename = parse_qs(url.query).get("filename", [""])[0]
+                        job = service.submit_document(
+                            filename or self.headers.get("X-Filename", ""),
+                            self.rfile,
+                            self._content_length(),
+                        )
+                        self._accepted(job)
+                    elif url.path == "/query":
+                        if service.query_handler is None:
+                            self._send_json(501, {"error": "Aucun retriever configuré"})
+                            return
+                        self._send_json(200, service.query_handler(self._read_json()))
+                    else:
+                        self._send_json(404, {"error": "Ressource inconnue"})
+                except ServiceOverloadedError as e:
+                    # Corps éventuel non lu : connexion fermée après la réponse
+                    self.close_connection = True
+                    self._send_json(
+                        503,
+                        {"error": e.message, "details": e.details},
+                        headers={
+                            "Retry-After": str(service.settings.retry_after_seconds)
+                        },
+                    )
+                except ValidationError as e:
+                    self.close_connection = True
+                    status = 413 if "max_upload_mb" in e.details else 400
+                    if "allowed_roots" in e.details:
+                        status = 403
+                    self._send_json(status, {"error": e.message, "details": e.details})
+                except Exception as e:
+                    logger.error(
+                        f"Erreur interne sur POST {url.path}: {e}", exc_info=True
+                    )
+                    self.close_connection = True
+                    self._send_json(500, {"error": "Erreur interne du service"})
+
+        return Handler
@@ -1,14 +1,35 @@
-"""Modules pour les étapes du pipeline RAG."""
+"""Modules pour les étapes du pipeline RAG.
+
+Chaque étape est importée au premier accès : seules les étapes activées
+chargent leurs dépendances (watchdog, ChromaDB, numpy, etc.).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from rag_framework.steps.base_step import BaseStep
-from rag_framework.steps.step_01_monitoring import MonitoringStep
-from rag_framework.steps.step_02_preprocessing import PreprocessingStep
-from rag_framework.steps.step_03_chunking import ChunkingStep
-from rag_framework.steps.step_04_enrichment import EnrichmentStep
-from rag_framework.steps.step_05_audit import AuditStep
-from rag_framework.steps.step_06_embedding import EmbeddingStep
-from rag_framework.steps.step_07_normalization import NormalizationStep
-from rag_framework.steps.step_08_vector_storage import VectorStorageStep
+
+if TYPE_CHECKING:
+    from rag_framework.steps.step_01_monitoring import MonitoringStep
+    from rag_framework.steps.step_02_preprocessing import PreprocessingStep
+    from rag_framework.steps.step_03_chunking import ChunkingStep
+    from rag_framework.steps.step_04_enrichment import EnrichmentStep
+    from rag_framework.steps.step_05_audit import AuditStep
+    from rag_framework.steps.step_06_embedding import EmbeddingStep
+    from rag_framework.steps.step_07_normalization import NormalizationStep
+    from rag_framework.steps.step_08_vector_storage import VectorStorageStep
+
+# Classe d'étape → module (dans l'ordre du pipeline)
+STEP_MODULES = {
+    "MonitoringStep": "rag_framework.steps.step_01_monitoring",
+    "PreprocessingStep": "rag_framework.steps.step_02_preprocessing",
+    "ChunkingStep": "rag_framework.steps.step_03_chunking",
+    "EnrichmentStep": "rag_framework.steps.step_04_enrichment",
+    "AuditStep": "rag_framework.steps.step_05_audit",
+    "EmbeddingStep": "rag_framework.steps.step_06_embedding",
+    "NormalizationStep": "rag_framework.steps.step_07_normalization",
+    "VectorStorageStep": "rag_framework.steps.step_08_vector_storage",
+}
 
 __all__ = [
     "AuditStep",
@@ -20,4 +41,32 @@ __all__ = [
     "NormalizationStep",
     "PreprocessingStep",
     "VectorStorageStep",
+    "load_step_class",
 ]
+
+
+def load_step_class(name: str) -> type[BaseStep]:
+    """Importe une classe d'étape à partir de son nom.
+
+    Args:
+        name: Nom de la classe (ex. "PreprocessingStep").
+
+    Returns:
+        Classe de l'étape.
+
+    Raises:
+        KeyError: Si l'étape est inconnue.
+    """
+    step_class: type[BaseStep] = getattr(
+        importlib.import_module(STEP_MODULES[name]), name
+    )
+    return step_class
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Importe une classe d'étape au premier accès (PEP 562)."""
+    if name not in STEP_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    step_class = load_step_class(name)
+    globals()[name] = step_class
+    return step_class
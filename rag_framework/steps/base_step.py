@@ -1,7 +1,7 @@
 """Classe abstraite de base pour toutes les étapes du pipeline RAG."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 from rag_framework.types import StepData
 
@@ -9,6 +9,13 @@ from rag_framework.types import StepData
 class BaseStep(ABC):
     """Classe de base pour toutes les étapes du pipeline RAG."""
 
+    # Clés de `data` lues et écrites par l'étape. Le pipeline en déduit le
+    # graphe de dépendances entre étapes et exécute en parallèle les
+    # branches indépendantes. Une étape qui ne déclare rien est traitée
+    # comme une barrière (dépend de toutes les précédentes et inversement).
+    consumes: ClassVar[tuple[str, ...]] = ()
+    produces: ClassVar[tuple[str, ...]] = ()
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the step.
 
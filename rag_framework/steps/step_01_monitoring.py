@@ -14,6 +14,7 @@ from watchdog.observers import Observer
 from rag_framework.exceptions import StepExecutionError, ValidationError
 from rag_framework.steps.base_step import BaseStep
 from rag_framework.types import StepData
+from rag_framework.utils.file_scanner import FileScanner
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,31 +23,60 @@ logger = get_logger(__name__)
 class FileEventHandler(FileSystemEventHandler):
     """Handler pour les événements de fichiers détectés par Watchdog."""
 
-    def __init__(self, file_patterns: list[str]) -> None:
+    def __init__(
+        self,
+        file_patterns: list[str],
+        exclude_patterns: Optional[list[str]] = None,
+        callback: Optional[Callable[[Path], None]] = None,
+        triggers: Optional[dict[str, bool]] = None,
+    ) -> None:
         """Initialize the handler.
 
         Args:
             file_patterns: Liste de patterns de fichiers à surveiller (ex: *.pdf).
+            exclude_patterns: Patterns de fichiers à ignorer.
+            callback: Fonction appelée pour chaque fichier détecté (ex. ajout
+                à une file de traitement) ; sinon les fichiers sont accumulés
+                dans ``detected_files``.
+            triggers: Événements pris en compte (section ``triggers``).
         """
         super().__init__()
         self.file_patterns = file_patterns
+        self.exclude_patterns = exclude_patterns or []
+        self.callback = callback
+        self.triggers = triggers or {}
         self.detected_files: list[Path] = []
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation events."""
-        if not event.is_directory:
-            file_path = Path(str(event.src_path))
-            if self._match_pattern(file_path):
-                logger.info(f"Fichier détecté: {file_path}")
-                self.detected_files.append(file_path)
+        if not event.is_directory and self.triggers.get("on_created", True):
+            self._detect(Path(str(event.src_path)), "Fichier détecté")
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events."""
-        if not event.is_directory:
-            file_path = Path(str(event.src_path))
-            if self._match_pattern(file_path):
-                logger.info(f"Fichier modifié: {file_path}")
-                self.detected_files.append(file_path)
+        if not event.is_directory and self.triggers.get("on_modified", True):
+            self._detect(Path(str(event.src_path)), "Fichier modifié")
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file move events (destination traitée comme une création).
+
+        Un dépôt écrit sous un nom temporaire puis renommé n'émet qu'un
+        événement de déplacement pour son nom définitif.
+        """
+        if not event.is_directory and self.triggers.get("on_created", True):
+            self._detect(Path(str(event.dest_path)), "Fichier déposé")
+
+    def _detect(self, file_path: Path, message: str) -> None:
+        """Retient un fichier correspondant aux patterns."""
+        if not self._match_pattern(file_path) or any(
+            file_path.match(pattern) for pattern in self.exclude_patterns
+        ):
+            return
+        logger.debug(f"{message}: {file_path}")
+        if self.callback is not None:
+            self.callback(file_path)
+        else:
+            self.detected_files.append(file_path)
 
     def _match_pattern(self, file_path: Path) -> bool:
         """Check if file matches any of the configured patterns."""
@@ -59,6 +89,27 @@ class FileEventHandler(FileSystemEventHandler):
 class MonitoringStep(BaseStep):
     """Étape 1 : Surveillance de fichiers sources avec Watchdog."""
 
+    consumes = ()
+    produces = ("monitored_files", "monitoring_config")
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialise l'étape et compile les patterns de fichiers.
+
+        Parameters
+        ----------
+        config : dict[str, Any]
+            Configuration de l'étape.
+        """
+        super().__init__(config)
+        # Un seul parcours par répertoire surveillé, tous patterns confondus
+        self.scanner = FileScanner(
+            include=self.config["file_patterns"],
+            exclude=self.config.get("exclude_patterns", []),
+            exclude_dirs=self.config.get("exclude_dirs", []),
+            follow_symlinks=self.config.get("follow_symlinks", False),
+            workers=self.config.get("scan_workers", 1),
+        )
+
     def validate_config(self) -> None:
         """Valide la configuration de l'étape."""
         required_keys = ["watch_paths", "file_patterns"]
@@ -78,6 +129,10 @@ class MonitoringStep(BaseStep):
     def execute(self, data: StepData) -> StepData:
         """Surveille les répertoires configurés et détecte les nouveaux fichiers.
 
+        Si ``data`` contient déjà ``monitored_files`` (fichiers signalés par
+        le daemon de surveillance), les répertoires ne sont pas parcourus :
+        seuls les fichiers encore présents et non exclus sont retenus.
+
         Args:
             data: Données d'entrée (peut être vide pour cette étape).
 
@@ -89,24 +144,28 @@ class MonitoringStep(BaseStep):
         """
         try:
             watch_paths = self.config["watch_paths"]
-            file_patterns = self.config["file_patterns"]
-            exclude_patterns = self.config.get("exclude_patterns", [])
 
-            # Scan initial des fichiers existants
             detected_files: list[Path] = []
-            for watch_path in watch_paths:
-                path_obj = Path(watch_path)
-                if path_obj.exists():
-                    for pattern in file_patterns:
-                        for file_path in path_obj.rglob(pattern):
-                            # Filtrer les fichiers exclus
-                            if not self._is_excluded(file_path, exclude_patterns):
-                                detected_files.append(file_path)
-
-            logger.info(
-                f"Monitoring: {len(detected_files)} fichiers détectés "
-                f"dans {len(watch_paths)} répertoires"
-            )
+            provided = data.get("monitored_files")
+            if provided is not None:
+                # Fichiers fournis par l'appelant (mode daemon)
+                for file_str in provided:
+                    file_path = Path(file_str)
+                    if file_path.is_file() and self.scanner.matches(file_path):
+                        detected_files.append(file_path)
+                logger.info(
+                    f"Monitoring: {len(detected_files)} fichiers signalés "
+                    f"({len(provided)} reçus)"
+                )
+            else:
+                # Scan initial des fichiers existants (une passe par
+                # répertoire, fichiers dédupliqués)
+                detected_files = self.scanner.scan(watch_paths)
+
+                logger.info(
+                    f"Monitoring: {len(detected_files)} fichiers détectés "
+                    f"dans {len(watch_paths)} répertoires"
+                )
 
             data["monitored_files"] = [str(f) for f in detected_files]
             data["monitoring_config"] = self.config
@@ -120,26 +179,6 @@ class MonitoringStep(BaseStep):
                 details={"error": str(e)},
             ) from e
 
-    def _is_excluded(self, file_path: Path, exclude_patterns: list[str]) -> bool:
-        """Vérifie si un fichier correspond à un pattern d'exclusion.
-
-        Parameters
-        ----------
-        file_path : Path
-            Chemin du fichier à vérifier.
-        exclude_patterns : list[str]
-            Liste des patterns d'exclusion (glob).
-
-        Returns:
-        -------
-        bool
-            True si le fichier doit être exclu, False sinon.
-        """
-        for pattern in exclude_patterns:
-            if file_path.match(pattern):
-                return True
-        return False
-
     def watch_continuously(
         self,
         callback: Optional[Callable[[Path], None]] = None,
@@ -4,7 +4,6 @@ import gc
 import json
 import os
 import re
-import statistics
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,14 +13,30 @@ import psutil
 
 from rag_framework.config_adapter import convert_parser_to_fallback_config
 from rag_framework.exceptions import StepExecutionError, ValidationError
+from rag_framework.extractors.base import ExtractionResult
+from rag_framework.extractors.extraction_cache import (
+    ExtractionCache,
+    ExtractionCacheSettings,
+    config_signature,
+    rebind_metadata,
+)
 from rag_framework.extractors.fallback_manager import FallbackManager
 from rag_framework.steps.base_step import BaseStep
+from rag_framework.telemetry import NOOP_SPAN, get_telemetry
 from rag_framework.types import StepData
 from rag_framework.utils.file_manager import FileManager
 from rag_framework.utils.logger import get_logger
+from rag_framework.utils.streaming_stats import QuantileSketch, ReservoirSample
 
 logger = get_logger(__name__)
 
+telemetry = get_telemetry()
+_DOCUMENTS = telemetry.counter("rag_documents_total", "Documents traités, par statut")
+_BYTES_READ = telemetry.counter("rag_bytes_read_total", "Octets des documents lus")
+_CACHE_REQUESTS = telemetry.counter(
+    "rag_cache_requests_total", "Consultations des caches, par résultat"
+)
+
 
 class MetricsCollector:
     """Collecteur de métriques de performance pour le preprocessing.
@@ -37,6 +52,13 @@ class MetricsCollector:
     - text_length: Longueur du texte extrait
     - file_size: Taille des fichiers traités
     - error_count: Nombre d'erreurs rencontrées
+
+    La mémoire occupée est constante, quel que soit le nombre de documents
+    (mode ``--watch``) : les distributions sont résumées par des sketches de
+    quantiles, les erreurs par un compteur et un échantillon de taille fixe.
+    Chaque export ajoute une ligne JSON au fichier ``export_path``, remplacé
+    par un nouveau fichier au-delà de ``max_file_mb`` (``backup_count``
+    fichiers précédents conservés : ``.1``, ``.2``...).
     """
 
     def __init__(self, metrics_config: dict[str, Any]) -> None:
@@ -51,23 +73,29 @@ class MetricsCollector:
         self.metrics_to_collect = set(metrics_config.get("collect", []))
         self.export_config = metrics_config.get("aggregation", {})
         self.export_path = metrics_config.get(
-            "export_path", "logs/preprocessing_metrics.json"
+            "export_path", "logs/preprocessing_metrics.jsonl"
         )
         self.export_frequency = metrics_config.get("export_frequency", "per_batch")
+        self.max_file_bytes = int(metrics_config.get("max_file_mb", 10) * 1024 * 1024)
+        self.backup_count = metrics_config.get("backup_count", 5)
+
+        accuracy = self.export_config.get("relative_accuracy", 0.01)
 
-        # Métriques collectées
+        # Métriques collectées (taille indépendante du nombre de documents)
         self.metrics: dict[str, Any] = {
             "session_start": datetime.now(timezone.utc).isoformat(),
             "documents_processed": 0,
             "documents_succeeded": 0,
             "documents_failed": 0,
-            "processing_times": [],
+            "processing_times": QuantileSketch(accuracy),
             "parser_usage": {},
-            "memory_usage_mb": [],
-            "text_lengths": [],
-            "file_sizes": [],
-            "errors": [],
+            "memory_usage_mb": QuantileSketch(accuracy),
+            "text_lengths": QuantileSketch(accuracy),
+            "file_sizes": QuantileSketch(accuracy),
+            "errors": ReservoirSample(self.export_config.get("error_samples", 5)),
         }
+        # Statistiques du cache d'extraction (renseignées par l'étape)
+        self.cache_stats: Optional[dict[str, Any]] = None
 
     def record_document(
         self,
@@ -105,25 +133,26 @@ class MetricsCollector:
         else:
             self.metrics["documents_failed"] += 1
             if error and "error_count" in self.metrics_to_collect:
-                self.metrics["errors"].append(error)
+                self.metrics["errors"].add(error)
 
         if "processing_time" in self.metrics_to_collect:
-            self.metrics["processing_times"].append(processing_time)
+            self.metrics["processing_times"].add(processing_time)
 
         if (
             "parser_time" in self.metrics_to_collect
             or "fallback_usage" in self.metrics_to_collect
         ):
-            if parser_used not in self.metrics["parser_usage"]:
-                self.metrics["parser_usage"][parser_used] = {"count": 0, "times": []}
-            self.metrics["parser_usage"][parser_used]["count"] += 1
-            self.metrics["parser_usage"][parser_used]["times"].append(processing_time)
+            usage = self.metrics["parser_usage"].setdefault(
+                parser_used, {"count": 0, "total_time": 0.0}
+            )
+            usage["count"] += 1
+            usage["total_time"] += processing_time
 
         if "text_length" in self.metrics_to_collect:
-            self.metrics["text_lengths"].append(text_length)
+            self.metrics["text_lengths"].add(text_length)
 
         if "file_size" in self.metrics_to_collect:
-            self.metrics["file_sizes"].append(file_size)
+            self.metrics["file_sizes"].add(file_size)
 
         if "memory_usage" in self.metrics_to_collect:
             # Mesure de la mémoire RSS du processus (en MB)
@@ -133,7 +162,7 @@ class MetricsCollector:
                 usage_mb = (
                     resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 / 1024
                 )
-                self.metrics["memory_usage_mb"].append(usage_mb)
+                self.metrics["memory_usage_mb"].add(usage_mb)
             except Exception:
                 # Fallback si resource n'est pas disponible (Windows)
                 pass
@@ -141,6 +170,10 @@ class MetricsCollector:
     def get_summary(self) -> dict[str, Any]:
         """Génère un résumé statistique des métriques collectées.
 
+        Les médianes et percentiles sont approchés (erreur relative
+        ``aggregation.relative_accuracy``) ; totaux, moyennes, minima et
+        maxima sont exacts.
+
         Returns:
         -------
         dict[str, Any]
@@ -165,26 +198,23 @@ class MetricsCollector:
         }
 
         # Statistiques de temps de traitement
-        if self.metrics["processing_times"]:
-            times = self.metrics["processing_times"]
+        times: QuantileSketch = self.metrics["processing_times"]
+        if times.count:
             summary["processing_time"] = {
-                "total_seconds": round(sum(times), 2),
-                "mean_seconds": round(statistics.mean(times), 2),
-                "median_seconds": round(statistics.median(times), 2),
-                "min_seconds": round(min(times), 2),
-                "max_seconds": round(max(times), 2),
+                "total_seconds": round(times.sum, 2),
+                "mean_seconds": round(times.mean, 2),
+                "median_seconds": round(times.quantile(0.5), 2),
+                "min_seconds": round(times.min, 2),
+                "max_seconds": round(times.max, 2),
             }
 
             # Calcul des percentiles si configuré
-            if self.export_config.get("compute_percentiles", False) and len(times) >= 2:
-                sorted_times = sorted(times)
-                summary["processing_time"]["p50"] = round(
-                    statistics.median(sorted_times), 2
-                )
-                p95_idx = int(len(sorted_times) * 0.95)
-                p99_idx = int(len(sorted_times) * 0.99)
-                summary["processing_time"]["p95"] = round(sorted_times[p95_idx], 2)
-                summary["processing_time"]["p99"] = round(sorted_times[p99_idx], 2)
+            if (
+                self.export_config.get("compute_percentiles", False)
+                and times.count >= 2
+            ):
+                for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+                    summary["processing_time"][name] = round(times.quantile(q), 2)
 
         # Statistiques d'utilisation des parsers
         if self.metrics["parser_usage"]:
@@ -197,52 +227,56 @@ class MetricsCollector:
                     )
                     if self.metrics["documents_processed"] > 0
                     else 0.0,
-                    "mean_time_seconds": round(statistics.mean(data["times"]), 2)
-                    if data["times"]
-                    else 0.0,
+                    "mean_time_seconds": round(data["total_time"] / data["count"], 2),
                 }
 
         # Statistiques de mémoire
-        if self.metrics["memory_usage_mb"]:
-            memory = self.metrics["memory_usage_mb"]
+        memory: QuantileSketch = self.metrics["memory_usage_mb"]
+        if memory.count:
             summary["memory_usage_mb"] = {
-                "peak": round(max(memory), 2),
-                "mean": round(statistics.mean(memory), 2),
+                "peak": round(memory.max, 2),
+                "mean": round(memory.mean, 2),
             }
 
         # Statistiques de longueur de texte
-        if self.metrics["text_lengths"]:
-            lengths = self.metrics["text_lengths"]
+        lengths: QuantileSketch = self.metrics["text_lengths"]
+        if lengths.count:
             summary["text_length_stats"] = {
-                "total_chars": sum(lengths),
-                "mean_chars": round(statistics.mean(lengths), 2),
-                "median_chars": round(statistics.median(lengths), 2),
-                "min_chars": min(lengths),
-                "max_chars": max(lengths),
+                "total_chars": int(lengths.sum),
+                "mean_chars": round(lengths.mean, 2),
+                "median_chars": round(lengths.quantile(0.5), 2),
+                "min_chars": int(lengths.min),
+                "max_chars": int(lengths.max),
             }
 
         # Statistiques de taille de fichier
-        if self.metrics["file_sizes"]:
-            sizes = self.metrics["file_sizes"]
+        sizes: QuantileSketch = self.metrics["file_sizes"]
+        if sizes.count:
             summary["file_size_stats"] = {
-                "total_bytes": sum(sizes),
-                "mean_bytes": round(statistics.mean(sizes), 2),
-                "median_bytes": round(statistics.median(sizes), 2),
-                "min_bytes": min(sizes),
-                "max_bytes": max(sizes),
+                "total_bytes": int(sizes.sum),
+                "mean_bytes": round(sizes.mean, 2),
+                "median_bytes": round(sizes.quantile(0.5), 2),
+                "min_bytes": int(sizes.min),
+                "max_bytes": int(sizes.max),
             }
 
-        # Statistiques d'erreurs
-        if self.metrics["errors"]:
-            summary["errors"] = {
-                "count": len(self.metrics["errors"]),
-                "samples": self.metrics["errors"][:5],  # 5 premières erreurs
-            }
+        # Statistiques d'erreurs (échantillon uniforme de messages)
+        errors: ReservoirSample = self.metrics["errors"]
+        if errors.seen:
+            summary["errors"] = {"count": errors.seen, "samples": list(errors.items)}
+
+        if self.cache_stats is not None:
+            summary["extraction_cache"] = self.cache_stats
 
         return summary
 
     def export_metrics(self) -> None:
-        """Exporte les métriques vers le fichier JSON configuré."""
+        """Ajoute le résumé courant au fichier JSON Lines configuré.
+
+        Coût constant : une ligne ajoutée en fin de fichier, sans relire
+        les exports précédents. Un fichier au format historique (tableau
+        JSON) est mis de côté comme un fichier plein.
+        """
         if not self.enabled:
             return
 
@@ -250,29 +284,35 @@ class MetricsCollector:
             export_path = Path(self.export_path)
             export_path.parent.mkdir(parents=True, exist_ok=True)
 
-            summary = self.get_summary()
-
-            # Lecture des métriques existantes si le fichier existe
+            line = json.dumps(self.get_summary(), ensure_ascii=False) + "\n"
             if export_path.exists():
-                with open(export_path, encoding="utf-8") as f:
-                    existing_metrics = json.load(f)
-                    if not isinstance(existing_metrics, list):
-                        existing_metrics = [existing_metrics]
-            else:
-                existing_metrics = []
+                size = export_path.stat().st_size
+                with open(export_path, "rb") as f:
+                    legacy = f.read(1) == b"["
+                if legacy or size + len(line) > self.max_file_bytes:
+                    self._rotate(export_path)
 
-            # Ajout de la nouvelle session
-            existing_metrics.append(summary)
-
-            # Écriture
-            with open(export_path, "w", encoding="utf-8") as f:
-                json.dump(existing_metrics, f, indent=2, ensure_ascii=False)
+            with open(export_path, "a", encoding="utf-8") as f:
+                f.write(line)
 
             logger.info(f"Métriques exportées vers {export_path}")
 
         except Exception as e:
             logger.error(f"Erreur lors de l'export des métriques: {e}")
 
+    def _rotate(self, export_path: Path) -> None:
+        """Décale les fichiers d'export (``.1`` le plus récent)."""
+        if self.backup_count <= 0:
+            export_path.unlink()
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = export_path.with_name(f"{export_path.name}.{index}")
+            if source.exists():
+                os.replace(
+                    source, export_path.with_name(f"{export_path.name}.{index + 1}")
+                )
+        os.replace(export_path, export_path.with_name(f"{export_path.name}.1"))
+
 
 class PreprocessingStep(BaseStep):
     """Étape 2 : Extraction et prétraitement de documents.
@@ -291,6 +331,9 @@ class PreprocessingStep(BaseStep):
         Configuration de l'étape depuis 02_preprocessing.yaml.
     """
 
+    consumes = ("monitored_files", "file_paths", "monitoring_config")
+    produces = ("extracted_documents",)
+
     def _check_and_collect_garbage(self) -> None:
         """Vérifie l'utilisation mémoire et force le GC si nécessaire.
 
@@ -468,6 +511,20 @@ class PreprocessingStep(BaseStep):
         # Initialisation du gestionnaire de fallback
         self.fallback_manager = FallbackManager(fallback_config)
 
+        # Cache des extractions adressé par le contenu des fichiers
+        cache_settings = ExtractionCacheSettings.from_config(
+            config.get("preprocessing", {}).get("extraction_cache", {})
+        )
+        self.extraction_cache: Optional[ExtractionCache] = None
+        if cache_settings.enabled:
+            self.extraction_cache = ExtractionCache(
+                cache_settings, signature=config_signature(fallback_config)
+            )
+            logger.info(
+                f"Cache d'extraction activé ({cache_settings.cache_dir}, "
+                f"{cache_settings.max_size_mb} MB max)"
+            )
+
         # Initialisation du gestionnaire de fichiers
         # Note: file_management config vient de monitoring_config
         file_mgmt_config = config.get("file_management", {"enabled": False})
@@ -570,12 +627,18 @@ class PreprocessingStep(BaseStep):
                 # Mesure de performance pour métriques (Feature #7)
                 start_time = time.time()
                 file_size = file_path.stat().st_size
+                _BYTES_READ.inc(file_size)
+                doc_span = (
+                    telemetry.start_span(
+                        "document.extract", file=file_path.name, bytes=file_size
+                    )
+                    if telemetry.settings.document_spans
+                    else NOOP_SPAN
+                )
 
                 try:
-                    # Extraction avec fallback automatique
-                    result, extractor_name = (
-                        self.fallback_manager.extract_with_fallback(file_path)
-                    )
+                    # Extraction avec fallback automatique (ou cache)
+                    result, extractor_name = self._extract(file_path)
 
                     # Nettoyage du texte extrait
                     cleaned_text = self._clean_text(result.text)
@@ -606,6 +669,9 @@ class PreprocessingStep(BaseStep):
                                 ),
                             )
 
+                        _DOCUMENTS.inc(status="too_short")
+                        doc_span.set_attribute("status", "too_short")
+                        doc_span.end()
                         continue
 
                     # Création de l'enregistrement du document extrait
@@ -678,9 +744,14 @@ class PreprocessingStep(BaseStep):
                         text_length=len(cleaned_text),
                         file_size=file_size,
                     )
+                    _DOCUMENTS.inc(status="extracted")
+                    doc_span.set_attribute("extractor", extractor_name or "unknown")
+                    doc_span.end()
 
                 except Exception as e:
                     logger.error(f"✗ Erreur extraction {file_path.name}: {e}")
+                    _DOCUMENTS.inc(status="failed")
+                    doc_span.end(e)
 
                     # Enregistrement des métriques d'échec (Feature #7)
                     processing_time = time.time() - start_time
@@ -725,6 +796,18 @@ class PreprocessingStep(BaseStep):
                 f"avec succès (sur {len(file_paths)} tentatives)"
             )
 
+            # Statistiques de l'ordre adaptatif : écriture groupée en fin de lot
+            self.fallback_manager.flush_extractor_stats()
+
+            if self.extraction_cache is not None:
+                cache_stats = self.extraction_cache.get_stats()
+                logger.info(
+                    f"Cache d'extraction: {cache_stats['hits']} succès, "
+                    f"{cache_stats['misses']} échecs "
+                    f"({cache_stats['seconds_saved']} s économisées)"
+                )
+                self.metrics_collector.cache_stats = cache_stats
+
             # Export des métriques si activé (Feature #7)
             if self.metrics_collector.enabled:
                 summary = self.metrics_collector.get_summary()
@@ -747,6 +830,40 @@ class PreprocessingStep(BaseStep):
                 details={"error": str(e)},
             ) from e
 
+    def _extract(self, file_path: Path) -> tuple[ExtractionResult, Optional[str]]:
+        """Extrait un fichier, en réutilisant le résultat d'un contenu identique.
+
+        Parameters
+        ----------
+        file_path : Path
+            Chemin du fichier à extraire.
+
+        Returns:
+        -------
+        tuple[ExtractionResult, Optional[str]]
+            Résultat validé et nom de l'extracteur utilisé.
+        """
+        if self.extraction_cache is None:
+            return self.fallback_manager.extract_with_fallback(file_path)
+
+        key = self.extraction_cache.key(file_path)
+        cached = self.extraction_cache.get(key)
+        if cached is not None:
+            _CACHE_REQUESTS.inc(cache="extraction", result="hit")
+            cached_result, cached_name = cached
+            logger.info(f"Extraction en cache: {file_path.name} ({cached_name})")
+            # L'entrée a pu être produite par une copie du fichier
+            cached_result.metadata = rebind_metadata(cached_result.metadata, file_path)
+            return cached_result, cached_name
+        _CACHE_REQUESTS.inc(cache="extraction", result="miss")
+
+        start = time.perf_counter()
+        result, extractor_name = self.fallback_manager.extract_with_fallback(file_path)
+        self.extraction_cache.put(
+            key, result, extractor_name, seconds=time.perf_counter() - start
+        )
+        return result, extractor_name
+
     def _clean_text(self, text: str) -> str:
         r"""Nettoie le texte extrait selon la configuration.
 
@@ -18,6 +18,9 @@ logger = get_logger(__name__)
 class ChunkingStep(BaseStep):
     """Étape 3 : Découpage de documents en chunks."""
 
+    consumes = ("extracted_documents", "boundaries")
+    produces = ("chunks",)
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialise l'étape de chunking.
 
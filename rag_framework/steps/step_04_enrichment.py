@@ -10,15 +10,27 @@ from typing import Any, Optional
 from rag_framework.config import get_llm_client, load_config
 from rag_framework.exceptions import StepExecutionError
 from rag_framework.steps.base_step import BaseStep
+from rag_framework.telemetry import get_telemetry
 from rag_framework.types import StepData
 from rag_framework.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+telemetry = get_telemetry()
+_LLM_CALLS = telemetry.counter("rag_llm_calls_total", "Appels LLM, par statut")
+_LLM_RETRIES = telemetry.counter(
+    "rag_llm_retries_total", "Appels LLM retentés (rate limit)"
+)
+_LLM_TOKENS = telemetry.counter("rag_llm_tokens_total", "Tokens LLM, par type")
+_LLM_LATENCY = telemetry.histogram("rag_llm_call_seconds", "Durée des appels LLM")
+
 
 class EnrichmentStep(BaseStep):
     """Étape 4 : Enrichissement et métadonnées de conformité."""
 
+    consumes = ("chunks",)
+    produces = ("enriched_chunks",)
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialise l'étape d'enrichissement.
 
@@ -227,6 +239,7 @@ class EnrichmentStep(BaseStep):
 
         # Tentatives avec retry
         for attempt in range(max_retries + 1):
+            call_start = time.perf_counter()
             try:
                 response = self.llm_client.chat.completions.create(
                     model=self.llm_client._model,
@@ -234,11 +247,22 @@ class EnrichmentStep(BaseStep):
                     temperature=self.llm_client._temperature,
                     max_tokens=max_tokens,
                 )
+                _LLM_LATENCY.observe(time.perf_counter() - call_start)
+                _LLM_CALLS.inc(status="ok")
+                usage = getattr(response, "usage", None)
+                if usage is not None:
+                    _LLM_TOKENS.inc(
+                        getattr(usage, "prompt_tokens", 0) or 0, kind="prompt"
+                    )
+                    _LLM_TOKENS.inc(
+                        getattr(usage, "completion_tokens", 0) or 0, kind="completion"
+                    )
 
                 content = response.choices[0].message.content
                 return content if content is not None else None
 
             except Exception as e:
+                _LLM_LATENCY.observe(time.perf_counter() - call_start)
                 error_str = str(e)
 
                 # Si c'est une erreur 429 (rate limit), retry avec backoff
@@ -250,6 +274,8 @@ class EnrichmentStep(BaseStep):
                         else:
                             delay = retry_delay_base
 
+                        _LLM_CALLS.inc(status="rate_limited")
+                        _LLM_RETRIES.inc()
                         logger.warning(
                             f"Rate limit atteint (tentative "
                             f"{attempt + 1}/{max_retries + 1}). "
@@ -258,6 +284,7 @@ class EnrichmentStep(BaseStep):
                         time.sleep(delay)
                         continue
                     else:
+                        _LLM_CALLS.inc(status="rate_limited")
                         logger.error(
                             f"Rate limit atteint après {max_retries + 1} tentatives. "
                             "Abandon de l'appel LLM."
@@ -266,6 +293,7 @@ class EnrichmentStep(BaseStep):
 
                 # Pour les autres erreurs, pas de retry
                 else:
+                    _LLM_CALLS.inc(status="error")
                     raise
 
         return None
@@ -2,7 +2,7 @@
 
 import gzip
 import json
-import re
+import os
 import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -12,45 +12,19 @@ from rag_framework.config import get_llm_client, load_config
 from rag_framework.exceptions import StepExecutionError, ValidationError
 from rag_framework.steps.base_step import BaseStep
 from rag_framework.types import StepData
+from rag_framework.utils.audit_trail import AuditTrail
 from rag_framework.utils.logger import get_logger
+from rag_framework.utils.pii_scanner import PII_TYPES, scan_texts
 
 logger = get_logger(__name__)
 
-# ═══════════════════════════════════════════════════════════════════════════
-# PATTERNS REGEX POUR DÉTECTION PII (RGPD)
-# ═══════════════════════════════════════════════════════════════════════════
-
-# Email : RFC 5322 simplifié
-PII_EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
-
-# Téléphone français : +33, 0033, 06/07 formats courants
-PII_PHONE_FR_PATTERN = re.compile(r"(?:(?:\+|00)33\s?|0)[1-9](?:[\s.-]?\d{2}){4}\b")
-
-# Téléphone international générique
-PII_PHONE_INTL_PATTERN = re.compile(
-    r"\+\d{1,3}[\s.-]?\(?\d{1,4}\)?[\s.-]?\d{1,4}[\s.-]?\d{1,9}"
-)
-
-# Numéro de sécurité sociale français (NIR) : 15 chiffres
-PII_SSN_FR_PATTERN = re.compile(
-    r"\b[12]\s?\d{2}\s?\d{2}\s?\d{2}\s?\d{3}\s?\d{3}\s?\d{2}\b"
-)
-
-# IBAN européen : 2 lettres + 2 chiffres + jusqu'à 30 caractères
-PII_IBAN_PATTERN = re.compile(
-    r"\b[A-Z]{2}\d{2}\s?(?:[A-Z0-9]{4}\s?){3,7}[A-Z0-9]{1,4}\b"
-)
-
-# Carte de crédit : 13-19 chiffres avec espaces optionnels
-PII_CREDIT_CARD_PATTERN = re.compile(r"\b(?:\d{4}[\s-]?){3}\d{1,7}\b")
-
-# Adresse IP (IPv4)
-PII_IP_ADDRESS_PATTERN = re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b")
-
 
 class AuditStep(BaseStep):
     """Étape 5 : Audit logging et traçabilité."""
 
+    consumes = ("enriched_chunks", "extracted_documents", "monitoring_config")
+    produces = ("audit_record",)
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialise l'étape d'audit.
 
@@ -102,6 +76,10 @@ class AuditStep(BaseStep):
                 )
                 self.llm_client = None
 
+        # Journal segmenté (rotation, compression, index) si configuré,
+        # sinon fichier JSONL unique (log_file)
+        self.audit_trail = AuditTrail.from_config(self.config.get("audit_logging", {}))
+
     def validate_config(self) -> None:
         """Valide la configuration de l'étape."""
         if "audit_logging" not in self.config:
@@ -254,12 +232,19 @@ class AuditStep(BaseStep):
         audit_record: dict[str, Any],
         audit_config: dict[str, Any],
     ) -> None:
-        """Écrit l'enregistrement d'audit dans le fichier de log.
+        """Écrit l'enregistrement d'audit dans le journal.
+
+        Journal segmenté (``audit_logging.rotation``) s'il est activé, sinon
+        ajout au fichier JSONL ``log_file``.
 
         Args:
             audit_record: Enregistrement d'audit.
             audit_config: Configuration de l'audit.
         """
+        if self.audit_trail is not None:
+            self.audit_trail.append(audit_record)
+            return
+
         log_file = audit_config.get("log_file", "logs/audit_trail.jsonl")
         log_path = Path(log_file)
 
@@ -589,6 +574,7 @@ Le résumé doit être factuel, professionnel et sans interprétation subjective
             - total_pii_found: Nombre total de PII détectés
             - pii_types: Dictionnaire {type: count}
             - chunks_with_pii: Liste des indices de chunks contenant PII
+            - pii_by_file: Dictionnaire {fichier source: {type: count}}
             - recommendations: Liste de recommandations RGPD
 
         Examples:
@@ -600,76 +586,36 @@ Le résumé doit être factuel, professionnel et sans interprétation subjective
         >>> print(report["pii_types"])
         {'email': 1, 'phone': 1}
         """
-        # Initialisation des compteurs
-        pii_counts: dict[str, int] = {
-            "email": 0,
-            "phone_fr": 0,
-            "phone_intl": 0,
-            "ssn_fr": 0,
-            "iban": 0,
-            "credit_card": 0,
-            "ip_address": 0,
-        }
+        pii_config = self.config.get("pii_detection", {})
+        validate = pii_config.get("validate_checksums", True)
+        workers = int(pii_config.get("workers") or os.cpu_count() or 1)
+        parallel_min_chars = int(
+            float(pii_config.get("parallel_min_mb", 4)) * 1024 * 1024
+        )
 
-        # Liste des chunks contenant des PII
-        chunks_with_pii: list[int] = []
+        # Une passe par chunk (expression combinée, clés de contrôle),
+        # chunks répartis entre processus pour les gros lots
+        texts = [chunk.get("text", "") or "" for chunk in chunks]
+        per_chunk = scan_texts(
+            texts,
+            categories=pii_config.get("categories"),
+            validate=validate,
+            workers=workers,
+            parallel_min_chars=parallel_min_chars,
+        )
 
-        # Scan de tous les chunks
-        for idx, chunk in enumerate(chunks):
-            text = chunk.get("text", "")
-            if not text:
-                continue
-
-            # Variable de tracking pour ce chunk
-            chunk_has_pii = False
-
-            # Détection email
-            emails = PII_EMAIL_PATTERN.findall(text)
-            if emails:
-                pii_counts["email"] += len(emails)
-                chunk_has_pii = True
-
-            # Détection téléphone français
-            phones_fr = PII_PHONE_FR_PATTERN.findall(text)
-            if phones_fr:
-                pii_counts["phone_fr"] += len(phones_fr)
-                chunk_has_pii = True
-
-            # Détection téléphone international
-            phones_intl = PII_PHONE_INTL_PATTERN.findall(text)
-            # Éviter double comptage avec téléphones FR
-            phones_intl_unique = [p for p in phones_intl if p not in phones_fr]
-            if phones_intl_unique:
-                pii_counts["phone_intl"] += len(phones_intl_unique)
-                chunk_has_pii = True
-
-            # Détection SSN français (NIR)
-            ssn_fr = PII_SSN_FR_PATTERN.findall(text)
-            if ssn_fr:
-                pii_counts["ssn_fr"] += len(ssn_fr)
-                chunk_has_pii = True
-
-            # Détection IBAN
-            ibans = PII_IBAN_PATTERN.findall(text)
-            if ibans:
-                pii_counts["iban"] += len(ibans)
-                chunk_has_pii = True
-
-            # Détection carte de crédit
-            credit_cards = PII_CREDIT_CARD_PATTERN.findall(text)
-            if credit_cards:
-                pii_counts["credit_card"] += len(credit_cards)
-                chunk_has_pii = True
-
-            # Détection adresse IP
-            ip_addresses = PII_IP_ADDRESS_PATTERN.findall(text)
-            if ip_addresses:
-                pii_counts["ip_address"] += len(ip_addresses)
-                chunk_has_pii = True
-
-            # Enregistrer l'indice du chunk si PII détectés
-            if chunk_has_pii:
+        # Agrégation des compteurs
+        pii_counts: dict[str, int] = dict.fromkeys(PII_TYPES, 0)
+        chunks_with_pii: list[int] = []
+        pii_by_file: dict[str, dict[str, int]] = {}
+        for idx, counts in enumerate(per_chunk):
+            if counts:
                 chunks_with_pii.append(idx)
+                source = str(chunks[idx].get("source_file", "unknown"))
+                file_counts = pii_by_file.setdefault(source, {})
+                for pii_type, count in counts.items():
+                    pii_counts[pii_type] += count
+                    file_counts[pii_type] = file_counts.get(pii_type, 0) + count
 
         # Calcul du total
         total_pii = sum(pii_counts.values())
@@ -729,7 +675,7 @@ Le résumé doit être factuel, professionnel et sans interprétation subjective
             )
 
         # Construction du rapport
-        report = {
+        report: dict[str, Any] = {
             "total_pii_found": total_pii,
             "pii_types": pii_counts,
             "chunks_with_pii": chunks_with_pii,
@@ -738,6 +684,8 @@ Le résumé doit être factuel, professionnel et sans interprétation subjective
             "pii_percentage": (
                 round(len(chunks_with_pii) / len(chunks) * 100, 2) if chunks else 0.0
             ),
+            "pii_by_file": pii_by_file,
+            "checksums_validated": validate,
             "recommendations": recommendations,
         }
 
@@ -751,6 +699,7 @@ Le résumé doit être factuel, professionnel et sans interprétation subjective
         Stratégie de rétention:
         - Archive: logs > 90 jours → compression gzip dans logs/archive/
         - Suppression: archives > 365 jours → suppression définitive
+        - Journal segmenté: segments scellés > 365 jours → suppression
 
         Parameters
         ----------
@@ -762,7 +711,11 @@ Le résumé doit être factuel, professionnel et sans interprétation subjective
         dict[str, Any]
             Rapport de rétention avec statistiques des opérations effectuées.
         """
-        retention_config = audit_config.get("log_retention", {})
+        # Section log_retention au niveau de l'étape (05_audit.yaml), ou dans
+        # audit_logging
+        retention_config = audit_config.get("log_retention") or self.config.get(
+            "log_retention", {}
+        )
 
         # Vérifier si la rétention est activée
         if not retention_config.get("enabled", False):
@@ -786,7 +739,7 @@ Le résumé doit être factuel, professionnel et sans interprétation subjective
         archive_threshold = now - timedelta(days=archive_after_days)
         delete_threshold = now - timedelta(days=delete_after_days)
 
-        report = {
+        report: dict[str, Any] = {
             "retention_enabled": True,
             "timestamp": now.isoformat(),
             "archive_threshold": archive_threshold.isoformat(),
@@ -897,6 +850,20 @@ Le résumé doit être factuel, professionnel et sans interprétation subjective
             report["errors"].append(error_msg)
             logger.error(error_msg)
 
+        # === PHASE 3: SEGMENTS EXPIRÉS DU JOURNAL SEGMENTÉ ===
+        # Les segments scellés sont déjà compressés : ils sont supprimés
+        # après delete_after_days, avec les blobs qui ne sont plus référencés
+        if self.audit_trail is not None:
+            try:
+                for segment in self.audit_trail.purge(delete_threshold):
+                    report["logs_deleted"] += 1
+                    report["deleted_files"].append(segment)
+                    logger.info(f"🗑️ Segment d'audit supprimé: {segment['file']}")
+            except Exception as e:
+                error_msg = f"Erreur purge des segments d'audit: {e}"
+                report["errors"].append(error_msg)
+                logger.error(error_msg)
+
         # === RAPPORT FINAL ===
         if report["logs_archived"] > 0 or report["logs_deleted"] > 0:
             logger.info(
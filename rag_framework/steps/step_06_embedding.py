@@ -6,20 +6,45 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-import numpy as np
-
-from rag_framework.config import get_llm_client, load_config
-from rag_framework.exceptions import StepExecutionError, ValidationError
+from rag_framework.config import load_config
+from rag_framework.exceptions import (
+    ConfigurationError,
+    StepExecutionError,
+    ValidationError,
+)
+from rag_framework.models.fake_embeddings import FakeEmbedder, FakeEmbeddingSettings
+from rag_framework.models.remote_embeddings import (
+    RemoteEmbeddingClient,
+    RemoteEmbeddingSettings,
+)
 from rag_framework.steps.base_step import BaseStep
+from rag_framework.telemetry import SIZE_BUCKETS, get_telemetry
 from rag_framework.types import StepData
 from rag_framework.utils.logger import get_logger
+from rag_framework.utils.vector_codec import (
+    FLOAT_DTYPES,
+    VectorFormat,
+    decode_vector,
+    encode_vector,
+)
 
 logger = get_logger(__name__)
 
+telemetry = get_telemetry()
+_CACHE_REQUESTS = telemetry.counter(
+    "rag_cache_requests_total", "Consultations des caches, par résultat"
+)
+_BATCH_SIZE = telemetry.histogram(
+    "rag_embedding_batch_size", "Textes à encoder par batch (hors cache)", SIZE_BUCKETS
+)
+
 
 class EmbeddingStep(BaseStep):
     """Étape 6 : Génération d'embeddings vectoriels."""
 
+    consumes = ("enriched_chunks",)
+    produces = ("embedded_chunks",)
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialise l'étape d'embeddings.
 
@@ -36,6 +61,7 @@ class EmbeddingStep(BaseStep):
         # Initialisation du client d'embeddings
         self.embedding_client: Optional[Any] = None
         self.embedding_model: Optional[Any] = None
+        self.fake_embedder: Optional[FakeEmbedder] = None
 
         provider = self.config.get("provider")
         model = self.config.get("model")
@@ -44,18 +70,29 @@ class EmbeddingStep(BaseStep):
             try:
                 # Provider API (OpenAI-compatible)
                 if provider in ["openai", "mistral_ai", "ollama", "lm_studio"]:
-                    self.embedding_client = get_llm_client(
-                        provider_name=provider,
-                        model=model,
-                        temperature=0.0,  # Pas utilisé pour embeddings
-                        global_config=self.global_config,
+                    self.embedding_client = self._initialize_remote_client(
+                        provider, model
+                    )
+                    settings = self.embedding_client.settings
+                    logger.info(
+                        f"Embedding client initialisé: {provider}/{model} "
+                        f"(concurrence={settings.max_concurrency}, "
+                        f"batch={settings.max_batch_size})"
                     )
-                    logger.info(f"Embedding client initialisé: {provider}/{model}")
 
                 # Sentence Transformers (local)
                 elif provider == "sentence-transformers":
                     self._initialize_sentence_transformers(model)
 
+                # Embeddings factices déterministes (tests de charge)
+                elif provider == "fake":
+                    self.fake_embedder = self._create_fake_embedder()
+                    logger.info(
+                        "Embeddings factices déterministes: "
+                        f"{self.fake_embedder.settings.dimensions} dimensions, "
+                        f"{self.fake_embedder.settings.n_clusters} clusters"
+                    )
+
                 else:
                     logger.warning(f"Provider d'embeddings non supporté: {provider}")
 
@@ -66,6 +103,12 @@ class EmbeddingStep(BaseStep):
                 )
                 self.embedding_client = None
 
+        # Précision de stockage des vecteurs dans le cache (float64 = JSON
+        # historique, float32/float16 = buffer binaire compact en base64)
+        self.vector_format = VectorFormat.from_config(
+            self.config.get("vector_format", {}), allowed_dtypes=FLOAT_DTYPES
+        )
+
         # Configuration du cache d'embeddings (Feature #8)
         caching_config = self.config.get("caching", {})
         self.cache_enabled = caching_config.get("enabled", False)
@@ -140,6 +183,10 @@ class EmbeddingStep(BaseStep):
                 cache_file.unlink()
                 return None
 
+            # Format compact (vector_format.dtype float32/float16)
+            if "embedding_encoded" in cached_data:
+                return decode_vector(cached_data["embedding_encoded"])
+
             # Type cast pour mypy : on sait que embedding est list[float]
             embedding: list[float] = cached_data["embedding"]
             return embedding
@@ -164,12 +211,17 @@ class EmbeddingStep(BaseStep):
         cache_file = self.cache_dir / f"{cache_key}.json"
 
         try:
-            cache_data = {
+            cache_data: dict[str, Any] = {
                 "timestamp": datetime.now(timezone.utc).isoformat(),
-                "embedding": embedding,
                 "provider": self.config.get("provider"),
                 "model": self.config.get("model"),
             }
+            if self.vector_format.dtype == "float64":
+                cache_data["embedding"] = embedding
+            else:
+                cache_data["embedding_encoded"] = encode_vector(
+                    embedding, self.vector_format.dtype
+                )
 
             with open(cache_file, "w", encoding="utf-8") as f:
                 json.dump(cache_data, f, ensure_ascii=False)
@@ -211,6 +263,69 @@ class EmbeddingStep(BaseStep):
         except Exception as e:
             logger.warning(f"Erreur nettoyage cache: {e}")
 
+    def _initialize_remote_client(
+        self, provider: str, model: str
+    ) -> RemoteEmbeddingClient:
+        """Crée le client HTTP d'embeddings pour un provider distant.
+
+        Les paramètres de connexion viennent de global.yaml > llm_providers,
+        les paramètres de concurrence/batching de la section ``remote_client``.
+
+        Parameters
+        ----------
+        provider : str
+            Nom du provider dans global.yaml.
+        model : str
+            Nom du modèle d'embedding.
+
+        Returns:
+        -------
+        RemoteEmbeddingClient
+            Client configuré (sessions HTTP keep-alive mutualisées).
+
+        Raises:
+        ------
+        ConfigurationError
+            Si le provider est absent ou incomplet dans global.yaml.
+        """
+        provider_config = self.global_config.llm_providers.get(provider)
+        if not provider_config or not provider_config.get("base_url"):
+            raise ConfigurationError(
+                f"Provider d'embeddings '{provider}' introuvable ou incomplet "
+                "dans global.yaml",
+                details={"provider": provider},
+            )
+
+        # Le batch_size historique sert de limite par requête par défaut
+        remote_config = {
+            "max_batch_size": self.config.get("processing", {}).get("batch_size", 64),
+            **self.config.get("remote_client", {}),
+        }
+
+        return RemoteEmbeddingClient(
+            protocol="openai",
+            base_url=provider_config["base_url"],
+            model=model,
+            api_key=provider_config.get("api_key"),
+            settings=RemoteEmbeddingSettings.from_config(remote_config),
+        )
+
+    def _create_fake_embedder(self) -> FakeEmbedder:
+        """Crée l'embedder factice depuis la section ``fake`` de la config.
+
+        La clé ``dimensions`` de l'étape est prioritaire ; à défaut, la
+        dimension de la section ``fake`` (1024 par défaut) est utilisée.
+
+        Returns:
+        -------
+        FakeEmbedder
+            Embedder déterministe et vectorisé.
+        """
+        settings = FakeEmbeddingSettings.from_config(
+            self.config.get("fake", {}), dimensions=self.config.get("dimensions")
+        )
+        return FakeEmbedder(settings)
+
     def _initialize_sentence_transformers(self, model: str) -> None:
         """Initialise Sentence Transformers pour embeddings locaux.
 
@@ -280,8 +395,17 @@ class EmbeddingStep(BaseStep):
                 "batch_size", self.global_config.performance.batch_size
             )
 
-            for i in range(0, len(chunks), batch_size):
-                batch = chunks[i : i + batch_size]
+            # Le client distant découpe lui-même en requêtes et en garde
+            # plusieurs en vol : on lui transmet une fenêtre plus large
+            window_size = batch_size
+            if isinstance(self.embedding_client, RemoteEmbeddingClient):
+                settings = self.embedding_client.settings
+                window_size = max(
+                    batch_size, settings.max_batch_size * settings.max_concurrency
+                )
+
+            for i in range(0, len(chunks), window_size):
+                batch = chunks[i : i + window_size]
                 texts = [chunk["text"] for chunk in batch]
 
                 # Génération des embeddings pour le batch
@@ -355,6 +479,10 @@ class EmbeddingStep(BaseStep):
 
         # Log du taux de cache hit
         if self.cache_enabled and len(texts) > 0:
+            _CACHE_REQUESTS.inc(cache_hits, cache="embedding", result="hit")
+            _CACHE_REQUESTS.inc(
+                len(texts) - cache_hits, cache="embedding", result="miss"
+            )
             hit_rate = (cache_hits / len(texts)) * 100
             logger.info(
                 f"Cache embeddings: {cache_hits}/{len(texts)} hits ({hit_rate:.1f}%)"
@@ -366,6 +494,7 @@ class EmbeddingStep(BaseStep):
 
         # Génération des embeddings manquants
         texts_only = [text for _, text in texts_to_generate]
+        _BATCH_SIZE.observe(len(texts_only))
         generated_embeddings: list[list[float]] = []
 
         try:
@@ -384,6 +513,10 @@ class EmbeddingStep(BaseStep):
                     texts_only
                 )
 
+            # Embeddings factices demandés explicitement
+            elif self.fake_embedder is not None:
+                generated_embeddings = self.fake_embedder.embed(texts_only)
+
             # Fallback : embeddings simulés
             else:
                 logger.warning(
@@ -423,13 +556,8 @@ class EmbeddingStep(BaseStep):
         """
         assert self.embedding_client is not None
 
-        # Utilisation de l'API embeddings (OpenAI-compatible)
-        response = self.embedding_client.embeddings.create(
-            input=texts, model=self.embedding_client._model
-        )
-
-        # Extraction des embeddings
-        embeddings = [data.embedding for data in response.data]
+        # Requêtes batchées, concurrentes et avec retry (ordre préservé)
+        embeddings: list[list[float]] = self.embedding_client.embed(texts)
 
         return embeddings
 
@@ -464,6 +592,9 @@ class EmbeddingStep(BaseStep):
     def _generate_embeddings_simulated(self, texts: list[str]) -> list[list[float]]:
         """Génère des embeddings simulés (pour tests uniquement).
 
+        Délègue à l'embedder factice : vecteurs dérivés du contenu des
+        textes, identiques d'une exécution à l'autre.
+
         Parameters
         ----------
         texts : list[str]
@@ -474,16 +605,6 @@ class EmbeddingStep(BaseStep):
         list[list[float]]
             Liste d'embeddings simulés.
         """
-        # Dimension par défaut (compatible avec la plupart des bases vectorielles)
-        dim = self.config.get("dimensions")
-        if dim is None:
-            dim = 1024  # Dimension par défaut si non spécifiée
-
-        embeddings = []
-        for text in texts:
-            # Génération d'un vecteur aléatoire déterministe basé sur le hash du texte
-            np.random.seed(hash(text) % 2**32)
-            embedding: list[float] = np.random.randn(dim).tolist()
-            embeddings.append(embedding)
-
-        return embeddings
+        if self.fake_embedder is None:
+            self.fake_embedder = self._create_fake_embedder()
+        return self.fake_embedder.embed(texts)
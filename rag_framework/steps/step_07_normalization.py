@@ -5,12 +5,17 @@ import unicodedata
 from typing import Any
 
 import numpy as np
-from numpy.typing import NDArray
 
 from rag_framework.exceptions import StepExecutionError
 from rag_framework.steps.base_step import BaseStep
 from rag_framework.types import StepData
 from rag_framework.utils.logger import get_logger
+from rag_framework.utils.vector_codec import (
+    VectorFormat,
+    l2_normalize,
+    to_matrix,
+    truncate,
+)
 
 logger = get_logger(__name__)
 
@@ -18,9 +23,14 @@ logger = get_logger(__name__)
 class NormalizationStep(BaseStep):
     """Étape 7 : Normalisation des données."""
 
+    consumes = ("embedded_chunks",)
+    produces = ("normalized_chunks",)
+
     def validate_config(self) -> None:
         """Valide la configuration de l'étape."""
-        pass  # Configuration optionnelle
+        # Seule la troncature est pertinente ici : la précision de stockage
+        # est définie à l'étape 8
+        VectorFormat.from_config(self.config.get("vector_format", {}))
 
     def execute(self, data: StepData) -> StepData:
         """Normalise les embeddings et les métadonnées.
@@ -75,19 +85,15 @@ class NormalizationStep(BaseStep):
                 if "text" in chunk:
                     normalized_chunk["text"] = self._normalize_text(chunk["text"])
 
-                # Normalisation L2 des embeddings
-                if self.config.get("vector_normalization", {}).get(
-                    "normalize_l2", True
-                ):
-                    embedding = np.array(chunk["embedding"])
-                    normalized_embedding = self._normalize_l2(embedding)
-                    normalized_chunk["embedding"] = normalized_embedding.tolist()
-
                 # Normalisation des métadonnées
                 normalized_chunk["metadata"] = self._normalize_metadata(chunk)
 
                 normalized_chunks.append(normalized_chunk)
 
+            # Troncature Matryoshka + normalisation L2 des embeddings,
+            # vectorisées sur l'ensemble du batch
+            self._normalize_embeddings(normalized_chunks)
+
             # Log des erreurs de validation si demandé
             log_errors = validation_config.get("log_validation_errors", True)
             if validation_errors and log_errors:
@@ -108,19 +114,47 @@ class NormalizationStep(BaseStep):
                 details={"error": str(e)},
             ) from e
 
-    def _normalize_l2(self, vector: NDArray[np.float64]) -> NDArray[np.float64]:
-        """Normalisation L2 d'un vecteur.
+    def _normalize_embeddings(self, chunks: list[dict[str, Any]]) -> None:
+        """Tronque (Matryoshka) et normalise les embeddings en place.
 
-        Args:
-            vector: Vecteur à normaliser.
+        Les chunks dont les embeddings ont la même dimension sont traités
+        en une seule opération matricielle ; les autres (dimensions
+        hétérogènes) sont traités individuellement.
 
-        Returns:
-            Vecteur normalisé.
+        Args:
+            chunks: Chunks normalisés (modifiés en place).
         """
-        norm = np.linalg.norm(vector)
-        if norm == 0:
-            return vector
-        return vector / norm
+        vector_format = VectorFormat.from_config(self.config.get("vector_format", {}))
+        truncate_dim = vector_format.truncate_dim
+        normalize_l2 = self.config.get("vector_normalization", {}).get(
+            "normalize_l2", True
+        )
+        # Après troncature Matryoshka, la renormalisation est obligatoire :
+        # le préfixe d'un vecteur unitaire n'est plus unitaire
+        if not normalize_l2 and truncate_dim is None:
+            return
+
+        # Regroupement par dimension d'origine
+        groups: dict[int, list[int]] = {}
+        for idx, chunk in enumerate(chunks):
+            embedding = chunk.get("embedding")
+            if isinstance(embedding, list) and embedding:
+                groups.setdefault(len(embedding), []).append(idx)
+
+        for dimensions, indices in groups.items():
+            if truncate_dim is not None and truncate_dim > dimensions:
+                logger.warning(
+                    f"Normalization: truncate_dim={truncate_dim} supérieur à la "
+                    f"dimension des embeddings ({dimensions}), troncature ignorée"
+                )
+
+            matrix = to_matrix([chunks[i]["embedding"] for i in indices])
+            matrix = l2_normalize(truncate(matrix, truncate_dim))
+            vectors = matrix.tolist()
+
+            for i, vector in zip(indices, vectors):
+                chunks[i]["embedding"] = vector
+                chunks[i]["embedding_dimensions"] = len(vector)
 
     def _normalize_metadata(self, chunk: dict[str, Any]) -> dict[str, Any]:
         """Normalise les métadonnées d'un chunk.
@@ -5,20 +5,37 @@ import uuid
 from pathlib import Path
 from typing import Any
 
-import chromadb
-from chromadb.config import Settings
-
 from rag_framework.exceptions import StepExecutionError, ValidationError
 from rag_framework.steps.base_step import BaseStep
+from rag_framework.telemetry import get_telemetry
 from rag_framework.types import StepData
 from rag_framework.utils.logger import get_logger
+from rag_framework.utils.vector_codec import VectorFormat, quantize_int8, to_matrix
 
 logger = get_logger(__name__)
 
+_VECTORS_WRITTEN = get_telemetry().counter(
+    "rag_vectors_written_total", "Vecteurs écrits dans la base, par provider"
+)
+
+# Précisions de stockage effectivement écrites par chaque provider
+# (pgvector: vector/halfvec, Milvus: FLOAT/FLOAT16/INT8_VECTOR). Le stockage
+# Qdrant est simulé : aucun datatype compact n'est transmis, float32 seul.
+STORAGE_DTYPES: dict[str, tuple[str, ...]] = {
+    "chromadb": ("float32",),
+    "qdrant": ("float32",),
+    "pgvector": ("float32", "float16"),
+    "milvus": ("float32", "float16", "int8"),
+    "weaviate": ("float32",),
+}
+
 
 class VectorStorageStep(BaseStep):
     """Étape 8 : Stockage vectoriel."""
 
+    consumes = ("normalized_chunks",)
+    produces = ("storage_result",)
+
     def validate_config(self) -> None:
         """Valide la configuration de l'étape."""
         if "provider" not in self.config:
@@ -35,6 +52,38 @@ class VectorStorageStep(BaseStep):
                 details={"step": "VectorStorageStep", "provider": provider},
             )
 
+        # Précision de stockage (float32 par défaut) validée pour le provider
+        self.vector_format = VectorFormat.from_config(
+            {"dtype": "float32", **self.config.get("vector_format", {})},
+            allowed_dtypes=STORAGE_DTYPES[provider],
+        )
+
+    def _prepare_vectors(self, chunks: list[dict[str, Any]]) -> tuple[Any, Any]:
+        """Convertit les embeddings dans la précision de stockage configurée.
+
+        Args:
+            chunks: Chunks normalisés (embeddings en listes de floats).
+
+        Returns:
+            Tuple (matrice de vecteurs au dtype cible, échelles int8 ou None).
+        """
+        matrix = to_matrix([chunk["embedding"] for chunk in chunks])
+        dtype = self.vector_format.dtype
+
+        if dtype == "int8":
+            quantized = quantize_int8(matrix)
+            return quantized.codes, quantized.scales
+        if dtype == "float16":
+            return matrix.astype("float16"), None
+        return matrix, None
+
+    def _storage_info(self, dimensions: int) -> dict[str, Any]:
+        """Informations de format ajoutées au résultat de stockage."""
+        return {
+            "vector_dtype": self.vector_format.dtype,
+            "bytes_per_vector": self.vector_format.bytes_per_vector(dimensions),
+        }
+
     def execute(self, data: StepData) -> StepData:
         """Stocke les chunks vectorisés dans le vector store.
 
@@ -74,7 +123,11 @@ class VectorStorageStep(BaseStep):
                     details={"provider": provider},
                 )
 
+            dimensions = len(chunks[0].get("embedding") or [])
+            result.update(self._storage_info(dimensions))
+
             data["storage_result"] = result
+            _VECTORS_WRITTEN.inc(result["stored_count"], provider=provider)
             logger.info(
                 f"Vector Storage: {result['stored_count']} chunks stockés "
                 f"dans {provider}"
@@ -110,6 +163,10 @@ class VectorStorageStep(BaseStep):
         Path(persist_dir).mkdir(parents=True, exist_ok=True)
 
         try:
+            # Import à l'usage : chromadb est coûteux à charger
+            import chromadb
+            from chromadb.config import Settings
+
             # Initialisation du client ChromaDB persistant
             logger.info(f"Initialisation ChromaDB dans: {persist_dir}")
 
@@ -145,8 +202,9 @@ class VectorStorageStep(BaseStep):
                 ) from e
 
             # Préparation des données pour ChromaDB
+            # (matrice float32 transmise telle quelle, sans listes Python)
+            embeddings, _ = self._prepare_vectors(chunks)
             ids: list[str] = []
-            embeddings: list[list[float]] = []
             documents: list[str] = []
             metadatas: list[dict[str, Any]] = []
 
@@ -165,9 +223,6 @@ class VectorStorageStep(BaseStep):
 
                 ids.append(chunk_id)
 
-                # Embedding (déjà normalisé par étape 7)
-                embeddings.append(chunk["embedding"])
-
                 # Document (texte du chunk)
                 documents.append(chunk.get("text", chunk.get("content", "")))
 
@@ -386,6 +441,13 @@ class VectorStorageStep(BaseStep):
             # Activation de l'extension pgvector
             cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
 
+            # Vecteurs au format de stockage : vector (float32) ou halfvec
+            # (float16, pgvector >= 0.7) soit 2x moins d'espace disque
+            vectors, _ = self._prepare_vectors(chunks)
+            column_type = (
+                "halfvec" if self.vector_format.dtype == "float16" else "vector"
+            )
+
             # Création de la table si nécessaire
             if create_table:
                 operator_map = {
@@ -397,7 +459,7 @@ class VectorStorageStep(BaseStep):
                 cur.execute(f"""
                     CREATE TABLE IF NOT EXISTS {table_name} (
                         id TEXT PRIMARY KEY,
-                        embedding vector({vector_dim}),
+                        embedding {column_type}({vector_dim}),
                         content TEXT,
                         metadata JSONB,
                         file_name TEXT,
@@ -455,9 +517,9 @@ class VectorStorageStep(BaseStep):
                 batch = chunks[i : i + batch_size]
 
                 values = []
-                for chunk in batch:
+                for offset, chunk in enumerate(batch):
                     chunk_id = chunk.get("content_hash", str(uuid.uuid4()))
-                    embedding = chunk["embedding"]
+                    embedding = vectors[i + offset].tolist()
                     content = chunk.get("text", chunk.get("content", ""))
                     metadata = chunk.get("metadata", {})
                     filename = (
@@ -559,6 +621,13 @@ class VectorStorageStep(BaseStep):
             logger.info(f"Connexion à Milvus: {host}:{port}")
             connections.connect("default", host=host, port=port)
 
+            vector_data_type = {
+                "float32": DataType.FLOAT_VECTOR,
+                "float16": DataType.FLOAT16_VECTOR,
+                "int8": DataType.INT8_VECTOR,
+            }[self.vector_format.dtype]
+            quantized = self.vector_format.dtype == "int8"
+
             # Création de la collection si nécessaire
             if create_collection and not utility.has_collection(collection_name):
                 fields = [
@@ -569,7 +638,7 @@ class VectorStorageStep(BaseStep):
                         max_length=100,
                     ),
                     FieldSchema(
-                        name="embedding", dtype=DataType.FLOAT_VECTOR, dim=vector_dim
+                        name="embedding", dtype=vector_data_type, dim=vector_dim
                     ),
                     FieldSchema(
                         name="content", dtype=DataType.VARCHAR, max_length=65535
@@ -578,6 +647,11 @@ class VectorStorageStep(BaseStep):
                         name="file_name", dtype=DataType.VARCHAR, max_length=500
                     ),
                 ]
+                if quantized:
+                    # Échelle par vecteur : embedding ≈ codes int8 * vector_scale
+                    fields.insert(
+                        2, FieldSchema(name="vector_scale", dtype=DataType.FLOAT)
+                    )
                 schema = CollectionSchema(fields, description="Compliance documents")
                 collection = Collection(
                     collection_name, schema, consistency_level=consistency_level
@@ -627,15 +701,15 @@ class VectorStorageStep(BaseStep):
                     )
 
             # Préparation des données
+            vectors, scales = self._prepare_vectors(chunks)
+            embeddings = list(vectors)
             ids = []
-            embeddings = []
             contents = []
             filenames = []
 
             for chunk in chunks:
                 chunk_id = chunk.get("content_hash", str(uuid.uuid4()))[:100]
                 ids.append(chunk_id)
-                embeddings.append(chunk["embedding"])
                 contents.append(chunk.get("text", chunk.get("content", ""))[:65535])
 
                 metadata = chunk.get("metadata", {})
@@ -649,6 +723,8 @@ class VectorStorageStep(BaseStep):
 
             # Insertion
             data = [ids, embeddings, contents, filenames]
+            if quantized:
+                data.insert(2, scales.tolist())
             collection.insert(data)
             collection.flush()
 
@@ -0,0 +1,44 @@
+"""Instrumentation transverse du pipeline (métriques et spans).
+
+Les modules instrumentés déclarent leurs métriques sur le registre du
+processus et ouvrent des spans ; la section ``telemetry`` de global.yaml
+active la collecte et choisit les exports (Prometheus, OpenTelemetry).
+"""
+
+from rag_framework.telemetry.core import (
+    DURATION_BUCKETS,
+    NOOP_SPAN,
+    SIZE_BUCKETS,
+    Counter,
+    Histogram,
+    Span,
+    Telemetry,
+    TelemetrySettings,
+    get_telemetry,
+)
+from rag_framework.telemetry.exporters import (
+    MetricsHTTPServer,
+    configure_telemetry,
+    export_telemetry,
+    render_prometheus,
+    to_otel_json,
+    write_prometheus_textfile,
+)
+
+__all__ = [
+    "DURATION_BUCKETS",
+    "NOOP_SPAN",
+    "SIZE_BUCKETS",
+    "Counter",
+    "Histogram",
+    "MetricsHTTPServer",
+    "Span",
+    "Telemetry",
+    "TelemetrySettings",
+    "configure_telemetry",
+    "export_telemetry",
+    "get_telemetry",
+    "render_prometheus",
+    "to_otel_json",
+    "write_prometheus_textfile",
+]
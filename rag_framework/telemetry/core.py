@@ -0,0 +1,442 @@
+"""Compteurs, histogrammes et spans du pipeline.
+
+Un registre unique par processus (:func:`get_telemetry`) : les modules
+déclarent leurs métriques à l'import et les incrémentent sans se soucier
+de la configuration, appliquée ensuite par :func:`configure_telemetry`.
+Désactivée, chaque opération se réduit à la lecture d'un booléen.
+
+- :class:`Counter` : valeur cumulée par jeu de labels
+  (ex. ``rag_llm_calls_total{status="ok"}``) ;
+- :class:`Histogram` : répartition par buckets fixes, somme et nombre
+  d'observations (ex. taille des batches d'embeddings) ;
+- :class:`Span` : intervalle de temps nommé (exécution, étape, document),
+  rattaché à son parent ; les spans terminés sont conservés dans un tampon
+  borné jusqu'à leur export, et leur durée alimente l'histogramme
+  ``rag_span_duration_seconds{span=...}``.
+
+Le span courant est porté par une ``ContextVar`` : les spans ouverts dans
+une étape sont rattachés à celle-ci. Les threads d'un pool n'héritent pas
+du contexte : le parent se passe alors explicitement (``parent=``).
+"""
+
+import bisect
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional, TypeVar, Union
+
+from rag_framework.exceptions import ConfigurationError
+
+LabelKey = tuple[tuple[str, str], ...]
+AttributeValue = Union[str, int, float, bool]
+
+# Buckets par défaut : durées (secondes) et tailles (éléments)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+@dataclass
+class TelemetrySettings:
+    """Paramètres de l'instrumentation.
+
+    Attributes:
+        enabled: Active la collecte (désactivée : coût quasi nul).
+        document_spans: Un span par document extrait (en plus des étapes).
+        max_spans: Spans terminés conservés en attente d'export.
+        service_name: Nom du service dans les exports OpenTelemetry.
+        prometheus: ``textfile`` (fichier pour le textfile collector de
+            node_exporter), ``http_host`` et ``http_port`` (endpoint
+            ``/metrics``).
+        otel_json: ``path`` du fichier JSON Lines (une ligne par export).
+    """
+
+    enabled: bool = True
+    document_spans: bool = True
+    max_spans: int = 10000
+    service_name: str = "rag_framework"
+    prometheus: dict[str, Any] = field(default_factory=dict)
+    otel_json: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "TelemetrySettings":
+        """Construit les paramètres depuis la section ``telemetry``.
+
+        Args:
+            config: Section ``telemetry`` de global.yaml.
+
+        Returns:
+            Paramètres (valeurs par défaut pour les clés absentes).
+        """
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in config.items() if k in known})
+
+
+class Counter:
+    """Compteur monotone, par jeu de labels."""
+
+    kind = "counter"
+
+    def __init__(self, telemetry: "Telemetry", name: str, help: str) -> None:
+        """Déclare le compteur (via :meth:`Telemetry.counter`)."""
+        self._telemetry = telemetry
+        self.name = name
+        self.help = help
+        self._values: dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, value: float = 1, **labels: Any) -> None:  # noqa: ANN401
+        """Incrémente le compteur.
+
+        Args:
+            value: Incrément (positif).
+            **labels: Labels de la série.
+        """
+        if not self._telemetry.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def samples(self) -> dict[LabelKey, float]:
+        """Valeurs courantes par jeu de labels."""
+        with self._lock:
+            return dict(self._values)
+
+    def value(self, **labels: Any) -> float:  # noqa: ANN401
+        """Valeur d'une série (0 si jamais incrémentée)."""
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+
+    def reset(self) -> None:
+        """Remet les séries à zéro."""
+        with self._lock:
+            self._values.clear()
+
+
+@dataclass
+class HistogramSample:
+    """Série d'un histogramme : effectifs par bucket, somme, nombre."""
+
+    bucket_counts: list[int]
+    sum: float = 0.0
+    count: int = 0
+
+
+class Histogram:
+    """Histogramme à buckets fixes, par jeu de labels."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        telemetry: "Telemetry",
+        name: str,
+        help: str,
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ) -> None:
+        """Déclare l'histogramme (via :meth:`Telemetry.histogram`)."""
+        self._telemetry = telemetry
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[LabelKey, HistogramSample] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:  # noqa: ANN401
+        """Enregistre une observation.
+
+        Args:
+            value: Valeur observée.
+            **labels: Labels de la série.
+        """
+        if not self._telemetry.enabled:
+            return
+        key = _label_key(labels)
+        # Dernier bucket = +Inf
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            sample = self._values.get(key)
+            if sample is None:
+                sample = HistogramSample([0] * (len(self.buckets) + 1))
+                self._values[key] = sample
+            sample.bucket_counts[index] += 1
+            sample.sum += value
+            sample.count += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:  # noqa: ANN401
+        """Observe la durée du bloc (secondes)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> dict[LabelKey, HistogramSample]:
+        """Copie des séries courantes."""
+        with self._lock:
+            return {
+                key: HistogramSample(list(s.bucket_counts), s.sum, s.count)
+                for key, s in self._values.items()
+            }
+
+    def reset(self) -> None:
+        """Remet les séries à zéro."""
+        with self._lock:
+            self._values.clear()
+
+
+Metric = Union[Counter, Histogram]
+MetricT = TypeVar("MetricT", Counter, Histogram)
+
+
+class Span:
+    """Intervalle de temps nommé, rattaché à une trace."""
+
+    __slots__ = (
+        "_telemetry",
+        "attributes",
+        "end_ns",
+        "error",
+        "name",
+        "parent_id",
+        "span_id",
+        "start_ns",
+        "trace_id",
+    )
+
+    def __init__(
+        self,
+        telemetry: "Telemetry",
+        name: str,
+        parent: Optional["Span"],
+        attributes: dict[str, AttributeValue],
+    ) -> None:
+        """Ouvre le span (via :meth:`Telemetry.start_span`)."""
+        self._telemetry = telemetry
+        self.name = name
+        self.trace_id: str = (
+            parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        )
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        """Durée du span (jusqu'à maintenant s'il est ouvert)."""
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Ajoute ou remplace un attribut."""
+        self.attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """Termine le span (sans effet s'il l'est déjà).
+
+        Args:
+            error: Exception ayant interrompu l'opération.
+        """
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self._telemetry._finish(self)
+
+
+class _NoopSpan:
+    """Span renvoyé lorsque la collecte est désactivée."""
+
+    name = ""
+    trace_id = span_id = ""
+    parent_id = error = None
+    duration_seconds = 0.0
+
+    def __bool__(self) -> bool:
+        # Jamais utilisé comme parent
+        return False
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        return
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        return
+
+
+NOOP_SPAN: Any = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("rag_current_span", default=None)
+
+
+class Telemetry:
+    """Registre des métriques et des spans d'un processus."""
+
+    def __init__(self, settings: Optional[TelemetrySettings] = None) -> None:
+        """Initialise un registre vide."""
+        self.settings = settings or TelemetrySettings()
+        self.enabled = self.settings.enabled
+        self._metrics: dict[str, Metric] = {}
+        self._metrics_lock = threading.Lock()
+        self._spans: deque[Span] = deque(maxlen=self.settings.max_spans)
+        self._dropped_spans = 0
+        self.span_duration = self.histogram(
+            "rag_span_duration_seconds", "Durée des spans (étapes, documents)"
+        )
+
+    def configure(self, settings: TelemetrySettings) -> None:
+        """Applique de nouveaux paramètres (les métriques sont conservées)."""
+        self.settings = settings
+        self.enabled = settings.enabled
+        if self._spans.maxlen != settings.max_spans:
+            self._spans = deque(self._spans, maxlen=settings.max_spans)
+
+    # ------------------------------------------------------------------
+    # Métriques
+    # ------------------------------------------------------------------
+
+    def _register(self, metric: MetricT) -> MetricT:
+        with self._metrics_lock:
+            existing = self._metrics.get(metric.name)
+            if isinstance(existing, type(metric)):
+                return existing
+            if existing is not None:
+                raise ConfigurationError(
+                    f"Métrique '{metric.name}' déjà déclarée comme {existing.kind}"
+                )
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str = "") -> Counter:
+        """Déclare (ou retrouve) un compteur.
+
+        Args:
+            name: Nom Prometheus (suffixe ``_total`` par convention).
+            help: Description.
+        """
+        return self._register(Counter(self, name, help))
+
+    def histogram(
+        self, name: str, help: str = "", buckets: Sequence[float] = DURATION_BUCKETS
+    ) -> Histogram:
+        """Déclare (ou retrouve) un histogramme.
+
+        Args:
+            name: Nom Prometheus (unité en suffixe, ex. ``_seconds``).
+            help: Description.
+            buckets: Bornes supérieures des buckets.
+        """
+        return self._register(Histogram(self, name, help, buckets))
+
+    def metrics(self) -> list[Metric]:
+        """Métriques déclarées, par nom."""
+        with self._metrics_lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    # ------------------------------------------------------------------
+    # Spans
+    # ------------------------------------------------------------------
+
+    def start_span(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        **attributes: AttributeValue,
+    ) -> Any:  # noqa: ANN401
+        """Ouvre un span, à terminer par :meth:`Span.end`.
+
+        Args:
+            name: Nom du span (ex. ``step.ChunkingStep``).
+            parent: Span parent (défaut: span courant du contexte).
+            **attributes: Attributs du span.
+
+        Returns:
+            Span ouvert (span inerte si la collecte est désactivée).
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+        if parent is None:
+            parent = _current_span.get()
+        return Span(self, name, parent, attributes)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        **attributes: AttributeValue,
+    ) -> Iterator[Any]:
+        """Span couvrant un bloc, courant pendant celui-ci.
+
+        Args:
+            name: Nom du span.
+            parent: Span parent (défaut: span courant du contexte).
+            **attributes: Attributs du span.
+        """
+        span = self.start_span(name, parent, **attributes)
+        if span is NOOP_SPAN:
+            yield span
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.end(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def current_span(self) -> Optional[Span]:
+        """Span courant du contexte."""
+        return _current_span.get()
+
+    def _finish(self, span: Span) -> None:
+        self.span_duration.observe(span.duration_seconds, span=span.name)
+        if len(self._spans) == self._spans.maxlen:
+            self._dropped_spans += 1
+        self._spans.append(span)
+
+    def drain_spans(self) -> list[Span]:
+        """Retire et retourne les spans terminés en attente d'export."""
+        spans = []
+        while True:
+            try:
+                spans.append(self._spans.popleft())
+            except IndexError:
+                return spans
+
+    @property
+    def dropped_spans(self) -> int:
+        """Spans écartés faute de place dans le tampon."""
+        return self._dropped_spans
+
+    def reset(self) -> None:
+        """Remet métriques et spans à zéro (tests, benchmarks)."""
+        for metric in self.metrics():
+            metric.reset()
+        self._spans.clear()
+        self._dropped_spans = 0
+
+
+_TELEMETRY = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    """Registre du processus."""
+    return _TELEMETRY
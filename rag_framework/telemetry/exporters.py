@@ -0,0 +1,386 @@
+"""Export des métriques et des spans.
+
+- Prometheus, format texte d'exposition 0.0.4 : fichier pour le
+  *textfile collector* de node_exporter (réécrit atomiquement à chaque
+  export) et/ou endpoint HTTP ``/metrics`` ;
+- OpenTelemetry, encodage JSON d'OTLP : une ligne JSON par export, avec
+  les spans terminés depuis l'export précédent (``resourceSpans``) et
+  l'état cumulé des métriques (``resourceMetrics``), lisible par le
+  receiver ``otlpjsonfile`` de l'OpenTelemetry Collector.
+
+:func:`configure_telemetry` applique la section ``telemetry`` de
+global.yaml ; :func:`export_telemetry` est appelée à la fin de chaque
+exécution du pipeline.
+"""
+
+import json
+import math
+import os
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from rag_framework.telemetry.core import (
+    AttributeValue,
+    Counter,
+    LabelKey,
+    Span,
+    Telemetry,
+    TelemetrySettings,
+    get_telemetry,
+)
+from rag_framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Début de la période de cumul des métriques (exports OpenTelemetry)
+_PROCESS_START_NS = time.time_ns()
+
+_http_server: Optional["MetricsHTTPServer"] = None
+_http_lock = threading.Lock()
+
+
+# ----------------------------------------------------------------------
+# Prometheus
+# ----------------------------------------------------------------------
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(key: LabelKey, extra: Optional[tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus(telemetry: Optional[Telemetry] = None) -> str:
+    """Métriques au format texte d'exposition Prometheus.
+
+    Args:
+        telemetry: Registre (défaut: registre du processus).
+
+    Returns:
+        Texte d'exposition (séries sans observation omises).
+    """
+    telemetry = telemetry or get_telemetry()
+    lines: list[str] = []
+    for metric in telemetry.metrics():
+        header = [
+            f"# HELP {metric.name} {metric.help}",
+            f"# TYPE {metric.name} {metric.kind}",
+        ]
+        if isinstance(metric, Counter):
+            values = metric.samples()
+            if values:
+                lines.extend(header)
+            for key, value in sorted(values.items()):
+                lines.append(f"{metric.name}{_labels(key)} {_number(value)}")
+            continue
+        samples = metric.samples()
+        if samples:
+            lines.extend(header)
+        for key, sample in sorted(samples.items()):
+            cumulative = 0
+            bounds = [*metric.buckets, math.inf]
+            for bound, count in zip(bounds, sample.bucket_counts):
+                cumulative += count
+                le = ("le", _number(bound))
+                lines.append(f"{metric.name}_bucket{_labels(key, le)} {cumulative}")
+            lines.append(f"{metric.name}_sum{_labels(key)} {_number(sample.sum)}")
+            lines.append(f"{metric.name}_count{_labels(key)} {sample.count}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(
+    path: Union[str, Path], telemetry: Optional[Telemetry] = None
+) -> Path:
+    """Écrit les métriques pour le textfile collector de node_exporter.
+
+    Le fichier est remplacé atomiquement (node_exporter ne lit jamais un
+    fichier partiel).
+
+    Args:
+        path: Fichier ``.prom`` de destination.
+        telemetry: Registre (défaut: registre du processus).
+
+    Returns:
+        Chemin écrit.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+    tmp_path.write_text(render_prometheus(telemetry), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+class MetricsHTTPServer:
+    """Endpoint HTTP ``/metrics`` exécuté dans un thread.
+
+    Args:
+        telemetry: Registre exposé.
+        host: Adresse d'écoute.
+        port: Port d'écoute (0 = port libre choisi par l'OS).
+    """
+
+    def __init__(
+        self, telemetry: Telemetry, host: str = "127.0.0.1", port: int = 9464
+    ) -> None:
+        """Ouvre le port (le service démarre avec :meth:`start`)."""
+        self.telemetry = telemetry
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL de base de l'endpoint."""
+        host, port = self.httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MetricsHTTPServer":
+        """Démarre le serveur dans un thread daemon."""
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="rag-metrics-http", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Arrête le serveur."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+                return
+
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                payload = render_prometheus(server.telemetry).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+# ----------------------------------------------------------------------
+# OpenTelemetry (OTLP/JSON)
+# ----------------------------------------------------------------------
+
+
+def _otel_value(value: AttributeValue) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otel_attributes(items: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+    return [{"key": k, "value": _otel_value(v)} for k, v in items]
+
+
+def _resource(settings: TelemetrySettings) -> dict[str, Any]:
+    return {
+        "attributes": _otel_attributes(
+            [
+                ("service.name", settings.service_name),
+                ("host.name", socket.gethostname()),
+                ("process.pid", os.getpid()),
+            ]
+        )
+    }
+
+
+def _otel_span(span: Span) -> dict[str, Any]:
+    data: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _otel_attributes(span.attributes.items()),
+        # STATUS_CODE_OK = 1, STATUS_CODE_ERROR = 2
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_id:
+        data["parentSpanId"] = span.parent_id
+    return data
+
+
+def to_otel_json(
+    spans: list[Span],
+    telemetry: Optional[Telemetry] = None,
+    start_ns: Optional[int] = None,
+) -> dict[str, Any]:
+    """Spans et métriques encodés comme une requête OTLP/JSON.
+
+    Args:
+        spans: Spans terminés à exporter.
+        telemetry: Registre (défaut: registre du processus).
+        start_ns: Début de la période de cumul des métriques.
+
+    Returns:
+        Objet avec ``resourceSpans`` et ``resourceMetrics``.
+    """
+    telemetry = telemetry or get_telemetry()
+    now = str(time.time_ns())
+    start = str(start_ns or _PROCESS_START_NS)
+    scope = {"name": "rag_framework"}
+    metrics: list[dict[str, Any]] = []
+    for metric in telemetry.metrics():
+        points: list[dict[str, Any]]
+        if isinstance(metric, Counter):
+            values = metric.samples()
+            if not values:
+                continue
+            points = [
+                {
+                    "attributes": _otel_attributes(key),
+                    "startTimeUnixNano": start,
+                    "timeUnixNano": now,
+                    "asDouble": float(value),
+                }
+                for key, value in sorted(values.items())
+            ]
+            body: dict[str, Any] = {
+                "sum": {
+                    "dataPoints": points,
+                    "aggregationTemporality": 2,  # CUMULATIVE
+                    "isMonotonic": True,
+                }
+            }
+        else:
+            samples = metric.samples()
+            if not samples:
+                continue
+            points = [
+                {
+                    "attributes": _otel_attributes(key),
+                    "startTimeUnixNano": start,
+                    "timeUnixNano": now,
+                    "count": str(sample.count),
+                    "sum": sample.sum,
+                    "bucketCounts": [str(c) for c in sample.bucket_counts],
+                    "explicitBounds": list(metric.buckets),
+                }
+                for key, sample in sorted(samples.items())
+            ]
+            body = {"histogram": {"dataPoints": points, "aggregationTemporality": 2}}
+        metrics.append({"name": metric.name, "description": metric.help, **body})
+
+    resource = _resource(telemetry.settings)
+    return {
+        "resourceSpans": [
+            {
+                "resource": resource,
+                "scopeSpans": [
+                    {"scope": scope, "spans": [_otel_span(s) for s in spans]}
+                ],
+            }
+        ],
+        "resourceMetrics": [
+            {
+                "resource": resource,
+                "scopeMetrics": [{"scope": scope, "metrics": metrics}],
+            }
+        ],
+    }
+
+
+# ----------------------------------------------------------------------
+# Configuration et export
+# ----------------------------------------------------------------------
+
+
+def configure_telemetry(config: dict[str, Any]) -> Telemetry:
+    """Applique la section ``telemetry`` de global.yaml.
+
+    L'endpoint HTTP n'est démarré qu'une fois par processus.
+
+    Args:
+        config: Section ``telemetry``.
+
+    Returns:
+        Registre du processus.
+    """
+    global _http_server
+    telemetry = get_telemetry()
+    settings = TelemetrySettings.from_config(config)
+    telemetry.configure(settings)
+
+    port = settings.prometheus.get("http_port")
+    if settings.enabled and port:
+        with _http_lock:
+            if _http_server is None:
+                host = settings.prometheus.get("http_host", "127.0.0.1")
+                try:
+                    _http_server = MetricsHTTPServer(telemetry, host, int(port)).start()
+                    logger.info(
+                        f"Métriques Prometheus: {_http_server.base_url}/metrics"
+                    )
+                except OSError as e:
+                    logger.warning(
+                        f"Endpoint /metrics indisponible ({host}:{port}): {e}"
+                    )
+    return telemetry
+
+
+def export_telemetry(telemetry: Optional[Telemetry] = None) -> None:
+    """Exporte métriques et spans vers les destinations configurées.
+
+    Les spans terminés sont retirés du tampon, qu'une destination
+    OpenTelemetry soit configurée ou non.
+
+    Args:
+        telemetry: Registre (défaut: registre du processus).
+    """
+    telemetry = telemetry or get_telemetry()
+    if not telemetry.enabled:
+        return
+    settings = telemetry.settings
+    spans = telemetry.drain_spans()
+    try:
+        textfile = settings.prometheus.get("textfile")
+        if textfile:
+            write_prometheus_textfile(textfile, telemetry)
+        otel_path = settings.otel_json.get("path")
+        if otel_path:
+            path = Path(otel_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            line = json.dumps(to_otel_json(spans, telemetry), ensure_ascii=False)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except OSError as e:
+        # L'instrumentation ne doit jamais faire échouer une exécution
+        logger.warning(f"Export de la télémétrie impossible: {e}")
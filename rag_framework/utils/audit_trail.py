@@ -0,0 +1,614 @@
+"""Journal d'audit segmenté, compressé et indexé.
+
+Les enregistrements d'audit sont ajoutés à un segment actif (JSONL). Au-delà
+d'une taille ou d'une ancienneté maximale, le segment est scellé : compressé
+par blocs et accompagné d'un index compact. Les requêtes par période ou par
+fichier ne lisent que les index et les blocs concernés.
+
+    <root>/
+        segments/000042.jsonl       segment actif (texte, ajout en fin)
+        segments/000041.jsonl.gz    segment scellé (un membre gzip par bloc)
+        segments/000041.idx         index du segment scellé
+        blobs/<sha[:16]>.json       blobs dédupliqués (configurations)
+
+Un segment scellé est un fichier gzip multi-membres valide (``zcat``
+fonctionne) : chaque bloc de ``block_records`` enregistrements est un membre
+indépendant, décompressable seul à partir de sa position.
+
+L'index commence par une ligne d'en-tête JSON (période couverte, volumes,
+blobs référencés) suivie d'une ligne par enregistrement::
+
+    horodatage<TAB>position du bloc<TAB>taille du bloc<TAB>rang<TAB>empreintes
+
+où les empreintes sont celles des chemins de ``metadata.files_processed``.
+
+Les champs volumineux et répétés d'un enregistrement à l'autre (ex.
+``metadata.monitoring_config``) sont stockés une fois dans ``blobs/`` et
+remplacés par ``{"$blob": empreinte}`` ; ils sont restitués à la lecture.
+
+Plusieurs processus peuvent partager un journal (``--serve``, ``--watch``,
+``--worker``) : ajouts, rotations, purges et requêtes sont sérialisés par un
+verrou exclusif sur ``<root>/audit.lock`` (``flock`` ; sous Windows, seuls
+les threads d'un même processus sont sérialisés). Sous ce verrou, l'état en
+mémoire est d'abord resynchronisé avec le disque (enregistrements ajoutés,
+segments scellés ou purgés par les autres processus).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, NamedTuple, Optional, Union
+
+from rag_framework.utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows : verrou limité aux threads du processus
+    fcntl = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+BLOB_KEY = "$blob"
+
+
+class IndexEntry(NamedTuple):
+    """Position d'un enregistrement dans un segment.
+
+    Attributes:
+        timestamp: Horodatage (epoch, secondes).
+        offset: Position du bloc (segment scellé) ou de la ligne (actif).
+        length: Taille du bloc compressé ou de la ligne.
+        slot: Rang de l'enregistrement dans le bloc (0 pour l'actif).
+        file_hashes: Empreintes des fichiers traités.
+    """
+
+    timestamp: float
+    offset: int
+    length: int
+    slot: int
+    file_hashes: tuple[str, ...]
+
+
+def path_hash(file_path: Union[str, Path]) -> str:
+    """Empreinte courte (64 bits) d'un chemin de fichier."""
+    return hashlib.blake2b(str(file_path).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def parse_timestamp(value: Union[str, datetime, None]) -> float:
+    """Horodatage ISO 8601 (ou datetime) en epoch ; UTC si sans fuseau."""
+    if value is None:
+        return time.time()
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def record_files(record: dict[str, Any]) -> list[str]:
+    """Chemins des fichiers traités mentionnés par un enregistrement."""
+    files = record.get("metadata", {}).get("files_processed") or []
+    return [str(f) for f in files]
+
+
+class AuditTrail:
+    """Journal d'audit à rotation, compression par blocs et index."""
+
+    def __init__(
+        self,
+        root: Path,
+        max_segment_mb: float = 16.0,
+        max_segment_age_hours: float = 24.0,
+        block_records: int = 256,
+        compression_level: int = 6,
+        blob_fields: Sequence[str] = ("metadata.monitoring_config",),
+    ) -> None:
+        """Ouvre (ou crée) le journal.
+
+        Args:
+            root: Répertoire du journal.
+            max_segment_mb: Taille du segment actif déclenchant la rotation.
+            max_segment_age_hours: Écart maximal entre le premier et le
+                dernier enregistrement d'un segment.
+            block_records: Enregistrements par bloc compressé.
+            compression_level: Niveau de compression gzip (1-9).
+            blob_fields: Champs (chemins pointés) stockés comme blobs
+                dédupliqués.
+        """
+        self.root = Path(root)
+        self.max_segment_bytes = int(max_segment_mb * 1024 * 1024)
+        self.max_segment_age = max_segment_age_hours * 3600
+        self.block_records = max(1, block_records)
+        self.compression_level = compression_level
+        self.blob_fields = [tuple(field.split(".")) for field in blob_fields]
+        self.segments_dir = self.root / "segments"
+        self.blobs_dir = self.root / "blobs"
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.lock_path = self.root / "audit.lock"
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file: Optional[IO[bytes]] = None
+        self._blob_cache: dict[str, Any] = {}
+
+        # En-têtes des segments scellés, par numéro de segment
+        self._segments: dict[int, dict[str, Any]] = {}
+        # Segment actif : numéro, index en mémoire, taille, blobs référencés
+        self._active_seq = 0
+        self._active_entries: list[IndexEntry] = []
+        self._active_size = 0
+        self._active_blobs: set[str] = set()
+        with self._locked():
+            pass  # état initial chargé par _sync
+
+    @classmethod
+    def from_config(cls, audit_config: dict[str, Any]) -> Optional["AuditTrail"]:
+        """Crée le journal depuis la section ``audit_logging`` de l'étape 5.
+
+        Args:
+            audit_config: Section ``audit_logging`` (sous-section ``rotation``).
+
+        Returns:
+            Journal configuré, ou None si la rotation est désactivée (fichier
+            JSONL unique).
+        """
+        rotation = audit_config.get("rotation", {})
+        if not rotation.get("enabled", False):
+            return None
+        log_file = Path(audit_config.get("log_file", "logs/audit_trail.jsonl"))
+        return cls(
+            root=Path(rotation.get("dir") or log_file.with_suffix("")),
+            max_segment_mb=rotation.get("max_segment_mb", 16.0),
+            max_segment_age_hours=rotation.get("max_segment_age_hours", 24.0),
+            block_records=rotation.get("block_records", 256),
+            compression_level=rotation.get("compression_level", 6),
+            blob_fields=rotation.get("blob_fields", ["metadata.monitoring_config"]),
+        )
+
+    # ------------------------------------------------------------------
+    # Ouverture et chemins
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, seq: int, suffix: str) -> Path:
+        return self.segments_dir / f"{seq:06d}{suffix}"
+
+    @property
+    def active_path(self) -> Path:
+        """Chemin du segment actif."""
+        return self._segment_path(self._active_seq, ".jsonl")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Verrou exclusif du journal (threads et processus), état resynchronisé.
+
+        Réentrant : seul l'appel le plus externe prend le verrou de fichier.
+        """
+        with self._lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                self._lock_file = open(self.lock_path, "a+b")
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                if self._lock_depth == 1:
+                    self._sync()
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and self._lock_file is not None:
+                    # Fermeture du descripteur : libère le verrou
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def _sync(self) -> None:
+        """Met l'état en mémoire à jour depuis le disque (sous verrou).
+
+        Charge les en-têtes des segments scellés, oublie les segments
+        purgés et indexe les ajouts au segment actif, y compris ceux des
+        autres processus.
+        """
+        sealed = {int(p.stem) for p in self.segments_dir.glob("*.idx")}
+        for seq in set(self._segments) - sealed:
+            del self._segments[seq]
+        for seq in sorted(sealed - set(self._segments)):
+            with open(self._segment_path(seq, ".idx"), encoding="utf-8") as f:
+                self._segments[seq] = json.loads(f.readline())
+
+        pending = sorted(int(p.stem) for p in self.segments_dir.glob("*.jsonl"))
+        active = False
+        for seq in pending:
+            if seq in self._segments:
+                # Interruption entre le scellement et la suppression du
+                # segment actif : son contenu est déjà dans le segment scellé
+                self._segment_path(seq, ".jsonl").unlink()
+                continue
+            if seq == self._active_seq and self._active_entries:
+                # Ajouts éventuels d'un autre processus
+                self._index_active(self._active_size)
+            else:
+                self._active_seq = seq
+                self._index_active()
+            active = True
+            if seq != pending[-1]:
+                self.rotate()
+                active = False
+
+        if not active or not self._active_entries:
+            self._active_entries = []
+            self._active_size = 0
+            self._active_blobs = set()
+            self._active_seq = max([*self._segments, self._active_seq - 1]) + 1
+
+    def _index_active(self, start: int = 0) -> None:
+        """Indexe le segment actif à partir de la position ``start``.
+
+        Args:
+            start: Position de la première ligne non indexée (0 : index
+                reconstruit entièrement).
+        """
+        if start == 0 or start > self.active_path.stat().st_size:
+            start = 0
+            self._active_entries = []
+            self._active_blobs = set()
+        offset = start
+        with open(self.active_path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Ligne tronquée (arrêt pendant une écriture) : ignorée
+                    # et écrasée par le prochain ajout
+                    break
+                record = json.loads(line)
+                self._active_entries.append(self._entry(record, offset, len(line), 0))
+                self._active_blobs.update(self._blob_refs(record))
+                offset += len(line)
+        self._active_size = offset
+        if offset != self.active_path.stat().st_size:
+            os.truncate(self.active_path, offset)
+
+    @staticmethod
+    def _entry(
+        record: dict[str, Any], offset: int, length: int, slot: int
+    ) -> IndexEntry:
+        return IndexEntry(
+            parse_timestamp(record.get("timestamp")),
+            offset,
+            length,
+            slot,
+            tuple(path_hash(f) for f in record_files(record)),
+        )
+
+    # ------------------------------------------------------------------
+    # Blobs dédupliqués
+    # ------------------------------------------------------------------
+
+    def _blob_refs(self, record: dict[str, Any]) -> Iterator[str]:
+        for field in self.blob_fields:
+            value: Any = record
+            for key in field:
+                value = value.get(key) if isinstance(value, dict) else None
+            if isinstance(value, dict) and BLOB_KEY in value:
+                yield value[BLOB_KEY]
+
+    def _store_blob(self, value: Any) -> str:  # noqa: ANN401
+        payload = json.dumps(value, ensure_ascii=False, sort_keys=True).encode()
+        digest = hashlib.sha256(payload).hexdigest()[:16]
+        path = self.blobs_dir / f"{digest}.json"
+        if not path.exists():
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        return digest
+
+    def _load_blob(self, digest: str) -> Any:  # noqa: ANN401
+        if digest not in self._blob_cache:
+            path = self.blobs_dir / f"{digest}.json"
+            self._blob_cache[digest] = json.loads(path.read_bytes())
+        return self._blob_cache[digest]
+
+    def _replace_fields(
+        self,
+        record: dict[str, Any],
+        transform: Any,  # noqa: ANN401
+    ) -> dict[str, Any]:
+        """Copie de l'enregistrement où chaque champ blob passe par ``transform``.
+
+        Seuls les dictionnaires sur le chemin d'un champ sont copiés.
+        """
+        result = dict(record)
+        for field in self.blob_fields:
+            parent = result
+            for key in field[:-1]:
+                child = parent.get(key)
+                if not isinstance(child, dict):
+                    break
+                parent[key] = parent = dict(child)
+            else:
+                if parent.get(field[-1]) is not None:
+                    parent[field[-1]] = transform(parent[field[-1]])
+        return result
+
+    def _deduplicate(self, record: dict[str, Any]) -> dict[str, Any]:
+        return self._replace_fields(
+            record, lambda value: {BLOB_KEY: self._store_blob(value)}
+        )
+
+    def _inflate(self, record: dict[str, Any]) -> dict[str, Any]:
+        def load(value: Any) -> Any:  # noqa: ANN401
+            if isinstance(value, dict) and BLOB_KEY in value:
+                return self._load_blob(value[BLOB_KEY])
+            return value
+
+        return self._replace_fields(record, load)
+
+    # ------------------------------------------------------------------
+    # Écriture et rotation
+    # ------------------------------------------------------------------
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Ajoute un enregistrement, après rotation du segment actif si due.
+
+        Args:
+            record: Enregistrement d'audit (champ ``timestamp`` ISO 8601).
+        """
+        stored = self._deduplicate(record)
+        line = (json.dumps(stored, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._locked():
+            entry = self._entry(stored, self._active_size, len(line), 0)
+            if self._active_entries and (
+                self._active_size + len(line) > self.max_segment_bytes
+                or entry.timestamp - self._active_entries[0].timestamp
+                >= self.max_segment_age
+            ):
+                self.rotate()
+                entry = entry._replace(offset=0)
+            with open(self.active_path, "ab") as f:
+                f.write(line)
+            self._active_entries.append(entry)
+            self._active_blobs.update(self._blob_refs(stored))
+            self._active_size += len(line)
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> int:
+        """Ajoute plusieurs enregistrements (ex. import d'un ancien journal).
+
+        Returns:
+            Nombre d'enregistrements ajoutés.
+        """
+        count = 0
+        for record in records:
+            self.append(record)
+            count += 1
+        return count
+
+    def rotate(self) -> Optional[Path]:
+        """Scelle le segment actif : compression par blocs et index.
+
+        Returns:
+            Chemin du segment scellé, ou None si le segment actif est vide.
+        """
+        with self._locked():
+            if not self._active_entries:
+                return None
+            seq = self._active_seq
+            data = self.active_path.read_bytes()
+            gz_path = self._segment_path(seq, ".jsonl.gz")
+            idx_path = self._segment_path(seq, ".idx")
+
+            rows: list[str] = []
+            compressed = 0
+            tmp_gz = gz_path.with_name(f"{gz_path.name}.{os.getpid()}.tmp")
+            with open(tmp_gz, "wb") as out:
+                entries = self._active_entries
+                for first in range(0, len(entries), self.block_records):
+                    block = entries[first : first + self.block_records]
+                    raw = data[block[0].offset : block[-1].offset + block[-1].length]
+                    member = gzip.compress(
+                        raw, compresslevel=self.compression_level, mtime=0
+                    )
+                    out.write(member)
+                    for slot, entry in enumerate(block):
+                        rows.append(
+                            f"{entry.timestamp:.6f}\t{compressed}\t{len(member)}"
+                            f"\t{slot}\t{','.join(entry.file_hashes)}\n"
+                        )
+                    compressed += len(member)
+
+            header = {
+                "records": len(entries),
+                "min_ts": min(e.timestamp for e in entries),
+                "max_ts": max(e.timestamp for e in entries),
+                "raw_bytes": len(data),
+                "compressed_bytes": compressed,
+                "blobs": sorted(self._active_blobs),
+            }
+            tmp_idx = idx_path.with_name(f"{idx_path.name}.{os.getpid()}.tmp")
+            with open(tmp_idx, "w", encoding="utf-8") as f:
+                f.write(json.dumps(header) + "\n")
+                f.writelines(rows)
+            # L'index est écrit en dernier : un segment est scellé dès que
+            # son index existe
+            os.replace(tmp_gz, gz_path)
+            os.replace(tmp_idx, idx_path)
+            self.active_path.unlink()
+
+            self._segments[seq] = header
+            self._active_seq = seq + 1
+            self._active_entries = []
+            self._active_size = 0
+            self._active_blobs = set()
+            logger.info(
+                f"Journal d'audit: segment {gz_path.name} scellé "
+                f"({header['records']} enregistrements, "
+                f"{len(data) / 1024:.0f} → {compressed / 1024:.0f} Ko)"
+            )
+            return gz_path
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        since: Union[str, datetime, None] = None,
+        until: Union[str, datetime, None] = None,
+        file_path: Union[str, Path, None] = None,
+        limit: Optional[int] = None,
+        resolve_blobs: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Enregistrements d'une période et/ou mentionnant un fichier.
+
+        Seuls les segments chevauchant la période sont consultés, et seuls
+        les blocs contenant un enregistrement retenu sont décompressés.
+
+        Args:
+            since: Début de période (inclus).
+            until: Fin de période (incluse).
+            file_path: Chemin tel qu'enregistré dans ``files_processed``.
+            limit: Nombre maximal d'enregistrements (les plus anciens).
+            resolve_blobs: Restituer les champs dédupliqués.
+
+        Returns:
+            Enregistrements par ordre chronologique.
+        """
+        start = parse_timestamp(since) if since is not None else float("-inf")
+        end = parse_timestamp(until) if until is not None else float("inf")
+        wanted = path_hash(file_path) if file_path is not None else None
+
+        def selected(entry: IndexEntry) -> bool:
+            return start <= entry.timestamp <= end and (
+                wanted is None or wanted in entry.file_hashes
+            )
+
+        found: list[tuple[float, dict[str, Any]]] = []
+        with self._locked():
+            for seq in sorted(self._segments):
+                header = self._segments[seq]
+                if header["max_ts"] < start or header["min_ts"] > end:
+                    continue
+                entries = [e for e in self._read_index(seq) if selected(e)]
+                found.extend(self._read_sealed(seq, entries))
+
+            entries = [e for e in self._active_entries if selected(e)]
+            if entries:
+                with open(self.active_path, "rb") as f:
+                    for entry in entries:
+                        f.seek(entry.offset)
+                        record = json.loads(f.read(entry.length))
+                        found.append((entry.timestamp, record))
+
+        if file_path is not None:
+            # Collisions d'empreintes : vérification sur le chemin complet
+            found = [(t, r) for t, r in found if str(file_path) in record_files(r)]
+        found.sort(key=lambda item: item[0])
+        records = [record for _, record in found[:limit]]
+        if resolve_blobs:
+            records = [self._inflate(record) for record in records]
+        return records
+
+    def _read_index(self, seq: int) -> Iterator[IndexEntry]:
+        with open(self._segment_path(seq, ".idx"), encoding="utf-8") as f:
+            f.readline()  # en-tête
+            for line in f:
+                ts, offset, length, slot, hashes = line.rstrip("\n").split("\t")
+                yield IndexEntry(
+                    float(ts),
+                    int(offset),
+                    int(length),
+                    int(slot),
+                    tuple(hashes.split(",")) if hashes else (),
+                )
+
+    def _read_sealed(
+        self, seq: int, entries: list[IndexEntry]
+    ) -> list[tuple[float, dict[str, Any]]]:
+        """Lit les enregistrements indexés d'un segment scellé, bloc par bloc."""
+        records: list[tuple[float, dict[str, Any]]] = []
+        if not entries:
+            return records
+        blocks: dict[tuple[int, int], list[IndexEntry]] = {}
+        for entry in entries:
+            blocks.setdefault((entry.offset, entry.length), []).append(entry)
+        with open(self._segment_path(seq, ".jsonl.gz"), "rb") as f:
+            for (offset, length), block_entries in blocks.items():
+                f.seek(offset)
+                lines = gzip.decompress(f.read(length)).splitlines()
+                for entry in block_entries:
+                    records.append((entry.timestamp, json.loads(lines[entry.slot])))
+        return records
+
+    # ------------------------------------------------------------------
+    # Rétention et statistiques
+    # ------------------------------------------------------------------
+
+    def purge(self, older_than: Union[str, datetime]) -> list[dict[str, Any]]:
+        """Supprime les segments scellés antérieurs à une date.
+
+        Les blobs qui ne sont plus référencés sont supprimés également.
+
+        Args:
+            older_than: Un segment est supprimé si son dernier enregistrement
+                est antérieur à cette date.
+
+        Returns:
+            Description des segments supprimés.
+        """
+        cutoff = parse_timestamp(older_than)
+        deleted: list[dict[str, Any]] = []
+        with self._locked():
+            for seq in sorted(self._segments):
+                header = self._segments[seq]
+                if header["max_ts"] >= cutoff:
+                    continue
+                gz_path = self._segment_path(seq, ".jsonl.gz")
+                # Index supprimé en premier : le segment cesse d'exister
+                self._segment_path(seq, ".idx").unlink()
+                gz_path.unlink(missing_ok=True)
+                del self._segments[seq]
+                deleted.append(
+                    {
+                        "file": gz_path.name,
+                        "records": header["records"],
+                        "size": header["compressed_bytes"],
+                    }
+                )
+
+            if deleted:
+                referenced = set(self._active_blobs)
+                for header in self._segments.values():
+                    referenced.update(header.get("blobs", []))
+                for blob_path in self.blobs_dir.glob("*.json"):
+                    if blob_path.stem not in referenced:
+                        blob_path.unlink()
+                        self._blob_cache.pop(blob_path.stem, None)
+        return deleted
+
+    def get_stats(self) -> dict[str, Any]:
+        """Volumes du journal (segments scellés, segment actif, blobs)."""
+        with self._locked():
+            headers = list(self._segments.values())
+            raw = sum(h["raw_bytes"] for h in headers)
+            compressed = sum(h["compressed_bytes"] for h in headers)
+            return {
+                "segments": len(headers),
+                "sealed_records": sum(h["records"] for h in headers),
+                "raw_mb": round(raw / 1024 / 1024, 3),
+                "compressed_mb": round(compressed / 1024 / 1024, 3),
+                "compression_ratio": round(raw / compressed, 2) if compressed else 0.0,
+                "active_segment": self.active_path.name,
+                "active_records": len(self._active_entries),
+                "active_mb": round(self._active_size / 1024 / 1024, 3),
+                "blobs": sum(1 for _ in self.blobs_dir.glob("*.json")),
+                "oldest": (
+                    datetime.fromtimestamp(
+                        min(h["min_ts"] for h in headers), tz=timezone.utc
+                    ).isoformat()
+                    if headers
+                    else None
+                ),
+            }
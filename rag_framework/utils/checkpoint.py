@@ -0,0 +1,466 @@
+"""Checkpoints durables des exécutions du pipeline.
+
+Chaque exécution reçoit un identifiant (``run_id``) et un manifeste JSON
+décrivant les étapes terminées et, pour les étapes découpées en
+sous-batches, les sous-batches déjà traités. Les données intermédiaires
+(documents extraits, chunks, chunks enrichis, vectorisés...) sont stockées
+comme objets adressés par leur contenu :
+
+    <checkpoint_dir>/
+        runs/<run_id>.json              manifeste de l'exécution
+        objects/<sha[:2]>/<sha>.pkl.gz  valeur d'une clé de données
+
+Une valeur inchangée d'une étape à l'autre (ex. ``extracted_documents``)
+n'est donc écrite qu'une fois. Les objets sont sérialisés avec pickle pour
+restituer fidèlement les métadonnées des extracteurs (dates, etc.) ; le
+répertoire de checkpoints est local et ne doit contenir que des données
+produites par le pipeline.
+
+À la fin d'une exécution réussie, son manifeste et ses objets sont
+supprimés ; :meth:`CheckpointStore.collect_garbage`, appelée au démarrage
+du pipeline et après chaque exécution, purge en plus les exécutions trop
+anciennes et les objets orphelins.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from rag_framework.exceptions import RAGFrameworkError
+from rag_framework.types import StepData
+from rag_framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Statuts possibles d'une exécution
+RUN_RUNNING = "running"
+RUN_FAILED = "failed"
+RUN_COMPLETED = "completed"
+
+
+class _SharedState:
+    """Verrou et objets en cours d'écriture, communs à un répertoire."""
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        # Objets écrits dont le manifeste n'est pas encore enregistré
+        self.pinned: Counter[str] = Counter()
+
+
+# Plusieurs pipelines d'un même processus (--serve, --watch) peuvent
+# partager un répertoire de checkpoints : un état par répertoire
+_SHARED_STATES: dict[Path, _SharedState] = {}
+_SHARED_STATES_LOCK = threading.Lock()
+
+
+def _shared_state(root: Path) -> _SharedState:
+    with _SHARED_STATES_LOCK:
+        return _SHARED_STATES.setdefault(root.resolve(), _SharedState())
+
+
+class CheckpointStore:
+    """Stockage des checkpoints d'exécution du pipeline."""
+
+    def __init__(
+        self,
+        root: Path,
+        keep_completed: bool = False,
+        max_age_days: float = 7.0,
+        orphan_grace_seconds: float = 3600.0,
+    ) -> None:
+        """Initialise le stockage.
+
+        Args:
+            root: Répertoire racine des checkpoints.
+            keep_completed: Conserve les exécutions terminées (débogage).
+            max_age_days: Âge au-delà duquel une exécution est purgée.
+            orphan_grace_seconds: Âge minimal d'un objet non référencé avant
+                suppression (protège les exécutions concurrentes en cours
+                d'écriture).
+        """
+        self.root = Path(root)
+        self.keep_completed = keep_completed
+        self.max_age_days = max_age_days
+        self.orphan_grace_seconds = orphan_grace_seconds
+        self.runs_dir = self.root / "runs"
+        self.objects_dir = self.root / "objects"
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        # Les étapes indépendantes (et les autres pipelines du processus)
+        # s'exécutent en parallèle : les lectures-modifications des
+        # manifestes et les suppressions d'objets sont sérialisées
+        self._shared = _shared_state(self.root)
+        self._lock = self._shared.lock
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> Optional["CheckpointStore"]:
+        """Crée le stockage depuis la section ``checkpointing`` de global.yaml.
+
+        Args:
+            config: Section ``checkpointing``.
+
+        Returns:
+            Stockage configuré, ou None si les checkpoints sont désactivés.
+        """
+        if not config.get("enabled", False):
+            return None
+        return cls(
+            root=Path(config.get("dir", ".cache/checkpoints")),
+            keep_completed=config.get("keep_completed", False),
+            max_age_days=config.get("max_age_days", 7.0),
+        )
+
+    # ------------------------------------------------------------------
+    # Objets adressés par contenu
+    # ------------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.pkl.gz"
+
+    @staticmethod
+    def _serialize(value: Any) -> bytes:  # noqa: ANN401
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def digest(value: Any) -> str:  # noqa: ANN401
+        """Empreinte SHA256 du contenu sérialisé d'une valeur."""
+        return hashlib.sha256(CheckpointStore._serialize(value)).hexdigest()
+
+    def put_object(self, value: Any, pin: bool = False) -> str:  # noqa: ANN401
+        """Stocke une valeur et retourne son empreinte.
+
+        L'écriture est atomique et ignorée si l'objet existe déjà.
+
+        Args:
+            value: Valeur sérialisable par pickle.
+            pin: Protège l'objet des suppressions jusqu'à :meth:`_unpin`
+                (objet pas encore référencé par un manifeste).
+
+        Returns:
+            Empreinte SHA256 du contenu.
+        """
+        raw = self._serialize(value)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._object_path(digest)
+        with self._lock:
+            if pin:
+                self._shared.pinned[digest] += 1
+            if path.exists():
+                # Rafraîchit la date pour le délai de grâce du ramasse-miettes
+                path.touch()
+                return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with gzip.open(tmp_path, "wb", compresslevel=1) as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+        return digest
+
+    def _unpin(self, digests: list[str]) -> None:
+        """Libère les objets protégés par ``put_object(pin=True)``."""
+        with self._lock:
+            self._shared.pinned.subtract(digests)
+            for digest in digests:
+                if self._shared.pinned[digest] <= 0:
+                    del self._shared.pinned[digest]
+
+    def get_object(self, digest: str) -> Any:  # noqa: ANN401
+        """Charge une valeur depuis son empreinte.
+
+        Raises:
+            RAGFrameworkError: Si l'objet est absent ou corrompu.
+        """
+        path = self._object_path(digest)
+        try:
+            with gzip.open(path, "rb") as f:
+                return pickle.loads(f.read())
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            raise RAGFrameworkError(
+                f"Checkpoint illisible: {digest}",
+                details={"object": str(path), "error": str(e)},
+            ) from e
+
+    # ------------------------------------------------------------------
+    # Manifestes d'exécution
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def new_run_id() -> str:
+        """Génère un identifiant d'exécution triable par date."""
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        return f"{timestamp}-{uuid.uuid4().hex[:8]}"
+
+    def _run_path(self, run_id: str) -> Path:
+        return self.runs_dir / f"{run_id}.json"
+
+    def _write_manifest(self, manifest: dict[str, Any]) -> None:
+        manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+        path = self._run_path(manifest["run_id"])
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load_run(self, run_id: str) -> dict[str, Any]:
+        """Charge le manifeste d'une exécution.
+
+        Raises:
+            RAGFrameworkError: Si l'exécution est inconnue.
+        """
+        path = self._run_path(run_id)
+        if not path.exists():
+            raise RAGFrameworkError(
+                f"Exécution introuvable: {run_id}",
+                details={"run_id": run_id, "checkpoint_dir": str(self.root)},
+            )
+        with open(path, encoding="utf-8") as f:
+            manifest: dict[str, Any] = json.load(f)
+        return manifest
+
+    def list_runs(self) -> list[dict[str, Any]]:
+        """Liste les manifestes, du plus ancien au plus récent."""
+        manifests = []
+        for path in sorted(self.runs_dir.glob("*.json")):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    manifests.append(json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Manifeste de checkpoint illisible {path}: {e}")
+        return manifests
+
+    def latest_resumable_run(self) -> Optional[str]:
+        """Identifiant de la dernière exécution interrompue ou en échec."""
+        for manifest in reversed(self.list_runs()):
+            if manifest.get("status") in (RUN_RUNNING, RUN_FAILED):
+                run_id: str = manifest["run_id"]
+                return run_id
+        return None
+
+    def start_run(self, run_id: str) -> dict[str, Any]:
+        """Crée le manifeste d'une nouvelle exécution."""
+        now = datetime.now(timezone.utc).isoformat()
+        manifest: dict[str, Any] = {
+            "run_id": run_id,
+            "status": RUN_RUNNING,
+            "created_at": now,
+            "stages": [],
+            "sub_batches": {},
+        }
+        self._write_manifest(manifest)
+        return manifest
+
+    def resume_run(self, run_id: str) -> tuple[StepData, list[str]]:
+        """Restaure les données de la dernière étape terminée d'une exécution.
+
+        Args:
+            run_id: Identifiant de l'exécution.
+
+        Returns:
+            Tuple (données, noms des étapes déjà terminées).
+        """
+        with self._lock:
+            manifest = self.load_run(run_id)
+            stages = manifest.get("stages", [])
+            data: StepData = {}
+            if stages:
+                data = {
+                    key: self.get_object(digest)
+                    for key, digest in stages[-1]["keys"].items()
+                }
+
+            manifest["status"] = RUN_RUNNING
+            manifest["resumed_at"] = datetime.now(timezone.utc).isoformat()
+            self._write_manifest(manifest)
+            return data, [stage["step"] for stage in stages]
+
+    def save_stage(self, run_id: str, step_name: str, data: StepData) -> None:
+        """Enregistre les données en sortie d'une étape terminée.
+
+        Args:
+            run_id: Identifiant de l'exécution.
+            step_name: Nom de l'étape terminée.
+            data: Données en sortie de l'étape.
+        """
+        keys = {key: self.put_object(value, pin=True) for key, value in data.items()}
+        try:
+            with self._lock:
+                manifest = self.load_run(run_id)
+                manifest["stages"].append(
+                    {
+                        "step": step_name,
+                        "keys": keys,
+                        "completed_at": datetime.now(timezone.utc).isoformat(),
+                    }
+                )
+                # Les sous-batches de l'étape ne sont plus nécessaires
+                batches = manifest["sub_batches"].pop(step_name, {})
+                self._write_manifest(manifest)
+                self._release({entry["output"] for entry in batches.values()})
+        finally:
+            self._unpin(list(keys.values()))
+
+    def load_sub_batch(
+        self, run_id: str, step_name: str, index: int, input_digest: str
+    ) -> tuple[bool, Any]:
+        """Cherche la sortie d'un sous-batch déjà traité.
+
+        La sortie n'est réutilisée que si l'entrée du sous-batch est
+        identique (même empreinte) à celle de l'exécution précédente.
+
+        Returns:
+            Tuple (trouvé, sortie).
+        """
+        manifest = self.load_run(run_id)
+        entry = manifest["sub_batches"].get(step_name, {}).get(str(index))
+        if entry is None or entry["input"] != input_digest:
+            return False, None
+        return True, self.get_object(entry["output"])
+
+    def save_sub_batch(
+        self,
+        run_id: str,
+        step_name: str,
+        index: int,
+        input_digest: str,
+        output: Any,  # noqa: ANN401
+    ) -> None:
+        """Enregistre la sortie d'un sous-batch terminé."""
+        output_digest = self.put_object(output, pin=True)
+        try:
+            with self._lock:
+                manifest = self.load_run(run_id)
+                manifest["sub_batches"].setdefault(step_name, {})[str(index)] = {
+                    "input": input_digest,
+                    "output": output_digest,
+                }
+                self._write_manifest(manifest)
+        finally:
+            self._unpin([output_digest])
+
+    def fail_run(self, run_id: str, step_name: str, error: str) -> None:
+        """Marque une exécution en échec (reprenable)."""
+        with self._lock:
+            manifest = self.load_run(run_id)
+            manifest["status"] = RUN_FAILED
+            manifest["failed_step"] = step_name
+            manifest["error"] = error
+            self._write_manifest(manifest)
+
+    def complete_run(self, run_id: str) -> None:
+        """Marque une exécution terminée et libère ses checkpoints."""
+        with self._lock:
+            manifest = self.load_run(run_id)
+            manifest["status"] = RUN_COMPLETED
+            self._write_manifest(manifest)
+            if not self.keep_completed:
+                self.delete_run(run_id)
+
+    # ------------------------------------------------------------------
+    # Ramasse-miettes
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _referenced_objects(manifest: dict[str, Any]) -> set[str]:
+        digests: set[str] = set()
+        for stage in manifest.get("stages", []):
+            digests.update(stage["keys"].values())
+        for batches in manifest.get("sub_batches", {}).values():
+            for entry in batches.values():
+                digests.add(entry["output"])
+        return digests
+
+    def delete_run(self, run_id: str) -> int:
+        """Supprime une exécution et ses objets non partagés.
+
+        Returns:
+            Nombre d'objets supprimés.
+        """
+        with self._lock:
+            manifest = self.load_run(run_id)
+            self._run_path(run_id).unlink(missing_ok=True)
+            return self._release(self._referenced_objects(manifest))
+
+    def _release(self, digests: set[str]) -> int:
+        """Supprime les objets qui ne sont plus référencés par aucun manifeste.
+
+        Les objets en cours d'écriture par une autre exécution (protégés par
+        ``put_object(pin=True)``) sont conservés.
+
+        Returns:
+            Nombre d'objets supprimés.
+        """
+        if not digests:
+            return 0
+
+        with self._lock:
+            still_referenced = set(self._shared.pinned)
+            for manifest in self.list_runs():
+                still_referenced |= self._referenced_objects(manifest)
+
+            removed = 0
+            for digest in digests - still_referenced:
+                path = self._object_path(digest)
+                if path.exists():
+                    path.unlink()
+                    removed += 1
+            return removed
+
+    def collect_garbage(self) -> dict[str, int]:
+        """Purge les exécutions expirées et les objets orphelins.
+
+        Returns:
+            Statistiques ``{"runs_removed", "objects_removed"}``.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.max_age_days)
+        runs_removed = 0
+        objects_removed = 0
+
+        with self._lock:
+            for manifest in self.list_runs():
+                updated_at = datetime.fromisoformat(
+                    manifest.get("updated_at", manifest["created_at"])
+                )
+                expired = updated_at < cutoff
+                finished = manifest.get("status") == RUN_COMPLETED
+                if expired or (finished and not self.keep_completed):
+                    objects_removed += self.delete_run(manifest["run_id"])
+                    runs_removed += 1
+
+            # Objets orphelins (exécution supprimée à la main, écriture
+            # avortée) ; le délai de grâce protège les autres processus
+            referenced = set(self._shared.pinned)
+            for manifest in self.list_runs():
+                referenced |= self._referenced_objects(manifest)
+
+            grace_cutoff = time.time() - self.orphan_grace_seconds
+            for path in self.objects_dir.glob("*/*"):
+                digest = path.name.split(".", 1)[0]
+                try:
+                    if digest in referenced or path.stat().st_mtime > grace_cutoff:
+                        continue
+                except FileNotFoundError:
+                    continue
+                path.unlink(missing_ok=True)
+                objects_removed += 1
+
+            for directory in self.objects_dir.iterdir():
+                if directory.is_dir() and not any(directory.iterdir()):
+                    shutil.rmtree(directory, ignore_errors=True)
+
+        if runs_removed or objects_removed:
+            logger.info(
+                f"Checkpoints purgés: {runs_removed} exécution(s), "
+                f"{objects_removed} objet(s)"
+            )
+        return {"runs_removed": runs_removed, "objects_removed": objects_removed}
@@ -0,0 +1,197 @@
+"""Parcours des répertoires surveillés en une passe (``os.scandir``).
+
+``Path.rglob`` appelé une fois par pattern parcourt l'arborescence autant
+de fois qu'il y a de patterns (35 dans la configuration par défaut), puis
+chaque fichier est confronté aux exclusions une par une, et un fichier
+correspondant à deux patterns est retourné deux fois.
+
+:class:`FileScanner` parcourt chaque arborescence une seule fois :
+
+- les patterns d'inclusion et d'exclusion portant sur le nom du fichier
+  (``*.pdf``, ``*_tmp*``) sont compilés en une expression régulière
+  chacun ; les patterns contenant un ``/`` gardent la sémantique de
+  ``Path.match`` ;
+- les répertoires dont le nom correspond à ``exclude_dirs`` (``.git``,
+  ``__pycache__``...) ne sont pas parcourus ;
+- chaque fichier n'est retourné qu'une fois, y compris lorsque des
+  répertoires surveillés se recouvrent ;
+- les sous-arborescences de premier niveau peuvent être parcourues par
+  plusieurs threads (``os.scandir`` libère le GIL pendant les appels
+  système : utile sur disque réseau ou cache froid).
+
+Comme ``rglob``, les liens symboliques vers des répertoires ne sont pas
+suivis par défaut.
+"""
+
+import fnmatch
+import os
+import re
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
+
+
+def compile_globs(patterns: Iterable[str]) -> Optional[re.Pattern[str]]:
+    """Compile des patterns glob (sur un nom) en une seule expression.
+
+    Args:
+        patterns: Patterns au format ``fnmatch`` (ex. ``*.pdf``).
+
+    Returns:
+        Expression dont ``match`` équivaut à un ``fnmatchcase`` sur l'un
+        des patterns, ou None si la liste est vide.
+    """
+    translated = [fnmatch.translate(pattern) for pattern in patterns]
+    if not translated:
+        return None
+    return re.compile("|".join(f"(?:{t})" for t in translated))
+
+
+class GlobMatcher:
+    """Ensemble de patterns glob, à la manière de ``Path.match``.
+
+    Args:
+        patterns: Patterns ; ceux sans ``/`` portent sur le nom seul.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Sépare les patterns de nom (compilés) et de chemin."""
+        patterns = list(patterns)
+        self.name_regex = compile_globs(p for p in patterns if "/" not in p)
+        self.path_patterns = [p for p in patterns if "/" in p]
+
+    def match(self, name: str, path: Optional[str] = None) -> bool:
+        """Indique si un fichier correspond à l'un des patterns.
+
+        Args:
+            name: Nom du fichier.
+            path: Chemin complet (requis pour les patterns de chemin).
+        """
+        if self.name_regex is not None and self.name_regex.match(name):
+            return True
+        if self.path_patterns and path is not None:
+            pure = Path(path)
+            return any(pure.match(pattern) for pattern in self.path_patterns)
+        return False
+
+
+class FileScanner:
+    """Parcours des répertoires surveillés en une passe.
+
+    Args:
+        include: Patterns des fichiers à retenir (``file_patterns``).
+        exclude: Patterns des fichiers à ignorer (``exclude_patterns``).
+        exclude_dirs: Patterns des noms de répertoires à ne pas parcourir.
+        follow_symlinks: Suivre les liens symboliques vers des répertoires.
+        workers: Threads de parcours (1 = parcours séquentiel).
+
+    Example:
+        >>> scanner = FileScanner(["*.pdf", "*.docx"], ["*_tmp*"], [".git"])
+        >>> scanner.scan(["data/input/docs"])
+        [PosixPath('data/input/docs/rapport.pdf'), ...]
+    """
+
+    def __init__(
+        self,
+        include: Sequence[str],
+        exclude: Sequence[str] = (),
+        exclude_dirs: Sequence[str] = (),
+        follow_symlinks: bool = False,
+        workers: int = 1,
+    ) -> None:
+        """Compile les patterns."""
+        self.include = GlobMatcher(include)
+        self.exclude = GlobMatcher(exclude)
+        self.exclude_dirs = compile_globs(exclude_dirs)
+        self.follow_symlinks = follow_symlinks
+        self.workers = max(1, workers)
+
+    def matches(self, path: Union[str, Path]) -> bool:
+        """Indique si un fichier est retenu (inclus et non exclu)."""
+        path = str(path)
+        name = os.path.basename(path)
+        return self.include.match(name, path) and not self.exclude.match(name, path)
+
+    def _walk(self, top: str, files: list[str], subdirs: Optional[list[str]]) -> None:
+        """Parcourt ``top`` en profondeur.
+
+        Args:
+            top: Répertoire de départ.
+            files: Fichiers retenus (complétée).
+            subdirs: Si fournie, les sous-répertoires directs de ``top`` y
+                sont ajoutés au lieu d'être parcourus.
+        """
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda e: e.name)
+            except OSError:
+                continue
+            children = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=self.follow_symlinks):
+                        if self.exclude_dirs is None or not self.exclude_dirs.match(
+                            entry.name
+                        ):
+                            children.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                name = entry.name
+                if self.include.match(name, entry.path) and not self.exclude.match(
+                    name, entry.path
+                ):
+                    files.append(entry.path)
+            if subdirs is not None and directory == top:
+                subdirs.extend(children)
+            else:
+                # Ordre de parcours déterministe (ordre alphabétique)
+                stack.extend(reversed(children))
+
+    def _walk_subtree(self, top: str) -> list[str]:
+        files: list[str] = []
+        self._walk(top, files, None)
+        return files
+
+    def scan(self, roots: Iterable[Union[str, Path]]) -> list[Path]:
+        """Fichiers retenus sous chacun des répertoires.
+
+        Args:
+            roots: Répertoires surveillés (les inexistants sont ignorés).
+
+        Returns:
+            Fichiers, sans doublon, dans l'ordre des répertoires puis de
+            parcours.
+        """
+        found: list[str] = []
+        for root in roots:
+            top = str(root)
+            if not os.path.isdir(top):
+                continue
+            if self.workers == 1:
+                self._walk(top, found, None)
+                continue
+            # Premier niveau séquentiel, sous-arborescences en parallèle
+            subdirs: list[str] = []
+            self._walk(top, found, subdirs)
+            with ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="rag-scan"
+            ) as executor:
+                for files in executor.map(self._walk_subtree, subdirs):
+                    found.extend(files)
+
+        # Répertoires surveillés imbriqués : un fichier n'est retenu qu'une fois
+        seen: set[str] = set()
+        unique: list[Path] = []
+        for path in found:
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                unique.append(Path(path))
+        return unique
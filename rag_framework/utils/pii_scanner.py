@@ -0,0 +1,304 @@
+r"""Détection de données personnelles (PII) en une passe par texte.
+
+Tous les détecteurs sont réunis dans une seule expression régulière
+(alternance de groupes nommés, par ordre de priorité) : chaque texte est
+parcouru une fois, et chaque occurrence n'est attribuée qu'à un seul type
+(un numéro international français n'est plus compté deux fois).
+
+Les candidats des types munis d'une clé de contrôle sont validés, sur les
+seules occurrences trouvées :
+
+- carte bancaire : algorithme de Luhn ;
+- IBAN : modulo 97 (ISO 13616) ;
+- NIR : clé = 97 - (13 premiers chiffres mod 97), Corse 2A/2B comprise ;
+- adresse IPv4 : octets ≤ 255.
+
+Un candidat rejeté est soumis aux détecteurs de priorité inférieure à la
+même position (une suite de chiffres qui n'est pas une carte valide peut
+être un numéro de téléphone).
+
+Le moteur ``re`` essaie chaque alternative à chaque position : appliquée
+à tout le texte, l'expression combinée serait plus lente que plusieurs
+``findall``. Toute donnée détectée contient un chiffre, un ``@`` ou un
+``+`` et commence dans le mot où apparaît le premier d'entre eux : le
+texte est parcouru par une expression de déclenchement (``[\d@+]``,
+recherche accélérée sur jeu de caractères) et l'expression combinée n'est
+essayée qu'entre le début de ce mot et le déclencheur.
+
+Pour les gros lots, les textes sont répartis en paquets analysés par des
+processus workers (``scan_texts``).
+"""
+
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+from rag_framework.extractors.page_ranges import map_in_processes
+
+# Détecteurs par ordre de priorité : (type, expression)
+PII_DETECTORS: list[tuple[str, str]] = [
+    # Email : RFC 5322 simplifié
+    ("email", r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"),
+    # IBAN européen : 2 lettres + 2 chiffres + jusqu'à 30 caractères
+    ("iban", r"\b[A-Z]{2}\d{2}\s?(?:[A-Z0-9]{4}\s?){3,7}[A-Z0-9]{1,4}\b"),
+    # Numéro de sécurité sociale français (NIR) : 13 chiffres + clé
+    (
+        "ssn_fr",
+        r"\b[12]\s?\d{2}\s?\d{2}\s?(?:\d{2}|2[AB])\s?\d{3}\s?\d{3}\s?\d{2}\b",
+    ),
+    # Carte bancaire : 13 à 19 chiffres, espaces ou tirets optionnels
+    ("credit_card", r"\b(?:\d{4}[\s-]?){3}\d{1,7}\b"),
+    # Téléphone français : +33, 0033, 0X
+    ("phone_fr", r"(?:(?:\+|00)33\s?|0)[1-9](?:[\s.-]?\d{2}){4}\b"),
+    # Téléphone international générique
+    ("phone_intl", r"\+\d{1,3}[\s.-]?\(?\d{1,4}\)?[\s.-]?\d{1,4}[\s.-]?\d{1,9}"),
+    # Adresse IPv4
+    ("ip_address", r"\b(?:\d{1,3}\.){3}\d{1,3}\b"),
+]
+
+PII_TYPES: list[str] = [name for name, _ in PII_DETECTORS]
+
+SEPARATORS = re.compile(r"[\s-]")
+
+# Caractère présent dans toute donnée détectée
+TRIGGER = re.compile(r"[\d@+]")
+
+# Caractères d'un mot pouvant précéder le déclencheur dans une occurrence
+# (partie locale d'un email, préfixe pays d'un IBAN)
+TOKEN_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-"
+)
+
+
+@dataclass(frozen=True)
+class PIIMatch:
+    """Donnée personnelle trouvée dans un texte.
+
+    Attributes:
+        pii_type: Type de donnée (clé de ``PII_DETECTORS``).
+        start: Position de début dans le texte.
+        end: Position de fin (exclue).
+        value: Texte de l'occurrence.
+    """
+
+    pii_type: str
+    start: int
+    end: int
+    value: str
+
+
+def luhn_valid(value: str) -> bool:
+    """Vérifie la clé de Luhn d'un numéro de carte (13 à 19 chiffres)."""
+    digits = SEPARATORS.sub("", value)
+    if not digits.isdigit() or not 13 <= len(digits) <= 19:
+        return False
+    total = 0
+    for position, char in enumerate(reversed(digits)):
+        digit = int(char)
+        if position % 2:
+            digit = digit * 2 - 9 if digit > 4 else digit * 2
+        total += digit
+    return total % 10 == 0
+
+
+def iban_valid(value: str) -> bool:
+    """Vérifie la clé d'un IBAN (modulo 97 = 1, ISO 13616)."""
+    iban = SEPARATORS.sub("", value).upper()
+    if not 15 <= len(iban) <= 34 or not iban.isalnum():
+        return False
+    rearranged = iban[4:] + iban[:4]
+    # Lettres converties en nombres : A = 10, ..., Z = 35
+    return int("".join(str(int(char, 36)) for char in rearranged)) % 97 == 1
+
+
+def nir_valid(value: str) -> bool:
+    """Vérifie la clé d'un NIR (numéro de sécurité sociale français)."""
+    nir = SEPARATORS.sub("", value).upper()
+    if len(nir) != 15:
+        return False
+    # Corse : 2A et 2B sont remplacés par 19 et 18 pour le calcul
+    body = nir[:13].replace("2A", "19", 1).replace("2B", "18", 1)
+    if not body.isdigit() or not nir[13:].isdigit():
+        return False
+    return 97 - int(body) % 97 == int(nir[13:])
+
+
+def ipv4_valid(value: str) -> bool:
+    """Vérifie que chaque octet d'une adresse IPv4 est compris entre 0 et 255."""
+    return all(int(part) <= 255 for part in value.split("."))
+
+
+# Validateurs appliqués aux candidats, par type
+VALIDATORS: dict[str, Callable[[str], bool]] = {
+    "credit_card": luhn_valid,
+    "iban": iban_valid,
+    "ssn_fr": nir_valid,
+    "ip_address": ipv4_valid,
+}
+
+
+class PIIScanner:
+    """Détecteur de données personnelles en une passe.
+
+    Args:
+        categories: Types à détecter (tous par défaut).
+        validate: Valider les candidats par clé de contrôle.
+
+    Example:
+        >>> scanner = PIIScanner()
+        >>> scanner.count("Contact: jean@example.com, IBAN FR76 3000 6000 0112 ...")
+        {'email': 1, 'iban': 1}
+    """
+
+    def __init__(
+        self, categories: Optional[Sequence[str]] = None, validate: bool = True
+    ) -> None:
+        """Compile l'expression combinée des détecteurs retenus."""
+        selected = set(categories) if categories is not None else set(PII_TYPES)
+        unknown = selected - set(PII_TYPES)
+        if unknown:
+            raise ValueError(f"Types de PII inconnus: {sorted(unknown)}")
+        self.detectors = [(n, p) for n, p in PII_DETECTORS if n in selected]
+        self.validate = validate
+        self.pattern = self._combine(self.detectors)
+        # Détecteurs de priorité inférieure, essayés après un rejet
+        self._fallbacks: dict[str, Optional[re.Pattern[str]]] = {
+            name: self._combine(self.detectors[i + 1 :]) if name in VALIDATORS else None
+            for i, (name, _) in enumerate(self.detectors)
+        }
+
+    @staticmethod
+    def _combine(detectors: list[tuple[str, str]]) -> Optional[re.Pattern[str]]:
+        """Alternance des détecteurs en groupes nommés (None si vide)."""
+        if not detectors:
+            return None
+        return re.compile("|".join(f"(?P<{n}>{p})" for n, p in detectors))
+
+    def _accept(self, match: Optional[re.Match[str]]) -> Optional[re.Match[str]]:
+        """Retient l'occurrence, ou celle d'un détecteur suivant si rejetée."""
+        while match is not None:
+            pii_type = match.lastgroup or ""
+            validator = VALIDATORS.get(pii_type) if self.validate else None
+            if validator is None or validator(match.group()):
+                return match
+            fallback = self._fallbacks.get(pii_type)
+            if fallback is None:
+                return None
+            match = fallback.match(match.string, match.start())
+        return None
+
+    def iter_matches(self, text: str) -> Iterator[PIIMatch]:
+        """Parcourt un texte et produit les données personnelles validées.
+
+        Args:
+            text: Texte à analyser.
+
+        Yields:
+            Occurrences, dans l'ordre du texte, sans chevauchement.
+        """
+        if self.pattern is None:
+            return
+        match_at = self.pattern.match
+        search_trigger = TRIGGER.search
+        position = 0
+        while (trigger := search_trigger(text, position)) is not None:
+            end = trigger.start()
+            # Début du mot contenant le déclencheur (sans revenir en arrière
+            # au-delà des positions déjà essayées)
+            start = end
+            while start > position and text[start - 1] in TOKEN_CHARS:
+                start -= 1
+
+            match = None
+            for offset in range(start, end + 1):
+                match = self._accept(match_at(text, offset))
+                if match is not None:
+                    break
+            if match is None:
+                position = end + 1
+                continue
+            yield PIIMatch(
+                match.lastgroup or "", match.start(), match.end(), match.group()
+            )
+            position = max(match.end(), match.start() + 1)
+
+    def count(self, text: str) -> dict[str, int]:
+        """Nombre d'occurrences par type dans un texte (types trouvés seulement).
+
+        Args:
+            text: Texte à analyser.
+
+        Returns:
+            ``{type: nombre}``.
+        """
+        counts: dict[str, int] = {}
+        for match in self.iter_matches(text):
+            counts[match.pii_type] = counts.get(match.pii_type, 0) + 1
+        return counts
+
+
+@lru_cache(maxsize=8)
+def _cached_scanner(
+    categories: Optional[tuple[str, ...]], validate: bool
+) -> PIIScanner:
+    """Scanner compilé une fois par processus et par configuration."""
+    return PIIScanner(categories, validate)
+
+
+def _count_shard(
+    shard: tuple[list[str], Optional[tuple[str, ...]], bool],
+) -> list[dict[str, int]]:
+    """Compte les PII d'un paquet de textes (exécuté dans un worker)."""
+    texts, categories, validate = shard
+    scanner = _cached_scanner(categories, validate)
+    return [scanner.count(text) for text in texts]
+
+
+def scan_texts(
+    texts: Sequence[str],
+    categories: Optional[Sequence[str]] = None,
+    validate: bool = True,
+    workers: int = 1,
+    parallel_min_chars: int = 4 * 1024 * 1024,
+    shard_chars: int = 1024 * 1024,
+    start_method: str = "spawn",
+) -> list[dict[str, int]]:
+    """Compte les PII de chaque texte, en processus pour les gros lots.
+
+    Args:
+        texts: Textes à analyser (ex. chunks).
+        categories: Types à détecter (tous par défaut).
+        validate: Valider les candidats par clé de contrôle.
+        workers: Nombre de processus (1 = dans le processus courant).
+        parallel_min_chars: Volume total en dessous duquel le lot est
+            analysé dans le processus courant (coût de démarrage).
+        shard_chars: Volume visé par paquet envoyé à un worker.
+        start_method: Méthode de démarrage des workers.
+
+    Returns:
+        ``{type: nombre}`` pour chaque texte, dans l'ordre.
+    """
+    key = tuple(categories) if categories is not None else None
+    total_chars = sum(len(text) for text in texts)
+    if workers <= 1 or total_chars < parallel_min_chars:
+        return _count_shard((list(texts), key, validate))
+
+    # Paquets contigus d'environ shard_chars caractères
+    shards: list[tuple[list[str], Optional[tuple[str, ...]], bool]] = []
+    current: list[str] = []
+    size = 0
+    for text in texts:
+        current.append(text)
+        size += len(text)
+        if size >= shard_chars:
+            shards.append((current, key, validate))
+            current, size = [], 0
+    if current:
+        shards.append((current, key, validate))
+
+    results: list[dict[str, int]] = []
+    for counts in map_in_processes(_count_shard, shards, workers, start_method):
+        results.extend(counts)
+    return results
@@ -0,0 +1,92 @@
+"""Graphe de dépendances entre étapes du pipeline.
+
+Les dépendances sont déduites des clés de ``data`` déclarées par chaque
+étape (``consumes`` / ``produces``), en conservant l'ordre de déclaration
+du pipeline comme ordre de référence. Une étape B placée après A dépend
+de A si :
+
+- B lit une clé écrite par A (lecture après écriture) ;
+- B écrit une clé lue par A (écriture après lecture) ;
+- A et B écrivent la même clé (écriture après écriture) ;
+- A ou B ne déclare aucune clé (barrière).
+
+Le module fournit aussi le calcul du chemin critique à partir des durées
+mesurées, pour identifier les étapes qui bornent la durée totale.
+"""
+
+from collections.abc import Sequence
+from typing import ClassVar, Protocol
+
+
+class DeclaresData(Protocol):
+    """Étape déclarant les clés de données lues et écrites."""
+
+    consumes: ClassVar[tuple[str, ...]]
+    produces: ClassVar[tuple[str, ...]]
+
+
+def _depends_on(step: DeclaresData, previous: DeclaresData) -> bool:
+    """Indique si ``step`` doit attendre ``previous`` (placée avant)."""
+    if not (step.consumes or step.produces):
+        return True
+    if not (previous.consumes or previous.produces):
+        return True
+
+    reads, writes = set(step.consumes), set(step.produces)
+    return bool(
+        set(previous.produces) & (reads | writes) or set(previous.consumes) & writes
+    )
+
+
+def build_dependencies(
+    steps: Sequence[DeclaresData], names: Sequence[str]
+) -> dict[str, list[str]]:
+    """Calcule les dépendances directes de chaque étape.
+
+    Args:
+        steps: Étapes dans l'ordre de référence du pipeline.
+        names: Nom de chaque étape (même ordre).
+
+    Returns:
+        Dictionnaire ``{nom: [noms des étapes à attendre]}``.
+    """
+    dependencies: dict[str, list[str]] = {}
+    for i, step in enumerate(steps):
+        dependencies[names[i]] = [
+            names[j] for j in range(i) if _depends_on(step, steps[j])
+        ]
+    return dependencies
+
+
+def critical_path(
+    dependencies: dict[str, list[str]], durations: dict[str, float]
+) -> tuple[list[str], float]:
+    """Chemin critique : chaîne de dépendances de durée cumulée maximale.
+
+    Args:
+        dependencies: Dépendances directes (ordre d'insertion topologique).
+        durations: Durée mesurée de chaque étape exécutée (secondes). Les
+            étapes absentes (non exécutées) comptent pour zéro.
+
+    Returns:
+        Tuple (étapes du chemin dans l'ordre d'exécution, durée cumulée).
+    """
+    finish: dict[str, float] = {}
+    predecessor: dict[str, str] = {}
+    for name, deps in dependencies.items():
+        start = 0.0
+        for dep in deps:
+            if finish.get(dep, 0.0) > start:
+                start = finish[dep]
+                predecessor[name] = dep
+        finish[name] = start + durations.get(name, 0.0)
+
+    if not finish:
+        return [], 0.0
+
+    last = max(finish, key=lambda name: finish[name])
+    path = [last]
+    while path[-1] in predecessor:
+        path.append(predecessor[path[-1]])
+    path.reverse()
+    return path, finish[last]
@@ -0,0 +1,148 @@
+"""Statistiques en flux à mémoire bornée.
+
+Pour les collecteurs de métriques d'un processus de longue durée (mode
+``--watch``, service) : la mémoire occupée ne dépend pas du nombre
+d'observations.
+
+- :class:`QuantileSketch` : quantiles approchés à erreur relative bornée
+  (principe de DDSketch : buckets logarithmiques), avec nombre, somme,
+  minimum et maximum exacts ;
+- :class:`ReservoirSample` : échantillon uniforme de taille fixe
+  (algorithme R), par exemple pour conserver quelques messages d'erreur
+  représentatifs.
+"""
+
+import math
+import random
+from typing import Any, Optional
+
+# En dessous, une valeur est comptée comme nulle
+_MIN_POSITIVE = 1e-9
+
+
+class QuantileSketch:
+    """Quantiles approchés d'un flux de valeurs positives ou nulles.
+
+    Chaque valeur est rangée dans le bucket ``ceil(log(v) / log(gamma))``
+    avec ``gamma = (1 + a) / (1 - a)`` : le quantile restitué est à moins
+    de ``a`` (erreur relative) de la valeur exacte. Au-delà de
+    ``max_bins`` buckets, les plus bas sont fusionnés (seuls les quantiles
+    très bas perdent alors en précision).
+
+    Args:
+        relative_accuracy: Erreur relative maximale ``a`` des quantiles.
+        max_bins: Nombre maximal de buckets conservés.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048) -> None:
+        """Initialise un sketch vide."""
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy doit être dans ]0, 1[")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Ajoute une observation (les valeurs négatives comptent comme 0)."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value < _MIN_POSITIVE:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._bins[key] = self._bins.get(key, 0) + 1
+        if len(self._bins) > self.max_bins:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        lowest, second = sorted(self._bins)[:2]
+        self._bins[second] += self._bins.pop(lowest)
+
+    @property
+    def mean(self) -> float:
+        """Moyenne exacte (0.0 si vide)."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Quantile approché.
+
+        Args:
+            q: Rang dans [0, 1] (0.5 = médiane).
+
+        Returns:
+            Valeur approchée, bornée par le minimum et le maximum observés
+            (exacts pour 0 et 1 ; 0.0 si vide).
+        """
+        if not self.count:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return max(self.min, 0.0)
+        cumulative = self.zero_count
+        for key in sorted(self._bins):
+            cumulative += self._bins[key]
+            if cumulative > rank:
+                value = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Ajoute les observations d'un autre sketch de même précision."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Sketches de précisions différentes")
+        for key, count in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + count
+        while len(self._bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def __len__(self) -> int:
+        """Nombre d'observations."""
+        return self.count
+
+
+class ReservoirSample:
+    """Échantillon uniforme de taille fixe d'un flux (algorithme R).
+
+    Args:
+        capacity: Nombre d'éléments conservés.
+        seed: Graine du générateur (échantillon reproductible).
+    """
+
+    def __init__(self, capacity: int, seed: Optional[int] = None) -> None:
+        """Initialise un échantillon vide."""
+        self.capacity = capacity
+        self.items: list[Any] = []
+        self.seen = 0
+        self._random = random.Random(seed)
+
+    def add(self, item: Any) -> None:  # noqa: ANN401
+        """Présente un élément à l'échantillon."""
+        self.seen += 1
+        if len(self.items) < self.capacity:
+            self.items.append(item)
+            return
+        index = self._random.randrange(self.seen)
+        if index < self.capacity:
+            self.items[index] = item
+
+    def __len__(self) -> int:
+        """Nombre d'éléments présentés."""
+        return self.seen
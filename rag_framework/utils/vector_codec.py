@@ -0,0 +1,213 @@
+"""Formats compacts de vecteurs d'embeddings.
+
+Ce module regroupe les conversions utilisées par les étapes 06 à 08 :
+
+- précision de stockage : float64 (historique), float32, float16 ;
+- troncature de dimensions pour les modèles Matryoshka (suivie d'une
+  renormalisation L2) ;
+- quantification scalaire int8 symétrique avec une échelle par vecteur ;
+- sérialisation compacte (base64 du buffer binaire) pour les caches.
+
+Toutes les fonctions travaillent sur des matrices NumPy (un vecteur par
+ligne) afin de vectoriser les traitements sur un batch complet.
+"""
+
+import base64
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from rag_framework.exceptions import ValidationError
+
+# Types de stockage supportés et taille d'un composant en octets
+DTYPE_SIZES: dict[str, int] = {"float64": 8, "float32": 4, "float16": 2, "int8": 1}
+FLOAT_DTYPES = ("float64", "float32", "float16")
+
+
+@dataclass
+class QuantizedVectors:
+    """Vecteurs quantifiés en int8 avec une échelle par vecteur.
+
+    Attributes:
+        codes: Matrice int8 (n, d).
+        scales: Échelles float32 (n,) telles que ``vecteur ≈ codes * scale``.
+    """
+
+    codes: NDArray[np.int8]
+    scales: NDArray[np.float32]
+
+    def dequantize(self) -> NDArray[np.float32]:
+        """Reconstruit une approximation float32 des vecteurs."""
+        return self.codes.astype(np.float32) * self.scales[:, np.newaxis]
+
+
+@dataclass
+class VectorFormat:
+    """Format de représentation des vecteurs configuré pour une étape.
+
+    Attributes:
+        dtype: Précision de stockage ("float64", "float32", "float16", "int8").
+        truncate_dim: Nombre de dimensions conservées (Matryoshka), ou None.
+    """
+
+    dtype: str = "float64"
+    truncate_dim: Optional[int] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: dict[str, Any],
+        allowed_dtypes: tuple[str, ...] = tuple(DTYPE_SIZES),
+    ) -> "VectorFormat":
+        """Construit et valide un format depuis la section ``vector_format``.
+
+        Args:
+            config: Section ``vector_format`` du YAML de l'étape.
+            allowed_dtypes: Précisions acceptées par l'étape.
+
+        Returns:
+            Format validé.
+
+        Raises:
+            ValidationError: Si la précision ou la troncature est invalide.
+        """
+        dtype = str(config.get("dtype", "float64"))
+        if dtype not in allowed_dtypes:
+            raise ValidationError(
+                f"vector_format.dtype invalide: {dtype}",
+                details={"dtype": dtype, "allowed": list(allowed_dtypes)},
+            )
+
+        truncate_dim = config.get("truncate_dim")
+        if truncate_dim is not None and (
+            not isinstance(truncate_dim, int) or truncate_dim <= 0
+        ):
+            raise ValidationError(
+                f"vector_format.truncate_dim invalide: {truncate_dim}",
+                details={"truncate_dim": truncate_dim},
+            )
+
+        return cls(dtype=dtype, truncate_dim=truncate_dim)
+
+    def bytes_per_vector(self, dimensions: int) -> int:
+        """Taille en octets d'un vecteur stocké dans ce format.
+
+        L'échelle float32 est comptée pour le format int8.
+        """
+        if self.truncate_dim is not None:
+            dimensions = min(dimensions, self.truncate_dim)
+        size = dimensions * DTYPE_SIZES[self.dtype]
+        if self.dtype == "int8":
+            size += DTYPE_SIZES["float32"]
+        return size
+
+
+def to_matrix(
+    vectors: Any,  # noqa: ANN401
+    dtype: str = "float32",
+) -> NDArray[Any]:
+    """Convertit une liste de vecteurs en matrice 2D NumPy.
+
+    Args:
+        vectors: Liste de listes, matrice NumPy ou vecteur unique.
+        dtype: Type NumPy de la matrice résultante.
+
+    Returns:
+        Matrice (n, d).
+    """
+    matrix = np.asarray(vectors, dtype=dtype)
+    if matrix.ndim == 1:
+        matrix = matrix[np.newaxis, :]
+    return matrix
+
+
+def truncate(matrix: NDArray[Any], dimensions: Optional[int]) -> NDArray[Any]:
+    """Conserve les ``dimensions`` premières composantes (Matryoshka).
+
+    Args:
+        matrix: Matrice (n, d).
+        dimensions: Dimensions conservées (None ou >= d : inchangé).
+
+    Returns:
+        Matrice (n, min(d, dimensions)).
+    """
+    if dimensions is None or dimensions >= matrix.shape[1]:
+        return matrix
+    return matrix[:, :dimensions]
+
+
+def l2_normalize(matrix: NDArray[Any]) -> NDArray[Any]:
+    """Normalise chaque ligne en norme L2 (lignes nulles inchangées)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    normalized: NDArray[Any] = matrix / norms
+    return normalized
+
+
+def quantize_int8(matrix: NDArray[Any]) -> QuantizedVectors:
+    """Quantification scalaire symétrique int8, une échelle par vecteur.
+
+    Args:
+        matrix: Matrice flottante (n, d).
+
+    Returns:
+        Codes int8 dans [-127, 127] et échelles ``max(|x|) / 127``.
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    safe_scales = np.where(scales == 0, 1.0, scales)
+    codes = np.clip(np.rint(matrix / safe_scales[:, np.newaxis]), -127, 127)
+    return QuantizedVectors(
+        codes=codes.astype(np.int8), scales=scales.astype(np.float32)
+    )
+
+
+def cast(matrix: NDArray[Any], dtype: str) -> NDArray[Any]:
+    """Applique la précision flottante demandée (float64/float32/float16)."""
+    if dtype not in FLOAT_DTYPES:
+        raise ValueError(f"Précision flottante non supportée: {dtype}")
+    return np.asarray(matrix, dtype=dtype)
+
+
+def encode_vector(vector: Any, dtype: str) -> dict[str, Any]:  # noqa: ANN401
+    """Sérialise un vecteur en dictionnaire JSON compact.
+
+    Args:
+        vector: Vecteur (liste ou tableau 1D).
+        dtype: Précision ("float32", "float16" ou "int8").
+
+    Returns:
+        Dictionnaire ``{"dtype", "dims", "data"[, "scale"]}`` où ``data`` est
+        le buffer binaire encodé en base64.
+    """
+    matrix = to_matrix(vector, dtype="float32")
+    payload: dict[str, Any] = {"dtype": dtype, "dims": int(matrix.shape[1])}
+
+    if dtype == "int8":
+        quantized = quantize_int8(matrix)
+        raw = quantized.codes.tobytes()
+        payload["scale"] = float(quantized.scales[0])
+    else:
+        raw = cast(matrix, dtype).tobytes()
+
+    payload["data"] = base64.b64encode(raw).decode("ascii")
+    return payload
+
+
+def decode_vector(payload: dict[str, Any]) -> list[float]:
+    """Désérialise un vecteur produit par :func:`encode_vector`.
+
+    Args:
+        payload: Dictionnaire ``{"dtype", "dims", "data"[, "scale"]}``.
+
+    Returns:
+        Vecteur sous forme de liste de floats.
+    """
+    raw = base64.b64decode(payload["data"])
+    values = np.frombuffer(raw, dtype=payload["dtype"]).astype(np.float32)
+    if payload["dtype"] == "int8":
+        values = values * np.float32(payload.get("scale", 1.0))
+    result: list[float] = values.tolist()
+    return result
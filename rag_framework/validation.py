@@ -1,6 +1,6 @@
 """Validation des dépendances et prérequis du framework RAG."""
 
-import importlib
+import importlib.util
 from pathlib import Path
 
 from rag_framework.config import GlobalConfig, get_llm_client
@@ -106,7 +106,7 @@ class DependencyValidator:
             logger.info("✓ Toutes les dépendances critiques sont installées")
 
     def _check_module(self, module_name: str) -> bool:
-        """Vérifie si un module Python est disponible.
+        """Vérifie si un module Python est disponible, sans l'importer.
 
         Parameters
         ----------
@@ -119,9 +119,8 @@ class DependencyValidator:
             True si le module est disponible, False sinon.
         """
         try:
-            importlib.import_module(module_name)
-            return True
-        except ImportError:
+            return importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
             return False
 
     def _validate_file_paths(self) -> None:
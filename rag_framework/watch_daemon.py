@@ -0,0 +1,424 @@
+"""Mode daemon : surveillance événementielle et file de traitement.
+
+Le mode ``--watch`` historique relançait tout le pipeline à intervalle
+fixe, chaque itération reparcourant tous les répertoires surveillés. Ici,
+les événements watchdog (création, modification, dépôt par renommage)
+alimentent une file de travail ; un parcours de réconciliation au
+démarrage (puis à intervalle long, optionnel) rattrape les fichiers
+déposés pendant l'arrêt ou les événements perdus.
+
+La file :
+
+- déduplique les chemins (un fichier signalé dix fois est traité une fois) ;
+- ne délivre un fichier qu'une fois stable : taille et date de
+  modification inchangées pendant ``settle_seconds`` (un dépôt en cours
+  d'écriture n'est pas pris) ;
+- regroupe les fichiers prêts en lots (``batch_size``, ``batch_wait_seconds``)
+  traités par des workers dès qu'ils sont disponibles ;
+- remet en file un fichier modifié pendant son traitement.
+
+Sans fichier en attente, les workers sont bloqués sur une condition :
+aucun réveil périodique, l'utilisation CPU au repos est nulle.
+
+Exemple:
+    >>> daemon = WatchDaemon(monitoring_config, lambda: RAGPipeline())
+    >>> daemon.start()
+    >>> ...
+    >>> daemon.stop()
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Protocol, Union
+
+from rag_framework.types import StepData
+from rag_framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BatchProcessor(Protocol):
+    """Objet traitant un lot de fichiers (ex. :class:`RAGPipeline`)."""
+
+    def execute(self, input_data: Optional[StepData] = None) -> StepData:
+        """Traite les fichiers de ``input_data["monitored_files"]``."""
+        ...
+
+
+@dataclass
+class WatchSettings:
+    """Paramètres du mode daemon.
+
+    Attributes:
+        settle_seconds: Durée sans changement de taille/date de modification
+            au-delà de laquelle un fichier est considéré comme complet.
+        poll_interval_seconds: Intervalle de vérification des fichiers en
+            cours de stabilisation (uniquement s'il y en a).
+        batch_size: Nombre maximal de fichiers par exécution du pipeline.
+        batch_wait_seconds: Attente maximale pour compléter un lot lorsque
+            d'autres fichiers sont en cours de stabilisation.
+        workers: Nombre de workers (un pipeline chacun).
+        reconcile_on_start: Parcours complet des répertoires au démarrage.
+        reconcile_interval_seconds: Intervalle des parcours de réconciliation
+            suivants (0 = jamais).
+    """
+
+    settle_seconds: float = 2.0
+    poll_interval_seconds: float = 0.5
+    batch_size: int = 50
+    batch_wait_seconds: float = 1.0
+    workers: int = 1
+    reconcile_on_start: bool = True
+    reconcile_interval_seconds: float = 900.0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "WatchSettings":
+        """Construit les paramètres depuis la section ``watch_daemon``.
+
+        Args:
+            config: Section ``watch_daemon`` de 01_monitoring.yaml.
+
+        Returns:
+            Paramètres (valeurs par défaut pour les clés absentes).
+        """
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in config.items() if k in known})
+
+
+@dataclass
+class _Candidate:
+    """Fichier signalé, en attente de stabilisation."""
+
+    first_seen: float
+    last_change: float
+    signature: Optional[tuple[int, int]] = None
+
+
+@dataclass
+class _QueueStats:
+    events: int = 0
+    enqueued: int = 0
+    deduplicated: int = 0
+    vanished: int = 0
+    requeued: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+
+class StableFileQueue:
+    """File de fichiers dédupliquée, délivrant les fichiers stabilisés.
+
+    Args:
+        settle_seconds: Durée de stabilité requise.
+        poll_interval_seconds: Intervalle de vérification des fichiers en
+            attente de stabilisation.
+    """
+
+    def __init__(
+        self, settle_seconds: float = 2.0, poll_interval_seconds: float = 0.5
+    ) -> None:
+        """Initialise une file vide."""
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval_seconds
+        self._cond = threading.Condition()
+        self._pending: dict[str, _Candidate] = {}
+        # Fichiers stables, dans l'ordre où ils le sont devenus → first_seen
+        self._ready: dict[str, float] = {}
+        self._in_flight: dict[str, float] = {}
+        self._requeue: set[str] = set()
+        self._closed = False
+        self._stats = _QueueStats()
+
+    def offer(self, file_path: Union[str, Path]) -> None:
+        """Signale un fichier créé ou modifié.
+
+        Args:
+            file_path: Chemin du fichier.
+        """
+        key = str(Path(file_path))
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                return
+            self._stats.events += 1
+            if key in self._in_flight:
+                # Modifié pendant son traitement : repris ensuite
+                self._requeue.add(key)
+                return
+            candidate = self._pending.get(key)
+            if candidate is not None:
+                candidate.last_change = now
+                self._stats.deduplicated += 1
+            elif key in self._ready:
+                # Modifié alors qu'il était prêt : nouvelle attente
+                self._pending[key] = _Candidate(self._ready.pop(key), now)
+                self._stats.deduplicated += 1
+            else:
+                self._pending[key] = _Candidate(now, now)
+                self._stats.enqueued += 1
+            self._cond.notify_all()
+
+    def _check_pending(self, now: float) -> None:
+        """Passe à l'état prêt les fichiers stables depuis ``settle_seconds``."""
+        for key, candidate in list(self._pending.items()):
+            try:
+                stat = os.stat(key)
+            except OSError:
+                # Supprimé ou déplacé avant stabilisation
+                del self._pending[key]
+                self._stats.vanished += 1
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if signature != candidate.signature:
+                candidate.signature = signature
+                candidate.last_change = max(candidate.last_change, now)
+            elif now - candidate.last_change >= self.settle_seconds:
+                del self._pending[key]
+                self._ready[key] = candidate.first_seen
+
+    def get_batch(self, max_items: int = 50, batch_wait: float = 1.0) -> list[str]:
+        """Attend et retourne un lot de fichiers stables.
+
+        Le lot est délivré dès qu'il est plein, dès que plus aucun fichier
+        n'est en cours de stabilisation, ou après ``batch_wait`` secondes.
+
+        Args:
+            max_items: Taille maximale du lot.
+            batch_wait: Attente maximale pour compléter un lot.
+
+        Returns:
+            Chemins du lot (liste vide après :meth:`close`).
+        """
+        batch_started: Optional[float] = None
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._check_pending(now)
+                if self._closed:
+                    return []
+                timeout: Optional[float] = None
+                if self._ready:
+                    if batch_started is None:
+                        batch_started = now
+                    if (
+                        len(self._ready) >= max_items
+                        or not self._pending
+                        or now - batch_started >= batch_wait
+                    ):
+                        batch = list(self._ready)[:max_items]
+                        for key in batch:
+                            self._in_flight[key] = self._ready.pop(key)
+                        return batch
+                    timeout = min(self.poll_interval, batch_started + batch_wait - now)
+                elif self._pending:
+                    timeout = self.poll_interval
+                # Sans fichier en attente : attente sans réveil périodique
+                self._cond.wait(timeout)
+
+    def task_done(self, batch: list[str]) -> None:
+        """Signale la fin du traitement d'un lot.
+
+        Args:
+            batch: Lot retourné par :meth:`get_batch`.
+        """
+        now = time.monotonic()
+        with self._cond:
+            for key in batch:
+                first_seen = self._in_flight.pop(key, now)
+                self._stats.latencies.append(now - first_seen)
+                if key in self._requeue:
+                    self._requeue.discard(key)
+                    self._pending[key] = _Candidate(now, now)
+                    self._stats.requeued += 1
+            # Latences des 1000 derniers fichiers
+            del self._stats.latencies[:-1000]
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Ferme la file : les workers en attente reçoivent un lot vide."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Compteurs de la file et latences (détection → fin de traitement)."""
+        with self._cond:
+            latencies = sorted(self._stats.latencies)
+            return {
+                "events": self._stats.events,
+                "enqueued": self._stats.enqueued,
+                "deduplicated": self._stats.deduplicated,
+                "vanished": self._stats.vanished,
+                "requeued": self._stats.requeued,
+                "pending": len(self._pending),
+                "ready": len(self._ready),
+                "in_flight": len(self._in_flight),
+                "latency_p50_s": (
+                    round(latencies[len(latencies) // 2], 3) if latencies else None
+                ),
+                "latency_max_s": round(latencies[-1], 3) if latencies else None,
+            }
+
+
+class WatchDaemon:
+    """Surveillance événementielle alimentant des workers de traitement.
+
+    Args:
+        monitoring_config: Configuration de l'étape 1 (01_monitoring.yaml).
+        pipeline_factory: Crée le pipeline d'un worker (appelée une fois
+            par worker, dans son thread).
+        settings: Paramètres du daemon (défaut: section ``watch_daemon``
+            de ``monitoring_config``).
+    """
+
+    def __init__(
+        self,
+        monitoring_config: dict[str, Any],
+        pipeline_factory: Callable[[], BatchProcessor],
+        settings: Optional[WatchSettings] = None,
+    ) -> None:
+        """Prépare le daemon (rien n'est démarré)."""
+        self.monitoring_config = monitoring_config
+        self.pipeline_factory = pipeline_factory
+        self.settings = settings or WatchSettings.from_config(
+            monitoring_config.get("watch_daemon", {})
+        )
+        self.queue = StableFileQueue(
+            self.settings.settle_seconds, self.settings.poll_interval_seconds
+        )
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._observer: Any = None
+        self._stats_lock = threading.Lock()
+        self._stats = {"batches": 0, "files_processed": 0, "errors": 0}
+
+    def start(self) -> None:
+        """Démarre l'observateur watchdog, les workers et la réconciliation."""
+        # Imports différés : watchdog n'est chargé qu'en mode daemon
+        from watchdog.observers import Observer
+
+        from rag_framework.steps.step_01_monitoring import FileEventHandler
+
+        handler = FileEventHandler(
+            self.monitoring_config["file_patterns"],
+            exclude_patterns=self.monitoring_config.get("exclude_patterns", []),
+            callback=self.queue.offer,
+            triggers=self.monitoring_config.get("triggers", {}),
+        )
+        self._observer = Observer()
+        for watch_path in self.monitoring_config["watch_paths"]:
+            if Path(watch_path).exists():
+                self._observer.schedule(
+                    handler,
+                    str(watch_path),
+                    recursive=self.monitoring_config.get("recursive", True),
+                )
+            else:
+                logger.warning(f"Chemin de surveillance inexistant: {watch_path}")
+        self._observer.start()
+
+        for index in range(max(1, self.settings.workers)):
+            self._spawn(self._work, f"rag-watch-worker-{index}")
+
+        # Observateur démarré avant le parcours : aucun fichier déposé
+        # entre les deux n'est manqué (les doublons sont dédupliqués)
+        if self.settings.reconcile_on_start:
+            self.reconcile()
+        if self.settings.reconcile_interval_seconds > 0:
+            self._spawn(self._reconcile_periodically, "rag-watch-reconcile")
+
+        logger.info(
+            f"🔍 Daemon de surveillance démarré: "
+            f"{len(self.monitoring_config['watch_paths'])} répertoire(s), "
+            f"{self.settings.workers} worker(s), "
+            f"stabilisation {self.settings.settle_seconds}s"
+        )
+
+    def _spawn(self, target: Callable[[], None], name: str) -> None:
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def reconcile(self) -> int:
+        """Parcourt les répertoires surveillés et met en file leurs fichiers.
+
+        Returns:
+            Nombre de fichiers trouvés.
+        """
+        from rag_framework.steps.step_01_monitoring import MonitoringStep
+
+        scan = MonitoringStep(self.monitoring_config).execute({})
+        for file_path in scan["monitored_files"]:
+            self.queue.offer(file_path)
+        logger.info(f"Réconciliation: {len(scan['monitored_files'])} fichier(s)")
+        return len(scan["monitored_files"])
+
+    def _reconcile_periodically(self) -> None:
+        while not self._stop.wait(self.settings.reconcile_interval_seconds):
+            try:
+                self.reconcile()
+            except Exception as e:
+                logger.error(f"Erreur de réconciliation: {e}", exc_info=True)
+
+    def _work(self) -> None:
+        """Boucle d'un worker : lots de fichiers stables → pipeline."""
+        pipeline = self.pipeline_factory()
+        while True:
+            batch = self.queue.get_batch(
+                self.settings.batch_size, self.settings.batch_wait_seconds
+            )
+            if not batch:
+                return
+            logger.info(f"📥 Lot de {len(batch)} fichier(s) prêt(s)")
+            start = time.perf_counter()
+            try:
+                result = pipeline.execute({"monitored_files": batch})
+                processed = len(result.get("extracted_documents", []))
+                with self._stats_lock:
+                    self._stats["batches"] += 1
+                    self._stats["files_processed"] += processed
+                logger.info(
+                    f"✅ {processed} document(s) traité(s) en "
+                    f"{time.perf_counter() - start:.1f}s"
+                )
+            except Exception as e:
+                with self._stats_lock:
+                    self._stats["errors"] += 1
+                logger.error(f"Erreur de traitement du lot: {e}", exc_info=True)
+            finally:
+                self.queue.task_done(batch)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Arrête la surveillance ; les lots en cours sont terminés.
+
+        Args:
+            timeout: Attente maximale par thread.
+        """
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout)
+        self.queue.close()
+        for thread in self._threads:
+            thread.join(timeout)
+        logger.info(f"Daemon de surveillance arrêté: {self.get_stats()}")
+
+    def request_stop(self) -> None:
+        """Demande l'arrêt (ex. depuis un gestionnaire de signal)."""
+        self._stop.set()
+
+    def wait(self) -> None:
+        """Bloque jusqu'à :meth:`request_stop` ou :meth:`stop`."""
+        # Attente par tranches : les signaux restent traités
+        while not self._stop.wait(1.0):
+            pass
+
+    def get_stats(self) -> dict[str, Any]:
+        """Compteurs de traitement et de la file."""
+        with self._stats_lock:
+            stats: dict[str, Any] = dict(self._stats)
+        stats.update(self.queue.get_stats())
+        return stats
@@ -0,0 +1,134 @@
+"""Tests pour l'ordre adaptatif de la chaîne de fallback."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from rag_framework.extractors.adaptive_order import (
+    AdaptiveOrdering,
+    AdaptiveSettings,
+    normalize_producer,
+)
+from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.fallback_manager import FallbackManager
+
+
+class NativeExtractor(BaseExtractor):
+    """Extracteur factice rapide qui échoue toujours (PDF scanné)."""
+
+    calls = 0
+
+    def can_extract(self, file_path: Path) -> bool:
+        """Accepte tous les fichiers."""
+        return True
+
+    def extract(self, file_path: Path) -> ExtractionResult:
+        """Échoue : aucune couche texte."""
+        type(self).calls += 1
+        return ExtractionResult("", False, self.name, {}, "Pas de texte")
+
+
+class ScanExtractor(NativeExtractor):
+    """Extracteur factice qui réussit toujours (OCR)."""
+
+    calls = 0
+
+    def extract(self, file_path: Path) -> ExtractionResult:
+        """Réussit."""
+        type(self).calls += 1
+        return ExtractionResult("Texte OCRisé du scan.", True, self.name, {})
+
+
+def test_order_minimizes_expected_time() -> None:
+    """Tri par coût / probabilité de succès, extracteur sans succès relégué."""
+    ordering = AdaptiveOrdering(
+        AdaptiveSettings(enabled=True, stats_path="", exploration=0.0, skip_after=5)
+    )
+    key = ".pdf|canon ir adv|1-10MB"
+    names = ["pymupdf", "pdfplumber", "ocr"]
+    assert ordering.order(key, names) == names  # profil inconnu
+
+    for _ in range(6):
+        ordering.record(key, "pymupdf", False, 0.01)
+        ordering.record(key, "pdfplumber", False, 0.5)
+        ordering.record(key, "ocr", True, 3.0)
+
+    assert ordering.order(key, names) == ["ocr", "pymupdf", "pdfplumber"]
+    assert ordering.snapshot()[key]["ocr"] == {
+        "attempts": 6,
+        "successes": 6,
+        "success_rate": 1.0,
+        "mean_seconds": 3.0,
+    }
+
+    ordering.rng = random.Random(0)
+    ordering.settings.exploration = 1.0
+    assert ordering.order(key, names) == names  # exploration
+
+
+def test_stats_saved_every_n_records(tmp_path: Path) -> None:
+    """Le fichier n'est réécrit que tous les ``save_every`` enregistrements."""
+    stats_path = tmp_path / "stats.json"
+    settings = AdaptiveSettings(enabled=True, stats_path=str(stats_path), save_every=3)
+    ordering = AdaptiveOrdering(settings)
+
+    for _ in range(2):
+        ordering.record(".pdf||<100KB", "pymupdf", True, 0.1)
+    assert not stats_path.exists()
+    ordering.record(".pdf||<100KB", "pymupdf", True, 0.1)
+    assert stats_path.exists()
+
+    ordering.record(".pdf||<100KB", "ocr", True, 2.0)
+    ordering.flush()
+    reloaded = AdaptiveOrdering(settings)
+    assert reloaded.snapshot()[".pdf||<100KB"]["ocr"]["attempts"] == 1
+
+
+def test_normalize_producer_drops_versions() -> None:
+    """Les versions du logiciel producteur ne fragmentent pas les profils."""
+    assert normalize_producer("pdfTeX-1.40.21") == "pdftex"
+    assert normalize_producer("Microsoft® Word 2016") == "microsoft word"
+
+
+def test_fallback_manager_learns_and_persists(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Après quelques fichiers, l'extracteur qui réussit est tenté en premier."""
+    monkeypatch.setitem(FallbackManager.EXTRACTOR_CLASSES, "native", NativeExtractor)
+    monkeypatch.setitem(FallbackManager.EXTRACTOR_CLASSES, "scan", ScanExtractor)
+    stats_path = tmp_path / "stats.json"
+    config = {
+        "fallback": {
+            "enabled": True,
+            "extractors": [{"name": "native"}, {"name": "scan"}],
+            "adaptive": {
+                "enabled": True,
+                "stats_path": str(stats_path),
+                "min_samples": 4,
+                "exploration": 0.0,
+                "skip_after": 2,
+            },
+        }
+    }
+    document = tmp_path / "scan.pdf"
+    document.write_bytes(b"%PDF-1.4 factice")
+
+    manager = FallbackManager(config)
+    for _ in range(2):
+        manager.extract_with_fallback(document)
+    assert NativeExtractor.calls == 2
+    # Écriture groupée : rien sur disque avant la fin du lot
+    assert not stats_path.exists()
+    manager.flush_extractor_stats()
+
+    # Nouvelle instance : statistiques rechargées, "native" n'est plus tenté
+    manager = FallbackManager(config)
+    _, name = manager.extract_with_fallback(document)
+
+    assert name == "scan"
+    assert NativeExtractor.calls == 2
+    assert ScanExtractor.calls == 3
+    stats = manager.get_extractor_stats()
+    assert list(stats) == [".pdf||<100KB"]
+    assert stats[".pdf||<100KB"]["native"]["success_rate"] == 0.0
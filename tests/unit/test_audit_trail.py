@@ -0,0 +1,99 @@
+"""Tests du journal d'audit segmenté et indexé."""
+
+import gzip
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from rag_framework.utils.audit_trail import AuditTrail
+
+START = datetime(2025, 3, 1, tzinfo=timezone.utc)
+CONFIG = {"watch_paths": ["data/input"], "file_patterns": ["*.pdf"] * 50}
+
+
+def _record(hour: int, files: list[str], config: Any = CONFIG) -> dict[str, Any]:  # noqa: ANN401
+    return {
+        "timestamp": (START + timedelta(hours=hour)).isoformat(),
+        "operation": "rag_pipeline_execution",
+        "metadata": {"monitoring_config": config, "files_processed": files},
+    }
+
+
+def test_rotation_and_indexed_queries(tmp_path: Path) -> None:
+    """Segments scellés par ancienneté, requêtes par fichier et par période."""
+    trail = AuditTrail(tmp_path, max_segment_age_hours=24, block_records=4)
+    for hour in range(72):
+        trail.append(_record(hour, [f"data/input/doc_{hour}.pdf", "data/input/a.pdf"]))
+
+    stats = trail.get_stats()
+    assert stats["segments"] == 2
+    assert stats["active_records"] == 24
+    # Configuration de surveillance stockée une seule fois
+    assert stats["blobs"] == 1
+
+    # Segment scellé : gzip multi-membres lisible en entier
+    with gzip.open(tmp_path / "segments" / "000000.jsonl.gz", "rt") as f:
+        assert len(f.readlines()) == 24
+
+    found = trail.query(file_path="data/input/doc_30.pdf")
+    assert len(found) == 1
+    assert found[0]["timestamp"] == (START + timedelta(hours=30)).isoformat()
+    assert found[0]["metadata"]["monitoring_config"] == CONFIG
+
+    period = trail.query(
+        since=START + timedelta(hours=20), until=START + timedelta(hours=50)
+    )
+    assert len(period) == 31
+    assert [r["timestamp"] for r in period] == sorted(r["timestamp"] for r in period)
+
+    # Réouverture : même résultat depuis les index sur disque
+    reopened = AuditTrail(tmp_path, max_segment_age_hours=24, block_records=4)
+    assert len(reopened.query(file_path="data/input/a.pdf", limit=10)) == 10
+    assert len(reopened.query(file_path="data/input/a.pdf")) == 72
+
+
+def test_recovery_and_purge(tmp_path: Path) -> None:
+    """Ligne tronquée ignorée, segments expirés et blobs orphelins supprimés."""
+    trail = AuditTrail(tmp_path, max_segment_age_hours=24)
+    trail.append(_record(0, ["old.pdf"], config={"version": 1}))
+    trail.append(_record(30, ["new.pdf"], config={"version": 2}))
+    with open(trail.active_path, "ab") as f:
+        f.write(b'{"timestamp": "2025-03-02T')
+
+    trail = AuditTrail(tmp_path, max_segment_age_hours=24)
+    trail.append(_record(31, ["new.pdf"], config={"version": 2}))
+    assert len(trail.query(file_path="new.pdf")) == 2
+
+    deleted = trail.purge(START + timedelta(hours=10))
+    assert [d["records"] for d in deleted] == [1]
+    assert trail.query(file_path="old.pdf") == []
+    assert trail.get_stats()["blobs"] == 1
+
+
+def test_writers_sharing_a_trail(tmp_path: Path) -> None:
+    """Deux écrivains (processus distincts) : ni perte ni segment corrompu."""
+    writers = [AuditTrail(tmp_path, max_segment_age_hours=6) for _ in range(2)]
+
+    def write(trail: AuditTrail, parity: int) -> None:
+        for hour in range(parity, 80, 2):
+            trail.append(_record(hour, [f"doc_{hour}.pdf"]))
+
+    threads = [
+        threading.Thread(target=write, args=(trail, parity))
+        for parity, trail in enumerate(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Chaque instance voit les ajouts et rotations de l'autre
+    for trail in writers:
+        records = trail.query()
+        assert sorted(r["metadata"]["files_processed"][0] for r in records) == sorted(
+            f"doc_{hour}.pdf" for hour in range(80)
+        )
+    stats = AuditTrail(tmp_path).get_stats()
+    assert stats["sealed_records"] + stats["active_records"] == 80
+    assert stats["segments"] >= 2
@@ -0,0 +1,103 @@
+"""Tests de la suite de benchmarks (corpus synthétique, comparaison)."""
+
+import copy
+from pathlib import Path
+
+import pytest
+
+from benchmarks.bench_pipeline import compare_results
+from benchmarks.corpus_generator import FORMATS, CorpusSpec, generate_corpus
+from rag_framework.exceptions import ValidationError
+from rag_framework.utils.pii_scanner import scan_texts
+
+
+def test_corpus_is_reproducible(tmp_path: Path) -> None:
+    """Même spécification, mêmes octets ; tous les formats, PII détectables."""
+    config = {
+        "documents": 10,
+        "seed": 3,
+        "formats": dict.fromkeys(FORMATS, 1.0),
+        "size_median_kb": 2,
+        "size_sigma": 0.5,
+        "pii_per_1000_words": 20,
+        "scanned_max_pages": 1,
+        "scanned_dpi": 60,
+    }
+    first = generate_corpus(CorpusSpec.from_config(config), tmp_path / "a")
+    second = generate_corpus(CorpusSpec.from_config(config), tmp_path / "b")
+    assert first["fingerprint"] == second["fingerprint"]
+    for document in first["documents"]:
+        name = document["path"]
+        assert (tmp_path / "a" / name).read_bytes() == (
+            tmp_path / "b" / name
+        ).read_bytes()
+
+    other = generate_corpus(
+        CorpusSpec.from_config({**config, "seed": 4}), tmp_path / "c"
+    )
+    assert other["fingerprint"] != first["fingerprint"]
+
+    assert first["totals"]["documents"] == 10
+    assert len(first["totals"]["formats"]) > 3
+    assert sum(first["totals"]["pii"].values()) > 0
+    markdown = [d for d in first["documents"] if d["format"] in ("md", "csv")]
+    assert markdown
+    # Les PII insérées sont valides (clés de contrôle) : le scanner les trouve
+    for document in markdown:
+        text = (tmp_path / "a" / document["path"]).read_text(encoding="utf-8")
+        found = sum(scan_texts([text])[0].values())
+        assert found >= sum(document["pii"].values())
+
+    with pytest.raises(ValidationError):
+        CorpusSpec.from_config({"formats": {"odt": 1.0}})
+
+
+def _results(pipeline_seconds: float, rss_mb: float, chunks: int) -> dict:
+    case = {
+        "seconds": {"p50": 0.01},
+        "peak_rss_mb": 200.0,
+        "rss_growth_mb": 1.0,
+        "outputs": {},
+    }
+    return {
+        "corpus": {"fingerprint": "abc"},
+        "environment": {"python": "3.11", "machine": "x86_64", "cpu_count": 8},
+        "results": {
+            "pipeline": {
+                "seconds": {"p50": pipeline_seconds},
+                "document_latency_seconds": {"p95": 0.2},
+                "peak_rss_mb": rss_mb,
+                "outputs": {"documents": 10, "chunks": chunks},
+            },
+            "steps": {"ChunkingStep": case, "EmbeddingStep": copy.deepcopy(case)},
+        },
+    }
+
+
+def test_compare_flags_regressions() -> None:
+    """Tolérance relative, plancher de bruit, volumes et corpus comparés."""
+    baseline = _results(pipeline_seconds=10.0, rss_mb=300.0, chunks=400)
+
+    same = compare_results(_results(10.5, 310.0, 400), baseline)
+    assert same["regressions"] == 0
+    assert same["warnings"] == []
+
+    current = _results(pipeline_seconds=12.0, rss_mb=400.0, chunks=398)
+    # Étape très courte : x3 mais sous le plancher min_seconds
+    current["results"]["steps"]["ChunkingStep"]["seconds"]["p50"] = 0.03
+    del current["results"]["steps"]["EmbeddingStep"]
+    current["corpus"]["fingerprint"] = "def"
+    comparison = compare_results(current, baseline, {"tolerance": 0.1})
+    statuses = {(r["case"], r["metric"]): r["status"] for r in comparison["rows"]}
+
+    assert comparison["regressions"] == 2
+    assert statuses[("pipeline", "seconds.p50")] == "regression"
+    assert statuses[("pipeline", "peak_rss_mb")] == "regression"
+    assert statuses[("pipeline", "document_latency_seconds.p95")] == "ok"
+    assert statuses[("pipeline", "outputs.chunks")] == "changed"
+    assert statuses[("steps/ChunkingStep", "seconds.p50")] == "ok"
+    assert statuses[("steps/EmbeddingStep", "-")] == "missing"
+    assert any("Corpus" in warning for warning in comparison["warnings"])
+
+    faster = compare_results(_results(5.0, 300.0, 400), baseline)
+    assert faster["rows"][0]["status"] == "improvement"
@@ -0,0 +1,162 @@
+"""Tests pour les checkpoints et la reprise des exécutions du pipeline."""
+
+from pathlib import Path
+from typing import Any, ClassVar
+
+import pytest
+
+from rag_framework.config import GlobalConfig
+from rag_framework.exceptions import RAGFrameworkError
+from rag_framework.pipeline import RAGPipeline
+from rag_framework.profiling import ProfilingSettings
+from rag_framework.steps.base_step import BaseStep
+from rag_framework.types import StepData
+from rag_framework.utils.checkpoint import CheckpointStore
+
+
+class ChunkingStep(BaseStep):
+    """Étape factice produisant des chunks répartis sur plusieurs documents."""
+
+    calls = 0
+
+    def validate_config(self) -> None:
+        """Aucune configuration."""
+
+    def execute(self, data: StepData) -> StepData:
+        """Produit 10 chunks (2 documents)."""
+        ChunkingStep.calls += 1
+        data["chunks"] = [
+            {"text": f"c{i}", "source_file": f"doc{i // 5}"} for i in range(10)
+        ]
+        return data
+
+
+class EmbeddingStep(BaseStep):
+    """Étape factice pouvant échouer sur un chunk donné."""
+
+    fail_on: str = ""
+    seen: ClassVar[list[str]] = []
+
+    def validate_config(self) -> None:
+        """Aucune configuration."""
+
+    def execute(self, data: StepData) -> StepData:
+        """Vectorise les chunks (échoue si ``fail_on`` est présent)."""
+        texts = [chunk["text"] for chunk in data["enriched_chunks"]]
+        if EmbeddingStep.fail_on in texts:
+            raise RuntimeError("modèle indisponible")
+        EmbeddingStep.seen.extend(texts)
+        data["embedded_chunks"] = [
+            {**chunk, "embedding": [1.0]} for chunk in data["enriched_chunks"]
+        ]
+        return data
+
+
+class EnrichmentStep(BaseStep):
+    """Étape factice recopiant les chunks."""
+
+    def validate_config(self) -> None:
+        """Aucune configuration."""
+
+    def execute(self, data: StepData) -> StepData:
+        """Recopie les chunks."""
+        data["enriched_chunks"] = list(data["chunks"])
+        return data
+
+
+def make_pipeline(tmp_path: Path, sub_batch_size: int = 2) -> RAGPipeline:
+    """Pipeline minimal sans chargement de configuration."""
+    pipeline = RAGPipeline.__new__(RAGPipeline)
+    pipeline.global_config = GlobalConfig()
+    config: dict[str, Any] = {}
+    pipeline.steps = [ChunkingStep(config), EnrichmentStep(config)]
+    pipeline.steps.append(EmbeddingStep(config))
+    pipeline.checkpoint_store = CheckpointStore(tmp_path / "checkpoints")
+    pipeline.sub_batch_size = sub_batch_size
+    pipeline.run_id = None
+    pipeline.profiling = ProfilingSettings()
+    pipeline._profiler = None
+    return pipeline
+
+
+def test_object_store_is_content_addressed(tmp_path: Path) -> None:
+    """Une même valeur n'est stockée qu'une fois."""
+    store = CheckpointStore(tmp_path)
+    value = [{"text": "a", "metadata": {"pages": 3}}]
+
+    digest = store.put_object(value)
+
+    assert store.put_object(list(value)) == digest
+    assert store.get_object(digest) == value
+    assert len(list(store.objects_dir.glob("*/*"))) == 1
+
+
+def test_sub_batches_never_split_a_document(tmp_path: Path) -> None:
+    """Les sous-batches s'étendent jusqu'à la fin du document courant."""
+    pipeline = make_pipeline(tmp_path, sub_batch_size=2)
+    chunks = [{"source_file": f"doc{i // 5}"} for i in range(10)]
+
+    assert pipeline._plan_sub_batches(chunks) == [(0, 5), (5, 10)]
+
+
+def test_resume_skips_completed_stages_and_sub_batches(tmp_path: Path) -> None:
+    """La reprise ne rejoue ni les étapes ni les sous-batches terminés."""
+    pipeline = make_pipeline(tmp_path, sub_batch_size=5)
+    ChunkingStep.calls = 0
+    EmbeddingStep.seen = []
+    EmbeddingStep.fail_on = "c7"
+
+    with pytest.raises(RAGFrameworkError) as exc_info:
+        pipeline.execute()
+    run_id = exc_info.value.details["run_id"]
+    assert EmbeddingStep.seen == ["c0", "c1", "c2", "c3", "c4"]
+
+    EmbeddingStep.fail_on = ""
+    result = pipeline.execute(resume=True)
+
+    assert pipeline.run_id == run_id
+    assert ChunkingStep.calls == 1
+    assert EmbeddingStep.seen == [f"c{i}" for i in range(10)]
+    assert [c["text"] for c in result["embedded_chunks"]] == [
+        f"c{i}" for i in range(10)
+    ]
+    # Exécution terminée : manifeste et objets supprimés
+    assert pipeline.checkpoint_store is not None
+    assert pipeline.checkpoint_store.list_runs() == []
+    assert list(pipeline.checkpoint_store.objects_dir.glob("*/*")) == []
+
+
+def test_release_keeps_objects_pinned_by_another_store(tmp_path: Path) -> None:
+    """Un objet écrit mais pas encore référencé n'est pas supprimé."""
+    writer = CheckpointStore(tmp_path)
+    cleaner = CheckpointStore(tmp_path)
+    value = [{"text": "partagé"}]
+    cleaner.start_run("ancienne")
+    cleaner.save_stage("ancienne", "ChunkingStep", {"chunks": value})
+
+    # Autre pipeline du processus : objet écrit, manifeste pas encore écrit
+    digest = writer.put_object(value, pin=True)
+    cleaner.delete_run("ancienne")
+    assert writer.get_object(digest) == value
+
+    writer._unpin([digest])
+    cleaner.start_run("suivante")
+    cleaner.save_stage("suivante", "ChunkingStep", {"chunks": value})
+    assert cleaner.delete_run("suivante") == 1
+
+
+def test_expired_failed_runs_are_purged_after_each_run(tmp_path: Path) -> None:
+    """Un processus long récupère les exécutions en échec expirées."""
+    pipeline = make_pipeline(tmp_path)
+    store = pipeline.checkpoint_store
+    assert store is not None
+    store.start_run("abandonnee")
+    store.save_stage("abandonnee", "ChunkingStep", {"chunks": ["orphelin"]})
+    store.fail_run("abandonnee", "EmbeddingStep", "panne")
+    store.max_age_days = 0
+    EmbeddingStep.fail_on = ""
+
+    pipeline.execute()
+
+    assert store.list_runs() == []
+    assert list(store.objects_dir.glob("*/*")) == []
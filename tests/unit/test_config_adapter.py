@@ -0,0 +1,62 @@
+"""Tests pour la conversion de 02_preprocessing.yaml vers FallbackManager."""
+
+from pathlib import Path
+from typing import Any
+
+from rag_framework.config import load_yaml_config
+from rag_framework.config_adapter import convert_parser_to_fallback_config
+
+
+def _extractor(fallback: dict[str, Any], name: str) -> dict[str, Any]:
+    extractors = fallback["fallback"]["extractors"]
+    entry: dict[str, Any] = next(e for e in extractors if e["name"] == name)
+    return entry
+
+
+def test_ocr_pool_settings_read_from_config() -> None:
+    """Le pool OCR de 02_preprocessing.yaml est transmis à OCRExtractor."""
+    fallback = convert_parser_to_fallback_config(
+        load_yaml_config(Path("config/02_preprocessing.yaml"))
+    )
+
+    config = _extractor(fallback, "ocr")["config"]
+    assert config["lang"] == "fra+eng"
+    assert config["workers"] is None
+    assert config["page_window"] == 4
+    assert config["omp_thread_limit"] == 1
+
+
+def test_ocr_chain_pool_settings_passed_through() -> None:
+    """Images (ocr_chain) : paramètres du pool transmis, absents sinon."""
+    parser_config = {
+        "preprocessing": {
+            "file_categories": {
+                "images": {
+                    "enabled": True,
+                    "ocr_chain": [
+                        {
+                            "engine": "tesseract",
+                            "language": "fra",
+                            "workers": 2,
+                            "page_window": 8,
+                            "omp_thread_limit": 2,
+                            "timeout_seconds": 30,
+                        }
+                    ],
+                }
+            }
+        }
+    }
+
+    entry = _extractor(convert_parser_to_fallback_config(parser_config), "ocr")
+
+    assert entry["timeout_seconds"] == 30
+    assert entry["config"] == {
+        "lang": "fra",
+        "psm": 3,
+        "preprocess": True,
+        "min_confidence": 0.5,
+        "workers": 2,
+        "page_window": 8,
+        "omp_thread_limit": 2,
+    }
@@ -0,0 +1,80 @@
+"""Tests pour le cache des extractions adressé par contenu."""
+
+from pathlib import Path
+
+from rag_framework.extractors.base import ExtractionResult
+from rag_framework.extractors.extraction_cache import (
+    ExtractionCache,
+    ExtractionCacheSettings,
+    rebind_metadata,
+)
+
+
+def _result(text: str) -> ExtractionResult:
+    return ExtractionResult(
+        text=text,
+        success=True,
+        extractor_name="pymupdf",
+        metadata={"pages": 2},
+        confidence_score=0.9,
+    )
+
+
+def test_identical_content_hits_cache(tmp_path: Path) -> None:
+    """Deux fichiers au contenu identique partagent la même entrée."""
+    settings = ExtractionCacheSettings(enabled=True, cache_dir=str(tmp_path / "c"))
+    cache = ExtractionCache(settings, signature="abc")
+    first = tmp_path / "inbox_a" / "facture.pdf"
+    copy = tmp_path / "inbox_b" / "copie.pdf"
+    for path in (first, copy):
+        path.parent.mkdir()
+        path.write_bytes(b"%PDF-1.4 contenu identique")
+
+    key = cache.key(first)
+    assert cache.get(key) is None
+    cache.put(key, _result("Texte de la facture"), "pymupdf", seconds=3.0)
+
+    cached = ExtractionCache(settings, signature="abc").get(cache.key(copy))
+    assert cached is not None
+    result, name = cached
+    assert name == "pymupdf"
+    assert result.text == "Texte de la facture"
+    assert result.metadata == {"pages": 2}
+    assert result.confidence_score == 0.9
+
+    # Clés propres au fichier : celles de la copie, pas de l'original
+    stored = {"file_name": "facture.pdf", "file_size": 1, "pages": 2}
+    assert rebind_metadata(stored, copy) == {
+        "file_name": "copie.pdf",
+        "file_size": copy.stat().st_size,
+        "pages": 2,
+    }
+    assert stored["file_name"] == "facture.pdf"
+
+    # Autre configuration d'extraction : pas de réutilisation
+    assert ExtractionCache(settings, signature="xyz").key(copy) != key
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (0, 1, 1)
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Au-delà du quota, l'entrée la moins récemment lue est évincée."""
+    settings = ExtractionCacheSettings(
+        enabled=True, cache_dir=str(tmp_path), max_size_mb=0.0007, compression_level=0
+    )
+    cache = ExtractionCache(settings)
+    text = "x" * 150  # ~300 octets par entrée : deux entrées tiennent
+
+    cache.put("a" * 64, _result(text), "pymupdf")
+    cache.put("b" * 64, _result(text), "pymupdf")
+    assert cache.get("a" * 64) is not None  # "a" devient la plus récente
+    cache.put("c" * 64, _result(text), "pymupdf")
+
+    assert cache.get("b" * 64) is None
+    assert cache.get("a" * 64) is not None
+    assert cache.get("c" * 64) is not None
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["hit_rate"] == 0.75
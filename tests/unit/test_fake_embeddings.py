@@ -0,0 +1,70 @@
+"""Tests pour l'embedder factice déterministe."""
+
+import subprocess
+import sys
+
+import numpy as np
+
+from rag_framework.models.fake_embeddings import FakeEmbedder, FakeEmbeddingSettings
+from rag_framework.steps.step_06_embedding import EmbeddingStep
+
+
+def test_embeddings_are_deterministic_and_batch_independent() -> None:
+    """Un texte donne le même vecteur quel que soit le batch qui le contient."""
+    embedder = FakeEmbedder(FakeEmbeddingSettings(dimensions=64))
+    texts = [f"chunk {i}" for i in range(100)]
+
+    matrix = embedder.embed_matrix(texts)
+    single = embedder.embed_matrix(["chunk 42"])
+
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (100, 64)
+    np.testing.assert_array_equal(matrix[42], single[0])
+    assert abs(float(matrix.mean())) < 0.05
+    assert abs(float(matrix.std()) - 1.0) < 0.05
+
+
+def test_embeddings_are_stable_across_processes() -> None:
+    """Les vecteurs ne dépendent pas de la randomisation de hash() du processus."""
+    code = (
+        "from rag_framework.models.fake_embeddings import FakeEmbedder;"
+        "print(FakeEmbedder().embed_matrix(['stable'])[0, :4].tolist())"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={"PYTHONHASHSEED": str(seed)},
+        ).stdout
+        for seed in (1, 2)
+    }
+    assert len(outputs) == 1
+
+
+def test_cluster_structure_gives_ann_ground_truth() -> None:
+    """Le plus proche voisin d'un vecteur appartient à son cluster."""
+    settings = FakeEmbeddingSettings(
+        dimensions=32, n_clusters=8, cluster_spread=0.2, normalize=True
+    )
+    embedder = FakeEmbedder(settings)
+    texts = [f"doc {i}" for i in range(400)]
+
+    matrix = embedder.embed_matrix(texts)
+    clusters = embedder.cluster_of(texts)
+    scores = matrix @ matrix.T
+    np.fill_diagonal(scores, -np.inf)
+
+    assert np.all(clusters[scores.argmax(axis=1)] == clusters)
+
+
+def test_embedding_step_fake_provider() -> None:
+    """Le provider "fake" de l'étape 06 utilise la dimension configurée."""
+    step = EmbeddingStep({"provider": "fake", "model": "fake", "dimensions": 16})
+
+    result = step.execute({"enriched_chunks": [{"text": "a"}, {"text": "b"}]})
+
+    chunks = result["embedded_chunks"]
+    assert [c["embedding_dimensions"] for c in chunks] == [16, 16]
+    assert chunks[0]["embedding"] == step.fake_embedder.embed(["a"])[0]  # type: ignore[union-attr]
@@ -0,0 +1,63 @@
+"""Tests du parcours des répertoires surveillés en une passe."""
+
+from pathlib import Path
+
+from rag_framework.utils.file_scanner import FileScanner
+
+PATTERNS = ["*.pdf", "*.txt", "rapport*", "archives/*.csv"]
+EXCLUDES = ["*_tmp*", "*.bak"]
+
+
+def _tree(root: Path) -> None:
+    for relative in [
+        "rapport.pdf",  # deux patterns : retourné une fois
+        "notes.txt",
+        "brouillon_tmp.txt",
+        "image.png",
+        "a/b/c/profond.pdf",
+        "a/b/ancien.pdf.bak",
+        "archives/export.csv",
+        "autres/export.csv",
+        ".git/objects/pack.pdf",
+        "x_tmp/inclus.pdf",  # exclusions sur le nom du fichier seulement
+    ]:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    (root / "dossier.pdf").mkdir()
+
+
+def _legacy_scan(root: Path) -> set[Path]:
+    """Ancien parcours : un rglob par pattern, exclusions par Path.match."""
+    found = set()
+    for pattern in PATTERNS:
+        for path in root.rglob(pattern):
+            if path.is_file() and not any(path.match(e) for e in EXCLUDES):
+                found.add(path)
+    return found
+
+
+def test_single_walk_matches_legacy_scan(tmp_path: Path) -> None:
+    """Mêmes fichiers que rglob, sans doublon, répertoires exclus élagués."""
+    _tree(tmp_path)
+    scanner = FileScanner(PATTERNS, EXCLUDES)
+    found = scanner.scan([tmp_path])
+
+    assert len(found) == len(set(found))
+    assert set(found) == _legacy_scan(tmp_path)
+
+    pruned = FileScanner(PATTERNS, EXCLUDES, exclude_dirs=[".git"]).scan([tmp_path])
+    assert set(found) - set(pruned) == {tmp_path / ".git/objects/pack.pdf"}
+    assert scanner.matches(tmp_path / "archives" / "export.csv")
+    assert not scanner.matches(tmp_path / "autres" / "export.csv")
+
+
+def test_threads_and_nested_roots(tmp_path: Path) -> None:
+    """Parcours parallèle identique ; racines imbriquées dédupliquées."""
+    _tree(tmp_path)
+    sequential = FileScanner(PATTERNS, EXCLUDES).scan([tmp_path])
+    threaded = FileScanner(PATTERNS, EXCLUDES, workers=4).scan(
+        [tmp_path, tmp_path / "a", tmp_path / "inexistant"]
+    )
+
+    assert threaded == sequential
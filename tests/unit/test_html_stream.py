@@ -0,0 +1,59 @@
+"""Tests pour l'extraction HTML en une passe (moteur stream)."""
+
+from pathlib import Path
+
+import pytest
+
+from rag_framework.extractors.html_extractor import HTMLExtractor
+
+PAGE = """<!DOCTYPE html><html><head><title>Rapport annuel 2025</title>
+<meta name="description" content="Synthèse annuelle">
+<meta property="og:title" content="Titre OG"><script>var x = 1;</script></head>
+<body><header><h1>Bandeau</h1></header><nav><a href="/menu">Menu</a></nav>
+<h1>Synthèse &amp; perspectives</h1>
+<p>Le budget <b>progresse</b> (<a href="https://exemple.fr/budget">détail</a>).</p>
+<!-- commentaire --><div>Texte libre<br>sur deux lignes</div>
+<ul><li>Premier<ul><li>Imbriqué</li></ul></li><li>Second <p>paragraphe</p></li></ul>
+<blockquote><p>Citation</p> suite</blockquote>
+<img src="graphe.png" alt="Graphe"><img src="logo.png"><a href="#haut">haut</a>
+<p>Non fermé<p>suivant<footer>Pied de page</footer></body></html>"""
+
+
+@pytest.fixture
+def page(tmp_path: Path) -> Path:
+    """Page HTML couvrant titres, listes imbriquées, liens et balises meta."""
+    path = tmp_path / "rapport.html"
+    path.write_text(PAGE, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("preserve_structure", [False, True])
+def test_stream_engine_matches_beautifulsoup(
+    page: Path, preserve_structure: bool
+) -> None:
+    """Texte, liens, images et métadonnées identiques aux deux moteurs."""
+    config = {
+        "preserve_structure": preserve_structure,
+        "extract_links": True,
+        "extract_images": True,
+    }
+    soup = HTMLExtractor({**config, "engine": "beautifulsoup"}).extract(page)
+    stream = HTMLExtractor({**config, "engine": "stream"}).extract(page)
+
+    assert stream.success
+    assert stream.text == soup.text
+    assert stream.metadata["engine"] == "stream"
+    for key in ("title", "description", "links_count", "images_count"):
+        assert stream.metadata[key] == soup.metadata[key]
+    assert "Bandeau" not in stream.text
+    assert "- détail: https://exemple.fr/budget" in stream.text
+
+
+def test_auto_engine_uses_size_threshold(page: Path) -> None:
+    """En mode auto, seuls les fichiers au-delà du seuil passent en stream."""
+    small = HTMLExtractor({"stream_threshold_kb": 64}).extract(page)
+    large = HTMLExtractor({"stream_threshold_kb": 0.5}).extract(page)
+
+    assert small.metadata["extractor"] == "beautifulsoup"
+    assert large.metadata["engine"] == "stream"
+    assert large.metadata["title"] == "Rapport annuel 2025"
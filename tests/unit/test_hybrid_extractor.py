@@ -0,0 +1,197 @@
+"""Tests pour le routage page par page de HybridExtractor."""
+
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+import fitz
+import pytest
+
+from rag_framework.config import load_yaml_config
+from rag_framework.config_adapter import convert_parser_to_fallback_config
+from rag_framework.extractors import page_ranges
+from rag_framework.extractors.base import BaseExtractor, ExtractionResult
+from rag_framework.extractors.fallback_manager import FallbackManager
+from rag_framework.extractors.hybrid_extractor import HybridExtractor
+
+NATIVE_TEXT = "Texte natif du rapport annuel. " * 10
+
+
+@pytest.fixture
+def mixed_pdf(tmp_path: Path) -> Path:
+    """PDF mixte : page native, page scannée (image seule), page vide, native."""
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), NATIVE_TEXT[:90])
+    doc[0].insert_text((72, 100), NATIVE_TEXT[90:])
+    scan = doc.new_page()
+    pixmap = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 60, 80), False)
+    pixmap.clear_with(200)
+    scan.insert_image(scan.rect, pixmap=pixmap)
+    doc.new_page()
+    doc.new_page().insert_text((72, 72), NATIVE_TEXT)
+    path = tmp_path / "mixte.pdf"
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def fake_tesseract(monkeypatch: pytest.MonkeyPatch) -> list[tuple[int, int]]:
+    """Remplace pytesseract ; retourne la taille des images OCRisées."""
+    sizes: list[tuple[int, int]] = []
+
+    def image_to_data(image: Any, **kwargs: Any) -> dict[str, list[Any]]:  # noqa: ANN401
+        sizes.append(image.size)
+        return {"text": ["scan", "OCRisé"], "conf": [91, 87]}
+
+    pytesseract = types.ModuleType("pytesseract")
+    pytesseract.image_to_data = image_to_data  # type: ignore[attr-defined]
+    pytesseract.Output = types.SimpleNamespace(DICT="dict")  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract)
+    return sizes
+
+
+def test_only_pages_without_text_layer_are_ocred(
+    mixed_pdf: Path, fake_tesseract: list[tuple[int, int]]
+) -> None:
+    """Seule la page scannée passe à l'OCR ; l'ordre de lecture est conservé."""
+    extractor = HybridExtractor(config={"workers": 1, "dpi": 72, "preprocess": False})
+
+    result = extractor.extract(mixed_pdf)
+
+    assert result.success
+    assert len(fake_tesseract) == 1
+    pages = result.text.split("\n\n")
+    assert [p.splitlines()[0] for p in pages] == [
+        "=== Page 1 ===",
+        "=== Page 2 ===",
+        "=== Page 4 ===",
+    ]
+    assert pages[1].endswith("scan OCRisé")
+    decisions = result.metadata["page_decisions"]
+    assert [d["route"] for d in decisions] == ["text", "ocr", "empty", "text"]
+    assert decisions[1]["reason"] == "no_text_layer"
+    assert decisions[1]["image_coverage"] > 0.9
+    assert result.metadata["routes"] == {"text": 2, "ocr": 1, "empty": 1}
+    assert result.metadata["engine_pages"] == [2]
+
+
+class TesseractNotFoundError(OSError):
+    """Réplique de l'erreur levée par pytesseract sans binaire tesseract."""
+
+
+@pytest.mark.parametrize("missing", ["module", "binary"])
+def test_native_pages_kept_when_ocr_is_unavailable(
+    mixed_pdf: Path, monkeypatch: pytest.MonkeyPatch, missing: str
+) -> None:
+    """Sans moteur OCR, les pages natives restent extraites et l'échec est tracé."""
+    if missing == "module":
+        monkeypatch.setitem(sys.modules, "pytesseract", None)
+    else:
+
+        def image_to_data(image: Any, **kwargs: Any) -> dict[str, list[Any]]:  # noqa: ANN401
+            raise TesseractNotFoundError("tesseract is not installed")
+
+        pytesseract = types.ModuleType("pytesseract")
+        pytesseract.image_to_data = image_to_data  # type: ignore[attr-defined]
+        pytesseract.Output = types.SimpleNamespace(DICT="dict")  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "pytesseract", pytesseract)
+    extractor = HybridExtractor(config={"workers": 1})
+
+    result = extractor.extract(mixed_pdf)
+
+    assert result.success
+    assert "=== Page 2 ===" not in result.text
+    assert "ocr" in result.metadata["engine_error"]
+    assert result.confidence_score < 0.95
+
+
+def test_large_native_pdf_read_by_parallel_page_ranges(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Configuration par défaut : un PDF de 210 pages est lu par plages."""
+    fallback = convert_parser_to_fallback_config(
+        load_yaml_config(Path("config/02_preprocessing.yaml"))
+    )
+    hybrid = next(
+        e for e in fallback["fallback"]["extractors"] if e["name"] == "hybrid"
+    )
+    calls: list[tuple[int, int]] = []
+
+    def map_in_processes(func: Any, items: Any, workers: int, *args: Any) -> Any:  # noqa: ANN401
+        calls.append((len(items), workers))
+        return map(func, items)
+
+    monkeypatch.setattr(page_ranges, "map_in_processes", map_in_processes)
+    monkeypatch.setattr(page_ranges.os, "cpu_count", lambda: 4)
+    doc = fitz.open()
+    for number in range(210):
+        doc.new_page().insert_text((72, 72), f"Page {number + 1}. {NATIVE_TEXT}")
+    path = tmp_path / "long.pdf"
+    doc.save(str(path))
+    doc.close()
+
+    result = HybridExtractor(config=hybrid["config"]).extract(path)
+
+    assert result.success
+    assert calls and calls[0][0] > 1 and calls[0][1] == 4
+    assert result.metadata["routes"] == {"text": 210}
+    assert result.text.split("\n\n")[-1].startswith("=== Page 210 ===\nPage 210.")
+
+
+class CountingOCR(BaseExtractor):
+    """Extracteur "ocr" factice comptant ses appels."""
+
+    calls = 0
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Extracteur nommé "ocr"."""
+        super().__init__(config)
+        self.name = "ocr"
+
+    def can_extract(self, file_path: Path) -> bool:
+        """Accepte tous les fichiers."""
+        return True
+
+    def extract(self, file_path: Path) -> ExtractionResult:
+        """Réussit."""
+        CountingOCR.calls += 1
+        return ExtractionResult("Texte OCRisé du document.", True, self.name, {})
+
+
+def test_ocr_fallback_skipped_after_hybrid_ocr(
+    mixed_pdf: Path,
+    fake_tesseract: list[tuple[int, int]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Les pages déjà OCRisées par l'hybride ne sont pas refaites par "ocr"."""
+    monkeypatch.setitem(FallbackManager.EXTRACTOR_CLASSES, "ocr", CountingOCR)
+    hybrid_config = {"workers": 1, "dpi": 72, "preprocess": False}
+    manager = FallbackManager(
+        {
+            "fallback": {
+                "enabled": True,
+                "extractors": [
+                    # Résultat rejeté (trop court) après l'OCR de la page 2
+                    {
+                        "name": "hybrid",
+                        "config": {**hybrid_config, "min_text_length": 10**6},
+                    },
+                    {"name": "ocr"},
+                ],
+            }
+        }
+    )
+    CountingOCR.calls = 0
+
+    with pytest.raises(RuntimeError, match="Déjà tenté par 'hybrid'"):
+        manager.extract_with_fallback(mixed_pdf)
+    assert len(fake_tesseract) == 1
+    assert CountingOCR.calls == 0
+
+    # Sans page scannée, l'hybride n'a pas sollicité l'OCR : fallback tenté
+    hybrid = HybridExtractor(config=hybrid_config)
+    rejected = ExtractionResult("", False, "hybrid", {"engine_pages": []})
+    assert hybrid.attempted_engines(rejected) == set()
+    assert hybrid.attempted_engines(None) == {"ocr"}
@@ -0,0 +1,80 @@
+"""Tests du chargement paresseux (temps d'import et démarrage rapide)."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from rag_framework.config import load_config
+from rag_framework.extractors.fallback_manager import FallbackManager
+from rag_framework.validation import DependencyValidator
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Dépendances lourdes des étapes, jamais chargées par ``import rag_framework``
+HEAVY_MODULES = {"chromadb", "watchdog", "psutil", "numpy", "pydantic", "yaml"}
+
+
+def _imported_modules(*args: str) -> tuple[dict[str, int], float]:
+    """Modules importés (durée cumulée en µs) par ``python -X importtime``."""
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    modules = {}
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                modules[name.strip()] = int(cumulative)
+    return modules, elapsed
+
+
+def test_package_import_is_lightweight() -> None:
+    """``import rag_framework`` ne charge ni les étapes ni leurs dépendances."""
+    modules, _ = _imported_modules("-c", "import rag_framework")
+
+    assert "rag_framework" in modules
+    assert not HEAVY_MODULES & {name.split(".")[0] for name in modules}
+    assert not any(name.startswith("rag_framework.steps") for name in modules)
+    # Budget large (machines de CI lentes) : ~1 ms en pratique
+    assert modules["rag_framework"] < 200_000
+
+
+def test_status_does_not_initialize_pipeline() -> None:
+    """``--status`` lit global.yaml sans importer les étapes."""
+    modules, elapsed = _imported_modules("-m", "rag_framework.cli.main", "--status")
+
+    assert "rag_framework.pipeline" in modules
+    assert not any(name.startswith("rag_framework.steps.step_") for name in modules)
+    assert "chromadb" not in modules
+    assert elapsed < 5.0
+
+
+def test_extractor_classes_resolved_on_first_use() -> None:
+    """Les classes d'extracteurs sont importées à la demande."""
+    extractor_class = FallbackManager.get_extractor_class("text")
+
+    assert extractor_class is not None
+    assert extractor_class.__name__ == "TextExtractor"
+    assert FallbackManager.EXTRACTOR_CLASSES["text"] is extractor_class
+    assert FallbackManager.get_extractor_class("inconnu") is None
+
+
+def test_dependency_check_does_not_import() -> None:
+    """La vérification des dépendances n'importe pas les modules."""
+    validator = DependencyValidator(load_config(ROOT / "config"))
+
+    assert validator._check_module("this")
+    assert "this" not in sys.modules
+    assert not validator._check_module("module_inexistant_xyz")
+
+
+def test_global_config_parsed_once() -> None:
+    """Les appels successifs partagent la configuration déjà validée."""
+    assert load_config(ROOT / "config") is load_config(ROOT / "config")
@@ -0,0 +1,63 @@
+"""Tests pour l'OCR par fenêtres de pages de OCRExtractor."""
+
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+from PIL import Image
+
+from rag_framework.extractors.ocr_extractor import OCRExtractor
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch: pytest.MonkeyPatch) -> list[tuple[int, int]]:
+    """Remplace pdf2image et pytesseract par des doubles en mémoire.
+
+    Chaque page rastérisée est une image dont la largeur encode son numéro ;
+    l'OCR factice renvoie ``page<N>``. Retourne la liste des fenêtres
+    rastérisées.
+    """
+    windows: list[tuple[int, int]] = []
+
+    def convert_from_path(
+        path: str, dpi: int, first_page: int, last_page: int
+    ) -> list[Any]:
+        windows.append((first_page, last_page))
+        return [Image.new("L", (page, 1)) for page in range(first_page, last_page + 1)]
+
+    def image_to_data(image: Any, **kwargs: Any) -> dict[str, list[Any]]:  # noqa: ANN401
+        return {"text": [f"page{image.width}", ""], "conf": [90, -1]}
+
+    pdf2image = types.ModuleType("pdf2image")
+    pdf2image.convert_from_path = convert_from_path  # type: ignore[attr-defined]
+    pdf2image.pdfinfo_from_path = lambda path: {"Pages": 10}  # type: ignore[attr-defined]
+    pytesseract = types.ModuleType("pytesseract")
+    pytesseract.image_to_data = image_to_data  # type: ignore[attr-defined]
+    pytesseract.Output = types.SimpleNamespace(DICT="dict")  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract)
+    return windows
+
+
+def test_pdf_pages_are_rasterized_in_windows(
+    fake_ocr: list[tuple[int, int]], tmp_path: Path
+) -> None:
+    """Les pages sont rastérisées par fenêtres bornées, dans l'ordre."""
+    pdf = tmp_path / "scan.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    extractor = OCRExtractor(
+        config={"workers": 1, "page_window": 4, "preprocess": False}
+    )
+
+    result = extractor.extract(pdf)
+
+    assert result.success
+    assert fake_ocr == [(1, 4), (5, 8), (9, 10)]
+    pages = result.text.split("\n\n")
+    assert pages[0] == "=== Page 1 ===\npage1"
+    assert pages[-1] == "=== Page 10 ===\npage10"
+    assert result.metadata["num_pages"] == 10
+    assert result.metadata["pages_per_second"] > 0
+    assert result.metadata["peak_rss_mb"] > 0
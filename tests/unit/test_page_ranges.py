@@ -0,0 +1,61 @@
+"""Tests pour l'extraction parallèle de PDF par plages de pages."""
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from rag_framework.extractors.page_ranges import join_pages, plan_page_ranges
+from rag_framework.extractors.pdfplumber_extractor import PdfPlumberExtractor
+from rag_framework.extractors.pymupdf_extractor import PyMuPDFExtractor
+
+
+@pytest.fixture(scope="module")
+def long_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """PDF de 30 pages de texte, dont une page blanche (page 12)."""
+    doc = fitz.open()
+    for number in range(1, 31):
+        page = doc.new_page()
+        if number != 12:
+            page.insert_text((72, 72), f"Article {number} du recueil réglementaire.")
+    path = tmp_path_factory.mktemp("pdf") / "recueil.pdf"
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_plan_page_ranges_covers_document() -> None:
+    """Les plages sont contiguës et couvrent toutes les pages."""
+    assert plan_page_ranges(10, workers=2, range_pages=4) == [(0, 4), (4, 8), (8, 10)]
+    ranges = plan_page_ranges(2000, workers=8)
+    assert ranges[0] == (0, 125)
+    assert ranges[-1][1] == 2000
+    assert len(ranges) == 16
+
+
+def test_join_pages_records_offsets() -> None:
+    """Les positions des pages délimitent exactement leur texte."""
+    text, offsets = join_pages([(1, "abc"), (2, ""), (3, "de")])
+
+    assert text == "abc\n\nde"
+    assert offsets == [[1, 0, 3], [3, 5, 7]]
+
+
+@pytest.mark.parametrize("extractor_class", [PyMuPDFExtractor, PdfPlumberExtractor])
+def test_parallel_extraction_matches_sequential(
+    extractor_class: type, long_pdf: Path
+) -> None:
+    """Extraction en processus par plages identique à l'extraction séquentielle."""
+    config = {"preserve_layout": False, "extract_tables": False}
+    sequential = extractor_class({**config, "workers": 1}).extract(long_pdf)
+    parallel = extractor_class(
+        {**config, "workers": 2, "parallel_min_pages": 1, "range_pages": 7}
+    ).extract(long_pdf)
+
+    assert sequential.success, sequential.error
+    assert parallel.text == sequential.text
+    offsets = parallel.metadata["page_offsets"]
+    assert offsets == sequential.metadata["page_offsets"]
+    assert [page for page, _, _ in offsets] == [n for n in range(1, 31) if n != 12]
+    start, end = offsets[-1][1:]
+    assert "Article 30 " in parallel.text[start:end]
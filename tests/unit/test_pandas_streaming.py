@@ -0,0 +1,80 @@
+"""Tests pour l'extraction en flux des gros fichiers CSV/Excel."""
+
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from rag_framework.extractors.pandas_extractor import PandasExtractor
+
+STREAMING = {"streaming": True, "read_chunk_rows": 7, "window_rows": 5}
+
+
+@pytest.fixture
+def ventes_csv(tmp_path: Path) -> Path:
+    """CSV de 23 lignes avec valeurs manquantes."""
+    lines = ["region,montant,commentaire"]
+    for i in range(23):
+        montant = "" if i % 4 == 0 else str(i * 10)
+        lines.append(f"R{i % 3},{montant},ligne {i}")
+    path = tmp_path / "ventes.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_windows_repeat_header(ventes_csv: Path) -> None:
+    """Chaque fenêtre porte l'en-tête et ses numéros de lignes."""
+    extractor = PandasExtractor(config={**STREAMING, "include_stats": False})
+
+    result = extractor.extract(ventes_csv)
+
+    assert result.success
+    windows = result.text.split("\n\n\n")
+    assert len(windows) == 5  # fenêtres de 5 lignes à cheval sur les blocs
+    assert windows[0].startswith("### ventes.csv — lignes 1-5\n\n")
+    assert windows[1].startswith("### ventes.csv — lignes 6-10\n\n")
+    assert windows[-1].startswith("### ventes.csv — lignes 21-23\n\n")
+    assert all("| region | montant | commentaire |" in w for w in windows)
+    assert "| R2 |  | ligne 20 |\n| R0 | 210 | ligne 21 |" in windows[-1]
+
+    assert result.metadata["streaming"] is True
+    assert result.metadata["rows"] == 23
+
+
+def test_streaming_stats_match_full_read(ventes_csv: Path) -> None:
+    """Les statistiques incrémentales égalent celles du fichier entier."""
+    import pandas as pd
+
+    extractor = PandasExtractor(config={**STREAMING, "max_rows_display": 3})
+
+    result = extractor.extract(ventes_csv)
+
+    expected = extractor._generate_stats(pd.read_csv(ventes_csv))
+    assert result.text.endswith(f"### Statistiques\n\n{expected}")
+    assert "- **Lignes**: 23" in expected
+    assert "  - montant: 6 (26.09%)" in expected
+    # max_rows_display limite l'affichage, pas les statistiques
+    assert result.metadata["windows"] == 2
+
+
+def test_xlsx_sheets_streamed(tmp_path: Path) -> None:
+    """Les feuilles Excel sont lues en lecture seule, fenêtre par fenêtre."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Budget"
+    sheet.append(["poste", None])
+    for i in range(12):
+        sheet.append([f"poste {i}", i])
+    workbook.create_sheet("Vide")
+    path = tmp_path / "budget.xlsx"
+    workbook.save(path)
+
+    result = PandasExtractor(config=STREAMING).extract(path)
+
+    assert result.success, result.error
+    windows = result.text.split("\n\n\n")
+    assert windows[0].startswith("### Budget — lignes 1-5\n\n| poste | Unnamed: 1 |")
+    assert windows[2].startswith("### Budget — lignes 11-12")
+    assert windows[-1].startswith("### Statistiques — Budget")
+    assert result.metadata["sheets"] == 1
+    assert result.metadata["total_rows"] == 12
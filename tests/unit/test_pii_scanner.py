@@ -0,0 +1,106 @@
+"""Tests du détecteur de PII en une passe avec clés de contrôle."""
+
+from pathlib import Path
+
+import pytest
+
+from rag_framework.steps.step_05_audit import AuditStep
+from rag_framework.utils.pii_scanner import (
+    PIIScanner,
+    iban_valid,
+    luhn_valid,
+    nir_valid,
+    scan_texts,
+)
+
+TEXT = (
+    "Contact: jean.dupont@example.fr, tél. +33 6 12 34 56 78. "
+    "Carte 4539 1488 0343 6467, référence 4532-1234-5678-9010. "
+    "IBAN FR76 3000 6000 0112 3456 7890 189, compte FR00 1234 5678 9012 3456. "
+    "Serveur 192.168.1.10, version 999.1.1.1, NIR 2 85 05 78 006 048 77."
+)
+
+
+@pytest.mark.parametrize(
+    ("validator", "valid", "invalid"),
+    [
+        (luhn_valid, "4539 1488 0343 6467", "4532-1234-5678-9010"),
+        (iban_valid, "FR76 3000 6000 0112 3456 7890 189", "FR00 1234 5678 9012 3456"),
+        (nir_valid, "2 85 05 78 006 048 77", "1 80 09 75 116 025 87"),
+        (nir_valid, "1 72 03 2A 012 345 05", "1 72 03 2A 012 345 06"),
+    ],
+)
+def test_checksum_validators(validator: object, valid: str, invalid: str) -> None:
+    """Les clés de contrôle distinguent les numéros valides des autres."""
+    assert validator(valid)  # type: ignore[operator]
+    assert not validator(invalid)  # type: ignore[operator]
+
+
+def test_single_pass_counts_validated_matches() -> None:
+    """Chaque occurrence valide est comptée une fois, sous un seul type."""
+    assert PIIScanner().count(TEXT) == {
+        "email": 1,
+        "phone_fr": 1,
+        "credit_card": 1,
+        "iban": 1,
+        "ip_address": 1,
+        "ssn_fr": 1,
+    }
+    # Sans validation, les faux positifs sont comptés
+    unvalidated = PIIScanner(validate=False).count(TEXT)
+    assert unvalidated["credit_card"] == 2
+    assert unvalidated["iban"] == 2
+
+
+def test_trigger_scan_matches_full_search() -> None:
+    """Le parcours par déclencheurs trouve les occurrences d'une recherche complète."""
+    scanner = PIIScanner()
+    texts = [
+        TEXT,
+        "(jean@ex.fr) x+33 6 12 34 56 78 tel:+44 20 7946 0958",
+        "a1b2@c.de 12.3.4.5 +++1 @@@ ip 10.0.0.1.",
+    ]
+    for text in texts:
+        expected = []
+        position = 0
+        assert scanner.pattern is not None
+        while (candidate := scanner.pattern.search(text, position)) is not None:
+            match = scanner._accept(candidate)
+            if match is None:
+                position = candidate.start() + 1
+                continue
+            expected.append((match.lastgroup, match.start(), match.group()))
+            position = match.end()
+        found = [(m.pii_type, m.start, m.value) for m in scanner.iter_matches(text)]
+        assert found == expected
+
+
+def test_scan_texts_in_processes() -> None:
+    """La répartition entre processus conserve l'ordre et les comptes."""
+    texts = [TEXT, "rien", "écrire à paul@example.org"] * 4
+    sequential = scan_texts(texts, categories=["email", "iban"])
+    parallel = scan_texts(
+        texts,
+        categories=["email", "iban"],
+        workers=2,
+        parallel_min_chars=0,
+        shard_chars=500,
+    )
+    assert parallel == sequential
+    assert sequential[:3] == [{"email": 1, "iban": 1}, {}, {"email": 1}]
+
+
+def test_audit_step_report(tmp_path: Path) -> None:
+    """Le rapport d'AuditStep agrège les comptes par chunk."""
+    step = AuditStep(
+        {
+            "audit_logging": {"log_file": str(tmp_path / "audit.jsonl")},
+            "pii_detection": {"enabled": True, "workers": 1},
+        }
+    )
+    report = step._detect_pii([{"text": TEXT}, {"text": "aucune donnée"}])
+
+    assert report["total_pii_found"] == 6
+    assert report["pii_types"]["phone_intl"] == 0
+    assert report["chunks_with_pii"] == [0]
+    assert report["checksums_validated"] is True
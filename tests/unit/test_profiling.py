@@ -0,0 +1,98 @@
+"""Tests du profilage des exécutions (portées, rapports, marqueurs)."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from rag_framework.profiling import (
+    Profiler,
+    ProfilingSettings,
+    get_active_profiler,
+    marker,
+)
+
+
+def _allocate(size: int) -> list[bytes]:
+    return [bytes(1024) for _ in range(size)]
+
+
+def _busy(seconds: float) -> int:
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for index in range(200):
+            total += index
+    return total
+
+
+def _extract(size: int) -> list[bytes]:
+    _busy(0.02)
+    return _allocate(size)
+
+
+def _step(kept: list[list[bytes]]) -> None:
+    """Étape factice : extracteur exécuté dans un thread, comme le fallback."""
+    profiler = get_active_profiler()
+    assert profiler is not None
+    for _ in range(3):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(profiler.call, "extractor.fake", _extract, 500)
+            kept.append(future.result())
+    _busy(0.05)
+
+
+def test_profiler_scopes_and_reports(tmp_path: Path) -> None:
+    """Mesures par étape et par extracteur, dossier de l'exécution complet."""
+    settings = ProfilingSettings(
+        enabled=True, output_dir=str(tmp_path), sample_interval_ms=1
+    )
+    kept: list[list[bytes]] = []
+    profiler = Profiler(settings, label="run/42").start()
+    assert get_active_profiler() is profiler
+    profiler.call("step.FakeStep", _step, kept)
+    output_dir = profiler.stop()
+    assert get_active_profiler() is None
+
+    assert output_dir.parent == tmp_path
+    assert output_dir.name.endswith("_run_42")
+    summary = json.loads((output_dir / "summary.json").read_text())
+    scopes = {scope["name"]: scope for scope in summary["scopes"]}
+    assert scopes["extractor.fake"]["calls"] == 3
+    assert scopes["step.FakeStep"]["calls"] == 1
+    # Temps inclusif : l'étape contient ses extracteurs
+    assert (
+        scopes["step.FakeStep"]["wall_seconds"]
+        >= scopes["extractor.fake"]["wall_seconds"] + 0.05
+    )
+    # ~1,5 MB retenus par les extracteurs (bytes(1024) x 500 x 3)
+    assert scopes["extractor.fake"]["traced_peak_mb"] >= 0.4
+    assert "test_profiling.py" in scopes["extractor.fake"]["top_allocation"]
+    assert "_busy" in scopes["step.FakeStep"]["top_function"]
+
+    for path in (
+        "summary.txt",
+        "cprofile/step.FakeStep.prof",
+        "cprofile/extractor.fake.txt",
+        "allocations/extractor.fake.txt",
+    ):
+        assert (output_dir / path).is_file(), path
+    assert "extractor.fake" in (output_dir / "summary.txt").read_text()
+
+    # Piles au format collapsed : « frame;frame;... nombre »
+    stacks = (output_dir / "stacks.collapsed").read_text().splitlines()
+    assert stacks
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in stacks)
+    assert any("rag_extractor[fake]" in line and "_busy" in line for line in stacks)
+
+
+def test_marker_frame_name() -> None:
+    """Le frame marqueur porte le nom de la portée (py-spy, cProfile)."""
+
+    def current_caller() -> str:
+        import sys
+
+        return sys._getframe(1).f_code.co_name
+
+    assert marker("rag_step[ChunkingStep]")(current_caller) == "rag_step[ChunkingStep]"
+    assert marker("rag_step[ChunkingStep]") is marker("rag_step[ChunkingStep]")
@@ -0,0 +1,87 @@
+"""Tests pour le client d'embeddings distant (batching, concurrence, retry)."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from benchmarks.embedding_stub_server import StubEmbeddingServer
+from rag_framework.exceptions import EmbeddingError
+from rag_framework.models.remote_embeddings import (
+    RemoteEmbeddingClient,
+    RemoteEmbeddingSettings,
+)
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubEmbeddingServer]:
+    """Serveur stub local démarré pour la durée du test."""
+    with StubEmbeddingServer(dimensions=8, latency_ms=5) as server:
+        yield server
+
+
+def make_client(
+    server: StubEmbeddingServer, protocol: str = "openai", **settings: float
+) -> RemoteEmbeddingClient:
+    """Crée un client pointant vers le serveur stub."""
+    base_url = f"{server.base_url}/v1" if protocol == "openai" else server.base_url
+    if protocol == "huggingface":
+        base_url = f"{server.base_url}/hf"
+    return RemoteEmbeddingClient(
+        protocol=protocol,
+        base_url=base_url,
+        model="stub",
+        settings=RemoteEmbeddingSettings(backoff_base=0.0, **settings),  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.parametrize("protocol", ["openai", "ollama", "huggingface"])
+def test_embed_preserves_order(stub_server: StubEmbeddingServer, protocol: str) -> None:
+    """Les embeddings sont renvoyés dans l'ordre des textes (tous protocoles)."""
+    texts = [f"texte {i}" for i in range(50)]
+    client = make_client(stub_server, protocol, max_batch_size=7, max_concurrency=4)
+
+    vectors = client.embed(texts)
+
+    assert vectors == [stub_server.vector_for(t) for t in texts]
+    assert client.stats["requests"] == 8  # ceil(50 / 7)
+
+
+def test_requests_are_concurrent(stub_server: StubEmbeddingServer) -> None:
+    """Plusieurs requêtes sont en vol simultanément."""
+    client = make_client(stub_server, max_batch_size=1, max_concurrency=4)
+    client.embed([f"t{i}" for i in range(16)])
+    assert stub_server.max_in_flight > 1
+
+
+def test_plan_batches_respects_token_limit() -> None:
+    """Le découpage respecte la limite de tokens, un texte géant reste seul."""
+    client = RemoteEmbeddingClient(
+        protocol="openai",
+        base_url="http://unused/v1",
+        model="stub",
+        settings=RemoteEmbeddingSettings(max_batch_size=10, max_batch_tokens=10),
+    )
+    texts = ["a" * 12, "b" * 12, "c" * 100, "d"]
+
+    assert client.plan_batches(texts) == [(0, 2), (2, 3), (3, 4)]
+
+
+def test_retry_on_transient_errors() -> None:
+    """Les réponses 429/503 sont rejouées jusqu'au succès."""
+    with StubEmbeddingServer(dimensions=4, error_rate=0.5, seed=1) as server:
+        client = make_client(server, max_batch_size=2, max_retries=10)
+        texts = [f"x{i}" for i in range(20)]
+
+        vectors = client.embed(texts)
+
+        assert vectors == [server.vector_for(t) for t in texts]
+        assert client.stats["retries"] == server.error_count > 0
+
+
+def test_non_retryable_error_raises() -> None:
+    """Une erreur 4xx non transitoire lève EmbeddingError sans retry."""
+    with StubEmbeddingServer(dimensions=4, max_batch_size=2) as server:
+        client = make_client(server, max_batch_size=5, max_retries=3)
+        with pytest.raises(EmbeddingError):
+            client.embed([f"x{i}" for i in range(5)])
+        assert client.stats["retries"] == 0
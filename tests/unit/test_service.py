@@ -0,0 +1,178 @@
+"""Tests du service d'ingestion (API HTTP, file bornée)."""
+
+import http.client
+import io
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, ClassVar, Optional
+
+import pytest
+
+from rag_framework.exceptions import ValidationError
+from rag_framework.service import IngestionService, ServiceSettings
+from rag_framework.types import StepData
+
+
+class _FakePipeline:
+    """Pipeline factice : attend ``release`` puis renvoie un document par fichier."""
+
+    # Contenu des fichiers lus pendant les exécutions
+    contents: ClassVar[dict[str, bytes]] = {}
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.release.set()
+        self.last_timings: dict[str, Any] = {}
+
+    def execute(self, input_data: Optional[StepData] = None) -> StepData:
+        self.release.wait(10)
+        files = list((input_data or {})["monitored_files"])
+        _FakePipeline.contents.update({f: Path(f).read_bytes() for f in files})
+        if any(f.endswith("casse.txt") for f in files):
+            raise RuntimeError("extraction impossible")
+        self.last_timings = {"wall_clock_seconds": 0.01, "steps": {"extraction": {}}}
+        return {"extracted_documents": [{"file_path": f} for f in files]}
+
+
+def _request(
+    url: str, data: Optional[bytes] = None, method: str = "GET"
+) -> tuple[int, dict[str, Any], Any]:
+    request = urllib.request.Request(url, data=data, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, dict(response.headers), json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), json.loads(e.read())
+
+
+def _wait_done(base_url: str, job_id: str) -> dict[str, Any]:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        _, _, job = _request(f"{base_url}/jobs/{job_id}")
+        if job["status"] in {"succeeded", "failed"}:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"Travail {job_id} non terminé")
+
+
+def _settings(tmp_path: Path, **overrides: Any) -> ServiceSettings:  # noqa: ANN401
+    inbox = tmp_path / "inbox"
+    inbox.mkdir(exist_ok=True)
+    return ServiceSettings(
+        port=0,
+        upload_dir=str(tmp_path / "uploads"),
+        allowed_roots=[str(inbox)],
+        token_env=None,
+        **overrides,
+    )
+
+
+def test_submit_paths_and_documents(tmp_path: Path) -> None:
+    """Soumission par chemin ou par contenu ; statut, résultat et temps."""
+    settings = _settings(tmp_path)
+    (tmp_path / "inbox" / "rapport.txt").write_text("contenu")
+    (tmp_path / "inbox" / "casse.txt").write_text("illisible")
+    (tmp_path / "secret.txt").write_text("hors racine")
+
+    with IngestionService(_FakePipeline, settings) as service:
+        base = service.base_url
+        status, headers, job = _request(
+            f"{base}/jobs",
+            json.dumps({"paths": [str(tmp_path / "inbox" / "rapport.txt")]}).encode(),
+            "POST",
+        )
+        assert status == 202
+        assert headers["Location"] == f"/jobs/{job['id']}"
+        job = _wait_done(base, job["id"])
+        assert job["status"] == "succeeded"
+        assert job["result"] == {"extracted_documents": 1}
+        assert job["timings"]["steps"] == {"extraction": {}}
+        assert job["latency_seconds"] >= job["queue_wait_seconds"] >= 0
+
+        status, _, job = _request(
+            f"{base}/documents?filename=../../note.txt", b"texte soumis", "POST"
+        )
+        assert status == 202
+        uploaded = Path(job["files"][0])
+        assert uploaded.parent.parent == tmp_path / "uploads"
+        assert _wait_done(base, job["id"])["status"] == "succeeded"
+        assert _FakePipeline.contents[str(uploaded)] == b"texte soumis"
+        # Travail terminé : répertoire du document supprimé
+        assert not uploaded.parent.exists()
+
+        _, _, job = _request(
+            f"{base}/jobs",
+            json.dumps({"paths": [str(tmp_path / "inbox" / "casse.txt")]}).encode(),
+            "POST",
+        )
+        failed = _wait_done(base, job["id"])
+        assert failed["error"] == "RuntimeError: extraction impossible"
+
+        forbidden = json.dumps({"paths": [str(tmp_path / "secret.txt")]}).encode()
+        assert _request(f"{base}/jobs", forbidden, "POST")[0] == 403
+        missing = json.dumps({"paths": [str(tmp_path / "inbox" / "absent.txt")]})
+        assert _request(f"{base}/jobs", missing.encode(), "POST")[0] == 400
+        assert _request(f"{base}/jobs/inconnu")[0] == 404
+
+        # Corps plus court qu'annoncé : refusé, aucun fichier conservé
+        with pytest.raises(ValidationError, match="tronqué"):
+            service.submit_document("court.txt", io.BytesIO(b"abc"), 10)
+        assert list((tmp_path / "uploads").iterdir()) == []
+        connection = http.client.HTTPConnection(*service.httpd.server_address[:2])
+        connection.putrequest("POST", "/documents?filename=a.txt")
+        connection.putheader("Content-Length", "abc")
+        connection.endheaders()
+        assert connection.getresponse().status == 400
+        connection.close()
+
+        stats = service.get_stats()
+        assert (stats["succeeded"], stats["failed"], stats["files_processed"]) == (
+            2,
+            1,
+            2,
+        )
+
+
+def test_backpressure_and_query_endpoint(tmp_path: Path) -> None:
+    """File pleine : 503 + Retry-After ; /query sans retriever : 501."""
+    settings = _settings(tmp_path, queue_size=2, retry_after_seconds=3)
+    pipeline = _FakePipeline()
+    pipeline.release.clear()
+    (tmp_path / "inbox" / "doc.txt").write_text("x")
+    body = json.dumps({"paths": [str(tmp_path / "inbox" / "doc.txt")]}).encode()
+
+    with IngestionService(lambda: pipeline, settings) as service:
+        base = service.base_url
+        # Un travail en cours + deux en file : le suivant est refusé
+        accepted = [_request(f"{base}/jobs", body, "POST")]
+        while service.get_stats()["running"] == 0:
+            time.sleep(0.01)
+        accepted += [_request(f"{base}/jobs", body, "POST") for _ in range(2)]
+        assert [status for status, _, _ in accepted] == [202, 202, 202]
+
+        status, headers, _ = _request(f"{base}/jobs", body, "POST")
+        assert (status, headers["Retry-After"]) == (503, "3")
+        status, _, _ = _request(f"{base}/documents?filename=a.txt", b"x", "POST")
+        assert status == 503
+        assert not (tmp_path / "uploads").exists()
+
+        query = json.dumps({"query": "conformité"}).encode()
+        assert _request(f"{base}/query", query, "POST")[0] == 501
+
+        # Erreur inattendue : réponse JSON 500, le service reste disponible
+        def failing_query(payload: dict[str, Any]) -> dict[str, Any]:
+            raise KeyError("index")
+
+        service.query_handler = failing_query
+        status, _, error = _request(f"{base}/query", query, "POST")
+        assert (status, error) == (500, {"error": "Erreur interne du service"})
+        assert _request(f"{base}/health")[0] == 200
+
+        pipeline.release.set()
+        for _, _, job in accepted:
+            assert _wait_done(base, job["id"])["status"] == "succeeded"
+        assert service.get_stats()["rejected"] == 2
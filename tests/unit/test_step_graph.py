@@ -0,0 +1,97 @@
+"""Tests pour l'ordonnancement des étapes en graphe de dépendances."""
+
+import time
+
+from rag_framework.config import GlobalConfig
+from rag_framework.pipeline import RAGPipeline
+from rag_framework.profiling import ProfilingSettings
+from rag_framework.steps import (
+    AuditStep,
+    ChunkingStep,
+    EmbeddingStep,
+    EnrichmentStep,
+    MonitoringStep,
+    NormalizationStep,
+    PreprocessingStep,
+    VectorStorageStep,
+)
+from rag_framework.steps.base_step import BaseStep
+from rag_framework.types import StepData
+from rag_framework.utils.step_graph import build_dependencies, critical_path
+
+
+def test_audit_branch_is_independent_of_embeddings() -> None:
+    """L'audit ne bloque ni n'attend la branche embeddings/normalisation."""
+    steps = [
+        MonitoringStep,
+        PreprocessingStep,
+        ChunkingStep,
+        EnrichmentStep,
+        AuditStep,
+        EmbeddingStep,
+        NormalizationStep,
+        VectorStorageStep,
+    ]
+    dependencies = build_dependencies(steps, [s.__name__ for s in steps])  # type: ignore[arg-type]
+
+    assert "EnrichmentStep" in dependencies["AuditStep"]
+    assert dependencies["EmbeddingStep"] == ["EnrichmentStep"]
+    assert "AuditStep" not in dependencies["NormalizationStep"]
+    assert "AuditStep" not in dependencies["VectorStorageStep"]
+
+
+def test_critical_path() -> None:
+    """Le chemin critique suit la chaîne de durée cumulée maximale."""
+    dependencies = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]}
+    durations = {"a": 1.0, "b": 0.5, "c": 2.0, "d": 1.0}
+
+    assert critical_path(dependencies, durations) == (["a", "c", "d"], 4.0)
+
+
+class SleepStep(BaseStep):
+    """Étape factice qui attend puis écrit une clé."""
+
+    def validate_config(self) -> None:
+        """Aucune configuration."""
+
+    def execute(self, data: StepData) -> StepData:
+        """Attend ``delay`` secondes puis écrit ses sorties."""
+        time.sleep(self.config["delay"])
+        for key in self.produces:
+            data[key] = sorted(k for k in data if k in self.consumes)
+        return data
+
+
+def make_step(name: str, consumes: tuple[str, ...], produces: tuple[str, ...]) -> type:
+    """Crée une classe d'étape factice avec ses déclarations."""
+    return type(name, (SleepStep,), {"consumes": consumes, "produces": produces})
+
+
+def test_independent_branches_run_concurrently() -> None:
+    """Deux branches indépendantes se chevauchent et leurs sorties fusionnent."""
+    source = make_step("Source", (), ("chunks",))
+    audit = make_step("Audit", ("chunks",), ("audit",))
+    embed = make_step("Embed", ("chunks",), ("vectors",))
+    store = make_step("Store", ("vectors",), ("stored",))
+
+    pipeline = RAGPipeline.__new__(RAGPipeline)
+    pipeline.global_config = GlobalConfig()
+    pipeline.global_config.performance.parallel_steps = True  # opt-in
+    pipeline.checkpoint_store = None
+    pipeline.profiling = ProfilingSettings()
+    pipeline._profiler = None
+    pipeline.steps = [
+        source({"delay": 0.0}),
+        audit({"delay": 0.3}),
+        embed({"delay": 0.1}),
+        store({"delay": 0.1}),
+    ]
+
+    result = pipeline.execute()
+
+    assert result["audit"] == ["chunks"]
+    assert result["stored"] == ["vectors"]
+    timings = pipeline.last_timings
+    assert timings["steps"]["Embed"]["start"] < timings["steps"]["Audit"]["end"]
+    assert timings["wall_clock_seconds"] < 0.45
+    assert timings["critical_path"] == ["Source", "Audit"]
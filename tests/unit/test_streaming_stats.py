@@ -0,0 +1,81 @@
+"""Tests des statistiques en flux et de l'export des métriques de l'étape 2."""
+
+import json
+import random
+from pathlib import Path
+
+from rag_framework.steps.step_02_preprocessing import MetricsCollector
+from rag_framework.utils.streaming_stats import QuantileSketch, ReservoirSample
+
+
+def test_sketch_quantiles_within_relative_accuracy() -> None:
+    """Quantiles à 1 % près, mémoire bornée, échantillon de taille fixe."""
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 1.5) for _ in range(50_000)] + [0.0] * 100
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert abs(sketch.quantile(q) - exact) <= 0.01 * exact
+    assert sketch.quantile(0.0) == 0.0
+    assert sketch.max == ordered[-1]
+    assert len(sketch._bins) < 2048
+
+    other = QuantileSketch(relative_accuracy=0.01)
+    other.add(1e6)
+    sketch.merge(other)
+    assert sketch.count == len(values) + 1
+    assert sketch.quantile(1.0) == 1e6
+
+    reservoir = ReservoirSample(5, seed=1)
+    for index in range(10_000):
+        reservoir.add(index)
+    assert len(reservoir.items) == 5
+    assert reservoir.seen == 10_000
+    assert max(reservoir.items) >= 5
+
+
+def test_collector_appends_jsonl_and_rotates(tmp_path: Path) -> None:
+    """Une ligne par export, sans relecture ; rotation et ancien format."""
+    export_path = tmp_path / "metrics.jsonl"
+    # Fichier au format historique (tableau JSON) : mis de côté
+    export_path.write_text(json.dumps([{"total_documents": 1}], indent=2))
+    collector = MetricsCollector(
+        {
+            "enabled": True,
+            "collect": ["processing_time", "parser_time", "error_count"],
+            "aggregation": {"compute_percentiles": True, "error_samples": 2},
+            "export_path": str(export_path),
+            "max_file_mb": 0.001,
+            "backup_count": 2,
+        }
+    )
+
+    for index in range(1, 101):
+        collector.record_document(
+            success=index % 10 != 0,
+            processing_time=index / 10,
+            parser_used="pymupdf",
+            text_length=1000,
+            file_size=2048,
+            error=None if index % 10 else f"erreur {index}",
+        )
+    summary = collector.get_summary()
+    assert summary["processing_time"]["total_seconds"] == 505.0
+    assert summary["processing_time"]["min_seconds"] == 0.1
+    assert abs(summary["processing_time"]["p95"] - 9.5) <= 0.1
+    assert summary["parser_usage"]["pymupdf"]["mean_time_seconds"] == 5.05
+    assert summary["errors"]["count"] == 10
+    assert len(summary["errors"]["samples"]) == 2
+
+    for _ in range(6):
+        collector.export_metrics()
+
+    rotated = sorted(p.name for p in tmp_path.iterdir())
+    assert rotated == ["metrics.jsonl", "metrics.jsonl.1", "metrics.jsonl.2"]
+    for path in tmp_path.iterdir():
+        for line in path.read_text().splitlines():
+            assert json.loads(line)["total_documents"] == 100
@@ -0,0 +1,92 @@
+"""Tests de l'instrumentation (métriques, spans, exports)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from rag_framework.exceptions import ConfigurationError
+from rag_framework.telemetry import (
+    SIZE_BUCKETS,
+    Telemetry,
+    TelemetrySettings,
+    render_prometheus,
+    to_otel_json,
+    write_prometheus_textfile,
+)
+
+
+def test_prometheus_exposition(tmp_path: Path) -> None:
+    """Compteurs et histogrammes au format texte, collecte désactivable."""
+    telemetry = Telemetry()
+    calls = telemetry.counter("rag_llm_calls_total", "Appels LLM")
+    batch = telemetry.histogram("rag_embedding_batch_size", "Batch", SIZE_BUCKETS)
+    calls.inc(status="ok")
+    calls.inc(2, status="ok")
+    calls.inc(status='rate "429"')
+    batch.observe(3)
+    batch.observe(100)
+
+    text = render_prometheus(telemetry)
+    assert "# TYPE rag_llm_calls_total counter" in text
+    assert 'rag_llm_calls_total{status="ok"} 3' in text
+    assert 'rag_llm_calls_total{status="rate \\"429\\""} 1' in text
+    assert 'rag_embedding_batch_size_bucket{le="2"} 0' in text
+    assert 'rag_embedding_batch_size_bucket{le="4"} 1' in text
+    assert 'rag_embedding_batch_size_bucket{le="+Inf"} 2' in text
+    assert "rag_embedding_batch_size_sum 103" in text
+    # Histogramme des spans sans observation : omis
+    assert "rag_span_duration_seconds" not in text
+
+    # Déclaration répétée : même instance ; autre type : refusée
+    assert telemetry.counter("rag_llm_calls_total") is calls
+    with pytest.raises(ConfigurationError):
+        telemetry.histogram("rag_llm_calls_total")
+
+    path = write_prometheus_textfile(tmp_path / "metrics" / "rag.prom", telemetry)
+    assert path.read_text(encoding="utf-8") == text
+
+    telemetry.configure(TelemetrySettings(enabled=False))
+    calls.inc(status="ok")
+    assert not telemetry.start_span("ignoré")
+    assert calls.value(status="ok") == 3
+
+
+def test_spans_nesting_and_otel_export() -> None:
+    """Spans rattachés à leur parent (contexte ou explicite), export OTLP/JSON."""
+    telemetry = Telemetry(TelemetrySettings(service_name="rag-test", max_spans=10))
+    run = telemetry.start_span("pipeline.run", run_id="r1")
+    with telemetry.span("step.PreprocessingStep", parent=run) as step:
+        document = telemetry.start_span("document.extract", file="a.pdf")
+        document.end(ValueError("illisible"))
+    run.end()
+
+    spans = telemetry.drain_spans()
+    assert [s.name for s in spans] == [
+        "document.extract",
+        "step.PreprocessingStep",
+        "pipeline.run",
+    ]
+    assert document.parent_id == step.span_id
+    assert step.parent_id == run.span_id
+    assert {s.trace_id for s in spans} == {run.trace_id}
+    assert telemetry.drain_spans() == []
+
+    payload = json.loads(json.dumps(to_otel_json(spans, telemetry)))
+    resource_spans = payload["resourceSpans"][0]
+    assert {"key": "service.name", "value": {"stringValue": "rag-test"}} in (
+        resource_spans["resource"]["attributes"]
+    )
+    exported = {s["name"]: s for s in resource_spans["scopeSpans"][0]["spans"]}
+    assert exported["document.extract"]["status"] == {
+        "code": 2,
+        "message": "ValueError: illisible",
+    }
+    assert exported["document.extract"]["parentSpanId"] == step.span_id
+    assert "parentSpanId" not in exported["pipeline.run"]
+
+    [metric] = payload["resourceMetrics"][0]["scopeMetrics"][0]["metrics"]
+    assert metric["name"] == "rag_span_duration_seconds"
+    points = metric["histogram"]["dataPoints"]
+    assert len(points) == 3
+    assert all(p["count"] == "1" for p in points)
@@ -0,0 +1,67 @@
+"""Tests pour la détection d'encodage et la lecture en une passe des textes."""
+
+import codecs
+from pathlib import Path
+
+import pytest
+
+from rag_framework.extractors.encoding import detect_encoding
+from rag_framework.extractors.text_extractor import TextExtractor
+
+CANDIDATES = ["utf-8", "latin-1", "cp1252"]
+TEXT = "Événement réseau détecté à 10h — coût : 15 € « urgent »\n"
+
+
+@pytest.mark.parametrize(
+    ("data", "expected", "method"),
+    [
+        (codecs.BOM_UTF8 + TEXT.encode("utf-8"), "utf-8-sig", "bom"),
+        (TEXT.encode("utf-16"), "utf-16", "bom"),
+        (b"plain ascii log line\n", "utf-8", "ascii"),
+        (TEXT.encode("utf-8"), "utf-8", "utf-8"),
+        ("Événement réseau détecté\n".encode("latin-1"), "latin-1", "statistical"),
+        (TEXT.encode("cp1252"), "cp1252", "statistical"),
+    ],
+)
+def test_detect_encoding(data: bytes, expected: str, method: str) -> None:
+    """BOM, validité UTF-8 puis repli statistique."""
+    guess = detect_encoding(data, CANDIDATES, complete=True)
+
+    assert (guess.encoding, guess.method) == (expected, method)
+
+
+def test_sample_may_cut_utf8_sequence() -> None:
+    """Une séquence UTF-8 coupée en fin d'échantillon reste valide."""
+    sample = TEXT.encode("utf-8")[:1]  # "É" coupé
+
+    assert detect_encoding(sample, CANDIDATES).encoding == "utf-8"
+    assert detect_encoding(sample, CANDIDATES, complete=True).encoding == "latin-1"
+
+
+def test_large_file_decoded_through_mmap(tmp_path: Path) -> None:
+    """Lecture via mmap identique au contenu."""
+    path = tmp_path / "journal.log"
+    path.write_text(TEXT * 5000, encoding="cp1252")
+    extractor = TextExtractor({"mmap_threshold_mb": 0.01, "sample_bytes": 4096})
+
+    result = extractor.extract(path)
+
+    assert result.success
+    assert result.metadata["encoding"] == "cp1252"
+    assert result.text == TEXT * 5000
+
+
+def test_invalid_byte_beyond_sample_falls_back(tmp_path: Path) -> None:
+    """Un octet non UTF-8 après l'échantillon déclenche un second décodage."""
+    path = tmp_path / "mixte.txt"
+    path.write_bytes(b"a" * 10_000 + "fin accentuée".encode("latin-1"))
+
+    result = TextExtractor({"sample_bytes": 1024}).extract(path)
+
+    assert result.success
+    assert result.text.endswith("fin accentuée")
+    assert result.metadata["encoding"] == "latin-1"
+    assert result.confidence_score < 1.0
+
+    only_utf8 = TextExtractor({"fallback_encodings": ["utf-8"]}).extract(path)
+    assert not only_utf8.success
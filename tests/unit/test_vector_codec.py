@@ -0,0 +1,60 @@
+"""Tests pour les formats compacts de vecteurs (float16, Matryoshka, int8)."""
+
+import numpy as np
+import pytest
+
+from rag_framework.exceptions import ValidationError
+from rag_framework.steps.step_07_normalization import NormalizationStep
+from rag_framework.utils.vector_codec import (
+    VectorFormat,
+    decode_vector,
+    encode_vector,
+    quantize_int8,
+)
+
+
+def test_quantize_int8_roundtrip() -> None:
+    """La quantification int8 reconstruit les vecteurs à l'échelle près."""
+    rng = np.random.default_rng(0)
+    matrix = rng.standard_normal((10, 64)).astype(np.float32)
+
+    quantized = quantize_int8(matrix)
+
+    assert quantized.codes.dtype == np.int8
+    assert np.abs(quantized.codes).max() == 127
+    error = np.abs(quantized.dequantize() - matrix).max(axis=1)
+    assert np.all(error <= quantized.scales / 2 + 1e-6)
+
+
+@pytest.mark.parametrize(("dtype", "tolerance"), [("float32", 1e-7), ("float16", 1e-3)])
+def test_encode_decode_vector(dtype: str, tolerance: float) -> None:
+    """Un vecteur encodé en base64 est restitué à la précision du format."""
+    vector = [0.1, -0.25, 0.5, 0.75]
+
+    decoded = decode_vector(encode_vector(vector, dtype))
+
+    assert decoded == pytest.approx(vector, abs=tolerance)
+
+
+def test_vector_format_validation() -> None:
+    """Les précisions et troncatures invalides sont rejetées."""
+    assert VectorFormat.from_config({"dtype": "int8"}).bytes_per_vector(1024) == 1028
+    with pytest.raises(ValidationError):
+        VectorFormat.from_config({"dtype": "int4"})
+    with pytest.raises(ValidationError):
+        VectorFormat.from_config({"truncate_dim": 0})
+
+
+def test_normalization_truncates_and_renormalizes() -> None:
+    """La troncature Matryoshka est suivie d'une renormalisation L2."""
+    step = NormalizationStep({"vector_format": {"truncate_dim": 2}})
+    chunks = [
+        {"text": "a", "source_file": "f.txt", "embedding": [3.0, 4.0, 12.0]},
+        {"text": "b", "source_file": "f.txt", "embedding": [1.0, 0.0, 5.0]},
+    ]
+
+    result = step.execute({"embedded_chunks": chunks})["normalized_chunks"]
+
+    assert result[0]["embedding"] == pytest.approx([0.6, 0.8])
+    assert result[1]["embedding"] == pytest.approx([1.0, 0.0])
+    assert result[0]["embedding_dimensions"] == 2
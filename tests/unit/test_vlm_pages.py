@@ -0,0 +1,158 @@
+"""Tests pour l'envoi concurrent et mis en cache des pages au VLM."""
+
+import base64
+import io
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from PIL import Image, ImageDraw
+
+from rag_framework.extractors.vlm_pages import (
+    RateLimiter,
+    VLMPageCache,
+    VLMPageRunner,
+    VLMPageSettings,
+    encode_image,
+)
+
+
+class FakeVLMClient:
+    """Client OpenAI-compatible factice : répond par la largeur de l'image."""
+
+    _model = "fake-vision"
+    _temperature = 0.0
+
+    def __init__(self) -> None:
+        """Initialise les compteurs."""
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, messages: list[dict[str, Any]], **kwargs: Any) -> Any:  # noqa: ANN401
+        """Décode l'image envoyée et renvoie son libellé."""
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        url = messages[0]["content"][1]["image_url"]["url"]
+        image = Image.open(io.BytesIO(base64.b64decode(url.split(",", 1)[1])))
+        time.sleep(0.05)
+        with self._lock:
+            self.in_flight -= 1
+        message = SimpleNamespace(content=f"{image.format} {image.width}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def page(label: int, scale: int = 1) -> Image.Image:
+    """Page synthétique distincte par ``label`` (bandes noires)."""
+    image = Image.new("RGB", (200 * scale, 280 * scale), "white")
+    draw = ImageDraw.Draw(image)
+    for i in range(label + 1):
+        top = (20 + 40 * i) * scale
+        draw.rectangle(
+            [20 * scale, top, (60 + 25 * i) * scale, top + 20 * scale], "black"
+        )
+    return image
+
+
+def test_encode_image_respects_pixel_budget() -> None:
+    """L'image est réduite au budget de pixels et encodée en JPEG."""
+    data, mime_type, size = encode_image(page(1, scale=10), max_pixels=100_000)
+
+    assert mime_type == "image/jpeg"
+    assert size[0] * size[1] <= 100_000
+    assert abs(size[0] / size[1] - 2000 / 2800) < 0.01
+    decoded = Image.open(io.BytesIO(base64.b64decode(data)))
+    assert decoded.format == "JPEG"
+    assert decoded.size == size
+
+
+def test_pages_sent_concurrently_in_order_and_cached(tmp_path: Path) -> None:
+    """Envoi concurrent ordonné ; une page inchangée n'est jamais renvoyée."""
+    client = FakeVLMClient()
+    settings = VLMPageSettings(
+        max_concurrency=4, max_pixels=20_000, cache_dir=str(tmp_path)
+    )
+    runner = VLMPageRunner(client, settings, prompt="Extract")
+
+    first = runner.extract(page(i) for i in range(6))
+
+    assert len(first) == 6
+    assert all(text and text.startswith("JPEG") for text in first)
+    assert client.calls == 6
+    assert client.max_in_flight > 1
+
+    # Ré-ingestion : pages re-rendues à l'identique, une page modifiée
+    runner = VLMPageRunner(client, settings, prompt="Extract")
+    again = runner.extract([page(0), page(1), page(9)])
+
+    assert again[:2] == first[:2]
+    assert client.calls == 7
+    assert runner.stats == {
+        "pages": 3,
+        "cache_hits": 2,
+        "requests": 1,
+        "bytes_sent": runner.stats["bytes_sent"],
+    }
+
+
+def test_cache_never_mixes_near_duplicate_pages(tmp_path: Path) -> None:
+    """Pages à l'empreinte perceptuelle identique : réutilisation opt-in."""
+    first = page(2)
+    second = first.copy()
+    second.putpixel((150, 200), (250, 250, 250))  # Invisible pour le dHash
+    client = FakeVLMClient()
+
+    settings = VLMPageSettings(max_pixels=20_000, cache_dir=str(tmp_path / "a"))
+    runner = VLMPageRunner(client, settings, prompt="Extract")
+    runner.extract([first, second])
+    assert runner.stats["cache_hits"] == 0
+    assert client.calls == 2
+
+    settings = VLMPageSettings(
+        max_pixels=20_000, cache_dir=str(tmp_path / "b"), near_duplicate_reuse=True
+    )
+    runner = VLMPageRunner(client, settings, prompt="Extract")
+    runner.extract([first])
+    runner.extract([second])
+    assert runner.stats["cache_hits"] == 1
+
+
+def test_cache_bounded_and_keyed_on_encoding(tmp_path: Path) -> None:
+    """Éviction LRU au-delà du quota ; autre qualité JPEG : nouvel appel."""
+    cache = VLMPageCache(tmp_path / "lru", max_size_mb=200 / 1024 / 1024)
+    for key in ("aa01", "bb02", "cc03"):
+        cache.put(key, "x" * 40)
+    assert cache.get("aa01") == "x" * 40  # plus récemment utilisée
+    cache.put("dd04", "x" * 40)
+
+    assert cache.get("bb02") is None
+    assert [cache.get(k) is not None for k in ("aa01", "cc03", "dd04")] == [True] * 3
+    # Réouverture : index reconstruit, quota toujours respecté
+    assert (
+        VLMPageCache(tmp_path / "lru", max_size_mb=100 / 1024 / 1024).get("cc03")
+        is None
+    )
+
+    client = FakeVLMClient()
+    settings = VLMPageSettings(max_pixels=20_000, cache_dir=str(tmp_path / "vlm"))
+    VLMPageRunner(client, settings, prompt="Extract").extract([page(3)])
+    settings.jpeg_quality = 40
+    VLMPageRunner(client, settings, prompt="Extract").extract([page(3)])
+    assert client.calls == 2
+
+
+def test_rate_limiter_spaces_calls() -> None:
+    """Le limiteur espace les appels selon le débit configuré."""
+    limiter = RateLimiter(requests_per_minute=600)
+    start = time.monotonic()
+
+    for _ in range(4):
+        limiter.acquire()
+
+    assert time.monotonic() - start >= 0.29
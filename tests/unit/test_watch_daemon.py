@@ -0,0 +1,108 @@
+"""Tests du mode daemon (file de fichiers stables, workers)."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from rag_framework.types import StepData
+from rag_framework.watch_daemon import StableFileQueue, WatchDaemon, WatchSettings
+
+
+def test_queue_deduplicates_and_waits_for_stable_files(tmp_path: Path) -> None:
+    """Un fichier en cours d'écriture n'est délivré qu'une fois stable."""
+    queue = StableFileQueue(settle_seconds=0.3, poll_interval_seconds=0.05)
+    upload = tmp_path / "upload.pdf"
+    done = tmp_path / "done.pdf"
+    upload.write_bytes(b"a")
+    done.write_bytes(b"complet")
+    for _ in range(3):
+        queue.offer(upload)
+    queue.offer(done)
+
+    def keep_writing() -> None:
+        for _ in range(6):
+            time.sleep(0.1)
+            with open(upload, "ab") as f:
+                f.write(b"a")
+
+    writer = threading.Thread(target=keep_writing)
+    writer.start()
+    assert queue.get_batch(max_items=10, batch_wait=0.0) == [str(done)]
+    queue.task_done([str(done)])
+
+    batch = queue.get_batch(max_items=10, batch_wait=0.0)
+    writer.join()
+    assert batch == [str(upload)]
+    assert upload.stat().st_size == 7
+
+    # Modifié pendant son traitement : remis en file ensuite
+    queue.offer(upload)
+    queue.task_done(batch)
+    assert queue.get_batch(max_items=10, batch_wait=0.0) == [str(upload)]
+
+    stats = queue.get_stats()
+    assert (stats["enqueued"], stats["deduplicated"], stats["requeued"]) == (2, 2, 1)
+
+
+class _RecordingPipeline:
+    """Pipeline factice : enregistre les lots reçus."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.processed = threading.Event()
+
+    def execute(self, input_data: Optional[StepData] = None) -> StepData:
+        files = list((input_data or {})["monitored_files"])
+        self.batches.append(files)
+        self.processed.set()
+        return {"extracted_documents": [{"file_path": f} for f in files]}
+
+
+def _wait_for(pipeline: _RecordingPipeline, count: int) -> None:
+    deadline = time.monotonic() + 10
+    while sum(map(len, pipeline.batches)) < count and time.monotonic() < deadline:
+        pipeline.processed.wait(0.05)
+        pipeline.processed.clear()
+
+
+def test_daemon_processes_existing_and_new_files(tmp_path: Path) -> None:
+    """Fichiers présents au démarrage puis déposés : traités en quelques secondes."""
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    (inbox / "existant.txt").write_text("déjà là")
+    (inbox / "ignore.bak").write_text("exclu")
+    config: dict[str, Any] = {
+        "watch_paths": [str(inbox)],
+        "file_patterns": ["*.txt"],
+        "exclude_patterns": ["*_tmp*"],
+    }
+    pipeline = _RecordingPipeline()
+    daemon = WatchDaemon(
+        config,
+        lambda: pipeline,
+        WatchSettings(
+            settle_seconds=0.2,
+            poll_interval_seconds=0.05,
+            batch_wait_seconds=0.1,
+            reconcile_interval_seconds=0,
+        ),
+    )
+    daemon.start()
+    try:
+        _wait_for(pipeline, 1)
+        assert pipeline.batches == [[str(inbox / "existant.txt")]]
+
+        # Dépôt par renommage d'un fichier temporaire (exclu tant qu'il l'est)
+        temp = inbox / "rapport_tmp.txt"
+        temp.write_text("contenu du rapport")
+        temp.rename(inbox / "rapport.txt")
+        _wait_for(pipeline, 2)
+    finally:
+        daemon.stop(timeout=5)
+
+    assert pipeline.batches[-1] == [str(inbox / "rapport.txt")]
+    stats = daemon.get_stats()
+    assert stats["files_processed"] == 2
+    assert stats["errors"] == 0
+    assert stats["latency_max_s"] < 5
@@ -0,0 +1,129 @@
+"""Tests de la file de travail partagée (baux, reprises, workers)."""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from rag_framework.distributed import (
+    DistributedSettings,
+    DistributedWorker,
+    SQLiteWorkQueue,
+)
+from rag_framework.types import StepData
+
+
+def _files(root: Path, count: int) -> list[str]:
+    paths = []
+    for index in range(count):
+        path = root / f"doc_{index}.txt"
+        path.write_text(f"document {index}")
+        paths.append(str(path))
+    return paths
+
+
+def test_leases_retries_and_fencing(tmp_path: Path) -> None:
+    """Bail expiré repris, résultat de l'ancien détenteur refusé, retentatives."""
+    queue = SQLiteWorkQueue(
+        tmp_path / "queue.db",
+        lease_seconds=0.2,
+        max_attempts=2,
+        retry_backoff_seconds=0,
+    )
+    first, second = _files(tmp_path, 2)
+    assert queue.enqueue([first, second, first]) == 2
+    assert queue.enqueue([first, second]) == 0
+
+    [item_a] = queue.claim("node-a", max_items=1)
+    [item_b] = queue.claim("node-b", max_items=5)
+    assert (item_a.key, item_b.key) == (first, second)
+    assert queue.claim("node-c", max_items=5) == []
+    assert queue.heartbeat("node-b", [item_a.id, item_b.id]) == [item_b.id]
+
+    # node-a ne donne plus signe de vie : son document est repris
+    time.sleep(0.3)
+    queue.heartbeat("node-b", [item_b.id])
+    [retaken] = queue.claim("node-c", max_items=5)
+    assert (retaken.id, retaken.attempts) == (item_a.id, 2)
+    assert queue.complete("node-a", [item_a.id]) == []
+
+    assert queue.fail("node-c", [retaken.id], "extraction impossible") == [retaken.id]
+    assert queue.complete("node-b", [item_b.id], busy_seconds=0.5) == [item_b.id]
+
+    # Document traité puis modifié : remis en file
+    os.utime(second, ns=(0, 1_000_000_000))
+    assert queue.enqueue([first, second]) == 1
+
+    stats = queue.get_stats()
+    assert stats["counts"] == {"pending": 1, "running": 0, "done": 0, "dead": 1}
+    assert stats["workers"]["node-a"]["lost_leases"] == 1
+    assert stats["workers"]["node-b"]["done"] == 1
+    assert queue.dead_letters()[0]["error"] == "extraction impossible"
+    queue.close()
+
+
+class _RecordingPipeline:
+    """Pipeline factice : n'extrait pas les documents « casse »."""
+
+    def __init__(self, seen: list[str], lock: threading.Lock) -> None:
+        self.seen = seen
+        self.lock = lock
+
+    def execute(self, input_data: Optional[StepData] = None) -> StepData:
+        files = list((input_data or {})["monitored_files"])
+        time.sleep(0.01)
+        with self.lock:
+            self.seen.extend(files)
+        return {
+            "extracted_documents": [
+                {"file_path": f} for f in files if "casse" not in Path(f).name
+            ]
+        }
+
+
+def test_workers_share_queue_without_duplicates(tmp_path: Path) -> None:
+    """Trois workers : chaque document traité une fois, métriques agrégées."""
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    expected = _files(inbox, 30)
+    (inbox / "casse.txt").write_text("illisible")
+    monitoring = {"watch_paths": [str(inbox)], "file_patterns": ["*.txt"]}
+    seen: list[str] = []
+    lock = threading.Lock()
+
+    def run_worker(index: int) -> None:
+        settings = DistributedSettings(
+            database=str(tmp_path / "queue.db"),
+            batch_size=4,
+            max_attempts=2,
+            retry_backoff_seconds=0,
+            idle_poll_seconds=0.01,
+            worker_id=f"node-{index}",
+        )
+        queue = SQLiteWorkQueue(
+            settings.database,
+            max_attempts=settings.max_attempts,
+            retry_backoff_seconds=settings.retry_backoff_seconds,
+        )
+        worker = DistributedWorker(
+            queue, lambda: _RecordingPipeline(seen, lock), monitoring, settings
+        )
+        worker.run(drain=True)
+        queue.close()
+
+    threads = [threading.Thread(target=run_worker, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    casse = str(inbox / "casse.txt")
+    assert sorted(f for f in seen if f != casse) == sorted(expected)
+    assert seen.count(casse) == 2
+
+    stats = SQLiteWorkQueue(tmp_path / "queue.db").get_stats()
+    assert stats["counts"]["done"] == 30
+    assert stats["counts"]["dead"] == 1
+    assert sum(w["done"] for w in stats["workers"].values()) == 30
+    assert sum(w["failed"] for w in stats["workers"].values()) == 2